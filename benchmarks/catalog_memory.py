@@ -0,0 +1,71 @@
+"""Measure memory held by SeriesCatalogEntry objects for the full catalog.
+
+Usage::
+
+    uv run python benchmarks/catalog_memory.py [--metadata-dir metadata]
+
+Reads every ``<DB>.parquet`` under the metadata directory (the bundled
+``metadata/`` by default), converts the concatenated table with
+``table_to_entries`` and reports the memory retained by the entries and the
+peak allocation during conversion, both measured with ``tracemalloc``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from boj_stat_search.core.catalog_parser import table_to_entries
+
+DEFAULT_METADATA_DIR = Path(__file__).resolve().parent.parent / "metadata"
+
+
+def load_bundled_catalog(metadata_dir: Path) -> pa.Table:
+    tables: list[pa.Table] = []
+    for path in sorted(metadata_dir.glob("*.parquet")):
+        table = pq.read_table(path)
+        db_column = pa.array([path.stem] * table.num_rows, type=pa.string())
+        tables.append(table.append_column("db", db_column))
+    if not tables:
+        raise SystemExit(f"no Parquet files found under {metadata_dir}")
+    return pa.concat_tables(tables)
+
+
+def measure_entries_memory(table: pa.Table) -> dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        entries = table_to_entries(table)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "entries": len(entries),
+        "retained_mib": retained / 2**20,
+        "peak_mib": peak / 2**20,
+        "bytes_per_entry": retained / max(len(entries), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--metadata-dir", type=Path, default=DEFAULT_METADATA_DIR)
+    args = parser.parse_args()
+
+    table = load_bundled_catalog(args.metadata_dir)
+    result = measure_entries_memory(table)
+
+    print(f"entries:          {result['entries']:,}")
+    print(f"retained:         {result['retained_mib']:.1f} MiB")
+    print(f"peak:             {result['peak_mib']:.1f} MiB")
+    print(f"bytes per entry:  {result['bytes_per_entry']:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Fixtures and a dependency-free ``benchmark`` fixture for the offline suite.
+
+``benchmark(fn, *args, **kwargs)`` and ``benchmark.pedantic(...)`` follow
+pytest-benchmark's calling convention, so the benchmark files read like that
+plugin's, but nothing beyond pytest is required. Each result's median is
+compared with ``baseline.json``; a benchmark slower than its baseline by more
+than ``--baseline-tolerance`` fails. ``--save-baseline`` adds this run's
+medians to the baseline instead, which keeps the medians of the last
+BASELINE_RUNS saved runs and compares against the median of those.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import shutil
+import statistics
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pyarrow.parquet as pq
+import pytest
+
+from boj_stat_search.shell.catalog import ensure_search_index, load_catalog_db
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+BASELINE_PATH = BENCHMARK_DIR / "baseline.json"
+METADATA_DIR = BENCHMARK_DIR.parent / "metadata"
+
+# Back-to-back runs of an unchanged tree differ by up to ~80% on shared CI
+# hosts, so only a slowdown well beyond that counts as a regression.
+DEFAULT_TOLERANCE = 1.0
+# Saved runs per benchmark whose medians form the baseline.
+BASELINE_RUNS = 5
+# Absolute slack so sub-millisecond benchmarks do not fail on timer noise.
+ABSOLUTE_SLACK_SECONDS = 0.002
+MIN_ROUNDS = 5
+MAX_TIME_SECONDS = 1.0
+
+_RESULTS_KEY = pytest.StashKey[dict[str, "BenchmarkStats"]]()
+
+
+@dataclass(frozen=True)
+class BenchmarkStats:
+    rounds: int
+    min: float
+    median: float
+    mean: float
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("baseline", "benchmark baselines")
+    group.addoption(
+        "--save-baseline",
+        action="store_true",
+        help="Add this run's medians to benchmarks/baseline.json",
+    )
+    group.addoption(
+        "--baseline-tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed slowdown over the baseline median (1.0 = 100%%)",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[_RESULTS_KEY] = {}
+
+
+class Benchmark:
+    def __init__(self, name: str, config: pytest.Config) -> None:
+        self._name = name
+        self._config = config
+
+    def __call__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Time ``fn`` for at least MIN_ROUNDS rounds or MAX_TIME_SECONDS."""
+        result = fn(*args, **kwargs)  # warm-up, also returned to the test
+        timings: list[float] = []
+        deadline = time.perf_counter() + MAX_TIME_SECONDS
+        while len(timings) < MIN_ROUNDS or time.perf_counter() < deadline:
+            start = time.perf_counter()
+            fn(*args, **kwargs)
+            timings.append(time.perf_counter() - start)
+        self._record(timings)
+        return result
+
+    def pedantic(
+        self,
+        target: Callable[..., Any],
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+        setup: Callable[[], tuple[tuple[Any, ...], dict[str, Any]] | None]
+        | None = None,
+        rounds: int = 1,
+        iterations: int = 1,
+        warmup_rounds: int = 0,
+    ) -> Any:
+        """Time exactly ``rounds`` x ``iterations`` calls, with optional setup."""
+        result = None
+        timings: list[float] = []
+        for round_number in range(warmup_rounds + rounds):
+            call_args, call_kwargs = args, kwargs or {}
+            if setup is not None:
+                prepared = setup()
+                if prepared is not None:
+                    call_args, call_kwargs = prepared
+            start = time.perf_counter()
+            for _ in range(iterations):
+                result = target(*call_args, **call_kwargs)
+            elapsed = (time.perf_counter() - start) / iterations
+            if round_number >= warmup_rounds:
+                timings.append(elapsed)
+        self._record(timings)
+        return result
+
+    def _record(self, timings: list[float]) -> None:
+        stats = BenchmarkStats(
+            rounds=len(timings),
+            min=min(timings),
+            median=statistics.median(timings),
+            mean=statistics.fmean(timings),
+        )
+        self._config.stash[_RESULTS_KEY][self._name] = stats
+
+        if self._config.getoption("save_baseline"):
+            return
+        baseline = _load_baseline().get(self._name)
+        if baseline is None:
+            return
+        tolerance = self._config.getoption("baseline_tolerance")
+        allowed = baseline["median"] * (1 + tolerance) + ABSOLUTE_SLACK_SECONDS
+        if stats.median > allowed:
+            pytest.fail(
+                f"{self._name}: median {stats.median * 1000:.2f} ms exceeds "
+                f"baseline {baseline['median'] * 1000:.2f} ms "
+                f"by more than {tolerance:.0%}"
+            )
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest) -> Benchmark:
+    return Benchmark(request.node.nodeid, request.config)
+
+
+@pytest.fixture(scope="session")
+def bundled_dbs() -> tuple[str, ...]:
+    dbs = tuple(sorted(path.stem for path in METADATA_DIR.glob("*.parquet")))
+    if not dbs:
+        pytest.skip(f"no bundled catalog under {METADATA_DIR}")
+    return dbs
+
+
+@pytest.fixture(scope="session")
+def largest_db(bundled_dbs: tuple[str, ...]) -> str:
+    return max(
+        bundled_dbs,
+        key=lambda db: pq.read_metadata(METADATA_DIR / f"{db}.parquet").num_rows,
+    )
+
+
+@pytest.fixture(scope="session")
+def catalog_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory, bundled_dbs: tuple[str, ...]
+) -> Iterator[Path]:
+    """A catalog cache seeded from ``metadata/``, with search index sidecars built."""
+    cache_dir = tmp_path_factory.mktemp("catalog")
+    for db in bundled_dbs:
+        shutil.copy(METADATA_DIR / f"{db}.parquet", cache_dir / f"{db}.parquet")
+        table = load_catalog_db(db, cache_dir=cache_dir)
+        ensure_search_index(db, table, cache_dir=cache_dir)
+    yield cache_dir
+
+
+def pytest_terminal_summary(terminalreporter: Any, config: pytest.Config) -> None:
+    results = config.stash.get(_RESULTS_KEY, {})
+    if not results:
+        return
+
+    baseline = _load_baseline()
+    terminalreporter.section("benchmarks (ms)")
+    terminalreporter.write_line(
+        f"{'name':<80} {'rounds':>6} {'min':>9} {'median':>9} {'baseline':>9}"
+    )
+    for name, stats in sorted(results.items()):
+        reference = baseline.get(name, {}).get("median")
+        reference_text = f"{reference * 1000:9.2f}" if reference else f"{'-':>9}"
+        terminalreporter.write_line(
+            f"{name:<80} {stats.rounds:>6} {stats.min * 1000:9.2f} "
+            f"{stats.median * 1000:9.2f} {reference_text}"
+        )
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    results = config.stash.get(_RESULTS_KEY, {})
+    if not config.getoption("save_baseline") or not results:
+        return
+
+    merged = _load_baseline()
+    for name, stats in results.items():
+        runs = [*merged.get(name, {}).get("runs", []), stats.median]
+        runs = runs[-BASELINE_RUNS:]
+        merged[name] = {"median": statistics.median(runs), "runs": runs}
+    document = {
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.machine(),
+        },
+        "benchmarks": dict(sorted(merged.items())),
+    }
+    BASELINE_PATH.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def _load_baseline() -> dict[str, dict[str, Any]]:
+    try:
+        document = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return document.get("benchmarks", {})
@@ -0,0 +1,47 @@
+"""Catalog loading and lookup over the full bundled ``metadata/`` catalog."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pyarrow.parquet as pq
+import pytest
+
+from boj_stat_search.shell.catalog import load_catalog_all, resolve_db, search_series
+
+from benchmarks.conftest import METADATA_DIR
+
+
+def test_load_catalog_all_warm(
+    benchmark, catalog_cache_dir: Path, bundled_dbs: tuple[str, ...]
+) -> None:
+    table = benchmark(load_catalog_all, dbs=bundled_dbs, cache_dir=catalog_cache_dir)
+
+    assert table.num_rows > 0
+
+
+@pytest.mark.parametrize(
+    "keyword",
+    ["yen", "円", ("loans", "banks")],
+    ids=["ascii", "japanese", "and-terms"],
+)
+def test_search_series(
+    benchmark,
+    catalog_cache_dir: Path,
+    bundled_dbs: tuple[str, ...],
+    keyword: str | tuple[str, ...],
+) -> None:
+    result = benchmark(
+        search_series, keyword, dbs=bundled_dbs, cache_dir=catalog_cache_dir
+    )
+
+    assert len(result) > 0
+
+
+def test_resolve_db(benchmark, catalog_cache_dir: Path, largest_db: str) -> None:
+    table = pq.read_table(METADATA_DIR / f"{largest_db}.parquet")
+    series_code = table["series_code"][table.num_rows // 2].as_py()
+
+    db = benchmark(resolve_db, series_code, cache_dir=catalog_cache_dir)
+
+    assert db == largest_db
@@ -0,0 +1,45 @@
+"""Client throughput against the local mock BOJ API (no network)."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from boj_stat_search.core.mock_api import MockDataset
+from boj_stat_search.shell.client import BojClient
+from boj_stat_search.shell.mock_server import MockBojServer
+
+_DATASET = MockDataset(series_per_db=1000, frequencies=("M",))
+
+
+def _fetch_all_pages(client: BojClient, db: str) -> int:
+    series = 0
+    position: int | None = None
+    while True:
+        response = client.get_data_layer(db, "M", "*", start_position=position)
+        series += len(response.result_set)
+        position = response.next_position
+        if position is None:
+            return series
+
+
+def test_paginated_data_layer_sweep(benchmark) -> None:
+    """Client-side cost of paging through 1,000 series with no server latency."""
+    server = MockBojServer(_DATASET)
+    with BojClient(client=server.client(), min_request_interval=0) as client:
+        assert benchmark(_fetch_all_pages, client, "FM01") == 1000
+
+
+def test_concurrent_requests_with_latency(benchmark) -> None:
+    """Eight threads, 20 ms +/- 5 ms per response, no client-side throttling."""
+    server = MockBojServer(_DATASET, latency=0.02, jitter=0.005)
+    codes = [f"FM01X{index:05d}" for index in range(1, 33)]
+
+    def fetch_all() -> None:
+        with (
+            BojClient(client=server.client(), min_request_interval=0) as client,
+            ThreadPoolExecutor(max_workers=8) as pool,
+        ):
+            list(pool.map(lambda code: client.get_data_code("FM01", code), codes))
+
+    benchmark(fetch_all)
+    assert server.peak_concurrency > 1
@@ -0,0 +1,28 @@
+"""Layer tree rendering for the largest bundled DB."""
+
+from __future__ import annotations
+
+import pyarrow.parquet as pq
+import pytest
+
+from boj_stat_search.core.catalog_parser import table_to_metadata_entries
+from boj_stat_search.core.formatter import format_layer_tree
+from boj_stat_search.core.models import MetadataEntry
+
+from benchmarks.conftest import METADATA_DIR
+
+
+@pytest.fixture(scope="module")
+def largest_db_entries(largest_db: str) -> tuple[MetadataEntry, ...]:
+    return table_to_metadata_entries(
+        pq.read_table(METADATA_DIR / f"{largest_db}.parquet")
+    )
+
+
+@pytest.mark.parametrize("layer", [None, "1,*"], ids=["full", "filtered"])
+def test_format_layer_tree_largest_db(
+    benchmark, largest_db_entries: tuple[MetadataEntry, ...], layer: str | None
+) -> None:
+    text = benchmark(format_layer_tree, largest_db_entries, layer)
+
+    assert text
@@ -0,0 +1,95 @@
+"""Parsing large ``getDataLayer`` pages.
+
+Recorded response bodies saved as ``benchmarks/payloads/*.json`` are picked up
+automatically. A deterministic full page built from the bundled catalog's
+series codes always runs, so the suite needs no network access.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pyarrow.parquet as pq
+import pytest
+
+from boj_stat_search.core.columnar import data_response_to_table, table_to_ipc_bytes
+from boj_stat_search.core.parser import parse_data_code_response
+
+from benchmarks.conftest import BENCHMARK_DIR, METADATA_DIR
+
+PAYLOAD_DIR = BENCHMARK_DIR / "payloads"
+# getDataLayer returns at most 255 series per page.
+SYNTHETIC_SERIES = 255
+SYNTHETIC_MONTHS = 360
+
+
+def _synthetic_payload() -> bytes:
+    paths = sorted(METADATA_DIR.glob("*.parquet"))
+    if not paths:
+        pytest.skip(f"no bundled catalog under {METADATA_DIR}")
+    codes = pq.read_table(paths[0], columns=["series_code"])["series_code"]
+    rng = random.Random(0)
+    survey_dates = [
+        (1995 + month // 12) * 100 + month % 12 + 1 for month in range(SYNTHETIC_MONTHS)
+    ]
+    result_set = [
+        {
+            "SERIES_CODE": codes[i % len(codes)].as_py(),
+            "NAME_OF_TIME_SERIES": f"Synthetic series {i}",
+            "UNIT": "100 million yen",
+            "FREQUENCY": "MONTHLY",
+            "CATEGORY": "Synthetic",
+            "LAST_UPDATE": 20260220,
+            "VALUES": {
+                "SURVEY_DATES": survey_dates,
+                "VALUES": [
+                    None if rng.random() < 0.02 else round(rng.uniform(0, 1e6), 1)
+                    for _ in survey_dates
+                ],
+            },
+        }
+        for i in range(SYNTHETIC_SERIES)
+    ]
+    return json.dumps(
+        {
+            "STATUS": 200,
+            "MESSAGEID": "M181000I",
+            "MESSAGE": "Successfully completed",
+            "DATE": "2026-02-21T23:41:58.086+09:00",
+            "PARAMETER": {"DB": "SYNTHETIC", "LAYER1": "*", "FREQUENCY": "M"},
+            "NEXTPOSITION": SYNTHETIC_SERIES + 1,
+            "RESULTSET": result_set,
+        }
+    ).encode()
+
+
+def _payload_params() -> list:
+    params = [pytest.param(None, id="synthetic")]
+    params.extend(
+        pytest.param(path, id=path.stem) for path in sorted(PAYLOAD_DIR.glob("*.json"))
+    )
+    return params
+
+
+@pytest.fixture(params=_payload_params())
+def payload(request: pytest.FixtureRequest) -> bytes:
+    path: Path | None = request.param
+    return _synthetic_payload() if path is None else path.read_bytes()
+
+
+def test_parse_data_layer_response(benchmark, payload: bytes) -> None:
+    response = benchmark(lambda: parse_data_code_response(json.loads(payload)))
+
+    assert response.result_set
+
+
+def test_decode_data_layer_payload_to_arrow(benchmark, payload: bytes) -> None:
+    def decode() -> bytes:
+        response = parse_data_code_response(json.loads(payload))
+        return table_to_ipc_bytes(data_response_to_table(response))
+
+    buffer = benchmark(decode)
+
+    assert buffer
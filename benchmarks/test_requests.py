@@ -0,0 +1,48 @@
+"""Validating and building request URLs for a large request plan.
+
+The specs come from ``plan_data_requests`` over the largest bundled DB, split
+into small windows so the batch is about the size a bulk download generates.
+"""
+
+from __future__ import annotations
+
+import pyarrow.parquet as pq
+import pytest
+
+from boj_stat_search.core.request_plan import plan_data_requests
+from boj_stat_search.core.url_builder import (
+    DataCodeSpec,
+    build_data_code_api_url,
+    build_data_code_api_urls,
+)
+
+from benchmarks.conftest import METADATA_DIR
+
+TARGET_SPECS = 10_000
+
+
+@pytest.fixture(scope="module")
+def specs(largest_db: str) -> list[DataCodeSpec]:
+    catalog = pq.read_table(METADATA_DIR / f"{largest_db}.parquet")
+    if "db" not in catalog.column_names:
+        catalog = catalog.append_column("db", [[largest_db] * catalog.num_rows])
+    plan = plan_data_requests(catalog, max_codes=50, max_observations=500)
+    specs = [
+        DataCodeSpec(
+            request.db, ",".join(request.codes), request.start_date, request.end_date
+        )
+        for request in plan
+    ]
+    return (specs * (TARGET_SPECS // max(len(specs), 1) + 1))[:TARGET_SPECS]
+
+
+def test_build_data_code_urls_one_by_one(benchmark, specs: list[DataCodeSpec]) -> None:
+    urls = benchmark(lambda: [build_data_code_api_url(*spec) for spec in specs])
+
+    assert len(urls) == TARGET_SPECS
+
+
+def test_build_data_code_urls_batch(benchmark, specs: list[DataCodeSpec]) -> None:
+    urls = benchmark(build_data_code_api_urls, specs)
+
+    assert len(urls) == TARGET_SPECS
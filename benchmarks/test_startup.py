@@ -0,0 +1,24 @@
+"""Wall-clock cost of starting a fresh interpreter that imports the package."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+
+def _run_python(*argv: str) -> None:
+    subprocess.run([sys.executable, *argv], check=True, capture_output=True)
+
+
+def test_interpreter_startup(benchmark) -> None:
+    """Reference point: subtract from the results below for the package's share."""
+    benchmark(_run_python, "-c", "pass")
+
+
+def test_import_package(benchmark) -> None:
+    benchmark(_run_python, "-c", "import boj_stat_search")
+
+
+def test_cli_list_db(benchmark) -> None:
+    # Same entry point as the `boj-stat-search` console script.
+    benchmark(_run_python, "-c", "from boj_stat_search import main; main()", "list-db")
@@ -1,42 +1,128 @@
-from boj_stat_search.shell.client import BojClient
-from boj_stat_search.shell.api import (
-    BojApiError,
-    get_data_code,
-    get_data_code_raw,
-    get_data_layer,
-    get_data_layer_raw,
-    get_metadata,
-    get_metadata_raw,
-)
-from boj_stat_search.shell.catalog.exporter import (
-    MetadataExportReport,
-    generate_metadata_parquet_files,
-)
-from boj_stat_search.shell.catalog.loader import (
-    CatalogCacheError,
-    CatalogError,
-    CatalogFetchError,
-    load_catalog_all,
-    load_catalog_db,
-)
-from boj_stat_search.shell.catalog.search import (
-    list_series,
-    resolve_db,
-    search_series,
-)
-from boj_stat_search.core import Code, Db, Frequency, Layer, Period, list_db
-from boj_stat_search.shell.display import show_layers
-from boj_stat_search.core.models import (
-    BaseResponse,
-    DataResponse,
-    DbInfo,
-    MetadataEntry,
-    MetadataResponse,
-    SeriesCatalogEntry,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from boj_stat_search._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from boj_stat_search.shell.client import BojClient
+    from boj_stat_search.shell.metrics import ClientMetrics
+    from boj_stat_search.shell.series_cache import SeriesCache
+    from boj_stat_search.shell.planner import fetch_planned, get_data_layer_planned
+    from boj_stat_search.shell.jobs import (
+        DownloadJobReport,
+        read_download_job,
+        run_download_job,
+    )
+    from boj_stat_search.shell.api import (
+        BojApiError,
+        get_data_code,
+        get_data_code_raw,
+        get_data_layer,
+        get_data_layer_raw,
+        get_metadata,
+        get_metadata_raw,
+    )
+    from boj_stat_search.shell.catalog.exporter import (
+        MetadataExportReport,
+        generate_metadata_parquet_files,
+    )
+    from boj_stat_search.shell.catalog.loader import (
+        CatalogCacheError,
+        CatalogError,
+        CatalogFetchError,
+        load_catalog_all,
+        load_catalog_db,
+    )
+    from boj_stat_search.shell.catalog.search import (
+        list_series,
+        rank_series,
+        resolve_db,
+        search_series,
+    )
+    from boj_stat_search.core import (
+        Code,
+        Db,
+        Frequency,
+        Layer,
+        Period,
+        SeriesCatalogResult,
+        list_db,
+    )
+    from boj_stat_search.shell.display import show_layers
+    from boj_stat_search.shell.profiling import profile_requests
+    from boj_stat_search.core.models import (
+        BaseResponse,
+        DataResponse,
+        DbInfo,
+        MetadataEntry,
+        MetadataResponse,
+        PhaseTimings,
+        SeriesCatalogEntry,
+    )
+
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "boj_stat_search.shell.client": ("BojClient",),
+    "boj_stat_search.shell.metrics": ("ClientMetrics",),
+    "boj_stat_search.shell.series_cache": ("SeriesCache",),
+    "boj_stat_search.shell.planner": ("fetch_planned", "get_data_layer_planned"),
+    "boj_stat_search.shell.jobs": (
+        "DownloadJobReport",
+        "read_download_job",
+        "run_download_job",
+    ),
+    "boj_stat_search.shell.api": (
+        "BojApiError",
+        "get_data_code",
+        "get_data_code_raw",
+        "get_data_layer",
+        "get_data_layer_raw",
+        "get_metadata",
+        "get_metadata_raw",
+    ),
+    "boj_stat_search.shell.catalog.exporter": (
+        "MetadataExportReport",
+        "generate_metadata_parquet_files",
+    ),
+    "boj_stat_search.shell.catalog.loader": (
+        "CatalogCacheError",
+        "CatalogError",
+        "CatalogFetchError",
+        "load_catalog_all",
+        "load_catalog_db",
+    ),
+    "boj_stat_search.shell.catalog.search": (
+        "list_series",
+        "rank_series",
+        "resolve_db",
+        "search_series",
+    ),
+    "boj_stat_search.core": (
+        "Code",
+        "Db",
+        "Frequency",
+        "Layer",
+        "Period",
+        "SeriesCatalogResult",
+        "list_db",
+    ),
+    "boj_stat_search.shell.display": ("show_layers",),
+    "boj_stat_search.shell.profiling": ("profile_requests",),
+    "boj_stat_search.core.models": (
+        "BaseResponse",
+        "DataResponse",
+        "DbInfo",
+        "MetadataEntry",
+        "MetadataResponse",
+        "PhaseTimings",
+        "SeriesCatalogEntry",
+    ),
+}
 
 __all__ = [
     "BojClient",
+    "ClientMetrics",
+    "SeriesCache",
     "BojApiError",
     "get_metadata_raw",
     "get_metadata",
@@ -44,11 +130,16 @@ __all__ = [
     "get_data_code",
     "get_data_layer_raw",
     "get_data_layer",
+    "get_data_layer_planned",
+    "fetch_planned",
+    "run_download_job",
+    "read_download_job",
     "generate_metadata_parquet_files",
     "load_catalog_db",
     "load_catalog_all",
     "list_series",
     "search_series",
+    "rank_series",
     "resolve_db",
     "Db",
     "Frequency",
@@ -56,6 +147,7 @@ __all__ = [
     "Code",
     "Period",
     "MetadataExportReport",
+    "DownloadJobReport",
     "CatalogError",
     "CatalogFetchError",
     "CatalogCacheError",
@@ -63,12 +155,17 @@ __all__ = [
     "DbInfo",
     "MetadataEntry",
     "SeriesCatalogEntry",
+    "SeriesCatalogResult",
     "MetadataResponse",
     "DataResponse",
+    "PhaseTimings",
     "list_db",
     "show_layers",
+    "profile_requests",
 ]
 
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
+
 
 def main() -> None:
     from boj_stat_search.shell.cli import app
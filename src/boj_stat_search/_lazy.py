@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+
+def lazy_exports(
+    package_globals: dict[str, Any],
+    exports: Mapping[str, Sequence[str]],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module ``__getattr__``/``__dir__`` hooks that import on first access.
+
+    ``exports`` maps a module path to the names re-exported from it. Each name
+    is imported when it is first looked up and then stored in
+    ``package_globals``, so later lookups skip the hook entirely.
+    """
+    package_name = package_globals["__name__"]
+    module_by_name = {
+        name: module_name for module_name, names in exports.items() for name in names
+    }
+
+    def __getattr__(name: str) -> Any:
+        module_name = module_by_name.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*package_globals, *module_by_name})
+
+    return __getattr__, __dir__
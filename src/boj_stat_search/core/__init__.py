@@ -1,32 +1,251 @@
-from boj_stat_search.core.catalog_parser import (
-    REQUIRED_COLUMNS,
-    ensure_required_columns,
-    resolve_db_from_tables,
-    row_to_entry,
-    table_to_entries,
-)
-from boj_stat_search.core.database import list_db
-from boj_stat_search.core.formatter import format_layer_tree
-from boj_stat_search.core.parser import (
-    parse_data_code_response,
-    parse_metadata_response,
-)
-from boj_stat_search.core.types import Code, Db, ErrorMode, Frequency, Layer, Period
-from boj_stat_search.core.url_builder import (
-    build_data_code_api_url,
-    build_data_layer_api_url,
-    build_metadata_api_url,
-)
-from boj_stat_search.core.validator import (
-    coerce_code,
-    coerce_frequency,
-    coerce_layer,
-    coerce_period,
-    extract_db_from_code,
-    validate_data_code_params,
-    validate_data_layer_params,
-    validate_metadata_params,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from boj_stat_search._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from boj_stat_search.core.catalog_parser import (
+        REQUIRED_COLUMNS,
+        ensure_required_columns,
+        resolve_db_from_tables,
+        row_to_entry,
+        table_to_entries,
+        table_to_metadata_entries,
+    )
+    from boj_stat_search.core.catalog_result import (
+        CATALOG_TABLE_SCHEMA,
+        SeriesCatalogResult,
+        ensure_catalog_table,
+    )
+    from boj_stat_search.core.columnar import (
+        DATA_TABLE_SCHEMA,
+        data_response_to_table,
+        data_table_to_wide,
+        series_to_batch,
+        table_from_ipc_bytes,
+        table_to_ipc_bytes,
+        wide_table_to_numpy,
+    )
+    from boj_stat_search.core.coverage import (
+        MonthRange,
+        OBSERVATION_SCHEMA,
+        OPEN_END,
+        OPEN_START,
+        merge_observations,
+        merge_ranges,
+        missing_ranges,
+        period_value,
+        request_dates,
+        request_months,
+        request_value_months,
+        select_months,
+    )
+    from boj_stat_search.core.database import list_db
+    from boj_stat_search.core.dataframes import table_to_pandas, table_to_polars
+    from boj_stat_search.core.formatter import (
+        DATA_CSV_COLUMNS,
+        format_layer_tree,
+        format_phase_timings,
+        iter_data_csv,
+        iter_data_ndjson,
+        iter_layer_tree,
+        layer_index_for_entries,
+    )
+    from boj_stat_search.core.layer_index import LAYER_COLUMNS, LayerIndex
+    from boj_stat_search.core.mock_api import (
+        FREQUENCY_NAMES,
+        MockDataset,
+        MockSeries,
+        mock_api_response,
+    )
+    from boj_stat_search.core.parser import (
+        parse_data_code_response,
+        parse_metadata_response,
+    )
+    from boj_stat_search.core.request_plan import (
+        MAX_CODES_PER_REQUEST,
+        MAX_OBSERVATIONS_PER_REQUEST,
+        PlannedRequest,
+        plan_data_requests,
+        stitch_data_responses,
+    )
+    from boj_stat_search.core.search_index import (
+        KEYWORD_FIELDS,
+        SEARCH_INDEX_FIELDS,
+        SearchIndex,
+        build_search_index,
+        normalize_search_text,
+        search_index_candidates,
+        search_index_from_table,
+        search_index_rows,
+        search_index_to_table,
+    )
+    from boj_stat_search.core.search_rank import (
+        DEFAULT_FIELD_WEIGHTS,
+        TermMatches,
+        match_search_terms,
+        resolve_field_weights,
+        score_term_matches,
+        top_ranked,
+    )
+    from boj_stat_search.core.time_index import (
+        PERIOD_MONTHS,
+        observation_dates,
+        period_range,
+        resolve_frequency,
+        survey_dates_to_dates,
+        survey_dates_to_months,
+        survey_dates_to_ordinals,
+    )
+    from boj_stat_search.core.types import Code, Db, ErrorMode, Frequency, Layer, Period
+    from boj_stat_search.core.url_builder import (
+        DataCodeSpec,
+        DataLayerSpec,
+        build_data_code_api_url,
+        build_data_code_api_urls,
+        build_data_layer_api_url,
+        build_data_layer_api_urls,
+        build_metadata_api_url,
+    )
+    from boj_stat_search.core.validator import (
+        BatchValidator,
+        coerce_code,
+        coerce_frequency,
+        coerce_layer,
+        coerce_period,
+        extract_db_from_code,
+        validate_data_code_params,
+        validate_data_layer_params,
+        validate_metadata_params,
+    )
+
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "boj_stat_search.core.catalog_parser": (
+        "REQUIRED_COLUMNS",
+        "ensure_required_columns",
+        "resolve_db_from_tables",
+        "row_to_entry",
+        "table_to_entries",
+        "table_to_metadata_entries",
+    ),
+    "boj_stat_search.core.catalog_result": (
+        "CATALOG_TABLE_SCHEMA",
+        "SeriesCatalogResult",
+        "ensure_catalog_table",
+    ),
+    "boj_stat_search.core.columnar": (
+        "DATA_TABLE_SCHEMA",
+        "data_response_to_table",
+        "data_table_to_wide",
+        "series_to_batch",
+        "table_from_ipc_bytes",
+        "table_to_ipc_bytes",
+        "wide_table_to_numpy",
+    ),
+    "boj_stat_search.core.coverage": (
+        "MonthRange",
+        "OBSERVATION_SCHEMA",
+        "OPEN_END",
+        "OPEN_START",
+        "merge_observations",
+        "merge_ranges",
+        "missing_ranges",
+        "period_value",
+        "request_dates",
+        "request_months",
+        "request_value_months",
+        "select_months",
+    ),
+    "boj_stat_search.core.database": ("list_db",),
+    "boj_stat_search.core.dataframes": ("table_to_pandas", "table_to_polars"),
+    "boj_stat_search.core.formatter": (
+        "DATA_CSV_COLUMNS",
+        "format_layer_tree",
+        "format_phase_timings",
+        "iter_data_csv",
+        "iter_data_ndjson",
+        "iter_layer_tree",
+        "layer_index_for_entries",
+    ),
+    "boj_stat_search.core.layer_index": (
+        "LAYER_COLUMNS",
+        "LayerIndex",
+    ),
+    "boj_stat_search.core.mock_api": (
+        "FREQUENCY_NAMES",
+        "MockDataset",
+        "MockSeries",
+        "mock_api_response",
+    ),
+    "boj_stat_search.core.parser": (
+        "parse_data_code_response",
+        "parse_metadata_response",
+    ),
+    "boj_stat_search.core.request_plan": (
+        "MAX_CODES_PER_REQUEST",
+        "MAX_OBSERVATIONS_PER_REQUEST",
+        "PlannedRequest",
+        "plan_data_requests",
+        "stitch_data_responses",
+    ),
+    "boj_stat_search.core.search_index": (
+        "KEYWORD_FIELDS",
+        "SEARCH_INDEX_FIELDS",
+        "SearchIndex",
+        "build_search_index",
+        "normalize_search_text",
+        "search_index_candidates",
+        "search_index_from_table",
+        "search_index_rows",
+        "search_index_to_table",
+    ),
+    "boj_stat_search.core.search_rank": (
+        "DEFAULT_FIELD_WEIGHTS",
+        "TermMatches",
+        "match_search_terms",
+        "resolve_field_weights",
+        "score_term_matches",
+        "top_ranked",
+    ),
+    "boj_stat_search.core.time_index": (
+        "PERIOD_MONTHS",
+        "observation_dates",
+        "period_range",
+        "resolve_frequency",
+        "survey_dates_to_dates",
+        "survey_dates_to_months",
+        "survey_dates_to_ordinals",
+    ),
+    "boj_stat_search.core.types": (
+        "Code",
+        "Db",
+        "ErrorMode",
+        "Frequency",
+        "Layer",
+        "Period",
+    ),
+    "boj_stat_search.core.url_builder": (
+        "DataCodeSpec",
+        "DataLayerSpec",
+        "build_data_code_api_url",
+        "build_data_code_api_urls",
+        "build_data_layer_api_url",
+        "build_data_layer_api_urls",
+        "build_metadata_api_url",
+    ),
+    "boj_stat_search.core.validator": (
+        "BatchValidator",
+        "coerce_code",
+        "coerce_frequency",
+        "coerce_layer",
+        "coerce_period",
+        "extract_db_from_code",
+        "validate_data_code_params",
+        "validate_data_layer_params",
+        "validate_metadata_params",
+    ),
+}
 
 __all__ = [
     "REQUIRED_COLUMNS",
@@ -34,21 +253,90 @@ __all__ = [
     "resolve_db_from_tables",
     "row_to_entry",
     "table_to_entries",
+    "table_to_metadata_entries",
+    "CATALOG_TABLE_SCHEMA",
+    "SeriesCatalogResult",
+    "ensure_catalog_table",
+    "DATA_TABLE_SCHEMA",
+    "data_response_to_table",
+    "data_table_to_wide",
+    "series_to_batch",
+    "table_from_ipc_bytes",
+    "table_to_ipc_bytes",
+    "wide_table_to_numpy",
+    "MonthRange",
+    "OBSERVATION_SCHEMA",
+    "OPEN_END",
+    "OPEN_START",
+    "merge_observations",
+    "merge_ranges",
+    "missing_ranges",
+    "period_value",
+    "request_dates",
+    "request_months",
+    "request_value_months",
+    "select_months",
     "list_db",
+    "table_to_pandas",
+    "table_to_polars",
+    "DATA_CSV_COLUMNS",
     "format_layer_tree",
+    "format_phase_timings",
+    "iter_data_csv",
+    "iter_data_ndjson",
+    "iter_layer_tree",
+    "layer_index_for_entries",
+    "LAYER_COLUMNS",
+    "LayerIndex",
+    "FREQUENCY_NAMES",
+    "MockDataset",
+    "MockSeries",
+    "mock_api_response",
     "parse_data_code_response",
     "parse_metadata_response",
+    "MAX_CODES_PER_REQUEST",
+    "MAX_OBSERVATIONS_PER_REQUEST",
+    "PlannedRequest",
+    "plan_data_requests",
+    "stitch_data_responses",
+    "KEYWORD_FIELDS",
+    "SEARCH_INDEX_FIELDS",
+    "SearchIndex",
+    "build_search_index",
+    "normalize_search_text",
+    "search_index_candidates",
+    "search_index_from_table",
+    "search_index_rows",
+    "search_index_to_table",
+    "DEFAULT_FIELD_WEIGHTS",
+    "TermMatches",
+    "match_search_terms",
+    "resolve_field_weights",
+    "score_term_matches",
+    "top_ranked",
+    "PERIOD_MONTHS",
+    "observation_dates",
+    "period_range",
+    "resolve_frequency",
+    "survey_dates_to_dates",
+    "survey_dates_to_months",
+    "survey_dates_to_ordinals",
     "Db",
     "Frequency",
     "Layer",
     "Code",
     "Period",
     "ErrorMode",
+    "DataCodeSpec",
+    "DataLayerSpec",
     "build_data_code_api_url",
+    "build_data_code_api_urls",
     "build_data_layer_api_url",
+    "build_data_layer_api_urls",
     "build_metadata_api_url",
     "coerce_frequency",
     "coerce_layer",
+    "BatchValidator",
     "coerce_code",
     "coerce_period",
     "extract_db_from_code",
@@ -56,3 +344,5 @@ __all__ = [
     "validate_data_layer_params",
     "validate_metadata_params",
 ]
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
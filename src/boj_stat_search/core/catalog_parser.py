@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Sequence
 from typing import Any
 
 import pyarrow as pa
 
-from boj_stat_search.core.models import SeriesCatalogEntry
+from boj_stat_search.core.models import MetadataEntry, SeriesCatalogEntry
 
 REQUIRED_COLUMNS: tuple[str, ...] = (
     "db",
@@ -29,13 +30,61 @@ REQUIRED_COLUMNS: tuple[str, ...] = (
     "notes_en",
 )
 
+_CONVERSION_BATCH_ROWS = 4096
+
+_LAYER_COLUMNS: frozenset[str] = frozenset(
+    {"layer1", "layer2", "layer3", "layer4", "layer5"}
+)
+
+# Catalog columns in ``MetadataEntry`` field order.
+_METADATA_ENTRY_COLUMNS: tuple[str, ...] = (
+    "series_code",
+    "name_j",
+    "name_en",
+    "unit_j",
+    "unit_en",
+    "frequency",
+    "category_j",
+    "category_en",
+    "layer1",
+    "layer2",
+    "layer3",
+    "layer4",
+    "layer5",
+    "start_of_time_series",
+    "end_of_time_series",
+    "last_update",
+    "notes_j",
+    "notes_en",
+)
+
+# Low-cardinality columns whose values repeat across most rows of a DB.
+_INTERNED_COLUMNS: frozenset[str] = frozenset(
+    {
+        "db",
+        "unit_j",
+        "unit_en",
+        "frequency",
+        "category_j",
+        "category_en",
+        "start_of_time_series",
+        "end_of_time_series",
+        "last_update",
+        "notes_j",
+        "notes_en",
+    }
+)
+
 
 def table_to_entries(table: pa.Table) -> tuple[SeriesCatalogEntry, ...]:
     ensure_required_columns(table.column_names)
 
     entries: list[SeriesCatalogEntry] = []
-    for row in table.to_pylist():
-        entries.append(row_to_entry(row))
+    # Convert in bounded batches so the transient row dicts never cover the
+    # whole table at once.
+    for batch in table.to_batches(max_chunksize=_CONVERSION_BATCH_ROWS):
+        for row in batch.to_pylist():
+            entries.append(row_to_entry(row))
     return tuple(entries)
 
 
@@ -71,10 +120,41 @@ def row_to_entry(row: dict[str, Any]) -> SeriesCatalogEntry:
     )
 
 
+def table_to_metadata_entries(table: pa.Table) -> tuple[MetadataEntry, ...]:
+    """Rebuild ``getMetadata`` entries from catalog or metadata snapshot rows.
+
+    The ``db`` column is not needed. Rows keep their table order, so a
+    ``LayerIndex`` built from ``table`` also indexes the returned entries.
+    """
+    # Entries carry no DB code, so the catalog's ``db`` column is optional.
+    ensure_required_columns(["db", *table.column_names])
+
+    # Validate whole columns up front; zipping Python lists is much cheaper
+    # than checking every value of every row dict.
+    columns: list[list[Any]] = []
+    for column in _METADATA_ENTRY_COLUMNS:
+        values = table[column]
+        is_int = column in _LAYER_COLUMNS
+        type_ok = (
+            pa.types.is_integer(values.type)
+            if is_int
+            else pa.types.is_string(values.type)
+            or pa.types.is_large_string(values.type)
+        )
+        if not type_ok or values.null_count:
+            kind = "an integer" if is_int else "a string"
+            raise ValueError(f"{column}: must be {kind}")
+        columns.append(values.to_pylist())
+
+    return tuple(MetadataEntry(*row) for row in zip(*columns))
+
+
 def _required_str(row: dict[str, Any], field: str) -> str:
     value = row[field]
     if not isinstance(value, str):
         raise ValueError(f"{field}: must be a string")
+    if field in _INTERNED_COLUMNS:
+        return sys.intern(value)
     return value
 
 
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import operator
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, overload
+
+import pyarrow as pa
+
+from boj_stat_search.core.catalog_parser import (
+    REQUIRED_COLUMNS,
+    ensure_required_columns,
+    row_to_entry,
+)
+from boj_stat_search.core.dataframes import table_to_pandas, table_to_polars
+from boj_stat_search.core.models import SeriesCatalogEntry
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
+_LAYER_COLUMNS: frozenset[str] = frozenset(
+    ("layer1", "layer2", "layer3", "layer4", "layer5")
+)
+_ITER_BATCH_ROWS = 1024
+
+CATALOG_TABLE_SCHEMA = pa.schema(
+    [
+        pa.field(column, pa.int64() if column in _LAYER_COLUMNS else pa.string())
+        for column in REQUIRED_COLUMNS
+    ]
+)
+
+
+class SeriesCatalogResult(Sequence[SeriesCatalogEntry]):
+    """Read-only view over catalog rows that builds entries only when accessed.
+
+    Supports ``len``, indexing, slicing and iteration like the tuple it
+    replaces. Slices are views over the same Arrow buffers, and ``to_arrow``
+    returns the underlying table without copying.
+    """
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table: pa.Table) -> None:
+        ensure_catalog_table(table)
+        self._table = table
+
+    @classmethod
+    def empty(cls) -> SeriesCatalogResult:
+        return cls._from_checked(CATALOG_TABLE_SCHEMA.empty_table())
+
+    @classmethod
+    def _from_checked(cls, table: pa.Table) -> SeriesCatalogResult:
+        result = cls.__new__(cls)
+        result._table = table
+        return result
+
+    def __len__(self) -> int:
+        return self._table.num_rows
+
+    @overload
+    def __getitem__(self, index: int) -> SeriesCatalogEntry: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> SeriesCatalogResult: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> SeriesCatalogEntry | SeriesCatalogResult:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self._from_checked(
+                    self._table.slice(start, max(stop - start, 0))
+                )
+            positions = pa.array(range(start, stop, step), type=pa.int64())
+            return self._from_checked(self._table.take(positions))
+
+        position = operator.index(index)
+        if position < 0:
+            position += len(self)
+        if position < 0 or position >= len(self):
+            raise IndexError("SeriesCatalogResult index out of range")
+        return row_to_entry(self._table.slice(position, 1).to_pylist()[0])
+
+    def __iter__(self) -> Iterator[SeriesCatalogEntry]:
+        for batch in self._table.to_batches(max_chunksize=_ITER_BATCH_ROWS):
+            for row in batch.to_pylist():
+                yield row_to_entry(row)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SeriesCatalogResult):
+            if self._table is other._table:
+                return True
+        elif not isinstance(other, (tuple, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            left == right for left, right in zip(self, other)
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"SeriesCatalogResult({len(self)} entries)"
+
+    def to_arrow(self) -> pa.Table:
+        """Return the underlying Arrow table (no copy)."""
+        return self._table
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Return the rows as a pandas DataFrame. Requires ``pandas``."""
+        return table_to_pandas(self._table)
+
+    def to_polars(self) -> pl.DataFrame:
+        """Return the rows as a polars DataFrame (no copy). Requires ``polars``."""
+        return table_to_polars(self._table)
+
+
+def ensure_catalog_table(table: pa.Table) -> None:
+    """Check column presence, types and nulls so lazy access cannot fail later."""
+    ensure_required_columns(table.column_names)
+    for column in REQUIRED_COLUMNS:
+        data_type = table.schema.field(column).type
+        if column in _LAYER_COLUMNS:
+            valid = pa.types.is_integer(data_type)
+            message = f"{column}: must be an integer"
+        else:
+            valid = pa.types.is_string(data_type) or pa.types.is_large_string(data_type)
+            message = f"{column}: must be a string"
+        if not valid or table[column].null_count > 0:
+            raise ValueError(message)
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from boj_stat_search.core.models import DataResponse
+from boj_stat_search.core.time_index import observation_dates
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DATA_TABLE_SCHEMA = pa.schema(
+    [
+        pa.field("series_code", pa.string()),
+        pa.field("frequency", pa.string()),
+        pa.field("survey_date", pa.int64()),
+        pa.field("value", pa.float64()),
+    ]
+)
+
+
+def data_response_to_table(response: DataResponse) -> pa.Table:
+    """Flatten a data response into one row per observation."""
+    batches = [
+        series_to_batch(entry)
+        for entry in response.result_set
+        if isinstance(entry.get("VALUES"), dict)
+    ]
+    if not batches:
+        return DATA_TABLE_SCHEMA.empty_table()
+    return pa.Table.from_batches(batches, schema=DATA_TABLE_SCHEMA)
+
+
+def data_table_to_wide(table: pa.Table) -> pa.Table:
+    """Pivot a long data table into one row per date and one column per series.
+
+    ``table`` has the columns of ``DATA_TABLE_SCHEMA``, optionally with the
+    ``date`` column added by ``DataResponse.to_arrow()``. The ``date`` column
+    of the result is the sorted union of every series' dates; series columns
+    follow their first appearance and are null where a series has no
+    observation. If a series repeats a date, its first observation wins.
+    """
+    dates = table["date"] if "date" in table.column_names else observation_dates(table)
+    long = pa.table(
+        {
+            "series_code": table["series_code"],
+            "date": dates,
+            "value": table["value"],
+        }
+    ).filter(pc.is_valid(dates))
+
+    unique_dates = pc.unique(long["date"])
+    wide_dates = unique_dates.take(pc.array_sort_indices(unique_dates))
+    series = pc.dictionary_encode(long["series_code"]).combine_chunks()
+    row_count = len(wide_dates)
+    series_count = len(series.dictionary)
+
+    # Each observation's cell in the column-major grid of series x dates.
+    cells = pc.add(
+        pc.multiply(series.indices.cast(pa.int64()), row_count),
+        pc.index_in(long["date"].combine_chunks(), value_set=wide_dates).cast(
+            pa.int64()
+        ),
+    )
+    grid = _scatter_indices(cells, row_count * series_count)
+    values = long["value"].combine_chunks().take(grid)
+
+    return pa.Table.from_arrays(
+        [
+            wide_dates,
+            *(
+                values.slice(index * row_count, row_count)
+                for index in range(series_count)
+            ),
+        ],
+        names=["date", *series.dictionary.to_pylist()],
+    )
+
+
+def wide_table_to_numpy(wide: pa.Table) -> np.ndarray:
+    """Return the series columns of a ``data_table_to_wide`` result as a 2-D array.
+
+    Rows follow the ``date`` column and columns follow the series columns;
+    missing observations are NaN. Requires ``numpy``.
+    """
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise ImportError("wide_table_to_numpy requires the numpy package") from exc
+
+    columns = [
+        pc.fill_null(wide[name], float("nan")).to_numpy()
+        for name in wide.column_names
+        if name != "date"
+    ]
+    if not columns:
+        return np.empty((wide.num_rows, 0), dtype=np.float64)
+    return np.column_stack(columns).astype(np.float64, copy=False)
+
+
+def table_to_ipc_bytes(table: pa.Table, *, compression: str | None = None) -> bytes:
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def table_from_ipc_bytes(buffer: bytes) -> pa.Table:
+    with pa.ipc.open_stream(pa.py_buffer(buffer)) as reader:
+        return reader.read_all()
+
+
+def series_to_batch(entry: dict[str, Any]) -> pa.RecordBatch:
+    """One ``DATA_TABLE_SCHEMA`` batch for a series entry of a data response."""
+    values = entry["VALUES"]
+    survey_dates = _to_array(values.get("SURVEY_DATES") or [], pa.int64())
+    observations = _to_array(values.get("VALUES") or [], pa.float64())
+    if len(survey_dates) != len(observations):
+        raise ValueError(
+            "VALUES: SURVEY_DATES and VALUES must have the same length "
+            f"for series {entry.get('SERIES_CODE', '')}"
+        )
+
+    length = len(survey_dates)
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.repeat(pa.scalar(str(entry.get("SERIES_CODE", ""))), length),
+            pa.repeat(pa.scalar(str(entry.get("FREQUENCY", ""))), length),
+            survey_dates,
+            observations,
+        ],
+        schema=DATA_TABLE_SCHEMA,
+    )
+
+
+def _scatter_indices(cells: pa.Array, size: int) -> pa.Array:
+    """For each of ``size`` slots, the first index into ``cells`` naming it.
+
+    Slots no cell names are null. ``cells`` is sorted (stably, so the first of
+    any repeats wins) and run-end decoded into, for every slot, the next
+    occupied slot at or after it; a slot is occupied when that is itself.
+    """
+    if len(cells) == 0:
+        return pa.nulls(size, pa.int64())
+
+    order = pc.sort_indices(cells).cast(pa.int64())
+    sorted_cells = cells.take(order)
+    if len(sorted_cells) > 1:
+        first = pc.not_equal(
+            sorted_cells.slice(1), sorted_cells.slice(0, len(sorted_cells) - 1)
+        )
+        first = pa.concat_arrays([pa.array([True]), first])
+        sorted_cells = sorted_cells.filter(first)
+        order = order.filter(first)
+
+    run_ends = pc.add(sorted_cells, 1)
+    if sorted_cells[-1].as_py() < size - 1:
+        run_ends = pa.concat_arrays([run_ends, pa.array([size], pa.int64())])
+        sorted_cells = pa.concat_arrays([sorted_cells, pa.nulls(1, pa.int64())])
+        order = pa.concat_arrays([order, pa.nulls(1, pa.int64())])
+
+    next_cell = pc.run_end_decode(
+        pa.RunEndEncodedArray.from_arrays(run_ends, sorted_cells)
+    )
+    next_index = pc.run_end_decode(pa.RunEndEncodedArray.from_arrays(run_ends, order))
+    return pc.if_else(pc.equal(next_cell, _positions(size)), next_index, None)
+
+
+def _positions(length: int) -> pa.Array:
+    """``0, 1, ..., length - 1`` as an int64 array."""
+    ones = pa.repeat(pa.scalar(1, pa.int64()), length)
+    return pc.subtract(pc.cumulative_sum(ones), 1)
+
+
+def _to_array(values: Sequence[Any], arrow_type: pa.DataType) -> pa.Array:
+    try:
+        return pa.array(values, type=arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Fall back to Arrow's string parsing for payloads that quote numbers.
+        return pa.array(
+            [None if value is None else str(value) for value in values],
+            type=pa.string(),
+        ).cast(arrow_type)
@@ -0,0 +1,177 @@
+"""Month ranges of series observations, for caching ``getDataCode`` results.
+
+Ranges are inclusive pairs of month indexes (``year * 12 + month - 1``) in
+which periods start. A request's ``startDate``/``endDate`` maps to the range
+of the periods it asks for, so coverage of series with different
+frequencies can be compared and extended the same way.
+"""
+
+from __future__ import annotations
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from boj_stat_search.core.time_index import (
+    PERIOD_MONTHS,
+    resolve_frequency,
+    survey_dates_to_months,
+)
+from boj_stat_search.core.types import Frequency, Period
+
+MonthRange = tuple[int, int]
+
+# Bounds standing in for a missing startDate or endDate.
+OPEN_START = -(10**9)
+OPEN_END = 10**9
+
+OBSERVATION_SCHEMA = pa.schema(
+    [
+        pa.field("survey_date", pa.int64()),
+        pa.field("value", pa.float64()),
+    ]
+)
+
+
+def request_months(
+    start_date: Period | str | None,
+    end_date: Period | str | None,
+    frequency: Frequency | str,
+) -> MonthRange:
+    """Return the months a ``startDate``/``endDate`` pair asks for.
+
+    Dates use the request notation of ``frequency`` (``YYYY`` for annual,
+    ``YYYYHH``, ``YYYYQQ`` or ``YYYYMM`` otherwise); a missing bound is open.
+    """
+    resolved = resolve_frequency(frequency)
+    return (
+        OPEN_START if start_date is None else _period_months(start_date, resolved)[0],
+        OPEN_END if end_date is None else _period_months(end_date, resolved)[1],
+    )
+
+
+def request_dates(
+    months: MonthRange, frequency: Frequency | str
+) -> tuple[str | None, str | None]:
+    """Return the ``startDate``/``endDate`` values that request ``months``."""
+    resolved = resolve_frequency(frequency)
+    start, end = months
+    return (
+        None if start <= OPEN_START else period_value(start, resolved),
+        None if end >= OPEN_END else period_value(end, resolved),
+    )
+
+
+def request_value_months(
+    values: pa.Array | pa.ChunkedArray, frequency: Frequency | str
+) -> tuple[pa.Array, pa.Array]:
+    """Return the first and last month of each request-notation value.
+
+    Values are read like the bounds of ``request_months``, column-wise; weekly
+    and daily ``YYYYMMDD`` dates give the month they fall in. Values that are
+    not all digits give null.
+    """
+    length, offset = _layout(resolve_frequency(frequency))
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    digits = pc.if_else(pc.utf8_is_digit(values), values, None)
+    year = pc.utf8_slice_codeunits(digits, 0, 4).cast(pa.int64())
+    part = pc.if_else(
+        pc.greater(pc.utf8_length(digits), 4),
+        pc.utf8_slice_codeunits(digits, 4, 6),
+        "01",
+    ).cast(pa.int64())
+    first = pc.add(
+        pc.add(pc.multiply(year, 12), offset),
+        pc.multiply(pc.subtract(part, 1), length),
+    )
+    return first, pc.add(first, length - 1)
+
+
+def missing_ranges(
+    coverage: MonthRange | None, requested: MonthRange
+) -> list[MonthRange]:
+    """Return the ranges to fetch so ``coverage`` extends over ``requested``.
+
+    Only the edges outside ``coverage`` are returned. A request that does not
+    touch ``coverage`` also fetches the gap between them, so the coverage
+    stays one contiguous range.
+    """
+    if coverage is None:
+        return [requested]
+    missing: list[MonthRange] = []
+    if requested[0] < coverage[0]:
+        missing.append((requested[0], coverage[0] - 1))
+    if requested[1] > coverage[1]:
+        missing.append((coverage[1] + 1, requested[1]))
+    return missing
+
+
+def merge_ranges(coverage: MonthRange | None, fetched: MonthRange) -> MonthRange:
+    if coverage is None:
+        return fetched
+    return min(coverage[0], fetched[0]), max(coverage[1], fetched[1])
+
+
+def merge_observations(cached: pa.Table, fetched: pa.Table) -> pa.Table:
+    """Merge two ``OBSERVATION_SCHEMA`` tables into one sorted by survey date.
+
+    Where both hold a survey date, the ``fetched`` value wins, so revisions
+    replace what was cached.
+    """
+    combined = pa.concat_tables(
+        [
+            fetched.select(OBSERVATION_SCHEMA.names),
+            cached.select(OBSERVATION_SCHEMA.names),
+        ]
+    )
+    combined = combined.take(pc.sort_indices(combined["survey_date"]))
+    dates = combined["survey_date"].combine_chunks()
+    if len(dates) < 2:
+        return combined
+    first = pc.not_equal(dates.slice(1), dates.slice(0, len(dates) - 1))
+    return combined.filter(pa.concat_arrays([pa.array([True]), first]))
+
+
+def select_months(
+    table: pa.Table, frequency: Frequency | str, months: MonthRange
+) -> pa.Table:
+    """Keep the observations whose period starts within ``months``."""
+    start_months = survey_dates_to_months(table["survey_date"], frequency)
+    return table.filter(
+        pc.and_(
+            pc.greater_equal(start_months, months[0]),
+            pc.less_equal(start_months, months[1]),
+        )
+    )
+
+
+def period_value(month: int, frequency: Frequency | str) -> str:
+    """Return the request value of the ``frequency`` period holding ``month``.
+
+    Weekly and daily periods are requested by month, so they give ``YYYYMM``.
+    """
+    length, offset = _layout(resolve_frequency(frequency))
+    index = (month - offset) // length
+    per_year = 12 // length
+    year, part = divmod(index, per_year)
+    if per_year == 1:
+        return f"{year:04d}"
+    return f"{year:04d}{part + 1:02d}"
+
+
+def _period_months(value: Period | str, frequency: Frequency) -> MonthRange:
+    period = value if isinstance(value, Period) else Period(value)
+    # Weekly and daily requests take YYYYMM bounds, validated as such.
+    text = period.to_api_value(frequency)
+    length, offset = _layout(frequency)
+    year = int(text[:4])
+    part = int(text[4:]) if len(text) > 4 else 1
+    first = year * 12 + offset + (part - 1) * length
+    return first, first + length - 1
+
+
+def _layout(frequency: Frequency) -> tuple[int, int]:
+    """Months per request period and the month periods are aligned to."""
+    length, offset = PERIOD_MONTHS[frequency]
+    # Weekly and daily requests are bounded by months.
+    return max(length, 1), offset
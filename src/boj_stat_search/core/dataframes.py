@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pyarrow as pa
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
+
+def table_to_pandas(table: pa.Table) -> pd.DataFrame:
+    """Convert an Arrow table to a pandas DataFrame. Requires ``pandas``.
+
+    Columns are kept as separate blocks instead of being consolidated, so
+    numeric columns without nulls can share Arrow's buffers. ``date32``
+    columns become ``datetime64`` rather than Python ``date`` objects.
+    """
+    try:
+        import pandas  # noqa: F401
+    except ImportError as exc:
+        raise ImportError("to_pandas requires the pandas package") from exc
+
+    return table.to_pandas(split_blocks=True, date_as_object=False)
+
+
+def table_to_polars(table: pa.Table) -> pl.DataFrame:
+    """Convert an Arrow table to a polars DataFrame. Requires ``polars``.
+
+    polars reads Arrow memory directly, so the conversion does not copy
+    column data.
+    """
+    try:
+        import polars
+    except ImportError as exc:
+        raise ImportError("to_polars requires the polars package") from exc
+
+    return polars.DataFrame(table)
@@ -1,9 +1,18 @@
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+
+from boj_stat_search.core.layer_index import LayerIndex
 from boj_stat_search.core.types import Layer
-from boj_stat_search.core.models import MetadataEntry
+from boj_stat_search.core.models import DataResponse, MetadataEntry, PhaseTimings
 
 
 _MAX_LAYER_DEPTH = 5
 
+# Columns of the CSV data output, one row per observation.
+DATA_CSV_COLUMNS = ("series_code", "frequency", "survey_date", "value")
+
 
 def _entry_layer_path(entry: MetadataEntry) -> tuple[str, ...]:
     values = (
@@ -57,52 +66,105 @@ def _parse_layer_filter(layer: Layer | str | None) -> tuple[str, ...] | None:
     return tuple(tokens)
 
 
-def _matches_layer_filter(
-    path: tuple[str, ...],
-    layer_filter: tuple[str, ...] | None,
-) -> bool:
-    if layer_filter is None:
-        return True
-    if len(layer_filter) > len(path):
-        return False
-
-    for idx, filter_token in enumerate(layer_filter):
-        if filter_token == "*":
-            continue
-        if path[idx] != filter_token:
-            return False
-    return True
-
-
 def _format_path(path: tuple[str, ...]) -> str:
     if not path:
         return "0"
     return ",".join(path)
 
 
+def layer_index_for_entries(
+    metadata_entries: tuple[MetadataEntry, ...],
+) -> tuple[tuple[MetadataEntry, ...], LayerIndex]:
+    """Sort entries into tree order once, returning them with their layer index.
+
+    Pass both to ``format_layer_tree`` to render several filters without
+    re-sorting.
+    """
+    sorted_entries = tuple(
+        sorted(
+            metadata_entries,
+            key=lambda entry: (
+                entry.layer1,
+                entry.layer2,
+                entry.layer3,
+                entry.layer4,
+                entry.layer5,
+                entry.series_code,
+                _choose_label(entry),
+            ),
+        )
+    )
+    paths = [
+        (entry.layer1, entry.layer2, entry.layer3, entry.layer4, entry.layer5)
+        for entry in sorted_entries
+    ]
+    return sorted_entries, LayerIndex.from_paths(paths)
+
+
 def format_layer_tree(
     metadata_entries: tuple[MetadataEntry, ...],
     layer: Layer | str | None = None,
+    *,
+    layer_index: LayerIndex | None = None,
+    max_depth: int | None = None,
+    collapse: Iterable[str] = (),
 ) -> str:
+    return "\n".join(
+        iter_layer_tree(
+            metadata_entries,
+            layer,
+            layer_index=layer_index,
+            max_depth=max_depth,
+            collapse=collapse,
+        )
+    )
+
+
+def iter_layer_tree(
+    metadata_entries: tuple[MetadataEntry, ...],
+    layer: Layer | str | None = None,
+    *,
+    layer_index: LayerIndex | None = None,
+    max_depth: int | None = None,
+    collapse: Iterable[str] = (),
+) -> Iterator[str]:
+    """Yield the lines of ``format_layer_tree`` one at a time.
+
+    Entries deeper than ``max_depth``, or below a layer path listed in
+    ``collapse`` (e.g. ``"1,2"``), are not rendered; each hidden subtree is
+    summarized by a single ``... (N more)`` line.
+    """
     layer_filter = _parse_layer_filter(layer)
+    if max_depth is not None and (
+        isinstance(max_depth, bool)
+        or not isinstance(max_depth, int)
+        or not 1 <= max_depth <= _MAX_LAYER_DEPTH
+    ):
+        raise ValueError("max_depth: must be an integer between 1 and 5")
+    collapsed = _parse_collapse(collapse)
 
-    sorted_entries = sorted(
-        metadata_entries,
-        key=lambda entry: (
-            entry.layer1,
-            entry.layer2,
-            entry.layer3,
-            entry.layer4,
-            entry.layer5,
-            entry.series_code,
-            _choose_label(entry),
-        ),
-    )
+    if layer_index is None:
+        sorted_entries, layer_index = layer_index_for_entries(metadata_entries)
+    else:
+        if len(layer_index) != len(metadata_entries):
+            raise ValueError("layer_index: must be built from metadata_entries")
+        sorted_entries = metadata_entries
 
-    lines: list[str] = []
-    for entry in sorted_entries:
+    hidden_under: tuple[str, ...] | None = None
+    hidden_count = 0
+    for position in layer_index.rows(layer_filter, stop_at_zero=True).to_pylist():
+        entry = sorted_entries[position]
         path = _entry_layer_path(entry)
-        if not _matches_layer_filter(path, layer_filter):
+
+        hidden_key = _hidden_key(path, max_depth=max_depth, collapsed=collapsed)
+        if hidden_key is not None and hidden_key == hidden_under:
+            hidden_count += 1
+            continue
+        if hidden_count:
+            yield _summary_line(hidden_under, hidden_count)
+        hidden_under, hidden_count = hidden_key, 0
+        if hidden_key is not None:
+            hidden_count = 1
             continue
 
         label = _choose_label(entry)
@@ -112,6 +174,102 @@ def format_layer_tree(
             text = label
 
         indent = "  " * max(len(path) - 1, 0)
-        lines.append(f"{indent}- ({_format_path(path)}) {text}")
+        yield f"{indent}- ({_format_path(path)}) {text}"
 
+    if hidden_count:
+        yield _summary_line(hidden_under, hidden_count)
+
+
+def _parse_collapse(collapse: Iterable[str]) -> frozenset[tuple[str, ...]]:
+    if isinstance(collapse, str):
+        raise ValueError("collapse: must be an iterable of layer paths")
+
+    paths: set[tuple[str, ...]] = set()
+    for raw in collapse:
+        if not isinstance(raw, str):
+            raise ValueError("collapse: each path must be a string")
+        tokens = tuple(token.strip() for token in raw.split(","))
+        if not 1 <= len(tokens) <= _MAX_LAYER_DEPTH or not all(
+            token.isdigit() and str(int(token)) == token for token in tokens
+        ):
+            raise ValueError("collapse: each path must be comma-separated digits")
+        paths.add(tokens)
+    return frozenset(paths)
+
+
+def _hidden_key(
+    path: tuple[str, ...],
+    *,
+    max_depth: int | None,
+    collapsed: frozenset[tuple[str, ...]],
+) -> tuple[str, ...] | None:
+    """Return the collapsed ancestor that hides ``path``, if any."""
+    for depth in range(1, len(path)):
+        if path[:depth] in collapsed:
+            return path[:depth]
+    if max_depth is not None and len(path) > max_depth:
+        return path[:max_depth]
+    return None
+
+
+def _summary_line(parent: tuple[str, ...] | None, count: int) -> str:
+    depth = len(parent) if parent is not None else 0
+    return f"{'  ' * depth}- ... ({count} more)"
+
+
+def format_phase_timings(endpoint: str, timings: PhaseTimings) -> str:
+    """Render one call's phase timings as milliseconds with their share of the total.
+
+    Phases the call never entered (no throttle, no DB lookup) are left out.
+    """
+    total = timings.total
+    lines = [f"profile {endpoint}"]
+    for name, seconds in timings.as_dict().items():
+        if seconds == 0:
+            continue
+        share = seconds / total * 100 if total else 0.0
+        lines.append(f"  {name:<10} {seconds * 1000:>10.2f} ms {share:>6.1f}%")
+    lines.append(f"  {'total':<10} {total * 1000:>10.2f} ms")
     return "\n".join(lines)
+
+
+def iter_data_ndjson(response: DataResponse) -> Iterator[str]:
+    """Yield one JSON line per series of a data response, newline included.
+
+    Each line is the series entry as the API returned it, ``VALUES`` and all.
+    """
+    for entry in response.result_set:
+        yield json.dumps(entry, ensure_ascii=False) + "\n"
+
+
+def iter_data_csv(response: DataResponse, *, header: bool = True) -> Iterator[str]:
+    """Yield the observations of a data response as CSV, one series per chunk.
+
+    Rows have the ``DATA_CSV_COLUMNS``; missing values are empty. With
+    ``header``, the column names come first as a chunk of their own.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(DATA_CSV_COLUMNS)
+        yield _drain(buffer)
+    for entry in response.result_set:
+        values = entry.get("VALUES")
+        if not isinstance(values, dict):
+            continue
+        code = entry.get("SERIES_CODE", "")
+        frequency = entry.get("FREQUENCY", "")
+        writer.writerows(
+            (code, frequency, date, "" if value is None else value)
+            for date, value in zip(
+                values.get("SURVEY_DATES") or (), values.get("VALUES") or ()
+            )
+        )
+        yield _drain(buffer)
+
+
+def _drain(buffer: io.StringIO) -> str:
+    text = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return text
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+LAYER_COLUMNS: tuple[str, ...] = ("layer1", "layer2", "layer3", "layer4", "layer5")
+
+
+@dataclass(frozen=True, slots=True)
+class LayerIndex:
+    """Rows sorted by layer path, searchable as an implicit trie.
+
+    Sorting by (layer1, ..., layer5) places every subtree in one contiguous
+    range, so ``ranges`` resolves a filter such as ``1,*,3`` by walking the
+    matching subtrees with binary searches instead of testing every row.
+    ``order`` maps tree positions back to the rows the index was built from.
+    """
+
+    order: pa.Array
+    levels: tuple[tuple[int, ...], ...]
+
+    @classmethod
+    def from_table(cls, table: pa.Table) -> LayerIndex:
+        """Index a catalog table, breaking layer ties by series code."""
+        sort_keys = [(column, "ascending") for column in LAYER_COLUMNS]
+        if "series_code" in table.column_names:
+            sort_keys.append(("series_code", "ascending"))
+        order = pc.sort_indices(table, sort_keys=sort_keys)
+        return cls(
+            order=order,
+            levels=tuple(
+                tuple(table[column].take(order).to_pylist()) for column in LAYER_COLUMNS
+            ),
+        )
+
+    @classmethod
+    def from_paths(cls, paths: Sequence[Sequence[int]]) -> LayerIndex:
+        """Index rows already in tree order, given their five layer values each."""
+        return cls(
+            order=pa.array(range(len(paths)), type=pa.int64()),
+            levels=tuple(tuple(path[depth] for path in paths) for depth in range(5)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def ranges(
+        self, layer_filter: Sequence[str], *, stop_at_zero: bool = False
+    ) -> list[tuple[int, int]]:
+        """Return tree-order ``(start, stop)`` ranges of rows matching ``layer_filter``.
+
+        Each token is digits or ``*``. Digit tokens must be canonical decimal
+        text, so ``01`` matches nothing. With ``stop_at_zero`` a layer value of
+        0 ends the path, so no token (not even ``*``) matches it.
+        """
+        spans = [(0, len(self))]
+        last_depth = len(layer_filter) - 1
+        for depth, token in enumerate(layer_filter):
+            column = self.levels[depth]
+            next_spans: list[tuple[int, int]] = []
+            if token == "*":
+                for start, stop in spans:
+                    if stop_at_zero:
+                        start = bisect_right(column, 0, start, stop)
+                    if depth == last_depth:
+                        if start < stop:
+                            next_spans.append((start, stop))
+                        continue
+                    # Deeper levels are only sorted within one child subtree.
+                    while start < stop:
+                        child_stop = bisect_right(column, column[start], start, stop)
+                        next_spans.append((start, child_stop))
+                        start = child_stop
+            else:
+                value = int(token)
+                if str(value) != token or (stop_at_zero and value == 0):
+                    return []
+                for start, stop in spans:
+                    low = bisect_left(column, value, start, stop)
+                    high = bisect_right(column, value, low, stop)
+                    if low < high:
+                        next_spans.append((low, high))
+            spans = next_spans
+            if not spans:
+                break
+        return spans
+
+    def rows(
+        self, layer_filter: Sequence[str] | None, *, stop_at_zero: bool = False
+    ) -> pa.Array:
+        """Return positions of matching rows, in tree order."""
+        if layer_filter is None:
+            return self.order
+        spans = self.ranges(layer_filter, stop_at_zero=stop_at_zero)
+        if not spans:
+            return pa.array([], type=self.order.type)
+        return pa.concat_arrays(
+            [self.order.slice(start, stop - start) for start, stop in spans]
+        )
@@ -0,0 +1,407 @@
+"""Synthetic BOJ API responses for offline load and throughput testing.
+
+``mock_api_response`` answers ``getMetadata``, ``getDataCode`` and
+``getDataLayer`` requests from a deterministic ``MockDataset`` with the same
+JSON shapes, ``NEXTPOSITION`` paging and HTTP 400 error bodies as the live API.
+``boj_stat_search.shell.mock_server`` serves it through httpx.
+"""
+
+from __future__ import annotations
+
+import datetime
+import random
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from boj_stat_search.core.database import list_db
+
+FREQUENCY_NAMES: Mapping[str, str] = {
+    "CY": "ANNUAL",
+    "FY": "ANNUAL(MAR)",
+    "CH": "SEMIANNUAL",
+    "FH": "SEMIANNUAL(SEP)",
+    "Q": "QUARTERLY",
+    "M": "MONTHLY",
+    "W": "WEEKLY(MONDAY)",
+    "D": "DAILY",
+}
+
+_SUCCESS = (200, "M181000I", "Successfully completed")
+_INVALID_PARAMETERS = (400, "M181001E", "Invalid input parameters")
+_INVALID_DB = (400, "M181005E", "Invalid database name")
+_INVALID_FREQUENCY = (400, "M181018E", "Invalid frequency")
+
+_LAST_UPDATE = 20260220
+# Months that start each period of the sub-annual frequencies.
+_PERIOD_MONTHS: Mapping[str, tuple[int, ...]] = {
+    "CH": (1, 7),
+    "FH": (4, 10),
+    "Q": (1, 4, 7, 10),
+    "M": tuple(range(1, 13)),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class MockSeries:
+    code: str
+    frequency: str
+    layers: tuple[int, int, int, int, int]
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class MockDataset:
+    """Shape of the synthetic catalog served for every DB.
+
+    Each DB holds ``series_per_db`` series, cycling through ``frequencies`` and
+    arranged ``fanout`` wide under three layers with unnamed header rows, as
+    ``getMetadata`` reports them. Values are a seeded random walk, so the same
+    dataset always serves the same bytes.
+    """
+
+    series_per_db: int = 300
+    frequencies: tuple[str, ...] = ("M", "Q")
+    fanout: int = 10
+    start_year: int = 2000
+    end_year: int = 2025
+    page_size: int = 255
+    max_codes: int = 250
+    seed: int = 0
+    dbs: tuple[str, ...] | None = None
+
+    def __post_init__(self) -> None:
+        for name in ("series_per_db", "fanout", "page_size", "max_codes"):
+            value = getattr(self, name)
+            if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                raise ValueError(f"{name}: must be a positive integer")
+        if not self.frequencies or any(
+            frequency not in FREQUENCY_NAMES for frequency in self.frequencies
+        ):
+            raise ValueError(
+                "frequencies: must be a non-empty tuple of "
+                + ", ".join(FREQUENCY_NAMES)
+            )
+        if self.start_year > self.end_year:
+            raise ValueError("start_year: must be <= end_year")
+
+    def has_db(self, db: str) -> bool:
+        if self.dbs is not None:
+            return db in self.dbs
+        return any(db_info.name == db for db_info in list_db())
+
+    def series(self, db: str) -> tuple[MockSeries, ...]:
+        """Series of ``db`` in layer order."""
+        return _dataset_series(self, db)
+
+    def observations(
+        self, db: str, series: MockSeries
+    ) -> tuple[tuple[int, ...], tuple[float | None, ...]]:
+        """Survey dates and values of one series."""
+        return _series_observations(self, db, series)
+
+
+def mock_api_response(
+    dataset: MockDataset,
+    path: str,
+    params: Mapping[str, str],
+    *,
+    date: str,
+) -> tuple[int, dict[str, Any]]:
+    """Return the HTTP status and JSON body the API would send for a request.
+
+    ``path`` is matched on its last segment and parameter names are
+    case-insensitive, as in the live API. ``date`` fills the ``DATE`` field.
+    """
+    endpoint = path.rstrip("/").rsplit("/", 1)[-1].lower()
+    query = {key.lower(): value for key, value in params.items()}
+
+    db = query.get("db", "").upper()
+    if endpoint not in ("getmetadata", "getdatacode", "getdatalayer"):
+        return 404, _status_body((404, "", "Not Found"), date)
+    if not db or not dataset.has_db(db):
+        return 400, _status_body(_INVALID_DB, date)
+
+    if endpoint == "getmetadata":
+        return 200, _metadata_body(dataset, db, date)
+    if endpoint == "getdatacode":
+        return _data_code_response(dataset, db, query, date)
+    return _data_layer_response(dataset, db, query, date)
+
+
+def _status_body(status: tuple[int, str, str], date: str) -> dict[str, Any]:
+    code, message_id, message = status
+    return {"STATUS": code, "MESSAGEID": message_id, "MESSAGE": message, "DATE": date}
+
+
+def _error(status: tuple[int, str, str], date: str) -> tuple[int, dict[str, Any]]:
+    return status[0], _status_body(status, date)
+
+
+def _metadata_body(dataset: MockDataset, db: str, date: str) -> dict[str, Any]:
+    result_set: list[dict[str, Any]] = []
+    seen_headers: set[tuple[int, ...]] = set()
+    for series in dataset.series(db):
+        for depth in (1, 2):
+            header = series.layers[:depth]
+            if header not in seen_headers:
+                seen_headers.add(header)
+                result_set.append(_metadata_header(header))
+        dates, _ = dataset.observations(db, series)
+        result_set.append(_metadata_series(series, dates))
+    return {**_status_body(_SUCCESS, date), "DB": db, "RESULTSET": result_set}
+
+
+def _metadata_header(layers: tuple[int, ...]) -> dict[str, Any]:
+    padded = (*layers, *(0,) * (5 - len(layers)))
+    label = ".".join(str(value) for value in layers)
+    entry: dict[str, Any] = {
+        "SERIES_CODE": "",
+        "NAME_OF_TIME_SERIES_J": f"見出し {label}",
+        "NAME_OF_TIME_SERIES": f"Group {label}",
+    }
+    for key in ("UNIT", "FREQUENCY", "CATEGORY"):
+        entry[f"{key}_J"] = ""
+        entry[key] = ""
+    entry.update({f"LAYER{depth}": padded[depth - 1] for depth in range(1, 6)})
+    for key in ("START_OF_THE_TIME_SERIES", "END_OF_THE_TIME_SERIES", "LAST_UPDATE"):
+        entry[key] = ""
+    entry["NOTES_J"] = ""
+    entry["NOTES"] = ""
+    return entry
+
+
+def _metadata_series(series: MockSeries, dates: tuple[int, ...]) -> dict[str, Any]:
+    entry: dict[str, Any] = {
+        "SERIES_CODE": series.code,
+        "NAME_OF_TIME_SERIES_J": f"合成系列 {series.code}",
+        "NAME_OF_TIME_SERIES": series.name,
+        "UNIT_J": "億円",
+        "UNIT": "100 million yen",
+        "FREQUENCY": FREQUENCY_NAMES[series.frequency],
+        "CATEGORY_J": "合成データ",
+        "CATEGORY": "Synthetic data",
+    }
+    entry.update({f"LAYER{depth}": series.layers[depth - 1] for depth in range(1, 6)})
+    entry.update(
+        {
+            "START_OF_THE_TIME_SERIES": str(dates[0]) if dates else "",
+            "END_OF_THE_TIME_SERIES": str(dates[-1]) if dates else "",
+            "LAST_UPDATE": str(_LAST_UPDATE),
+            "NOTES_J": "",
+            "NOTES": "",
+        }
+    )
+    return entry
+
+
+def _data_code_response(
+    dataset: MockDataset, db: str, query: Mapping[str, str], date: str
+) -> tuple[int, dict[str, Any]]:
+    codes = [code.strip() for code in query.get("code", "").split(",")]
+    if not codes or any(not code for code in codes) or len(codes) > dataset.max_codes:
+        return _error(_INVALID_PARAMETERS, date)
+
+    by_code = {series.code: series for series in dataset.series(db)}
+    if any(code not in by_code for code in codes):
+        return _error(_INVALID_PARAMETERS, date)
+
+    parameter = {
+        "DB": db,
+        "CODE": query.get("code", ""),
+        **_echo_dates_and_position(query),
+    }
+    return _data_page(
+        dataset, db, [by_code[code] for code in codes], query, parameter, date
+    )
+
+
+def _data_layer_response(
+    dataset: MockDataset, db: str, query: Mapping[str, str], date: str
+) -> tuple[int, dict[str, Any]]:
+    frequency = query.get("frequency", "").upper()
+    if frequency not in FREQUENCY_NAMES:
+        return _error(_INVALID_FREQUENCY, date)
+
+    tokens = [token.strip() for token in query.get("layer", "").split(",")]
+    if not 1 <= len(tokens) <= 5 or any(
+        token != "*" and not token.isdigit() for token in tokens
+    ):
+        return _error(_INVALID_PARAMETERS, date)
+
+    selected = [
+        series
+        for series in dataset.series(db)
+        if series.frequency == frequency
+        and all(
+            token == "*" or int(token) == value
+            for token, value in zip(tokens, series.layers)
+        )
+    ]
+    parameter = {
+        "DB": db,
+        "FREQUENCY": frequency,
+        **{f"LAYER{depth}": token for depth, token in enumerate(tokens, start=1)},
+        **_echo_dates_and_position(query),
+    }
+    return _data_page(dataset, db, selected, query, parameter, date)
+
+
+def _echo_dates_and_position(query: Mapping[str, str]) -> dict[str, str]:
+    return {
+        "STARTDATE": query.get("startdate", ""),
+        "ENDDATE": query.get("enddate", ""),
+        "STARTPOSITION": query.get("startposition", ""),
+    }
+
+
+def _data_page(
+    dataset: MockDataset,
+    db: str,
+    selected: list[MockSeries],
+    query: Mapping[str, str],
+    parameter: dict[str, str],
+    date: str,
+) -> tuple[int, dict[str, Any]]:
+    raw_position = query.get("startposition", "") or "1"
+    if not raw_position.isdigit() or int(raw_position) < 1:
+        return _error(_INVALID_PARAMETERS, date)
+    start = int(raw_position)
+
+    page = selected[start - 1 : start - 1 + dataset.page_size]
+    result_set: list[dict[str, Any]] = []
+    for series in page:
+        try:
+            low = _date_bound(query.get("startdate", ""), series.frequency, end=False)
+            high = _date_bound(query.get("enddate", ""), series.frequency, end=True)
+        except ValueError:
+            return _error(_INVALID_PARAMETERS, date)
+
+        dates, values = dataset.observations(db, series)
+        kept = [
+            index
+            for index, survey_date in enumerate(dates)
+            if low <= _month_index(survey_date, series.frequency) <= high
+        ]
+        result_set.append(
+            {
+                "SERIES_CODE": series.code,
+                "NAME_OF_TIME_SERIES": series.name,
+                "UNIT": "100 million yen",
+                "FREQUENCY": FREQUENCY_NAMES[series.frequency],
+                "CATEGORY": "Synthetic data",
+                "LAST_UPDATE": _LAST_UPDATE,
+                "VALUES": {
+                    "SURVEY_DATES": [dates[index] for index in kept],
+                    "VALUES": [values[index] for index in kept],
+                },
+            }
+        )
+
+    next_index = start - 1 + len(page)
+    return 200, {
+        **_status_body(_SUCCESS, date),
+        "PARAMETER": parameter,
+        "NEXTPOSITION": next_index + 1 if next_index < len(selected) else None,
+        "RESULTSET": result_set,
+    }
+
+
+def _month_index(survey_date: int, frequency: str) -> int:
+    """Months since year 0 of the month a survey date falls in."""
+    if frequency in ("CY", "FY"):
+        return survey_date * 12 + (3 if frequency == "FY" else 0)
+    if frequency in ("W", "D"):
+        survey_date //= 100
+    return (survey_date // 100) * 12 + survey_date % 100 - 1
+
+
+def _date_bound(value: str, frequency: str, *, end: bool) -> int:
+    """Month index a ``startDate``/``endDate`` value starts (or ends) at."""
+    if not value:
+        return 10**9 if end else -(10**9)
+    if not value.isdigit():
+        raise ValueError("date: must be digits")
+
+    year = int(value[:4])
+    if frequency in ("CY", "FY"):
+        if len(value) != 4:
+            raise ValueError("date: must be YYYY")
+        first = year * 12 + (3 if frequency == "FY" else 0)
+        return first + 11 if end else first
+
+    if len(value) != 6:
+        raise ValueError("date: must be six digits")
+    part = int(value[4:])
+    if frequency in ("CH", "FH"):
+        if part not in (1, 2):
+            raise ValueError("date: half must be 01 or 02")
+        first = year * 12 + (3 if frequency == "FH" else 0) + (part - 1) * 6
+        return first + 5 if end else first
+    if frequency == "Q":
+        if not 1 <= part <= 4:
+            raise ValueError("date: quarter must be 01 to 04")
+        first = year * 12 + (part - 1) * 3
+        return first + 2 if end else first
+    if not 1 <= part <= 12:
+        raise ValueError("date: month must be 01 to 12")
+    return year * 12 + part - 1
+
+
+@lru_cache(maxsize=64)
+def _dataset_series(dataset: MockDataset, db: str) -> tuple[MockSeries, ...]:
+    fanout = dataset.fanout
+    series: list[MockSeries] = []
+    for index in range(dataset.series_per_db):
+        layers = (
+            index // (fanout * fanout) + 1,
+            index // fanout % fanout + 1,
+            index % fanout + 1,
+            0,
+            0,
+        )
+        series.append(
+            MockSeries(
+                code=f"{db}X{index + 1:05d}",
+                frequency=dataset.frequencies[index % len(dataset.frequencies)],
+                layers=layers,
+                name=f"Synthetic series {index + 1} of {db}",
+            )
+        )
+    return tuple(series)
+
+
+@lru_cache(maxsize=4096)
+def _series_observations(
+    dataset: MockDataset, db: str, series: MockSeries
+) -> tuple[tuple[int, ...], tuple[float | None, ...]]:
+    dates = _survey_dates(series.frequency, dataset.start_year, dataset.end_year)
+    rng = random.Random(f"{dataset.seed}:{db}:{series.code}")
+    level = rng.uniform(10, 1000)
+    values: list[float | None] = []
+    for _ in dates:
+        level *= 1 + rng.gauss(0, 0.01)
+        values.append(None if rng.random() < 0.01 else round(level, 3))
+    return dates, tuple(values)
+
+
+def _survey_dates(frequency: str, start_year: int, end_year: int) -> tuple[int, ...]:
+    years = range(start_year, end_year + 1)
+    if frequency in ("CY", "FY"):
+        return tuple(years)
+    if frequency in _PERIOD_MONTHS:
+        return tuple(
+            year * 100 + month for year in years for month in _PERIOD_MONTHS[frequency]
+        )
+
+    day = datetime.date(start_year, 1, 1)
+    last = datetime.date(end_year, 12, 31)
+    if frequency == "W":
+        day += datetime.timedelta(days=-day.weekday() % 7)
+    dates: list[int] = []
+    while day <= last:
+        if frequency == "W" or day.weekday() < 5:
+            dates.append(day.year * 10000 + day.month * 100 + day.day)
+        day += datetime.timedelta(days=7 if frequency == "W" else 1)
+    return tuple(dates)
@@ -1,5 +1,11 @@
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, Literal, overload
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
 
 
 @dataclass(frozen=True)
@@ -9,7 +15,7 @@ class DbInfo:
     category: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetadataEntry:
     series_code: str
     name_of_time_series_j: str
@@ -31,7 +37,7 @@ class MetadataEntry:
     notes: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SeriesCatalogEntry:
     db: str
     series_code: str
@@ -54,6 +60,26 @@ class SeriesCatalogEntry:
     notes_en: str
 
 
+@dataclass(frozen=True, slots=True)
+class PhaseTimings:
+    """Seconds spent in each phase of one API call, in execution order."""
+
+    throttle: float = 0.0
+    resolve_db: float = 0.0
+    build_url: float = 0.0
+    validate: float = 0.0
+    network: float = 0.0
+    decode: float = 0.0
+    parse: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return sum(getattr(self, item.name) for item in fields(self))
+
+    def as_dict(self) -> dict[str, float]:
+        return {item.name: getattr(self, item.name) for item in fields(self)}
+
+
 @dataclass(frozen=True)
 class BaseResponse:
     status: int
@@ -66,6 +92,7 @@ class BaseResponse:
 class MetadataResponse(BaseResponse):
     db: str
     result_set: tuple[MetadataEntry, ...]
+    timings: PhaseTimings | None = field(default=None, compare=False, repr=False)
 
 
 @dataclass(frozen=True)
@@ -73,3 +100,50 @@ class DataResponse(BaseResponse):
     parameter: dict[str, Any]
     next_position: int | None
     result_set: tuple[dict[str, Any], ...]
+    timings: PhaseTimings | None = field(default=None, compare=False, repr=False)
+
+    def to_arrow(self) -> "pa.Table":
+        """One row per observation, with the period start of each as ``date``.
+
+        Columns are those of ``DATA_TABLE_SCHEMA`` followed by a ``date32``
+        ``date`` column derived from ``survey_date`` and the series frequency.
+        """
+        from boj_stat_search.core.columnar import data_response_to_table
+        from boj_stat_search.core.time_index import observation_dates
+
+        table = data_response_to_table(self)
+        return table.append_column("date", observation_dates(table))
+
+    @overload
+    def to_wide(self, *, as_numpy: Literal[False] = False) -> "pa.Table": ...
+
+    @overload
+    def to_wide(self, *, as_numpy: Literal[True]) -> "np.ndarray": ...
+
+    def to_wide(self, *, as_numpy: bool = False) -> "pa.Table | np.ndarray":
+        """Align all series on the union of their dates, one column per series.
+
+        Returns an Arrow table with a ``date32`` ``date`` column followed by one
+        ``float64`` column per series code (null where a series has no
+        observation). With ``as_numpy=True`` returns only the values as a 2-D
+        NumPy array with NaN fill instead, which requires ``numpy``.
+        """
+        from boj_stat_search.core.columnar import (
+            data_table_to_wide,
+            wide_table_to_numpy,
+        )
+
+        wide = data_table_to_wide(self.to_arrow())
+        return wide_table_to_numpy(wide) if as_numpy else wide
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """The ``to_arrow()`` table as a pandas DataFrame. Requires ``pandas``."""
+        from boj_stat_search.core.dataframes import table_to_pandas
+
+        return table_to_pandas(self.to_arrow())
+
+    def to_polars(self) -> "pl.DataFrame":
+        """The ``to_arrow()`` table as a polars DataFrame. Requires ``polars``."""
+        from boj_stat_search.core.dataframes import table_to_polars
+
+        return table_to_polars(self.to_arrow())
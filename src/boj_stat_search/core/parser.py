@@ -1,26 +1,32 @@
+import sys
 from typing import Any
 
 from boj_stat_search.core.models import DataResponse, MetadataEntry, MetadataResponse
 
 
+def _interned_str(raw: dict[str, Any], key: str) -> str:
+    # Units, categories and dates repeat across most entries of a DB.
+    return sys.intern(str(raw.get(key, "")))
+
+
 def _parse_metadata_entry(raw: dict[str, Any]) -> MetadataEntry:
     return MetadataEntry(
         series_code=str(raw.get("SERIES_CODE", "")),
         name_of_time_series_j=str(raw.get("NAME_OF_TIME_SERIES_J", "")),
         name_of_time_series=str(raw.get("NAME_OF_TIME_SERIES", "")),
-        unit_j=str(raw.get("UNIT_J", "")),
-        unit=str(raw.get("UNIT", "")),
-        frequency=str(raw.get("FREQUENCY", "")),
-        category_j=str(raw.get("CATEGORY_J", "")),
-        category=str(raw.get("CATEGORY", "")),
+        unit_j=_interned_str(raw, "UNIT_J"),
+        unit=_interned_str(raw, "UNIT"),
+        frequency=_interned_str(raw, "FREQUENCY"),
+        category_j=_interned_str(raw, "CATEGORY_J"),
+        category=_interned_str(raw, "CATEGORY"),
         layer1=int(raw.get("LAYER1", 0)),
         layer2=int(raw.get("LAYER2", 0)),
         layer3=int(raw.get("LAYER3", 0)),
         layer4=int(raw.get("LAYER4", 0)),
         layer5=int(raw.get("LAYER5", 0)),
-        start_of_the_time_series=str(raw.get("START_OF_THE_TIME_SERIES", "")),
-        end_of_the_time_series=str(raw.get("END_OF_THE_TIME_SERIES", "")),
-        last_update=str(raw.get("LAST_UPDATE", "")),
+        start_of_the_time_series=_interned_str(raw, "START_OF_THE_TIME_SERIES"),
+        end_of_the_time_series=_interned_str(raw, "END_OF_THE_TIME_SERIES"),
+        last_update=_interned_str(raw, "LAST_UPDATE"),
         notes_j=str(raw.get("NOTES_J", "")),
         notes=str(raw.get("NOTES", "")),
     )
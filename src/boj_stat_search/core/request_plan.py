@@ -0,0 +1,213 @@
+"""Split large data pulls into date windows and code chunks.
+
+A query over many series and a long history comes back as a chain of
+``NEXTPOSITION`` pages that can only be fetched one after another. The
+catalog knows when each series starts and ends, so the same pull can be cut
+into ``getDataCode`` requests small enough to arrive in one page each. Those
+requests are independent, so they can be sent in parallel and stitched back
+together in plan order.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from boj_stat_search.core.catalog_result import SeriesCatalogResult
+from boj_stat_search.core.coverage import (
+    OPEN_END,
+    OPEN_START,
+    MonthRange,
+    period_value,
+    request_months,
+    request_value_months,
+)
+from boj_stat_search.core.models import DataResponse
+from boj_stat_search.core.time_index import (
+    PERIOD_MONTHS,
+    resolve_frequency,
+)
+from boj_stat_search.core.types import Frequency, Period
+
+MAX_CODES_PER_REQUEST = 250
+# Observations the API returns in one response before it starts paging.
+MAX_OBSERVATIONS_PER_REQUEST = 60_000
+
+# Observations per requested period; weekly and daily requests are bounded by
+# months, which hold about this many weeks or days.
+_OBSERVATIONS_PER_PERIOD: dict[Frequency, int] = {
+    Frequency.WEEKLY: 5,
+    Frequency.DAILY: 31,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PlannedRequest:
+    """One ``getDataCode`` call of a request plan."""
+
+    db: str
+    codes: tuple[str, ...]
+    frequency: Frequency
+    start_date: str | None
+    end_date: str | None
+
+
+def plan_data_requests(
+    catalog: SeriesCatalogResult | pa.Table,
+    start_date: Period | str | None = None,
+    end_date: Period | str | None = None,
+    *,
+    max_codes: int = MAX_CODES_PER_REQUEST,
+    max_observations: int = MAX_OBSERVATIONS_PER_REQUEST,
+) -> tuple[PlannedRequest, ...]:
+    """Plan the ``getDataCode`` calls that fetch ``catalog`` series over a range.
+
+    Series are grouped by DB and frequency in catalog order and split into
+    chunks of ``max_codes``. The range of each chunk, clipped to the
+    ``start_of_time_series``/``end_of_time_series`` of its series, is cut
+    into windows of about ``max_observations`` observations. The first and
+    last windows keep the requested bounds, so observations the catalog does
+    not know about yet are still fetched. Header rows without a series code
+    and series of unrecognized frequency are skipped.
+    """
+    if isinstance(max_codes, bool) or not isinstance(max_codes, int):
+        raise ValueError(f"max_codes: must be between 1 and {MAX_CODES_PER_REQUEST}")
+    if not 1 <= max_codes <= MAX_CODES_PER_REQUEST:
+        raise ValueError(f"max_codes: must be between 1 and {MAX_CODES_PER_REQUEST}")
+    if (
+        isinstance(max_observations, bool)
+        or not isinstance(max_observations, int)
+        or max_observations < 1
+    ):
+        raise ValueError("max_observations: must be a positive integer")
+
+    table = catalog.to_arrow() if isinstance(catalog, SeriesCatalogResult) else catalog
+    table = table.filter(pc.not_equal(table["series_code"], ""))
+    start_text = None if start_date is None else str(start_date)
+    end_text = None if end_date is None else str(end_date)
+
+    plan: list[PlannedRequest] = []
+    for db, frequency, rows in _frequency_groups(table):
+        requested = request_months(start_date, end_date, frequency)
+        codes = rows["series_code"].to_pylist()
+        # Catalog spans are written in request notation (YYYYQQ, YYYYHH, ...).
+        starts, _ = request_value_months(rows["start_of_time_series"], frequency)
+        _, ends = request_value_months(rows["end_of_time_series"], frequency)
+        per_period = _OBSERVATIONS_PER_PERIOD.get(frequency, 1)
+
+        for offset in range(0, len(codes), max_codes):
+            chunk = tuple(codes[offset : offset + max_codes])
+            span = _clip(
+                requested,
+                pc.min(starts.slice(offset, len(chunk))).as_py(),
+                pc.max(ends.slice(offset, len(chunk))).as_py(),
+            )
+            if span is None:
+                plan.append(PlannedRequest(db, chunk, frequency, start_text, end_text))
+                continue
+
+            # Windows hold whole periods; weekly and daily ones are months.
+            periods = max(1, max_observations // (len(chunk) * per_period))
+            step = max(PERIOD_MONTHS[frequency][0], 1) * periods
+            for window_start in range(span[0], span[1] + 1, step):
+                window_end = min(window_start + step - 1, span[1])
+                plan.append(
+                    PlannedRequest(
+                        db,
+                        chunk,
+                        frequency,
+                        start_text
+                        if window_start == span[0]
+                        else period_value(window_start, frequency),
+                        end_text
+                        if window_end == span[1]
+                        else period_value(window_end, frequency),
+                    )
+                )
+    return tuple(plan)
+
+
+def stitch_data_responses(
+    responses: Iterable[DataResponse],
+    *,
+    parameter: dict[str, Any] | None = None,
+) -> DataResponse:
+    """Merge the responses of a plan into one response.
+
+    Series keep the order they first appear in. Observations of a series
+    split over several date windows are concatenated in response order, so
+    pass the responses in plan order. Status fields come from the first
+    response, as does ``parameter`` unless one is given.
+    """
+    merged: dict[str, dict[str, Any]] = {}
+    first: DataResponse | None = None
+    for response in responses:
+        if first is None:
+            first = response
+        for entry in response.result_set:
+            code = str(entry.get("SERIES_CODE", ""))
+            values = entry.get("VALUES")
+            stitched = merged.get(code)
+            if stitched is None:
+                merged[code] = (
+                    {**entry, "VALUES": _copy_values(values)}
+                    if isinstance(values, dict)
+                    else dict(entry)
+                )
+                continue
+            if isinstance(values, dict) and isinstance(stitched.get("VALUES"), dict):
+                for key in ("SURVEY_DATES", "VALUES"):
+                    stitched["VALUES"][key].extend(values.get(key) or ())
+
+    if first is None:
+        raise ValueError("responses: must contain at least one response")
+    return DataResponse(
+        status=first.status,
+        message_id=first.message_id,
+        message=first.message,
+        date=first.date,
+        parameter=dict(first.parameter if parameter is None else parameter),
+        next_position=None,
+        result_set=tuple(merged.values()),
+    )
+
+
+def _frequency_groups(
+    table: pa.Table,
+) -> Sequence[tuple[str, Frequency, pa.Table]]:
+    """Rows of each DB and frequency pair, in order of first appearance."""
+    keys = pc.binary_join_element_wise(table["db"], table["frequency"], "\x1f")
+    encoded = pc.dictionary_encode(keys).combine_chunks()
+    groups: list[tuple[str, Frequency, pa.Table]] = []
+    for index, key in enumerate(encoded.dictionary.to_pylist()):
+        db, name = key.split("\x1f", 1)
+        try:
+            frequency = resolve_frequency(name)
+        except ValueError:
+            continue
+        rows = pc.indices_nonzero(pc.equal(encoded.indices, index))
+        groups.append((db, frequency, table.take(rows)))
+    return groups
+
+
+def _clip(
+    requested: MonthRange, low: int | None, high: int | None
+) -> MonthRange | None:
+    """Requested months within the catalog span, or None if unbounded or empty."""
+    start = requested[0] if low is None else max(requested[0], low)
+    end = requested[1] if high is None else min(requested[1], high)
+    if start <= OPEN_START or end >= OPEN_END or start > end:
+        return None
+    return start, end
+
+
+def _copy_values(values: dict[str, Any]) -> dict[str, Any]:
+    return {
+        **values,
+        "SURVEY_DATES": list(values.get("SURVEY_DATES") or ()),
+        "VALUES": list(values.get("VALUES") or ()),
+    }
@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+SEARCH_INDEX_VERSION = "3"
+SEARCH_INDEX_FIELDS: tuple[str, ...] = (
+    "name_j",
+    "name_en",
+    "category_j",
+    "category_en",
+    "notes_j",
+    "notes_en",
+)
+KEYWORD_FIELDS: tuple[str, ...] = (
+    "name_j",
+    "name_en",
+    "category_j",
+    "category_en",
+)
+
+# Runs are maximal sequences of letters and digits ("words" for English,
+# unbroken character sequences for Japanese).
+_RUN_PATTERN = re.compile(r"[^\W_]+")
+# Hiragana folds onto katakana, which catalog names use far more often.
+_KANA_FOLDING = {code: code + 0x60 for code in range(0x3041, 0x3097)}
+
+_SEARCH_INDEX_SCHEMA = pa.schema(
+    [
+        pa.field("series_code", pa.list_(pa.string())),
+        *(
+            field_
+            for name in SEARCH_INDEX_FIELDS
+            for field_ in (
+                pa.field(f"{name}.values", pa.list_(pa.string())),
+                pa.field(f"{name}.indices", pa.list_(pa.int32())),
+            )
+        ),
+        pa.field("runs", pa.list_(pa.string())),
+        pa.field("run_rows", pa.list_(pa.list_(pa.int32()))),
+        pa.field("grams", pa.list_(pa.string())),
+        pa.field("gram_runs", pa.list_(pa.list_(pa.int32()))),
+    ],
+    metadata={"boj_stat_search.search_index_version": SEARCH_INDEX_VERSION},
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchIndex:
+    """N-gram inverted index over the searchable text of one catalog table.
+
+    Two levels keep the index small: each distinct run of letters/digits maps to
+    the rows containing it (``run_rows``), and each n-gram maps to the runs that
+    contain it (``gram_runs``). Grams are character bigrams for text with
+    non-ASCII characters (Japanese) and trigrams for ASCII text (English).
+    ``fields`` holds the normalized text of each field in ``SEARCH_INDEX_FIELDS``
+    as dictionary arrays, so matching and counting run once per distinct value.
+    """
+
+    series_code: pa.Array
+    fields: tuple[pa.DictionaryArray, ...]
+    runs: pa.Array
+    run_rows: pa.ListArray
+    grams: pa.Array
+    gram_runs: pa.ListArray
+    _gram_positions: dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if len(self.fields) != len(SEARCH_INDEX_FIELDS):
+            raise ValueError("search index: must have one text array per field")
+        object.__setattr__(
+            self,
+            "_gram_positions",
+            {gram: position for position, gram in enumerate(self.grams.to_pylist())},
+        )
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.series_code)
+
+    def field_text(self, name: str) -> pa.DictionaryArray:
+        return self.fields[SEARCH_INDEX_FIELDS.index(name)]
+
+    def matches_table(self, table: pa.Table) -> bool:
+        """Return whether this index was built from ``table``'s rows, in order."""
+        if table.num_rows != self.num_rows:
+            return False
+        return self.series_code.equals(table["series_code"].combine_chunks())
+
+
+def normalize_search_text(text: str) -> str:
+    """Normalize text for matching: NFKC, case folding, then hiragana to katakana.
+
+    NFKC maps full-width letters/digits to ASCII and half-width katakana to
+    full-width, so "ＣＰＩ" matches "CPI" and "ﾏﾈｰ" matches "マネー".
+    """
+    if text.isascii():
+        return text.casefold()
+    return unicodedata.normalize("NFKC", text).casefold().translate(_KANA_FOLDING)
+
+
+def build_search_index(table: pa.Table) -> SearchIndex:
+    """Build a search index over ``SEARCH_INDEX_FIELDS`` of a catalog table."""
+    missing = [
+        name
+        for name in ("series_code", *SEARCH_INDEX_FIELDS)
+        if name not in table.column_names
+    ]
+    if missing:
+        raise ValueError(
+            "Catalog table is missing search index columns: " + ", ".join(missing)
+        )
+
+    run_ids: dict[str, int] = {}
+    fields: list[pa.DictionaryArray] = []
+    pair_rows: list[pa.Array] = []
+    pair_runs: list[pa.Array] = []
+
+    for name in SEARCH_INDEX_FIELDS:
+        # Work per distinct value: categories, notes and many names repeat.
+        text = table[name].combine_chunks().cast(pa.string())
+        encoded = pc.fill_null(text, "").dictionary_encode()
+        normalized_values: list[str] = []
+        value_offsets = [0]
+        value_runs: list[int] = []
+        for value in encoded.dictionary.to_pylist():
+            normalized = normalize_search_text(value)
+            normalized_values.append(normalized)
+            for run in dict.fromkeys(_RUN_PATTERN.findall(normalized)):
+                value_runs.append(run_ids.setdefault(run, len(run_ids)))
+            value_offsets.append(len(value_runs))
+
+        indices = encoded.indices.cast(pa.int32())
+        fields.append(
+            pa.DictionaryArray.from_arrays(
+                indices, pa.array(normalized_values, type=pa.string())
+            )
+        )
+        row_runs = pc.take(
+            pa.ListArray.from_arrays(
+                pa.array(value_offsets, type=pa.int32()),
+                pa.array(value_runs, type=pa.int32()),
+            ),
+            indices,
+        )
+        pair_rows.append(pc.list_parent_indices(row_runs).cast(pa.int32()))
+        pair_runs.append(pc.list_flatten(row_runs))
+
+    run_rows = _group_rows_by_run(
+        pa.concat_arrays(pair_runs), pa.concat_arrays(pair_rows), len(run_ids)
+    )
+
+    gram_to_runs: dict[str, list[int]] = {}
+    for run, run_id in run_ids.items():
+        for gram in _run_grams(run):
+            gram_to_runs.setdefault(gram, []).append(run_id)
+    grams = sorted(gram_to_runs)
+
+    return SearchIndex(
+        series_code=table["series_code"].combine_chunks(),
+        fields=tuple(fields),
+        runs=pa.array(list(run_ids), type=pa.string()),
+        run_rows=run_rows,
+        grams=pa.array(grams, type=pa.string()),
+        gram_runs=_list_array([gram_to_runs[gram] for gram in grams]),
+    )
+
+
+def search_index_rows(
+    index: SearchIndex,
+    terms: Sequence[str],
+    *,
+    fields: Sequence[str] = KEYWORD_FIELDS,
+) -> pa.Array:
+    """Return ascending row positions where every term occurs in one of ``fields``."""
+    normalized_terms = [normalize_search_text(term) for term in terms]
+
+    candidates: pa.Array | None = None
+    for term in normalized_terms:
+        rows = search_index_candidates(index, term)
+        if rows is None:
+            continue
+        candidates = rows if candidates is None else _intersect(candidates, rows)
+        if len(candidates) == 0:
+            return candidates
+
+    if candidates is None:
+        candidates = pa.array(range(index.num_rows), type=pa.int32())
+
+    mask = pa.repeat(pa.scalar(True), len(candidates))
+    for term in normalized_terms:
+        term_mask = pa.repeat(pa.scalar(False), len(candidates))
+        for name in fields:
+            text = index.field_text(name)
+            matched = pc.match_substring(text.dictionary, term).take(
+                text.indices.take(candidates)
+            )
+            term_mask = pc.or_(term_mask, matched)
+        mask = pc.and_(mask, term_mask)
+    return candidates.filter(mask)
+
+
+def search_index_candidates(index: SearchIndex, term: str) -> pa.Array | None:
+    """Return ascending rows that may contain ``term``, or None if unconstrained.
+
+    ``term`` must already be normalized. The result is a superset of the rows
+    containing it in any indexed field; callers confirm matches against
+    ``SearchIndex.fields``.
+    """
+    runs = _RUN_PATTERN.findall(term)
+    if not runs:
+        return None
+
+    candidates: pa.Array | None = None
+    for run in runs:
+        grams = _run_grams(run)
+        if grams:
+            run_ids: pa.Array | None = None
+            for gram in grams:
+                position = index._gram_positions.get(gram)
+                if position is None:
+                    return pa.array([], type=pa.int32())
+                gram_run_ids = index.gram_runs[position].values
+                run_ids = (
+                    gram_run_ids
+                    if run_ids is None
+                    else _intersect(run_ids, gram_run_ids)
+                )
+        else:
+            # Too short for any gram: scan the (small) run vocabulary instead.
+            run_ids = pc.indices_nonzero(pc.match_substring(index.runs, run))
+
+        assert run_ids is not None
+        rows = pc.unique(pc.list_flatten(index.run_rows.take(run_ids)))
+        rows = rows.take(pc.sort_indices(rows)).cast(pa.int32())
+        candidates = rows if candidates is None else _intersect(candidates, rows)
+    return candidates
+
+
+def search_index_to_table(index: SearchIndex) -> pa.Table:
+    """Pack an index into a one-row table suitable for Arrow IPC files."""
+    columns = [_single_list(index.series_code)]
+    for text in index.fields:
+        columns.append(_single_list(text.dictionary))
+        columns.append(_single_list(text.indices))
+    columns.extend(
+        _single_list(values)
+        for values in (index.runs, index.run_rows, index.grams, index.gram_runs)
+    )
+    return pa.Table.from_arrays(columns, schema=_SEARCH_INDEX_SCHEMA)
+
+
+def search_index_from_table(table: pa.Table) -> SearchIndex:
+    metadata = table.schema.metadata or {}
+    version = metadata.get(b"boj_stat_search.search_index_version")
+    if version != SEARCH_INDEX_VERSION.encode() or table.num_rows != 1:
+        raise ValueError("search index: unsupported format or version")
+
+    def values(name: str) -> pa.Array:
+        return table[name].combine_chunks().values
+
+    return SearchIndex(
+        series_code=values("series_code"),
+        fields=tuple(
+            pa.DictionaryArray.from_arrays(
+                values(f"{name}.indices"), values(f"{name}.values")
+            )
+            for name in SEARCH_INDEX_FIELDS
+        ),
+        runs=values("runs"),
+        run_rows=values("run_rows"),
+        grams=values("grams"),
+        gram_runs=values("gram_runs"),
+    )
+
+
+def _run_grams(run: str) -> set[str]:
+    grams: set[str] = set()
+    for start in range(len(run) - 1):
+        gram = run[start : start + 2]
+        if not gram.isascii():
+            grams.add(gram)
+    for start in range(len(run) - 2):
+        gram = run[start : start + 3]
+        if gram.isascii():
+            grams.add(gram)
+    return grams
+
+
+def _intersect(left: pa.Array, right: pa.Array) -> pa.Array:
+    # Hash the shorter list, scan the longer one; order of the scanned list is kept.
+    if len(left) > len(right):
+        left, right = right, left
+    return right.filter(pc.is_in(right, value_set=left))
+
+
+def _group_rows_by_run(runs: pa.Array, rows: pa.Array, run_count: int) -> pa.ListArray:
+    pairs = pa.table({"run": runs, "row": rows}).sort_by(
+        [("run", "ascending"), ("row", "ascending")]
+    )
+    sorted_runs = pairs["run"].combine_chunks()
+    sorted_rows = pairs["row"].combine_chunks()
+
+    if len(sorted_runs) > 1:
+        # The same run can come from several fields of one row.
+        is_new = pc.or_(
+            pc.not_equal(sorted_runs[1:], sorted_runs[:-1]),
+            pc.not_equal(sorted_rows[1:], sorted_rows[:-1]),
+        )
+        keep = pa.concat_arrays([pa.array([True]), is_new])
+        sorted_runs = sorted_runs.filter(keep)
+        sorted_rows = sorted_rows.filter(keep)
+
+    counts = pc.value_counts(sorted_runs).field("counts")
+    if len(counts) != run_count:
+        raise ValueError("search index: every run must occur in at least one row")
+    offsets = pa.concat_arrays(
+        [pa.array([0], type=pa.int64()), pc.cumulative_sum(counts)]
+    ).cast(pa.int32())
+    return pa.ListArray.from_arrays(offsets, sorted_rows)
+
+
+def _list_array(lists: Iterable[list[int]]) -> pa.ListArray:
+    offsets = [0]
+    values: list[int] = []
+    for items in lists:
+        values.extend(items)
+        offsets.append(len(values))
+    return pa.ListArray.from_arrays(
+        pa.array(offsets, type=pa.int32()), pa.array(values, type=pa.int32())
+    )
+
+
+def _single_list(values: pa.Array) -> pa.ListArray:
+    return pa.ListArray.from_arrays(pa.array([0, len(values)], type=pa.int32()), values)
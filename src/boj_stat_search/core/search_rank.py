@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from boj_stat_search.core.search_index import (
+    SEARCH_INDEX_FIELDS,
+    SearchIndex,
+    normalize_search_text,
+    search_index_candidates,
+)
+
+DEFAULT_FIELD_WEIGHTS: Mapping[str, float] = MappingProxyType(
+    {
+        "name_j": 3.0,
+        "name_en": 3.0,
+        "category_j": 1.0,
+        "category_en": 1.0,
+        "notes_j": 0.5,
+        "notes_en": 0.5,
+    }
+)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+@dataclass(frozen=True, slots=True)
+class TermMatches:
+    """Per-field term counts for the rows that contain at least one query term.
+
+    ``counts[t][f]`` and ``lengths[f]`` are aligned with ``rows`` and follow the
+    order of ``SEARCH_INDEX_FIELDS``. ``num_rows`` and ``length_totals`` describe
+    the whole indexed table and feed BM25's IDF and length normalization.
+    """
+
+    rows: pa.Array
+    counts: tuple[tuple[pa.Array, ...], ...]
+    lengths: tuple[pa.Array, ...]
+    num_rows: int
+    length_totals: tuple[int, ...]
+
+    def offset(self, start: int) -> TermMatches:
+        """Shift row positions, e.g. when the index covers one segment of a table."""
+        return TermMatches(
+            rows=pc.add(self.rows, start),
+            counts=self.counts,
+            lengths=self.lengths,
+            num_rows=self.num_rows,
+            length_totals=self.length_totals,
+        )
+
+    @classmethod
+    def concat(cls, parts: Sequence[TermMatches]) -> TermMatches:
+        """Combine matches from several indexes into one collection."""
+        if not parts:
+            raise ValueError("parts: must not be empty")
+        term_count = len(parts[0].counts)
+        if any(len(part.counts) != term_count for part in parts):
+            raise ValueError("parts: must all have the same number of terms")
+
+        field_range = range(len(SEARCH_INDEX_FIELDS))
+        return cls(
+            rows=pa.concat_arrays([part.rows for part in parts]),
+            counts=tuple(
+                tuple(
+                    pa.concat_arrays([part.counts[term][f] for part in parts])
+                    for f in field_range
+                )
+                for term in range(term_count)
+            ),
+            lengths=tuple(
+                pa.concat_arrays([part.lengths[f] for part in parts])
+                for f in field_range
+            ),
+            num_rows=sum(part.num_rows for part in parts),
+            length_totals=tuple(
+                sum(part.length_totals[f] for part in parts) for f in field_range
+            ),
+        )
+
+
+def match_search_terms(index: SearchIndex, terms: Sequence[str]) -> TermMatches:
+    """Count occurrences of each term in each field for rows matching any term."""
+    normalized_terms = [normalize_search_text(term) for term in terms]
+    if not normalized_terms:
+        raise ValueError("terms: must not be empty")
+
+    candidate_sets: list[pa.Array] = []
+    for term in normalized_terms:
+        rows = search_index_candidates(index, term)
+        if rows is None:
+            rows = pa.array(range(index.num_rows), type=pa.int32())
+        candidate_sets.append(rows)
+    candidates = pc.unique(pa.concat_arrays(candidate_sets))
+    candidates = candidates.take(pc.sort_indices(candidates))
+
+    row_indices = [text.indices.take(candidates) for text in index.fields]
+    counts = tuple(
+        tuple(
+            pc.count_substring(text.dictionary, term).take(indices)
+            for text, indices in zip(index.fields, row_indices)
+        )
+        for term in normalized_terms
+    )
+
+    matched = pa.repeat(pa.scalar(False), len(candidates))
+    for term_counts in counts:
+        for field_counts in term_counts:
+            matched = pc.or_(matched, pc.greater(field_counts, 0))
+
+    dictionary_lengths = [pc.utf8_length(text.dictionary) for text in index.fields]
+    return TermMatches(
+        rows=candidates.filter(matched).cast(pa.int64()),
+        counts=tuple(
+            tuple(field_counts.filter(matched) for field_counts in term_counts)
+            for term_counts in counts
+        ),
+        lengths=tuple(
+            lengths.take(indices).filter(matched)
+            for lengths, indices in zip(dictionary_lengths, row_indices)
+        ),
+        num_rows=index.num_rows,
+        length_totals=tuple(
+            pc.sum(lengths.take(text.indices)).as_py() or 0
+            for lengths, text in zip(dictionary_lengths, index.fields)
+        ),
+    )
+
+
+def score_term_matches(
+    matches: TermMatches,
+    *,
+    field_weights: Mapping[str, float] | None = None,
+    k1: float = BM25_K1,
+    b: float = BM25_B,
+) -> pa.Array:
+    """Return BM25F scores aligned with ``matches.rows``.
+
+    Term frequencies are combined across fields with ``field_weights`` and
+    normalized by each field's length relative to its average, then saturated
+    once per term, so a term repeated across fields cannot dominate the score.
+    """
+    weights = resolve_field_weights(field_weights)
+    scores = pa.repeat(pa.scalar(0.0), len(matches.rows))
+    if matches.num_rows == 0:
+        return scores
+
+    for term_counts in matches.counts:
+        weighted = pa.repeat(pa.scalar(0.0), len(matches.rows))
+        present = pa.repeat(pa.scalar(False), len(matches.rows))
+        for f, name in enumerate(SEARCH_INDEX_FIELDS):
+            present = pc.or_(present, pc.greater(term_counts[f], 0))
+            weight = weights[name]
+            if weight == 0:
+                continue
+            average_length = matches.length_totals[f] / matches.num_rows
+            normalization: pa.Array | float = 1.0
+            if average_length > 0:
+                normalization = pc.add(
+                    1 - b,
+                    pc.multiply(
+                        b / average_length, matches.lengths[f].cast(pa.float64())
+                    ),
+                )
+            weighted = pc.add(
+                weighted,
+                pc.divide(
+                    pc.multiply(term_counts[f].cast(pa.float64()), weight),
+                    normalization,
+                ),
+            )
+
+        document_frequency = pc.sum(present.cast(pa.int64())).as_py() or 0
+        idf = math.log(
+            1
+            + (matches.num_rows - document_frequency + 0.5) / (document_frequency + 0.5)
+        )
+        scores = pc.add(
+            scores,
+            pc.multiply(pc.divide(weighted, pc.add(weighted, k1)), idf),
+        )
+    return scores
+
+
+def top_ranked(rows: pa.Array, scores: pa.Array, limit: int | None = None) -> pa.Table:
+    """Return ``row``/``score`` pairs by descending score, ties in row order.
+
+    With ``limit``, only the best ``limit`` pairs are selected and sorted.
+    """
+    if limit is not None and limit < 0:
+        raise ValueError("limit: must be >= 0")
+
+    table = pa.table({"row": rows, "score": scores})
+    sort_keys = [("score", "descending"), ("row", "ascending")]
+    if limit is None or limit >= table.num_rows:
+        return table.take(pc.sort_indices(table, sort_keys=sort_keys))
+    if limit == 0:
+        return table.slice(0, 0)
+    selected = table.take(pc.select_k_unstable(table, k=limit, sort_keys=sort_keys))
+    return selected.take(pc.sort_indices(selected, sort_keys=sort_keys))
+
+
+def resolve_field_weights(
+    field_weights: Mapping[str, float] | None,
+) -> dict[str, float]:
+    """Merge ``field_weights`` over ``DEFAULT_FIELD_WEIGHTS`` after validating it."""
+    weights = dict(DEFAULT_FIELD_WEIGHTS)
+    if field_weights is None:
+        return weights
+
+    for name, weight in field_weights.items():
+        if name not in weights:
+            raise ValueError(
+                "field_weights: keys must be one of " + ", ".join(SEARCH_INDEX_FIELDS)
+            )
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)):
+            raise ValueError("field_weights: weights must be numbers")
+        if weight < 0:
+            raise ValueError("field_weights: weights must be >= 0")
+        weights[name] = float(weight)
+    return weights
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import datetime
+from collections.abc import Mapping
+from functools import lru_cache
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from boj_stat_search.core.types import Frequency, Period
+
+# Months per period and the month (0 = January) periods are aligned to.
+# Weekly and daily periods are days, so they have no month layout.
+PERIOD_MONTHS: Mapping[Frequency, tuple[int, int]] = {
+    Frequency.CALENDAR_YEAR: (12, 0),
+    Frequency.FISCAL_YEAR: (12, 3),
+    Frequency.CALENDAR_HALF: (6, 0),
+    Frequency.FISCAL_HALF: (6, 3),
+    Frequency.QUARTERLY: (3, 0),
+    Frequency.MONTHLY: (1, 0),
+    Frequency.WEEKLY: (0, 0),
+    Frequency.DAILY: (0, 0),
+}
+
+# The FREQUENCY names the API reports on series, next to the request codes.
+_SERIES_FREQUENCIES: Mapping[str, Frequency] = {
+    "ANNUAL": Frequency.CALENDAR_YEAR,
+    "ANNUAL(MAR)": Frequency.FISCAL_YEAR,
+    "SEMIANNUAL": Frequency.CALENDAR_HALF,
+    "SEMIANNUAL(SEP)": Frequency.FISCAL_HALF,
+    "QUARTERLY": Frequency.QUARTERLY,
+    "MONTHLY": Frequency.MONTHLY,
+    "WEEKLY": Frequency.WEEKLY,
+    "DAILY": Frequency.DAILY,
+}
+
+_EPOCH_YEAR = 1970
+# 1970-01-01 was a Thursday; shifting by 3 days makes weeks start on Monday.
+_WEEK_SHIFT = 3
+# Keeps week arithmetic non-negative for dates before 1970 (Arrow truncates).
+_WEEK_BIAS = 7 * 1_000_000
+# Range of the month start lookup table.
+_MIN_YEAR = 1000
+_MAX_YEAR = 2999
+
+
+def resolve_frequency(value: Frequency | str) -> Frequency:
+    """Return the ``Frequency`` for a request code (``"Q"``) or series name.
+
+    Series names are the API's ``FREQUENCY`` values such as ``"QUARTERLY"``,
+    ``"ANNUAL(MAR)"`` or ``"WEEKLY(MONDAY)"``.
+    """
+    if isinstance(value, Frequency):
+        return value
+    text = value.strip().upper()
+    if text in Frequency._value2member_map_:
+        return Frequency(text)
+    if text in _SERIES_FREQUENCIES:
+        return _SERIES_FREQUENCIES[text]
+    if text.startswith("WEEKLY"):
+        return Frequency.WEEKLY
+    raise ValueError(f"frequency: unknown frequency {value!r}")
+
+
+def survey_dates_to_dates(
+    survey_dates: pa.Array | pa.ChunkedArray, frequency: Frequency | str
+) -> pa.Array:
+    """Convert ``SURVEY_DATES`` to the ``date32`` each period starts on.
+
+    ``YYYY``, ``YYYYMM`` and ``YYYYMMDD`` values are told apart by magnitude;
+    the frequency aligns them to period starts, so ``201005`` is 2010-04-01
+    for a quarterly series. Call ``to_numpy()`` on the result for
+    ``datetime64[D]`` values.
+    """
+    months, offset = PERIOD_MONTHS[resolve_frequency(frequency)]
+    start_months, day = _period_start_months(_as_int64(survey_dates), months, offset)
+    return _to_date32(_days_since_epoch(start_months, day))
+
+
+def survey_dates_to_ordinals(
+    survey_dates: pa.Array | pa.ChunkedArray, frequency: Frequency | str
+) -> pa.Array:
+    """Convert ``SURVEY_DATES`` to period ordinals counted from 1970.
+
+    Ordinals follow the pandas ``Period`` convention: years, halves, quarters
+    and months since the start of 1970 (fiscal periods count from the one
+    starting in 1970), days since 1970-01-01, and Monday-based weeks since the
+    week holding 1970-01-01.
+    """
+    resolved = resolve_frequency(frequency)
+    months, offset = PERIOD_MONTHS[resolved]
+    start_months, day = _period_start_months(_as_int64(survey_dates), months, offset)
+    if months == 0:
+        days = _days_since_epoch(start_months, day)
+        if resolved == Frequency.DAILY:
+            return days
+        return pc.subtract(
+            pc.divide(pc.add(days, _WEEK_SHIFT + _WEEK_BIAS), 7), _WEEK_BIAS // 7
+        )
+    if months == 1:
+        return pc.subtract(start_months, _EPOCH_YEAR * 12)
+    return pc.subtract(
+        pc.divide(pc.subtract(start_months, offset), months),
+        _EPOCH_YEAR * 12 // months,
+    )
+
+
+def survey_dates_to_months(
+    survey_dates: pa.Array | pa.ChunkedArray, frequency: Frequency | str
+) -> pa.Array:
+    """Return the month index (``year * 12 + month - 1``) each period starts in.
+
+    Weekly and daily survey dates give the month they fall in.
+    """
+    months, offset = PERIOD_MONTHS[resolve_frequency(frequency)]
+    start_months, _ = _period_start_months(_as_int64(survey_dates), months, offset)
+    return start_months
+
+
+def period_range(
+    start: Period | str, end: Period | str, frequency: Frequency | str
+) -> pa.Array:
+    """Return the ordinals of every ``frequency`` period from start to end.
+
+    Ordinals are those of ``survey_dates_to_ordinals``, and
+    ``Period.from_ordinal`` turns one back into a request value. Both bounds
+    are included. Strings are read in the notation of ``frequency`` and
+    periods of another frequency are converted with ``asfreq``. The result is
+    an ``int32`` array, empty when ``end`` precedes ``start``. Weekly and
+    daily periods are requested by month, so they have no ordinals and raise
+    ``ValueError``.
+    """
+    resolved = resolve_frequency(frequency)
+    first = _as_period(start, resolved).ordinal
+    last = _as_period(end, resolved).ordinal
+    # A running sum over ones builds the range in Arrow, not element by element.
+    ones = pa.repeat(pa.scalar(1, pa.int32()), max(last - first + 1, 0))
+    return pc.cumulative_sum(ones, start=pa.scalar(first - 1, pa.int32()))
+
+
+def observation_dates(table: pa.Table) -> pa.Array:
+    """Return the period start ``date32`` of every row of a data table.
+
+    Expects the ``frequency`` and ``survey_date`` columns of
+    ``DATA_TABLE_SCHEMA``. Rows mix frequencies, so each distinct
+    ``frequency`` value is resolved once and the conversion runs column-wise;
+    unrecognized frequencies keep the date the survey date spells out.
+    """
+    encoded = pc.dictionary_encode(table["frequency"]).combine_chunks()
+    layouts = []
+    for name in encoded.dictionary.to_pylist():
+        try:
+            layouts.append(PERIOD_MONTHS[resolve_frequency(name)])
+        except ValueError:
+            layouts.append((0, 0))
+
+    if len(set(layouts)) <= 1:
+        months, offset = layouts[0] if layouts else (0, 0)
+        start_months, day = _period_start_months(
+            _as_int64(table["survey_date"]), months, offset
+        )
+    else:
+        start_months, day = _period_start_months(
+            _as_int64(table["survey_date"]),
+            pa.array([layout[0] for layout in layouts], pa.int64()).take(
+                encoded.indices
+            ),
+            pa.array([layout[1] for layout in layouts], pa.int64()).take(
+                encoded.indices
+            ),
+        )
+    return _to_date32(_days_since_epoch(start_months, day))
+
+
+def _as_period(value: Period | str, frequency: Frequency) -> Period:
+    if not isinstance(value, Period):
+        return Period(value, frequency)
+    if value.frequency is None:
+        return Period(value.value, frequency)
+    return value.asfreq(frequency)
+
+
+def _as_int64(values: pa.Array | pa.ChunkedArray) -> pa.Array:
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    if values.type == pa.int64():
+        return values
+    return values.cast(pa.int64())
+
+
+def _to_date32(days: pa.Array) -> pa.Array:
+    return days.cast(pa.int32()).cast(pa.date32())
+
+
+def _split_survey_dates(
+    survey_dates: pa.Array, offset: pa.Array | int
+) -> tuple[pa.Array, pa.Array | int]:
+    """Month index (``year * 12 + month - 1``) and day of each survey date.
+
+    Year-only dates start at month ``offset``. Payloads use one layout per
+    series, so the layout is picked once from the value range; only mixed
+    arrays pay for per-row selection.
+    """
+    bounds = pc.min_max(survey_dates)
+    low, high = bounds["min"].as_py(), bounds["max"].as_py()
+    if low is not None and high < 10_000:
+        return pc.add(pc.multiply(survey_dates, 12), offset), 1
+    if low is not None and low >= 10_000 and high < 1_000_000:
+        return _year_month_index(survey_dates), 1
+    if low is None or low >= 1_000_000:
+        year_month = pc.divide(survey_dates, 100)
+        day = pc.subtract(survey_dates, pc.multiply(year_month, 100))
+        return _year_month_index(year_month), day
+
+    is_year = pc.less(survey_dates, 10_000)
+    is_month = pc.less(survey_dates, 1_000_000)
+    year_month = pc.if_else(is_month, survey_dates, pc.divide(survey_dates, 100))
+    month_index = pc.if_else(
+        is_year,
+        pc.add(pc.multiply(survey_dates, 12), offset),
+        _year_month_index(year_month),
+    )
+    day = pc.if_else(
+        is_month, 1, pc.subtract(survey_dates, pc.multiply(year_month, 100))
+    )
+    return month_index, day
+
+
+def _year_month_index(year_month: pa.Array) -> pa.Array:
+    year = pc.divide(year_month, 100)
+    # year * 12 + (month - 1), with month = year_month - year * 100.
+    return pc.subtract(pc.subtract(year_month, pc.multiply(year, 88)), 1)
+
+
+def _period_start_months(
+    survey_dates: pa.Array, months: pa.Array | int, offset: pa.Array | int
+) -> tuple[pa.Array, pa.Array | int]:
+    """Month index each period starts in, plus the day for day-level periods.
+
+    ``months`` of 0 marks day-level periods, which keep their own date.
+    """
+    month_index, day = _split_survey_dates(survey_dates, offset)
+    if isinstance(months, int):
+        if months <= 1:
+            return month_index, (day if months == 0 else 1)
+        aligned = pc.subtract(month_index, offset)
+        aligned = pc.subtract(aligned, _remainder(aligned, months))
+        return pc.add(aligned, offset), 1
+
+    day_level = pc.equal(months, 0)
+    step = pc.if_else(day_level, 1, months)
+    aligned = pc.subtract(month_index, offset)
+    aligned = pc.add(pc.subtract(aligned, _remainder(aligned, step)), offset)
+    return (
+        pc.if_else(day_level, month_index, aligned),
+        pc.if_else(day_level, day, 1),
+    )
+
+
+def _days_since_epoch(start_months: pa.Array, day: pa.Array | int) -> pa.Array:
+    bounds = pc.min_max(start_months)
+    low, high = bounds["min"].as_py(), bounds["max"].as_py()
+    if low is not None and (low < _MIN_YEAR * 12 or high >= (_MAX_YEAR + 1) * 12):
+        raise ValueError(
+            f"survey_date: year must be between {_MIN_YEAR} and {_MAX_YEAR}"
+        )
+    month_starts = _month_start_days().take(pc.subtract(start_months, _MIN_YEAR * 12))
+    if isinstance(day, int) and day == 1:
+        return month_starts
+    return pc.add(month_starts, pc.subtract(day, 1))
+
+
+@lru_cache(maxsize=1)
+def _month_start_days() -> pa.Array:
+    """Days since 1970-01-01 of the first of every month, from ``_MIN_YEAR``."""
+    epoch = datetime.date(_EPOCH_YEAR, 1, 1).toordinal()
+    return pa.array(
+        [
+            datetime.date(year, month, 1).toordinal() - epoch
+            for year in range(_MIN_YEAR, _MAX_YEAR + 1)
+            for month in range(1, 13)
+        ],
+        type=pa.int64(),
+    )
+
+
+def _remainder(values: pa.Array, divisor: pa.Array | int) -> pa.Array:
+    return pc.subtract(values, pc.multiply(pc.divide(values, divisor), divisor))
@@ -104,9 +104,21 @@ class Layer:
 
 @dataclass(frozen=True, slots=True, init=False)
 class Period:
+    """A ``startDate``/``endDate`` value, optionally tied to a frequency.
+
+    Periods with a frequency support arithmetic: adding an int moves by that
+    many periods, subtracting two periods gives the number of periods between
+    them, and periods of one frequency compare chronologically. The factory
+    methods attach the frequency their value is written in (CY, CH, Q, M),
+    overridable with the fiscal or weekly/daily counterpart. Equality and
+    hashing include the frequency, so ``Period.year(2025) != Period("2025")``;
+    compare ``value`` to ignore it.
+    """
+
     _value: str
+    _frequency: Frequency | None = None
 
-    def __init__(self, value: str) -> None:
+    def __init__(self, value: str, frequency: Frequency | str | None = None) -> None:
         if not isinstance(value, str):
             raise ValueError("period: must be a string")
         if not value.isdigit():
@@ -118,51 +130,119 @@ class Period:
             if tail < 1 or tail > 12:
                 raise ValueError("period: last two digits must be between 01 and 12")
         object.__setattr__(self, "_value", value)
+        resolved = None if frequency is None else _coerce_frequency(frequency)
+        if resolved is not None:
+            self.to_api_value(resolved)
+        object.__setattr__(self, "_frequency", resolved)
+
+    @classmethod
+    def from_string(
+        cls, value: str, frequency: Frequency | str | None = None
+    ) -> "Period":
+        return cls(value, frequency)
 
     @classmethod
-    def from_string(cls, value: str) -> "Period":
-        return cls(value)
+    def from_ordinal(cls, ordinal: int, frequency: Frequency | str) -> "Period":
+        """Return the period ``ordinal`` periods after the one starting 1970.
+
+        Ordinals are those of ``time_index.survey_dates_to_ordinals``. Weekly
+        and daily periods are requested by month, so they have none.
+        """
+        if isinstance(ordinal, bool) or not isinstance(ordinal, int):
+            raise ValueError("period: ordinal must be an integer")
+        resolved = _coerce_frequency(frequency)
+        _require_ordinals(resolved)
+        return cls._from_index(ordinal, resolved)
 
     @classmethod
-    def year(cls, year: int) -> "Period":
+    def year(
+        cls, year: int, frequency: Frequency | str = Frequency.CALENDAR_YEAR
+    ) -> "Period":
         _validate_year(year)
-        return cls(f"{year:04d}")
+        return cls(f"{year:04d}", _factory_frequency("year", frequency))
 
     @classmethod
-    def half(cls, year: int, half: int) -> "Period":
+    def half(
+        cls, year: int, half: int, frequency: Frequency | str = Frequency.CALENDAR_HALF
+    ) -> "Period":
         _validate_year(year)
         _validate_component("half", half, 1, 2)
-        return cls(f"{year:04d}{half:02d}")
+        return cls(f"{year:04d}{half:02d}", _factory_frequency("half", frequency))
 
     @classmethod
     def quarter(cls, year: int, quarter: int) -> "Period":
         _validate_year(year)
         _validate_component("quarter", quarter, 1, 4)
-        return cls(f"{year:04d}{quarter:02d}")
+        return cls(f"{year:04d}{quarter:02d}", Frequency.QUARTERLY)
 
     @classmethod
-    def month(cls, year: int, month: int) -> "Period":
+    def month(
+        cls, year: int, month: int, frequency: Frequency | str = Frequency.MONTHLY
+    ) -> "Period":
         _validate_year(year)
         _validate_component("month", month, 1, 12)
-        return cls(f"{year:04d}{month:02d}")
+        return cls(f"{year:04d}{month:02d}", _factory_frequency("month", frequency))
+
+    @classmethod
+    def _from_index(cls, index: int, frequency: Frequency) -> "Period":
+        """Inverse of ``_index``."""
+        length, offset = _PERIOD_LAYOUT[frequency]
+        return cls._from_month(
+            (index + _EPOCH_YEAR * 12 // length) * length + offset, frequency
+        )
+
+    @classmethod
+    def _from_month(cls, month: int, frequency: Frequency) -> "Period":
+        """Return the ``frequency`` period containing month index ``month``."""
+        length, offset = _PERIOD_LAYOUT[frequency]
+        year, part = divmod((month - offset) // length, 12 // length)
+        _validate_year(year)
+        if length == 12:
+            return cls(f"{year:04d}", frequency)
+        return cls(f"{year:04d}{part + 1:02d}", frequency)
 
     @property
     def value(self) -> str:
         return self._value
 
+    @property
+    def frequency(self) -> Frequency | None:
+        return self._frequency
+
+    @property
+    def ordinal(self) -> int:
+        """Periods since the one starting in 1970, as in ``time_index``.
+
+        Weekly and daily periods are requested by month and raise
+        ``ValueError``.
+        """
+        _require_ordinals(self._require_frequency())
+        return self._index()
+
+    def asfreq(
+        self,
+        frequency: Frequency | str,
+        how: Literal["start", "end"] = "start",
+    ) -> "Period":
+        """Return the ``frequency`` period holding this period's start or end.
+
+        ``Period.quarter(2010, 1).asfreq("FY")`` is fiscal year 2009 (April
+        2009 to March 2010); with ``how="end"`` the period holding the last
+        month is returned instead.
+        """
+        if how not in ("start", "end"):
+            raise ValueError("how: must be 'start' or 'end'")
+        length, _ = _PERIOD_LAYOUT[self._require_frequency()]
+        month = self._start_month()
+        if how == "end":
+            month += length - 1
+        return Period._from_month(month, _coerce_frequency(frequency))
+
     def to_api_value(self, frequency: Frequency | str | None = None) -> str:
         if frequency is None:
             return self._value
 
-        normalized_frequency = (
-            frequency.value
-            if isinstance(frequency, Frequency)
-            else frequency.strip().upper()
-            if isinstance(frequency, str)
-            else frequency
-        )
-        if normalized_frequency not in {item.value for item in Frequency}:
-            raise ValueError("frequency: must be one of CY, FY, CH, FH, Q, M, W, D")
+        normalized_frequency = _coerce_frequency(frequency).value
 
         if normalized_frequency in {"CY", "FY"}:
             if len(self._value) != 4:
@@ -196,6 +276,73 @@ class Period:
     def __str__(self) -> str:
         return self._value
 
+    def __add__(self, other: int) -> "Period":
+        if isinstance(other, bool) or not isinstance(other, int):
+            return NotImplemented
+        return Period._from_index(self._index() + other, self._require_frequency())
+
+    __radd__ = __add__
+
+    def __sub__(self, other: "Period | int") -> "Period | int":
+        if isinstance(other, Period):
+            first, second = self._indexes(other)
+            return first - second
+        if isinstance(other, bool) or not isinstance(other, int):
+            return NotImplemented
+        return self + -other
+
+    def __lt__(self, other: "Period") -> bool:
+        if not isinstance(other, Period):
+            return NotImplemented
+        first, second = self._indexes(other)
+        return first < second
+
+    def __le__(self, other: "Period") -> bool:
+        if not isinstance(other, Period):
+            return NotImplemented
+        first, second = self._indexes(other)
+        return first <= second
+
+    def __gt__(self, other: "Period") -> bool:
+        if not isinstance(other, Period):
+            return NotImplemented
+        first, second = self._indexes(other)
+        return first > second
+
+    def __ge__(self, other: "Period") -> bool:
+        if not isinstance(other, Period):
+            return NotImplemented
+        first, second = self._indexes(other)
+        return first >= second
+
+    def _require_frequency(self) -> Frequency:
+        if self._frequency is None:
+            raise ValueError(
+                "period: frequency is required for arithmetic; "
+                "pass one to Period() or use asfreq()"
+            )
+        return self._frequency
+
+    def _indexes(self, other: "Period") -> tuple[int, int]:
+        if self._require_frequency() != other._require_frequency():
+            raise ValueError(
+                "period: cannot combine periods of frequencies "
+                f"{self._frequency} and {other._frequency}"
+            )
+        return self._index(), other._index()
+
+    def _index(self) -> int:
+        """Request periods since 1970; weekly and daily periods count months."""
+        length, offset = _PERIOD_LAYOUT[self._require_frequency()]
+        return (self._start_month() - offset) // length - _EPOCH_YEAR * 12 // length
+
+    def _start_month(self) -> int:
+        """Month index (``year * 12 + month - 1``) the period starts in."""
+        length, offset = _PERIOD_LAYOUT[self._require_frequency()]
+        year = int(self._value[:4])
+        part = int(self._value[4:]) if len(self._value) > 4 else 1
+        return year * 12 + offset + (part - 1) * length
+
 
 @dataclass(frozen=True, slots=True, init=False)
 class Code:
@@ -254,6 +401,49 @@ class Code:
         return self.to_api_value()
 
 
+# Months per request period and the month (0 = January) periods are aligned
+# to. Weekly and daily periods are requested by month (YYYYMM).
+_PERIOD_LAYOUT: dict[Frequency, tuple[int, int]] = {
+    Frequency.CALENDAR_YEAR: (12, 0),
+    Frequency.FISCAL_YEAR: (12, 3),
+    Frequency.CALENDAR_HALF: (6, 0),
+    Frequency.FISCAL_HALF: (6, 3),
+    Frequency.QUARTERLY: (3, 0),
+    Frequency.MONTHLY: (1, 0),
+    Frequency.WEEKLY: (1, 0),
+    Frequency.DAILY: (1, 0),
+}
+
+_EPOCH_YEAR = 1970
+
+# Frequencies each Period factory may be given, by the layout it writes.
+_FACTORY_FREQUENCIES: dict[str, tuple[Frequency, ...]] = {
+    "year": (Frequency.CALENDAR_YEAR, Frequency.FISCAL_YEAR),
+    "half": (Frequency.CALENDAR_HALF, Frequency.FISCAL_HALF),
+    "month": (Frequency.MONTHLY, Frequency.WEEKLY, Frequency.DAILY),
+}
+
+
+def _coerce_frequency(frequency: Frequency | str) -> Frequency:
+    if isinstance(frequency, Frequency):
+        return frequency
+    if isinstance(frequency, str):
+        normalized = frequency.strip().upper()
+        if normalized in Frequency._value2member_map_:
+            return Frequency(normalized)
+    raise ValueError("frequency: must be one of CY, FY, CH, FH, Q, M, W, D")
+
+
+def _factory_frequency(name: str, frequency: Frequency | str) -> Frequency:
+    resolved = _coerce_frequency(frequency)
+    allowed = _FACTORY_FREQUENCIES[name]
+    if resolved not in allowed:
+        raise ValueError(
+            f"frequency: must be one of {', '.join(allowed)} for Period.{name}"
+        )
+    return resolved
+
+
 def _validate_year(year: int) -> None:
     if isinstance(year, bool) or not isinstance(year, int):
         raise ValueError("period: year must be an integer in range 1000..9999")
@@ -261,6 +451,14 @@ def _validate_year(year: int) -> None:
         raise ValueError("period: year must be an integer in range 1000..9999")
 
 
+def _require_ordinals(frequency: Frequency) -> None:
+    if frequency in (Frequency.WEEKLY, Frequency.DAILY):
+        raise ValueError(
+            f"period: {frequency.value} periods are requested by month "
+            "and have no ordinals"
+        )
+
+
 def _validate_component(name: str, value: int, min_value: int, max_value: int) -> None:
     if isinstance(value, bool) or not isinstance(value, int):
         raise ValueError(f"period: {name} must be an integer")
@@ -1,9 +1,11 @@
-from typing import Any
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple
 import warnings
-from urllib.parse import SplitResult, urlencode, urlunsplit
+from urllib.parse import SplitResult, quote_plus, urlencode, urlunsplit
 
 from boj_stat_search.core.types import Code, ErrorMode, Frequency, Layer, Period
 from boj_stat_search.core.validator import (
+    BatchValidator,
     coerce_code,
     coerce_frequency,
     coerce_layer,
@@ -27,15 +29,46 @@ API_PATH = {
 }
 
 
-def _handle_validation_errors(
-    validation_errors: list[str],
-    on_validation_error: str,
-) -> None:
+# Scheme, host and path of each endpoint, for URLs assembled by hand.
+_API_BASE = {
+    endpoint: urlunsplit((SCHEME, NETLOC, path, "", ""))
+    for endpoint, path in API_PATH.items()
+}
+
+
+class DataCodeSpec(NamedTuple):
+    """Arguments of one ``build_data_code_api_url`` call."""
+
+    db: str | None = None
+    code: Code | str | None = None
+    start_date: Period | str | None = None
+    end_date: Period | str | None = None
+    start_position: int | None = None
+
+
+class DataLayerSpec(NamedTuple):
+    """Arguments of one ``build_data_layer_api_url`` call."""
+
+    db: str
+    frequency: Frequency | str
+    layer: Layer | str
+    start_date: Period | str | None = None
+    end_date: Period | str | None = None
+    start_position: int | None = None
+
+
+def _check_error_mode(on_validation_error: str) -> None:
     if on_validation_error not in _VALIDATION_ERROR_MODES:
         raise ValueError(
             "on_validation_error: must be one of 'raise', 'warn', 'ignore'"
         )
 
+
+def _handle_validation_errors(
+    validation_errors: list[str],
+    on_validation_error: str,
+) -> None:
+    _check_error_mode(on_validation_error)
     if not validation_errors:
         return
 
@@ -46,72 +79,170 @@ def _handle_validation_errors(
         warnings.warn(message, UserWarning, stacklevel=2)
 
 
-def build_metadata_api_url(
-    db: str,
-    on_validation_error: ErrorMode = "raise",
-) -> str:
-    validation_errors = validate_metadata_params(db=db)
-    _handle_validation_errors(validation_errors, on_validation_error)
+def _handle_batch_validation_errors(
+    invalid: list[tuple[int, list[str]]],
+    on_validation_error: str,
+) -> None:
+    if not invalid:
+        return
+
+    messages = [
+        f"Invalid parameters in spec {index}: {'; '.join(errors)}"
+        for index, errors in invalid
+    ]
+    if on_validation_error == "raise":
+        more = (
+            f" (and {len(invalid) - 1} more invalid specs)" if len(invalid) > 1 else ""
+        )
+        raise ValueError(messages[0] + more)
+    if on_validation_error == "warn":
+        for message in messages:
+            warnings.warn(message, UserWarning, stacklevel=3)
 
-    query = urlencode({"db": db})
 
+class ApiUrlSteps(NamedTuple):
+    """The phases of one ``build_*_api_url`` call, for callers timing them apart.
+
+    ``normalize`` coerces the builder's arguments into the keyword arguments of
+    ``validate``, which returns the validation errors; ``encode`` turns the
+    normalized arguments into the request URL.
+    """
+
+    normalize: Callable[..., dict[str, Any]]
+    validate: Callable[..., list[str]]
+    encode: Callable[[dict[str, Any]], str]
+
+
+def _api_url(endpoint: str, query_params: dict[str, Any], safe: str = "") -> str:
     split_result = SplitResult(
         scheme=SCHEME,
         netloc=NETLOC,
-        path=API_PATH["getMetadata"],
-        query=query,
+        path=API_PATH[endpoint],
+        query=urlencode(query_params, safe=safe),
         fragment="",
     )
     return urlunsplit(split_result)
 
 
-def build_data_code_api_url(
+def _normalize_metadata_params(db: str) -> dict[str, Any]:
+    return {"db": db}
+
+
+def _encode_metadata_url(params: dict[str, Any]) -> str:
+    return _api_url("getMetadata", {"db": params["db"]})
+
+
+def _normalize_data_code_params(
     db: str | None = None,
     code: Code | str | None = None,
     start_date: Period | str | None = None,
     end_date: Period | str | None = None,
     start_position: int | None = None,
-    on_validation_error: ErrorMode = "raise",
-) -> str:
+) -> dict[str, Any]:
     code_embedded_db = extract_db_from_code(code)
     if db is not None and code_embedded_db is not None and db != code_embedded_db:
         raise ValueError("db/code: conflicting DB values between db and Code input")
 
-    resolved_db = db if db is not None else code_embedded_db
-    normalized_code: Any = coerce_code(code)
-    normalized_start_date: Any = coerce_period(start_date)
-    normalized_end_date: Any = coerce_period(end_date)
+    return {
+        "db": db if db is not None else code_embedded_db,
+        "code": coerce_code(code),
+        "start_date": coerce_period(start_date),
+        "end_date": coerce_period(end_date),
+        "start_position": start_position,
+    }
 
-    validation_errors = validate_data_code_params(
-        db=resolved_db,
-        code=normalized_code,
-        start_date=normalized_start_date,
-        end_date=normalized_end_date,
-        start_position=start_position,
-    )
-    _handle_validation_errors(validation_errors, on_validation_error)
 
+def _encode_data_code_url(params: dict[str, Any]) -> str:
     query_params: dict[str, Any] = {}
-    if resolved_db is not None:
-        query_params["db"] = resolved_db
-    query_params["code"] = normalized_code
-    if normalized_start_date is not None:
-        query_params["startDate"] = normalized_start_date
-    if normalized_end_date is not None:
-        query_params["endDate"] = normalized_end_date
-    if start_position is not None:
-        query_params["startPosition"] = start_position
-
-    query = urlencode(query_params, safe=",")
+    if params["db"] is not None:
+        query_params["db"] = params["db"]
+    query_params["code"] = params["code"]
+    if params["start_date"] is not None:
+        query_params["startDate"] = params["start_date"]
+    if params["end_date"] is not None:
+        query_params["endDate"] = params["end_date"]
+    if params["start_position"] is not None:
+        query_params["startPosition"] = params["start_position"]
+    return _api_url("getDataCode", query_params, safe=",")
 
-    split_result = SplitResult(
-        scheme=SCHEME,
-        netloc=NETLOC,
-        path=API_PATH["getDataCode"],
-        query=query,
-        fragment="",
+
+def _normalize_data_layer_params(
+    db: str,
+    frequency: Frequency | str,
+    layer: Layer | str,
+    start_date: Period | str | None = None,
+    end_date: Period | str | None = None,
+    start_position: int | None = None,
+) -> dict[str, Any]:
+    normalized_frequency: Any = coerce_frequency(frequency)
+    return {
+        "db": db,
+        "frequency": normalized_frequency,
+        "layer": coerce_layer(layer),
+        "start_date": coerce_period(start_date, frequency=normalized_frequency),
+        "end_date": coerce_period(end_date, frequency=normalized_frequency),
+        "start_position": start_position,
+    }
+
+
+def _encode_data_layer_url(params: dict[str, Any]) -> str:
+    query_params: dict[str, Any] = {
+        "db": params["db"],
+        "frequency": params["frequency"],
+        "layer": params["layer"],
+    }
+    if params["start_date"] is not None:
+        query_params["startDate"] = params["start_date"]
+    if params["end_date"] is not None:
+        query_params["endDate"] = params["end_date"]
+    if params["start_position"] is not None:
+        query_params["startPosition"] = params["start_position"]
+    return _api_url("getDataLayer", query_params, safe=",*")
+
+
+API_URL_STEPS: dict[str, ApiUrlSteps] = {
+    "getMetadata": ApiUrlSteps(
+        _normalize_metadata_params, validate_metadata_params, _encode_metadata_url
+    ),
+    "getDataCode": ApiUrlSteps(
+        _normalize_data_code_params, validate_data_code_params, _encode_data_code_url
+    ),
+    "getDataLayer": ApiUrlSteps(
+        _normalize_data_layer_params,
+        validate_data_layer_params,
+        _encode_data_layer_url,
+    ),
+}
+
+
+def build_metadata_api_url(
+    db: str,
+    on_validation_error: ErrorMode = "raise",
+) -> str:
+    params = _normalize_metadata_params(db)
+    validation_errors = validate_metadata_params(**params)
+    _handle_validation_errors(validation_errors, on_validation_error)
+    return _encode_metadata_url(params)
+
+
+def build_data_code_api_url(
+    db: str | None = None,
+    code: Code | str | None = None,
+    start_date: Period | str | None = None,
+    end_date: Period | str | None = None,
+    start_position: int | None = None,
+    on_validation_error: ErrorMode = "raise",
+) -> str:
+    params = _normalize_data_code_params(
+        db=db,
+        code=code,
+        start_date=start_date,
+        end_date=end_date,
+        start_position=start_position,
     )
-    return urlunsplit(split_result)
+    validation_errors = validate_data_code_params(**params)
+    _handle_validation_errors(validation_errors, on_validation_error)
+    return _encode_data_code_url(params)
 
 
 def build_data_layer_api_url(
@@ -123,46 +254,134 @@ def build_data_layer_api_url(
     start_position: int | None = None,
     on_validation_error: ErrorMode = "raise",
 ) -> str:
-    normalized_frequency: Any = coerce_frequency(frequency)
-    normalized_layer: Any = coerce_layer(layer)
-    normalized_start_date: Any = coerce_period(
-        start_date,
-        frequency=normalized_frequency,
-    )
-    normalized_end_date: Any = coerce_period(
-        end_date,
-        frequency=normalized_frequency,
-    )
-
-    validation_errors = validate_data_layer_params(
+    params = _normalize_data_layer_params(
         db=db,
-        frequency=normalized_frequency,
-        layer=normalized_layer,
-        start_date=normalized_start_date,
-        end_date=normalized_end_date,
+        frequency=frequency,
+        layer=layer,
+        start_date=start_date,
+        end_date=end_date,
         start_position=start_position,
     )
+    validation_errors = validate_data_layer_params(**params)
     _handle_validation_errors(validation_errors, on_validation_error)
+    return _encode_data_layer_url(params)
 
-    query_params: dict[str, str | int] = {
-        "db": db,
-        "frequency": normalized_frequency,
-        "layer": normalized_layer,
-    }
-    if normalized_start_date is not None:
-        query_params["startDate"] = normalized_start_date
-    if normalized_end_date is not None:
-        query_params["endDate"] = normalized_end_date
-    if start_position is not None:
-        query_params["startPosition"] = start_position
 
-    query = urlencode(query_params, safe=",*")
+def build_data_code_api_urls(
+    specs: Iterable[DataCodeSpec | tuple[Any, ...]],
+    on_validation_error: ErrorMode = "raise",
+) -> list[str]:
+    """Validate and build the URLs of many ``getDataCode`` requests in one pass.
 
-    split_result = SplitResult(
-        scheme=SCHEME,
-        netloc=NETLOC,
-        path=API_PATH["getDataLayer"],
-        query=query,
-        fragment="",
-    )
-    return urlunsplit(split_result)
+    Each spec holds the arguments of ``build_data_code_api_url`` and yields
+    the same URL. DBs and date pairs repeat across generated requests, so each
+    distinct one is validated and encoded once per batch. Invalid specs are
+    reported by position; with ``"raise"`` the first one raises.
+    """
+    _check_error_mode(on_validation_error)
+    validator = BatchValidator()
+    quoted: dict[Any, str] = {}
+    base = _API_BASE["getDataCode"]
+
+    urls: list[str] = []
+    invalid: list[tuple[int, list[str]]] = []
+    for index, spec in enumerate(map(_data_code_spec, specs)):
+        try:
+            params = _normalize_data_code_params(
+                db=spec.db,
+                code=spec.code,
+                start_date=spec.start_date,
+                end_date=spec.end_date,
+                start_position=spec.start_position,
+            )
+        except ValueError as exc:
+            raise ValueError(f"spec {index}: {exc}") from exc
+        errors = validator.data_code_params(**params)
+        if errors:
+            invalid.append((index, errors))
+
+        query = [f"code={quote_plus(str(params['code']), safe=',')}"]
+        if params["db"] is not None:
+            query.insert(0, f"db={_quote_repeated(params['db'], ',', quoted)}")
+        if params["start_date"] is not None:
+            query.append(
+                f"startDate={_quote_repeated(params['start_date'], ',', quoted)}"
+            )
+        if params["end_date"] is not None:
+            query.append(f"endDate={_quote_repeated(params['end_date'], ',', quoted)}")
+        if params["start_position"] is not None:
+            query.append(
+                f"startPosition={quote_plus(str(params['start_position']), safe=',')}"
+            )
+        urls.append(f"{base}?{'&'.join(query)}")
+
+    _handle_batch_validation_errors(invalid, on_validation_error)
+    return urls
+
+
+def build_data_layer_api_urls(
+    specs: Iterable[DataLayerSpec | tuple[Any, ...]],
+    on_validation_error: ErrorMode = "raise",
+) -> list[str]:
+    """Validate and build the URLs of many ``getDataLayer`` requests in one pass.
+
+    The batch counterpart of ``build_data_layer_api_url``: each distinct DB,
+    frequency and layer, and date pair is validated and encoded once.
+    """
+    _check_error_mode(on_validation_error)
+    validator = BatchValidator()
+    quoted: dict[Any, str] = {}
+    base = _API_BASE["getDataLayer"]
+
+    urls: list[str] = []
+    invalid: list[tuple[int, list[str]]] = []
+    for index, spec in enumerate(map(_data_layer_spec, specs)):
+        params = _normalize_data_layer_params(
+            db=spec.db,
+            frequency=spec.frequency,
+            layer=spec.layer,
+            start_date=spec.start_date,
+            end_date=spec.end_date,
+            start_position=spec.start_position,
+        )
+        errors = validator.data_layer_params(**params)
+        if errors:
+            invalid.append((index, errors))
+
+        query = [
+            f"db={_quote_repeated(params['db'], ',*', quoted)}",
+            f"frequency={_quote_repeated(params['frequency'], ',*', quoted)}",
+            f"layer={_quote_repeated(params['layer'], ',*', quoted)}",
+        ]
+        if params["start_date"] is not None:
+            query.append(
+                f"startDate={_quote_repeated(params['start_date'], ',*', quoted)}"
+            )
+        if params["end_date"] is not None:
+            query.append(f"endDate={_quote_repeated(params['end_date'], ',*', quoted)}")
+        if params["start_position"] is not None:
+            query.append(
+                f"startPosition={quote_plus(str(params['start_position']), safe=',*')}"
+            )
+        urls.append(f"{base}?{'&'.join(query)}")
+
+    _handle_batch_validation_errors(invalid, on_validation_error)
+    return urls
+
+
+def _data_code_spec(spec: DataCodeSpec | tuple[Any, ...]) -> DataCodeSpec:
+    return spec if isinstance(spec, DataCodeSpec) else DataCodeSpec(*spec)
+
+
+def _data_layer_spec(spec: DataLayerSpec | tuple[Any, ...]) -> DataLayerSpec:
+    return spec if isinstance(spec, DataLayerSpec) else DataLayerSpec(*spec)
+
+
+def _quote_repeated(value: Any, safe: str, quoted: dict[Any, str]) -> str:
+    """``urlencode``'s quoting of ``value``, cached for strings that repeat."""
+    if type(value) is not str:
+        return quote_plus(str(value), safe=safe)
+    result = quoted.get(value)
+    if result is None:
+        result = quoted[value] = quote_plus(value, safe=safe)
+    return result
@@ -1,8 +1,10 @@
-from typing import Any
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
 
 from boj_stat_search.core.database import list_db
 from boj_stat_search.core.types import Code, Frequency, Layer, Period
 
+_T = TypeVar("_T")
 
 FORBIDDEN_CHARS = ("<", ">", '"', "”", "!", "|", "\\", ";", "'")
 ALLOWED_FREQUENCIES = {frequency.value for frequency in Frequency}
@@ -159,6 +161,25 @@ def _validate_date_for_frequency(
     return [], True
 
 
+def _validate_code_list(code: Any) -> list[str]:
+    if not isinstance(code, str) or code == "":
+        return []
+    errors: list[str] = []
+    if _has_empty_item(code):
+        errors.append("code: must contain non-empty comma-separated series codes")
+    if code.count(",") >= 250:
+        errors.append("code: supports at most 250 series codes per request")
+    return errors
+
+
+def _has_empty_item(values: str) -> bool:
+    # Without whitespace (printable text has none but " "), an empty item is
+    # a leading, trailing or doubled comma; no need to split and strip.
+    if values.isprintable() and " " not in values:
+        return values[0] == "," or values[-1] == "," or ",," in values
+    return any(part.strip() == "" for part in values.split(","))
+
+
 def validate_data_code_params(
     db: str | None,
     code: str | None,
@@ -166,21 +187,20 @@ def validate_data_code_params(
     end_date: Period | str | None = None,
     start_position: int | None = None,
 ) -> list[str]:
-    normalized_start_date: Any = coerce_period(start_date)
-    normalized_end_date: Any = coerce_period(end_date)
-
     errors: list[str] = []
     errors.extend(_validate_db_name(db))
     errors.extend(_check_common_text("code", code, required=True))
     errors.extend(_validate_start_position(start_position))
+    errors.extend(_validate_code_list(code))
+    errors.extend(_validate_data_code_dates(start_date, end_date))
+    return errors
 
-    if isinstance(code, str) and code != "":
-        code_parts = [part.strip() for part in code.split(",")]
-        if any(part == "" for part in code_parts):
-            errors.append("code: must contain non-empty comma-separated series codes")
-        if len(code_parts) > 250:
-            errors.append("code: supports at most 250 series codes per request")
 
+def _validate_data_code_dates(start_date: Any, end_date: Any) -> list[str]:
+    normalized_start_date: Any = coerce_period(start_date)
+    normalized_end_date: Any = coerce_period(end_date)
+
+    errors: list[str] = []
     start_date_valid = normalized_start_date is None
     end_date_valid = normalized_end_date is None
     if normalized_start_date is not None:
@@ -231,28 +251,25 @@ def validate_data_layer_params(
     start_position: int | None = None,
 ) -> list[str]:
     normalized_frequency = coerce_frequency(frequency)
-    normalized_layer = coerce_layer(layer)
-    normalized_start_date = coerce_period(
-        start_date,
-        frequency=normalized_frequency,
-    )
-    normalized_end_date = coerce_period(
-        end_date,
-        frequency=normalized_frequency,
+    errors: list[str] = []
+    errors.extend(_validate_db_name(db))
+    errors.extend(_validate_layer_frequency(normalized_frequency, layer))
+    errors.extend(_validate_start_position(start_position))
+    errors.extend(
+        _validate_data_layer_dates(start_date, end_date, normalized_frequency)
     )
+    return errors
+
+
+def _validate_layer_frequency(normalized_frequency: Any, layer: Any) -> list[str]:
+    normalized_layer = coerce_layer(layer)
 
     errors: list[str] = []
-    errors.extend(_validate_db_name(db))
     errors.extend(_check_common_text("frequency", normalized_frequency, required=True))
     errors.extend(_check_common_text("layer", normalized_layer, required=True))
-    errors.extend(_validate_start_position(start_position))
-
-    frequency_valid = False
     if isinstance(normalized_frequency, str) and normalized_frequency != "":
         if normalized_frequency not in ALLOWED_FREQUENCIES:
             errors.append("frequency: must be one of CY, FY, CH, FH, Q, M, W, D")
-        else:
-            frequency_valid = True
 
     if isinstance(normalized_layer, str) and normalized_layer != "":
         layer_parts = [part.strip() for part in normalized_layer.split(",")]
@@ -266,7 +283,26 @@ def validate_data_layer_params(
             if part != "*" and not part.isdigit():
                 errors.append("layer: each layer must be '*' or digits only")
                 break
+    return errors
+
+
+def _validate_data_layer_dates(
+    start_date: Any, end_date: Any, normalized_frequency: Any
+) -> list[str]:
+    normalized_start_date = coerce_period(
+        start_date,
+        frequency=normalized_frequency,
+    )
+    normalized_end_date = coerce_period(
+        end_date,
+        frequency=normalized_frequency,
+    )
+    frequency_valid = (
+        isinstance(normalized_frequency, str)
+        and normalized_frequency in ALLOWED_FREQUENCIES
+    )
 
+    errors: list[str] = []
     start_date_valid = normalized_start_date is None
     end_date_valid = normalized_end_date is None
     if normalized_start_date is not None:
@@ -297,3 +333,91 @@ def validate_data_layer_params(
         errors.append("start_date/end_date: start_date must be <= end_date")
 
     return errors
+
+
+class BatchValidator:
+    """Validate many requests, checking each distinct value only once.
+
+    Requests generated in bulk repeat the same DBs, date pairs, frequencies
+    and layers, so their validation results are kept in lookup tables for
+    the lifetime of the validator. Series code lists and start positions are
+    checked per request. Errors match ``validate_data_code_params`` and
+    ``validate_data_layer_params``.
+    """
+
+    def __init__(self) -> None:
+        self._db: dict[Any, list[str]] = {}
+        self._dates: dict[Any, list[str]] = {}
+        self._layers: dict[Any, list[str]] = {}
+
+    def data_code_params(
+        self,
+        db: str | None,
+        code: str | None,
+        start_date: Period | str | None = None,
+        end_date: Period | str | None = None,
+        start_position: int | None = None,
+    ) -> list[str]:
+        errors: list[str] = []
+        errors.extend(_lookup(self._db, db, _validate_db_name, db))
+        errors.extend(_check_common_text("code", code, required=True))
+        errors.extend(_validate_start_position(start_position))
+        errors.extend(_validate_code_list(code))
+        errors.extend(
+            _lookup(
+                self._dates,
+                (start_date, end_date),
+                _validate_data_code_dates,
+                start_date,
+                end_date,
+            )
+        )
+        return errors
+
+    def data_layer_params(
+        self,
+        db: str,
+        frequency: Frequency | str,
+        layer: Layer | str,
+        start_date: Period | str | None = None,
+        end_date: Period | str | None = None,
+        start_position: int | None = None,
+    ) -> list[str]:
+        normalized_frequency = coerce_frequency(frequency)
+        errors: list[str] = []
+        errors.extend(_lookup(self._db, db, _validate_db_name, db))
+        errors.extend(
+            _lookup(
+                self._layers,
+                (normalized_frequency, layer),
+                _validate_layer_frequency,
+                normalized_frequency,
+                layer,
+            )
+        )
+        errors.extend(_validate_start_position(start_position))
+        errors.extend(
+            _lookup(
+                self._dates,
+                (start_date, end_date, normalized_frequency),
+                _validate_data_layer_dates,
+                start_date,
+                end_date,
+                normalized_frequency,
+            )
+        )
+        return errors
+
+
+def _lookup(
+    table: dict[Any, _T], key: Hashable, compute: Callable[..., _T], *args: Any
+) -> _T:
+    """Return ``compute(*args)``, cached in ``table`` under ``key``."""
+    try:
+        return table[key]
+    except KeyError:
+        result = table[key] = compute(*args)
+        return result
+    except TypeError:
+        # Unhashable input; validate it without caching.
+        return compute(*args)
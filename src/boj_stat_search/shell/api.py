@@ -1,6 +1,8 @@
-import httpx
+from collections.abc import Callable
 from typing import Any
 
+import httpx
+
 from boj_stat_search.core.models import DataResponse, MetadataResponse
 from boj_stat_search.core.parser import (
     parse_data_code_response,
@@ -8,11 +10,20 @@ from boj_stat_search.core.parser import (
 )
 from boj_stat_search.core.types import Code, Db, ErrorMode, Frequency, Layer, Period
 from boj_stat_search.core.url_builder import (
+    API_URL_STEPS,
+    _handle_validation_errors,
     build_data_code_api_url,
     build_data_layer_api_url,
     build_metadata_api_url,
 )
 from boj_stat_search.core.validator import coerce_code, extract_db_from_code
+from boj_stat_search.shell.metrics import observed_get
+from boj_stat_search.shell.profiling import (
+    is_profiling,
+    phase,
+    profiled_call,
+    with_timings,
+)
 
 
 class BojApiError(httpx.HTTPStatusError):
@@ -87,16 +98,108 @@ def _raise_for_status_with_boj_message(response: httpx.Response) -> None:
         ) from exc
 
 
-def _get_json(url: str, *, client: httpx.Client | None = None) -> dict[str, Any]:
-    if client is not None:
-        response = client.get(url)
+def _fetch(url: str, client: httpx.Client) -> httpx.Response:
+    with phase("network"):
+        response = observed_get(client, url)
         _raise_for_status_with_boj_message(response)
+    return response
+
+
+def _decode_json(response: httpx.Response) -> dict[str, Any]:
+    with phase("decode"):
         return response.json()
 
+
+def _get_json(url: str, *, client: httpx.Client | None = None) -> dict[str, Any]:
+    if client is not None:
+        return _decode_json(_fetch(url, client))
+
     with httpx.Client() as local_client:
-        response = local_client.get(url)
-        _raise_for_status_with_boj_message(response)
-        return response.json()
+        return _decode_json(_fetch(url, local_client))
+
+
+def get_content(url: str, *, client: httpx.Client | None = None) -> bytes:
+    """Fetch an already built BOJ API URL and return the undecoded response body."""
+    if client is not None:
+        return _fetch(url, client).content
+
+    with httpx.Client() as local_client:
+        return _fetch(url, local_client).content
+
+
+def _build_url(
+    endpoint: str,
+    build: Callable[..., str],
+    on_validation_error: ErrorMode,
+    **params: Any,
+) -> str:
+    if not is_profiling():
+        return build(**params, on_validation_error=on_validation_error)
+
+    # Same steps as ``build``, timed apart so validation shows up on its own.
+    steps = API_URL_STEPS[endpoint]
+    with phase("build_url"):
+        normalized = steps.normalize(**params)
+    with phase("validate"):
+        _handle_validation_errors(steps.validate(**normalized), on_validation_error)
+    with phase("build_url"):
+        return steps.encode(normalized)
+
+
+def metadata_request_url(db: Db | str, on_validation_error: ErrorMode = "raise") -> str:
+    """Validate the parameters of a getMetadata request and return its URL."""
+    return _build_url("getMetadata", build_metadata_api_url, on_validation_error, db=db)
+
+
+def data_code_request_url(
+    db: Db | str | None = None,
+    code: Code | str | None = None,
+    start_date: Period | str | None = None,
+    end_date: Period | str | None = None,
+    start_position: int | None = None,
+    on_validation_error: ErrorMode = "raise",
+) -> str:
+    """Validate the parameters of a getDataCode request and return its URL.
+
+    Without ``db``, the DB of the first code is looked up in the catalog.
+    """
+    if db is None and extract_db_from_code(code) is None:
+        with phase("resolve_db"):
+            db = resolve_code_db(code)
+
+    return _build_url(
+        "getDataCode",
+        build_data_code_api_url,
+        on_validation_error,
+        db=db,
+        code=code,
+        start_date=start_date,
+        end_date=end_date,
+        start_position=start_position,
+    )
+
+
+def data_layer_request_url(
+    db: Db | str,
+    frequency: Frequency | str,
+    layer: Layer | str,
+    start_date: Period | str | None = None,
+    end_date: Period | str | None = None,
+    start_position: int | None = None,
+    on_validation_error: ErrorMode = "raise",
+) -> str:
+    """Validate the parameters of a getDataLayer request and return its URL."""
+    return _build_url(
+        "getDataLayer",
+        build_data_layer_api_url,
+        on_validation_error,
+        db=db,
+        frequency=frequency,
+        layer=layer,
+        start_date=start_date,
+        end_date=end_date,
+        start_position=start_position,
+    )
 
 
 def get_metadata_raw(
@@ -105,11 +208,9 @@ def get_metadata_raw(
     *,
     client: httpx.Client | None = None,
 ) -> dict[str, Any]:
-    url = build_metadata_api_url(
-        db=db,
-        on_validation_error=on_validation_error,
-    )
-    return _get_json(url, client=client)
+    with profiled_call("getMetadata"):
+        url = metadata_request_url(db, on_validation_error)
+        return _get_json(url, client=client)
 
 
 def get_metadata(
@@ -118,12 +219,15 @@ def get_metadata(
     *,
     client: httpx.Client | None = None,
 ) -> MetadataResponse:
-    raw = get_metadata_raw(
-        db=db,
-        on_validation_error=on_validation_error,
-        client=client,
-    )
-    return parse_metadata_response(raw)
+    with profiled_call("getMetadata") as profile:
+        raw = get_metadata_raw(
+            db=db,
+            on_validation_error=on_validation_error,
+            client=client,
+        )
+        with phase("parse"):
+            response = parse_metadata_response(raw)
+    return with_timings(response, profile)
 
 
 def get_data_code_raw(
@@ -136,30 +240,29 @@ def get_data_code_raw(
     *,
     client: httpx.Client | None = None,
 ) -> dict[str, Any]:
-    if db is None and extract_db_from_code(code) is None:
-        normalized_code = coerce_code(code)
-        first_code = (
-            normalized_code.split(",", 1)[0].strip()
-            if isinstance(normalized_code, str)
-            else None
+    with profiled_call("getDataCode"):
+        url = data_code_request_url(
+            db, code, start_date, end_date, start_position, on_validation_error
         )
-        if first_code:
-            try:
-                from boj_stat_search.shell.catalog.search import resolve_db
+        return _get_json(url, client=client)
 
-                db = resolve_db(first_code)
-            except Exception:
-                pass
 
-    url = build_data_code_api_url(
-        db=db,
-        code=code,
-        start_date=start_date,
-        end_date=end_date,
-        start_position=start_position,
-        on_validation_error=on_validation_error,
+def resolve_code_db(code: Code | str | None) -> str | None:
+    """DB of the first series code in the catalog, or ``None`` if unknown."""
+    normalized_code = coerce_code(code)
+    first_code = (
+        normalized_code.split(",", 1)[0].strip()
+        if isinstance(normalized_code, str)
+        else None
     )
-    return _get_json(url, client=client)
+    if first_code:
+        try:
+            from boj_stat_search.shell.catalog.search import resolve_db
+
+            return resolve_db(first_code)
+        except Exception:
+            pass
+    return None
 
 
 def get_data_code(
@@ -172,16 +275,19 @@ def get_data_code(
     *,
     client: httpx.Client | None = None,
 ) -> DataResponse:
-    raw = get_data_code_raw(
-        db=db,
-        code=code,
-        start_date=start_date,
-        end_date=end_date,
-        start_position=start_position,
-        on_validation_error=on_validation_error,
-        client=client,
-    )
-    return parse_data_code_response(raw)
+    with profiled_call("getDataCode") as profile:
+        raw = get_data_code_raw(
+            db=db,
+            code=code,
+            start_date=start_date,
+            end_date=end_date,
+            start_position=start_position,
+            on_validation_error=on_validation_error,
+            client=client,
+        )
+        with phase("parse"):
+            response = parse_data_code_response(raw)
+    return with_timings(response, profile)
 
 
 def get_data_layer_raw(
@@ -195,16 +301,17 @@ def get_data_layer_raw(
     *,
     client: httpx.Client | None = None,
 ) -> dict[str, Any]:
-    url = build_data_layer_api_url(
-        db=db,
-        frequency=frequency,
-        layer=layer,
-        start_date=start_date,
-        end_date=end_date,
-        start_position=start_position,
-        on_validation_error=on_validation_error,
-    )
-    return _get_json(url, client=client)
+    with profiled_call("getDataLayer"):
+        url = data_layer_request_url(
+            db,
+            frequency,
+            layer,
+            start_date,
+            end_date,
+            start_position,
+            on_validation_error,
+        )
+        return _get_json(url, client=client)
 
 
 def get_data_layer(
@@ -218,14 +325,17 @@ def get_data_layer(
     *,
     client: httpx.Client | None = None,
 ) -> DataResponse:
-    raw = get_data_layer_raw(
-        db=db,
-        frequency=frequency,
-        layer=layer,
-        start_date=start_date,
-        end_date=end_date,
-        start_position=start_position,
-        on_validation_error=on_validation_error,
-        client=client,
-    )
-    return parse_data_code_response(raw)
+    with profiled_call("getDataLayer") as profile:
+        raw = get_data_layer_raw(
+            db=db,
+            frequency=frequency,
+            layer=layer,
+            start_date=start_date,
+            end_date=end_date,
+            start_position=start_position,
+            on_validation_error=on_validation_error,
+            client=client,
+        )
+        with phase("parse"):
+            response = parse_data_code_response(raw)
+    return with_timings(response, profile)
@@ -1,22 +1,76 @@
-from boj_stat_search.shell.catalog.exporter import (
-    METADATA_PARQUET_COLUMNS,
-    MetadataExportReport,
-    generate_metadata_parquet_files,
-    metadata_entries_to_rows,
-    write_metadata_parquet,
-)
-from boj_stat_search.shell.catalog.loader import (
-    CatalogCacheError,
-    CatalogError,
-    CatalogFetchError,
-    load_catalog_all,
-    load_catalog_db,
-)
-from boj_stat_search.shell.catalog.search import list_series, resolve_db, search_series
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from boj_stat_search._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from boj_stat_search.shell.catalog.exporter import (
+        METADATA_PARQUET_COLUMNS,
+        MetadataExportReport,
+        decode_metadata_payload,
+        generate_metadata_parquet_files,
+        metadata_entries_to_rows,
+        write_metadata_parquet,
+    )
+    from boj_stat_search.shell.catalog.loader import (
+        CatalogCacheError,
+        CatalogError,
+        CatalogFetchError,
+        ensure_search_index,
+        load_catalog_all,
+        load_catalog_db,
+        load_layer_index,
+        load_search_index,
+    )
+    from boj_stat_search.shell.catalog.search import (
+        list_series,
+        rank_series,
+        resolve_db,
+        search_series,
+    )
+    from boj_stat_search.shell.catalog.snapshot import (
+        load_layer_entries,
+        load_metadata_snapshot,
+        write_metadata_snapshot,
+    )
+
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "boj_stat_search.shell.catalog.exporter": (
+        "METADATA_PARQUET_COLUMNS",
+        "MetadataExportReport",
+        "decode_metadata_payload",
+        "generate_metadata_parquet_files",
+        "metadata_entries_to_rows",
+        "write_metadata_parquet",
+    ),
+    "boj_stat_search.shell.catalog.loader": (
+        "CatalogCacheError",
+        "CatalogError",
+        "CatalogFetchError",
+        "ensure_search_index",
+        "load_catalog_all",
+        "load_catalog_db",
+        "load_layer_index",
+        "load_search_index",
+    ),
+    "boj_stat_search.shell.catalog.search": (
+        "list_series",
+        "rank_series",
+        "resolve_db",
+        "search_series",
+    ),
+    "boj_stat_search.shell.catalog.snapshot": (
+        "load_layer_entries",
+        "load_metadata_snapshot",
+        "write_metadata_snapshot",
+    ),
+}
 
 __all__ = [
     "METADATA_PARQUET_COLUMNS",
     "MetadataExportReport",
+    "decode_metadata_payload",
     "generate_metadata_parquet_files",
     "metadata_entries_to_rows",
     "write_metadata_parquet",
@@ -25,7 +79,16 @@ __all__ = [
     "CatalogCacheError",
     "load_catalog_db",
     "load_catalog_all",
+    "ensure_search_index",
+    "load_layer_index",
+    "load_search_index",
     "list_series",
     "search_series",
+    "rank_series",
     "resolve_db",
+    "load_layer_entries",
+    "load_metadata_snapshot",
+    "write_metadata_snapshot",
 ]
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
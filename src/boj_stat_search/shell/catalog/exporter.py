@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import json
 import tempfile
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from types import MappingProxyType
 
+import httpx
 import pyarrow as pa
 import pyarrow.parquet as pq
 from tqdm import tqdm
 
 from boj_stat_search.shell.client import BojClient
+from boj_stat_search.shell.parallel import DECODE_ERRORS, decode_in_processes
 from boj_stat_search.core import list_db
+from boj_stat_search.core.columnar import table_to_ipc_bytes
 from boj_stat_search.core.models import MetadataEntry
+from boj_stat_search.core.parser import parse_metadata_response
+from boj_stat_search.core.url_builder import build_metadata_api_url
 
 METADATA_PARQUET_COLUMNS: tuple[str, ...] = (
     "series_code",
@@ -58,6 +65,9 @@ METADATA_PARQUET_SCHEMA = pa.schema(
     ]
 )
 
+# Failures that mark one DB as failed; anything else stops the export.
+_EXPORT_ERRORS: tuple[type[Exception], ...] = (httpx.HTTPError, *DECODE_ERRORS)
+
 
 @dataclass(frozen=True)
 class MetadataExportReport:
@@ -88,11 +98,13 @@ class MetadataExportReport:
 def metadata_entries_to_rows(
     db: str,
     entries: Iterable[MetadataEntry],
+    *,
+    include_headers: bool = False,
 ) -> list[dict[str, str | int]]:
     rows: list[dict[str, str | int]] = []
 
     for entry in entries:
-        if not entry.series_code.strip():
+        if not include_headers and not entry.series_code.strip():
             continue
 
         rows.append(
@@ -121,10 +133,28 @@ def metadata_entries_to_rows(
     return rows
 
 
+def decode_metadata_payload(db: str, content: bytes) -> bytes:
+    """Turn ``db``'s raw getMetadata body into an Arrow IPC buffer of Parquet rows.
+
+    Runs in worker processes when ``generate_metadata_parquet_files`` is called
+    with ``max_workers``.
+    """
+    metadata = parse_metadata_response(json.loads(content))
+    rows = metadata_entries_to_rows(db, metadata.result_set)
+    return table_to_ipc_bytes(
+        pa.Table.from_pylist(rows, schema=METADATA_PARQUET_SCHEMA)
+    )
+
+
 def write_metadata_parquet(
     file_path: str | Path,
     rows: Sequence[Mapping[str, str | int]],
 ) -> None:
+    table = pa.Table.from_pylist(list(rows), schema=METADATA_PARQUET_SCHEMA)
+    _write_metadata_table(file_path, table)
+
+
+def _write_metadata_table(file_path: str | Path, table: pa.Table) -> None:
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -138,7 +168,6 @@ def write_metadata_parquet(
             delete=False,
         ) as temp_file:
             temp_path = Path(temp_file.name)
-            table = pa.Table.from_pylist(list(rows), schema=METADATA_PARQUET_SCHEMA)
             pq.write_table(table, temp_file, compression="snappy")
 
         if temp_path is None:
@@ -157,7 +186,14 @@ def generate_metadata_parquet_files(
     min_request_interval: float = 1.0,
     *,
     show_progress: bool = False,
+    max_workers: int | None = None,
 ) -> MetadataExportReport:
+    """Export metadata for each DB to ``<output_dir>/<DB>.parquet``.
+
+    With ``max_workers`` set, responses are still fetched sequentially in this
+    process under the client's throttle, but JSON parsing and row conversion
+    run in a pool of ``max_workers`` processes.
+    """
     output_dir_path = Path(output_dir)
     requested_dbs = _resolve_dbs(dbs)
 
@@ -171,23 +207,33 @@ def generate_metadata_parquet_files(
         unit="db",
         disable=not show_progress,
     )
+
+    def export(db: str, load: Callable[[], pa.Table]) -> None:
+        try:
+            table = load()
+            _write_metadata_table(output_dir_path / f"{db}.parquet", table)
+        except _EXPORT_ERRORS as exc:
+            error_messages[db] = str(exc)
+            progress.set_postfix_str(f"{db}: failed")
+        else:
+            succeeded_dbs.append(db)
+            row_counts[db] = table.num_rows
+            progress.set_postfix_str(f"{db}: {table.num_rows} rows")
+        progress.update(1)
+
     try:
         with BojClient(min_request_interval=min_request_interval) as client:
-            for db in requested_dbs:
-                try:
-                    metadata = client.get_metadata(db)
-                    rows = metadata_entries_to_rows(db, metadata.result_set)
-                    write_metadata_parquet(output_dir_path / f"{db}.parquet", rows)
-                except Exception as exc:
-                    error_messages[db] = str(exc)
-                    progress.set_postfix_str(f"{db}: failed")
-                    progress.update(1)
-                    continue
-
-                succeeded_dbs.append(db)
-                row_counts[db] = len(rows)
-                progress.set_postfix_str(f"{db}: {len(rows)} rows")
-                progress.update(1)
+            if max_workers is None:
+                for db in requested_dbs:
+                    export(db, partial(_fetch_metadata_table, client, db))
+            else:
+                decoded = decode_in_processes(
+                    _fetch_metadata_payloads(client, requested_dbs),
+                    decode_metadata_payload,
+                    max_workers=max_workers,
+                )
+                for db, result in decoded:
+                    export(db, partial(_unwrap_decoded, result))
     finally:
         progress.close()
 
@@ -203,6 +249,29 @@ def generate_metadata_parquet_files(
     )
 
 
+def _fetch_metadata_table(client: BojClient, db: str) -> pa.Table:
+    metadata = client.get_metadata(db)
+    rows = metadata_entries_to_rows(db, metadata.result_set)
+    return pa.Table.from_pylist(rows, schema=METADATA_PARQUET_SCHEMA)
+
+
+def _fetch_metadata_payloads(
+    client: BojClient,
+    dbs: Sequence[str],
+) -> Iterator[tuple[str, bytes | BaseException]]:
+    for db in dbs:
+        try:
+            yield db, client.get_content(build_metadata_api_url(db))
+        except _EXPORT_ERRORS as exc:
+            yield db, exc
+
+
+def _unwrap_decoded(result: pa.Table | BaseException) -> pa.Table:
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
 def _resolve_dbs(dbs: Sequence[str] | None) -> tuple[str, ...]:
     if dbs is None:
         return tuple(db_info.name for db_info in list_db())
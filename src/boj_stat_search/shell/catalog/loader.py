@@ -3,9 +3,12 @@ from __future__ import annotations
 import os
 import sys
 import tempfile
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Sequence
 from pathlib import Path
+from typing import Generic, TypeVar
 from urllib.parse import quote
 
 import httpx
@@ -13,12 +16,70 @@ import pyarrow as pa
 import pyarrow.parquet as pq
 
 from boj_stat_search.core import list_db
+from boj_stat_search.core.layer_index import LayerIndex
+from boj_stat_search.core.columnar import table_from_ipc_bytes, table_to_ipc_bytes
+from boj_stat_search.core.search_index import (
+    SEARCH_INDEX_FIELDS,
+    SEARCH_INDEX_VERSION,
+    SearchIndex,
+    build_search_index,
+    search_index_from_table,
+    search_index_to_table,
+)
+from boj_stat_search.shell.metrics import (
+    CacheEvent,
+    ClientMetrics,
+    observed_get,
+    record_event,
+    use_metrics,
+)
 
 DEFAULT_CACHE_TTL_SECONDS = 24 * 60 * 60
 DEFAULT_CATALOG_REPO = "savioursho/boj-stat-search-python"
 DEFAULT_CATALOG_REF = "main"
 DEFAULT_METADATA_DIR = "metadata"
 
+# Memoized indexes per cache file; enough for every DB of a couple of cache dirs.
+MEMO_MAX_FILES = 128
+
+_V = TypeVar("_V")
+
+
+class _FileMemo(Generic[_V]):
+    """Values keyed by file path, valid while the file's (mtime_ns, size) match.
+
+    At most ``max_files`` paths are kept; the least recently used is dropped.
+    """
+
+    def __init__(self, max_files: int) -> None:
+        self.max_files = max_files
+        self._entries: OrderedDict[Path, tuple[tuple[int, int], _V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, key: tuple[int, int]) -> _V | None:
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != key:
+                return None
+            self._entries.move_to_end(path)
+            return entry[1]
+
+    def put(self, path: Path, key: tuple[int, int], value: _V) -> None:
+        with self._lock:
+            self._entries[path] = (key, value)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_files:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Parsed search index sidecars.
+_SEARCH_INDEX_MEMO: _FileMemo[SearchIndex] = _FileMemo(MEMO_MAX_FILES)
+# Layer indexes keyed by catalog cache path, with the series codes they cover.
+_LAYER_INDEX_MEMO: _FileMemo[tuple[pa.Array, LayerIndex]] = _FileMemo(MEMO_MAX_FILES)
+
 
 class CatalogError(RuntimeError):
     """Base exception for local catalog loading failures."""
@@ -41,11 +102,38 @@ def load_catalog_db(
     ref: str = DEFAULT_CATALOG_REF,
     metadata_dir: str = DEFAULT_METADATA_DIR,
     client: httpx.Client | None = None,
+    metrics: ClientMetrics | None = None,
 ) -> pa.Table:
-    """Load one DB catalog table, fetching from GitHub raw when cache is stale."""
+    """Load one DB catalog table, fetching from GitHub raw when cache is stale.
+
+    Cache hits and misses and catalog downloads are recorded into ``metrics``,
+    or into the currently active metrics when it is omitted.
+    """
     if cache_ttl_seconds < 0:
         raise ValueError("cache_ttl_seconds must be >= 0")
 
+    with use_metrics(metrics):
+        return _load_catalog_db(
+            db,
+            cache_ttl_seconds=cache_ttl_seconds,
+            cache_dir=cache_dir,
+            repo=repo,
+            ref=ref,
+            metadata_dir=metadata_dir,
+            client=client,
+        )
+
+
+def _load_catalog_db(
+    db: str,
+    *,
+    cache_ttl_seconds: int,
+    cache_dir: str | Path | None,
+    repo: str,
+    ref: str,
+    metadata_dir: str,
+    client: httpx.Client | None,
+) -> pa.Table:
     cache_path = _cache_file_path(db, cache_dir=cache_dir)
     should_refresh = _is_stale(cache_path, ttl_seconds=cache_ttl_seconds)
 
@@ -54,6 +142,7 @@ def load_catalog_db(
 
     try:
         if should_refresh:
+            record_event(CacheEvent(cache="catalog", key=db, hit=False))
             _refresh_cache(
                 db=db,
                 cache_path=cache_path,
@@ -62,25 +151,29 @@ def load_catalog_db(
                 metadata_dir=metadata_dir,
                 client=http_client,
             )
-            return _read_catalog_table(cache_path, db=db)
-
-        try:
-            return _read_catalog_table(cache_path, db=db)
-        except CatalogCacheError:
-            # Recover from a corrupted but "fresh" file by forcing one re-download.
-            _refresh_cache(
-                db=db,
-                cache_path=cache_path,
-                repo=repo,
-                ref=ref,
-                metadata_dir=metadata_dir,
-                client=http_client,
-            )
-            return _read_catalog_table(cache_path, db=db)
+            table = _read_catalog_table(cache_path, db=db)
+        else:
+            try:
+                table = _read_catalog_table(cache_path, db=db)
+                record_event(CacheEvent(cache="catalog", key=db, hit=True))
+            except CatalogCacheError:
+                # Recover from a corrupted but "fresh" file by forcing one re-download.
+                record_event(CacheEvent(cache="catalog", key=db, hit=False))
+                _refresh_cache(
+                    db=db,
+                    cache_path=cache_path,
+                    repo=repo,
+                    ref=ref,
+                    metadata_dir=metadata_dir,
+                    client=http_client,
+                )
+                table = _read_catalog_table(cache_path, db=db)
     finally:
         if owns_client:
             http_client.close()
 
+    return table
+
 
 def load_catalog_all(
     *,
@@ -91,6 +184,7 @@ def load_catalog_all(
     ref: str = DEFAULT_CATALOG_REF,
     metadata_dir: str = DEFAULT_METADATA_DIR,
     client: httpx.Client | None = None,
+    metrics: ClientMetrics | None = None,
 ) -> pa.Table:
     """Load and concatenate catalog tables for all (or selected) DBs."""
     resolved_dbs = _resolve_dbs(dbs)
@@ -110,6 +204,7 @@ def load_catalog_all(
                 ref=ref,
                 metadata_dir=metadata_dir,
                 client=http_client,
+                metrics=metrics,
             )
             for db in resolved_dbs
         ]
@@ -149,7 +244,7 @@ def _refresh_cache(
     content = _download_parquet(url, client=client)
 
     try:
-        _atomic_write_bytes(cache_path, content)
+        atomic_write_bytes(cache_path, content)
     except OSError as exc:
         raise CatalogCacheError(
             f"Failed to write catalog cache file for {db} at {cache_path}"
@@ -171,9 +266,102 @@ def _read_catalog_table(cache_path: Path, *, db: str) -> pa.Table:
     return table.append_column("db", db_column)
 
 
+def load_search_index(
+    db: str, table: pa.Table, *, cache_dir: str | Path | None = None
+) -> SearchIndex | None:
+    """Return the persisted search index for ``db`` if it was built from ``table``.
+
+    A sidecar older than the cached catalog is ignored.
+    """
+    cache_path = _cache_file_path(db, cache_dir=cache_dir)
+    index_path = _search_index_file_path(cache_path)
+    try:
+        stat = index_path.stat()
+        if stat.st_mtime_ns < cache_path.stat().st_mtime_ns:
+            return None
+    except OSError:
+        return None
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    index = _SEARCH_INDEX_MEMO.get(index_path, key)
+    record_event(CacheEvent(cache="search_index", key=db, hit=index is not None))
+    if index is None:
+        try:
+            index = search_index_from_table(
+                table_from_ipc_bytes(index_path.read_bytes())
+            )
+        except (OSError, ValueError, pa.ArrowException, KeyError):
+            return None
+        _SEARCH_INDEX_MEMO.put(index_path, key, index)
+
+    return index if index.matches_table(table) else None
+
+
+def ensure_search_index(
+    db: str, table: pa.Table, *, cache_dir: str | Path | None = None
+) -> SearchIndex | None:
+    """Return the search index for ``db``'s cached ``table``, building it on first use.
+
+    A missing or outdated sidecar is built from ``table`` and written next to
+    the cached catalog, replacing the sidecars of other index versions. Returns
+    ``None`` when ``table`` lacks the searchable columns.
+    """
+    index = load_search_index(db, table, cache_dir=cache_dir)
+    if index is not None:
+        return index
+    if "series_code" not in table.column_names or any(
+        name not in table.column_names for name in SEARCH_INDEX_FIELDS
+    ):
+        return None
+
+    index = build_search_index(table)
+    cache_path = _cache_file_path(db, cache_dir=cache_dir)
+    if cache_path.exists():
+        _write_search_index(index, cache_path=cache_path)
+    return index
+
+
+def load_layer_index(
+    db: str, table: pa.Table, *, cache_dir: str | Path | None = None
+) -> LayerIndex:
+    """Return the layer index for ``db``'s table, built once per cached catalog file."""
+    cache_path = _cache_file_path(db, cache_dir=cache_dir)
+    try:
+        stat = cache_path.stat()
+    except OSError:
+        return LayerIndex.from_table(table)
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    series_code = table["series_code"].combine_chunks()
+    memo = _LAYER_INDEX_MEMO.get(cache_path, key)
+    if memo is not None and memo[0].equals(series_code):
+        record_event(CacheEvent(cache="layer_index", key=db, hit=True))
+        return memo[1]
+
+    record_event(CacheEvent(cache="layer_index", key=db, hit=False))
+    index = LayerIndex.from_table(table)
+    _LAYER_INDEX_MEMO.put(cache_path, key, (series_code, index))
+    return index
+
+
+def _write_search_index(index: SearchIndex, *, cache_path: Path) -> None:
+    index_path = _search_index_file_path(cache_path)
+    try:
+        atomic_write_bytes(
+            index_path,
+            table_to_ipc_bytes(search_index_to_table(index), compression="zstd"),
+        )
+    except (OSError, ValueError, pa.ArrowException):
+        # The index only speeds up search; without a sidecar it is rebuilt next time.
+        return
+    for stale_path in cache_path.parent.glob(f"{cache_path.stem}.index-v*.arrow"):
+        if stale_path != index_path:
+            stale_path.unlink(missing_ok=True)
+
+
 def _download_parquet(url: str, *, client: httpx.Client) -> bytes:
     try:
-        response = client.get(url)
+        response = observed_get(client, url, endpoint="catalog")
         response.raise_for_status()
     except httpx.HTTPError as exc:
         raise CatalogFetchError(f"Failed to download catalog data from {url}") from exc
@@ -188,13 +376,19 @@ def _cache_file_path(db: str, *, cache_dir: str | Path | None) -> Path:
     return _cache_root(cache_dir) / f"{db}.parquet"
 
 
+def _search_index_file_path(cache_path: Path) -> Path:
+    # The format version is part of the name so upgrades rebuild the sidecar.
+    return cache_path.with_suffix(f".index-v{SEARCH_INDEX_VERSION}.arrow")
+
+
 def _cache_root(cache_dir: str | Path | None) -> Path:
     if cache_dir is not None:
         return Path(cache_dir).expanduser()
-    return _default_cache_root()
+    return default_cache_root()
 
 
-def _default_cache_root() -> Path:
+def default_cache_root() -> Path:
+    """Platform cache directory for the catalog; other caches sit beside it."""
     if os.name == "nt":
         base = Path(os.environ.get("LOCALAPPDATA") or (Path.home() / "AppData/Local"))
     elif sys.platform == "darwin":
@@ -222,7 +416,8 @@ def _build_raw_url(*, repo: str, ref: str, db: str, metadata_dir: str) -> str:
     )
 
 
-def _atomic_write_bytes(path: Path, content: bytes) -> None:
+def atomic_write_bytes(path: Path, content: bytes) -> None:
+    """Write ``content`` through a temporary file so readers never see part of it."""
     path.parent.mkdir(parents=True, exist_ok=True)
     temp_path: Path | None = None
 
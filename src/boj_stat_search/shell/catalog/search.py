@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import warnings
-from collections.abc import Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from pathlib import Path
 
 import httpx
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
 from boj_stat_search.shell.catalog.loader import (
@@ -16,23 +17,35 @@ from boj_stat_search.shell.catalog.loader import (
     _cache_file_path,
     CatalogCacheError,
     CatalogError,
+    ensure_search_index,
     load_catalog_all,
     load_catalog_db,
+    load_layer_index,
 )
 from boj_stat_search.core import (
     Layer,
+    SeriesCatalogResult,
     list_db,
     resolve_db_from_tables as _core_resolve_db_from_tables,
-    table_to_entries as _core_table_to_entries,
+)
+from boj_stat_search.core.search_index import (
+    KEYWORD_FIELDS,
+    build_search_index,
+    normalize_search_text,
+    search_index_rows,
+)
+from boj_stat_search.core.search_rank import (
+    TermMatches,
+    match_search_terms,
+    resolve_field_weights,
+    score_term_matches,
+    top_ranked,
 )
 from boj_stat_search.core.validator import coerce_layer
-from boj_stat_search.core.models import SeriesCatalogEntry
-
-_SEARCH_FIELDS: tuple[str, ...] = ("name_j", "name_en", "category_j", "category_en")
 
 
 def search_series(
-    keyword: str,
+    keyword: str | Sequence[str],
     *,
     db: str | None = None,
     dbs: Sequence[str] | None = None,
@@ -43,53 +56,111 @@ def search_series(
     ref: str = DEFAULT_CATALOG_REF,
     metadata_dir: str = DEFAULT_METADATA_DIR,
     client: httpx.Client | None = None,
-) -> tuple[SeriesCatalogEntry, ...]:
-    """Search local metadata catalog entries by keyword."""
-    normalized_keyword = _normalize_keyword(keyword)
+) -> SeriesCatalogResult:
+    """Search local metadata catalog entries by keyword.
+
+    ``keyword`` may be a sequence of terms, in which case entries must contain
+    every term. Keywords are resolved through the n-gram index persisted next to
+    each cached catalog file, falling back to a scan when it is unavailable.
+    Entries in the returned view are only built when accessed.
+    """
+    terms = _normalize_keyword(keyword)
     known_dbs = {db_info.name for db_info in list_db()}
     resolved_dbs = _resolve_dbs(db=db, dbs=dbs, known_dbs=known_dbs)
-    layer_parts = _coerce_and_validate_layer(layer)
+    layer_parts = normalize_layer_parts(layer)
 
     if resolved_dbs is not None and len(resolved_dbs) == 0:
-        return ()
+        return SeriesCatalogResult.empty()
 
-    if resolved_dbs is None:
-        table = load_catalog_all(
-            cache_ttl_seconds=cache_ttl_seconds,
-            cache_dir=cache_dir,
-            repo=repo,
-            ref=ref,
-            metadata_dir=metadata_dir,
-            client=client,
-        )
-    elif len(resolved_dbs) == 1:
-        table = load_catalog_db(
-            resolved_dbs[0],
-            cache_ttl_seconds=cache_ttl_seconds,
-            cache_dir=cache_dir,
-            repo=repo,
-            ref=ref,
-            metadata_dir=metadata_dir,
-            client=client,
-        )
+    table = _load_catalog_tables(
+        resolved_dbs,
+        cache_ttl_seconds=cache_ttl_seconds,
+        cache_dir=cache_dir,
+        repo=repo,
+        ref=ref,
+        metadata_dir=metadata_dir,
+        client=client,
+    )
+    catalog = _catalog_result(table).to_arrow()
+    rows = _keyword_rows(catalog, terms, cache_dir=cache_dir)
+    if layer_parts is not None:
+        layer_rows = layer_row_positions(catalog, layer_parts, cache_dir=cache_dir)
+        rows = rows.filter(pc.is_in(rows, value_set=layer_rows))
+    return _catalog_result(catalog.take(rows))
+
+
+def rank_series(
+    query: str | Sequence[str],
+    *,
+    limit: int | None = 20,
+    field_weights: Mapping[str, float] | None = None,
+    db: str | None = None,
+    dbs: Sequence[str] | None = None,
+    layer: Layer | str | None = None,
+    cache_ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS,
+    cache_dir: str | Path | None = None,
+    repo: str = DEFAULT_CATALOG_REPO,
+    ref: str = DEFAULT_CATALOG_REF,
+    metadata_dir: str = DEFAULT_METADATA_DIR,
+    client: httpx.Client | None = None,
+) -> SeriesCatalogResult:
+    """Rank local metadata catalog entries by BM25F relevance to ``query``.
+
+    A string query is split on whitespace; a sequence is used term by term, so
+    a term may contain spaces. Entries matching any term in name, category or
+    notes are scored with ``field_weights`` (see ``DEFAULT_FIELD_WEIGHTS``) and
+    only the best ``limit`` are selected. The returned view is ordered by
+    descending relevance and its ``to_arrow()`` table has a ``score`` column.
+    """
+    if isinstance(query, str):
+        terms = _normalize_keyword(query.split() or query)
     else:
-        table = load_catalog_all(
-            dbs=resolved_dbs,
-            cache_ttl_seconds=cache_ttl_seconds,
-            cache_dir=cache_dir,
-            repo=repo,
-            ref=ref,
-            metadata_dir=metadata_dir,
-            client=client,
-        )
+        terms = _normalize_keyword(query)
+    if limit is not None and (
+        isinstance(limit, bool) or not isinstance(limit, int) or limit < 1
+    ):
+        raise ValueError("limit: must be a positive integer or None")
+    weights = resolve_field_weights(field_weights)
+    known_dbs = {db_info.name for db_info in list_db()}
+    resolved_dbs = _resolve_dbs(db=db, dbs=dbs, known_dbs=known_dbs)
+    layer_parts = normalize_layer_parts(layer)
 
-    entries = _table_to_entries(table)
+    if resolved_dbs is not None and len(resolved_dbs) == 0:
+        return SeriesCatalogResult.empty()
 
-    return tuple(
-        entry
-        for entry in entries
-        if _row_matches_layer(entry, layer_parts)
-        and _row_matches_keyword(entry, normalized_keyword)
+    table = _load_catalog_tables(
+        resolved_dbs,
+        cache_ttl_seconds=cache_ttl_seconds,
+        cache_dir=cache_dir,
+        repo=repo,
+        ref=ref,
+        metadata_dir=metadata_dir,
+        client=client,
+    )
+    catalog = _catalog_result(table).to_arrow()
+    if catalog.num_rows == 0:
+        return _catalog_result(catalog)
+
+    matches = TermMatches.concat(
+        [
+            match_search_terms(
+                ensure_search_index(db_name, segment, cache_dir=cache_dir)
+                or build_search_index(segment),
+                terms,
+            ).offset(start)
+            for db_name, start, segment in _db_segments(catalog)
+        ]
+    )
+    scores = score_term_matches(matches, field_weights=weights)
+
+    rows = matches.rows
+    if layer_parts is not None:
+        layer_rows = layer_row_positions(catalog, layer_parts, cache_dir=cache_dir)
+        in_layer = pc.is_in(rows, value_set=layer_rows)
+        rows, scores = rows.filter(in_layer), scores.filter(in_layer)
+    ranked = top_ranked(rows, scores, limit=limit)
+    return _catalog_result(
+        catalog.take(ranked["row"]).append_column("score", ranked["score"])
     )
 
 
@@ -102,7 +173,7 @@ def list_series(
     ref: str = DEFAULT_CATALOG_REF,
     metadata_dir: str = DEFAULT_METADATA_DIR,
     client: httpx.Client | None = None,
-) -> tuple[SeriesCatalogEntry, ...]:
+) -> SeriesCatalogResult:
     """List all local metadata catalog entries for one DB."""
     known_dbs = {db_info.name for db_info in list_db()}
     _validate_db_name(db, known_dbs=known_dbs)
@@ -116,7 +187,7 @@ def list_series(
         metadata_dir=metadata_dir,
         client=client,
     )
-    return _table_to_entries(table)
+    return _catalog_result(table)
 
 
 def resolve_db(
@@ -161,13 +232,104 @@ def resolve_db(
     return _core_resolve_db_from_tables(normalized_series_code, tables)
 
 
-def _normalize_keyword(keyword: str) -> str:
-    if not isinstance(keyword, str):
-        raise ValueError("keyword: must be a string")
-    normalized = keyword.strip()
-    if not normalized:
+def normalize_layer_parts(layer: Layer | str | None) -> tuple[str, ...] | None:
+    """Split a layer filter into its validated levels; None passes through."""
+    if layer is None:
+        return None
+
+    normalized = coerce_layer(layer)
+    if not isinstance(normalized, str):
+        raise ValueError("layer: must be a string or Layer")
+    if normalized == "":
+        raise ValueError("layer: must not be empty")
+
+    parts = [part.strip() for part in normalized.split(",")]
+    if len(parts) < 1 or len(parts) > 5:
+        raise ValueError("layer: must have between 1 and 5 comma-separated values")
+    if any(part == "" for part in parts):
+        raise ValueError("layer: must not contain empty layer values")
+
+    for part in parts:
+        if part != "*" and not part.isdigit():
+            raise ValueError("layer: each layer must be '*' or digits only")
+
+    return tuple(parts)
+
+
+def layer_row_positions(
+    table: pa.Table, layer_parts: tuple[str, ...], *, cache_dir: str | Path | None
+) -> pa.Array:
+    """Return positions of rows under ``layer_parts`` by walking each DB's layer index.
+
+    ``table`` is a catalog of one or more DBs, each in one contiguous run of
+    rows, as ``list_series`` and ``search_series`` return them.
+    """
+    positions: list[pa.Array] = [pa.array([], type=pa.int64())]
+    for db, start, segment in _db_segments(table):
+        index = load_layer_index(db, segment, cache_dir=cache_dir)
+        positions.append(pc.add(index.rows(layer_parts).cast(pa.int64()), start))
+    return pa.concat_arrays(positions)
+
+
+def _load_catalog_tables(
+    resolved_dbs: tuple[str, ...] | None,
+    *,
+    cache_ttl_seconds: int,
+    cache_dir: str | Path | None,
+    repo: str,
+    ref: str,
+    metadata_dir: str,
+    client: httpx.Client | None,
+) -> pa.Table:
+    if resolved_dbs is None:
+        return load_catalog_all(
+            cache_ttl_seconds=cache_ttl_seconds,
+            cache_dir=cache_dir,
+            repo=repo,
+            ref=ref,
+            metadata_dir=metadata_dir,
+            client=client,
+        )
+    if len(resolved_dbs) == 1:
+        return load_catalog_db(
+            resolved_dbs[0],
+            cache_ttl_seconds=cache_ttl_seconds,
+            cache_dir=cache_dir,
+            repo=repo,
+            ref=ref,
+            metadata_dir=metadata_dir,
+            client=client,
+        )
+    return load_catalog_all(
+        dbs=resolved_dbs,
+        cache_ttl_seconds=cache_ttl_seconds,
+        cache_dir=cache_dir,
+        repo=repo,
+        ref=ref,
+        metadata_dir=metadata_dir,
+        client=client,
+    )
+
+
+def _normalize_keyword(keyword: str | Sequence[str]) -> tuple[str, ...]:
+    if isinstance(keyword, str):
+        keywords: Sequence[object] = (keyword,)
+    elif isinstance(keyword, Sequence):
+        keywords = keyword
+    else:
+        raise ValueError("keyword: must be a string or a sequence of strings")
+
+    terms: list[str] = []
+    for term in keywords:
+        if not isinstance(term, str):
+            raise ValueError("keyword: must be a string or a sequence of strings")
+        normalized = term.strip()
+        if not normalized:
+            raise ValueError("keyword: must not be empty")
+        terms.append(normalize_search_text(normalized))
+    if not terms:
         raise ValueError("keyword: must not be empty")
-    return normalized.casefold()
+    return tuple(dict.fromkeys(terms))
 
 
 def _resolve_dbs(
@@ -208,62 +370,56 @@ def _validate_db_name(db: str, *, known_dbs: set[str]) -> None:
         raise ValueError("db: must be one of known DB names in list_db()")
 
 
-def _coerce_and_validate_layer(layer: Layer | str | None) -> tuple[str, ...] | None:
-    if layer is None:
-        return None
-
-    normalized = coerce_layer(layer)
-    if not isinstance(normalized, str):
-        raise ValueError("layer: must be a string or Layer")
-    if normalized == "":
-        raise ValueError("layer: must not be empty")
-
-    parts = [part.strip() for part in normalized.split(",")]
-    if len(parts) < 1 or len(parts) > 5:
-        raise ValueError("layer: must have between 1 and 5 comma-separated values")
-    if any(part == "" for part in parts):
-        raise ValueError("layer: must not contain empty layer values")
-
-    for part in parts:
-        if part != "*" and not part.isdigit():
-            raise ValueError("layer: each layer must be '*' or digits only")
-
-    return tuple(parts)
-
-
-def _row_matches_layer(
-    row: SeriesCatalogEntry, layer_parts: tuple[str, ...] | None
-) -> bool:
-    if layer_parts is None:
-        return True
-
-    row_layers = (
-        str(row.layer1),
-        str(row.layer2),
-        str(row.layer3),
-        str(row.layer4),
-        str(row.layer5),
-    )
-
-    for index, expected in enumerate(layer_parts):
-        if expected == "*":
-            continue
-        if row_layers[index] != expected:
-            return False
-
-    return True
-
-
-def _row_matches_keyword(row: SeriesCatalogEntry, normalized_keyword: str) -> bool:
-    for field in _SEARCH_FIELDS:
-        value = getattr(row, field)
-        if normalized_keyword in value.casefold():
-            return True
-    return False
-
-
-def _table_to_entries(table: pa.Table) -> tuple[SeriesCatalogEntry, ...]:
+def _keyword_rows(
+    table: pa.Table, terms: tuple[str, ...], *, cache_dir: str | Path | None
+) -> pa.Array:
+    """Return positions of rows containing every term, one DB segment at a time."""
+    if table.num_rows == 0:
+        return pa.array([], type=pa.int64())
+
+    positions: list[pa.Array] = []
+    for db, start, segment in _db_segments(table):
+        index = ensure_search_index(db, segment, cache_dir=cache_dir)
+        rows = (
+            search_index_rows(index, terms)
+            if index is not None
+            else _scan_rows(segment, terms)
+        )
+        positions.append(pc.add(rows.cast(pa.int64()), start))
+    return pa.concat_arrays(positions)
+
+
+def _db_segments(table: pa.Table) -> Iterator[tuple[str, int, pa.Table]]:
+    # Catalog tables are concatenations of per-DB tables, so each DB is one run.
+    db_runs = pc.run_end_encode(table["db"].combine_chunks())
+    start = 0
+    for db, end in zip(db_runs.values.to_pylist(), db_runs.run_ends.to_pylist()):
+        yield db, start, table.slice(start, end - start)
+        start = end
+
+
+def _scan_rows(table: pa.Table, terms: tuple[str, ...]) -> pa.Array:
+    # Normalize each distinct value once rather than every row.
+    encoded_fields = []
+    for field in KEYWORD_FIELDS:
+        encoded = table[field].combine_chunks().dictionary_encode()
+        normalized = [
+            normalize_search_text(value) for value in encoded.dictionary.to_pylist()
+        ]
+        encoded_fields.append((encoded.indices, normalized))
+
+    mask = pa.repeat(pa.scalar(True), table.num_rows)
+    for term in terms:
+        term_mask = pa.repeat(pa.scalar(False), table.num_rows)
+        for indices, normalized in encoded_fields:
+            matched = pa.array([term in value for value in normalized], type=pa.bool_())
+            term_mask = pc.or_(term_mask, matched.take(indices))
+        mask = pc.and_(mask, term_mask)
+    return pc.indices_nonzero(mask)
+
+
+def _catalog_result(table: pa.Table) -> SeriesCatalogResult:
     try:
-        return _core_table_to_entries(table)
+        return SeriesCatalogResult(table)
     except ValueError as exc:
         raise CatalogError(str(exc)) from exc
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from boj_stat_search.core.catalog_parser import table_to_metadata_entries
+from boj_stat_search.core.formatter import layer_index_for_entries
+from boj_stat_search.core.layer_index import LayerIndex
+from boj_stat_search.core.models import MetadataEntry, MetadataResponse
+from boj_stat_search.shell.catalog.exporter import (
+    METADATA_PARQUET_SCHEMA,
+    metadata_entries_to_rows,
+)
+from boj_stat_search.shell.catalog.loader import (
+    DEFAULT_CACHE_TTL_SECONDS,
+    CatalogCacheError,
+    atomic_write_bytes,
+    _cache_root,
+    load_catalog_db,
+    load_layer_index,
+)
+
+
+def write_metadata_snapshot(
+    response: MetadataResponse, *, cache_dir: str | Path | None = None
+) -> Path:
+    """Cache a ``getMetadata`` result, header rows included, next to the catalog."""
+    rows = metadata_entries_to_rows(
+        response.db, response.result_set, include_headers=True
+    )
+    table = pa.Table.from_pylist(rows, schema=METADATA_PARQUET_SCHEMA)
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink)
+
+    path = _snapshot_file_path(response.db, cache_dir=cache_dir)
+    try:
+        atomic_write_bytes(path, sink.getvalue().to_pybytes())
+    except OSError as exc:
+        raise CatalogCacheError(
+            f"Failed to write metadata snapshot for {response.db} at {path}"
+        ) from exc
+    return path
+
+
+def load_metadata_snapshot(
+    db: str, *, cache_dir: str | Path | None = None
+) -> tuple[MetadataEntry, ...] | None:
+    """Return the cached ``getMetadata`` entries for ``db``, or None if absent."""
+    path = _snapshot_file_path(db, cache_dir=cache_dir)
+    if not path.exists():
+        return None
+
+    try:
+        table = pq.read_table(path)
+        return table_to_metadata_entries(table)
+    except (OSError, ValueError, pa.ArrowException) as exc:
+        raise CatalogCacheError(
+            f"Failed to read metadata snapshot for {db} at {path}"
+        ) from exc
+
+
+def load_layer_entries(
+    db: str,
+    *,
+    cache_ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS,
+    cache_dir: str | Path | None = None,
+    client: httpx.Client | None = None,
+) -> tuple[tuple[MetadataEntry, ...], LayerIndex]:
+    """Return layer tree entries for ``db`` without calling the BOJ API.
+
+    A metadata snapshot is preferred because it keeps the unnamed header rows.
+    Otherwise the entries come from the local catalog, which lists series
+    only, so the tree has no header lines.
+    """
+    entries = load_metadata_snapshot(db, cache_dir=cache_dir)
+    if entries is not None:
+        return layer_index_for_entries(entries)
+
+    table = load_catalog_db(
+        db, cache_ttl_seconds=cache_ttl_seconds, cache_dir=cache_dir, client=client
+    )
+    return (
+        table_to_metadata_entries(table),
+        load_layer_index(db, table, cache_dir=cache_dir),
+    )
+
+
+def _snapshot_file_path(db: str, *, cache_dir: str | Path | None) -> Path:
+    return _cache_root(cache_dir) / f"{db}.metadata.parquet"
@@ -1,23 +1,143 @@
+import contextlib
 import json
+import sys
+from collections.abc import Callable, Iterator
 from dataclasses import asdict
-from typing import Annotated, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Any, Optional
 
 import typer
 
-from boj_stat_search.shell.api import (
-    BojApiError,
-    get_data_code,
-    get_data_layer,
-    get_metadata,
-)
-from boj_stat_search.shell.catalog.exporter import generate_metadata_parquet_files
-from boj_stat_search.core import list_db
-from boj_stat_search.shell.display import show_layers
+from boj_stat_search.core.database import list_db
+
+if TYPE_CHECKING:
+    from boj_stat_search.core.models import DataResponse
+
+# Commands import the API client, pyarrow-backed catalog modules and the
+# formatter when they run, so `--help` and `list-db` start without them.
 
 app = typer.Typer(
     help="Query Bank of Japan Time Series Statistical Data from the terminal."
 )
 
+ProfileOption = Annotated[
+    bool,
+    typer.Option(
+        "--profile",
+        help="Print per-phase request timings to stderr",
+    ),
+]
+
+DATA_FORMATS = ("json", "ndjson", "csv", "arrow")
+
+OutputFormatOption = Annotated[
+    str,
+    typer.Option(
+        "--format",
+        help=(
+            "Output format: json (one document), or streamed as data arrives: "
+            "ndjson (one series per line), csv (one observation per row) or "
+            "arrow (Arrow IPC stream)"
+        ),
+    ),
+]
+
+AllPagesOption = Annotated[
+    bool,
+    typer.Option(
+        "--all-pages",
+        help="Follow NEXTPOSITION and write each page as it arrives (not with json)",
+    ),
+]
+
+MinRequestIntervalOption = Annotated[
+    float,
+    typer.Option(
+        "--min-request-interval",
+        help="Minimum delay in seconds between BOJ API requests",
+    ),
+]
+
+
+def _profiling(enabled: bool) -> contextlib.AbstractContextManager[None]:
+    if not enabled:
+        return contextlib.nullcontext()
+
+    from boj_stat_search.core.formatter import format_phase_timings
+    from boj_stat_search.shell.profiling import profile_requests
+
+    return profile_requests(
+        lambda endpoint, timings: typer.echo(
+            format_phase_timings(endpoint, timings), err=True
+        )
+    )
+
+
+def _response_json(result: Any) -> str:
+    payload = asdict(result)
+    payload.pop("timings", None)
+    return json.dumps(payload, ensure_ascii=False, indent=2)
+
+
+def _data_pages(
+    fetch: Callable[[Optional[int]], "DataResponse"],
+    start_position: Optional[int],
+    all_pages: bool,
+) -> Iterator["DataResponse"]:
+    position = start_position
+    while True:
+        response = fetch(position)
+        yield response
+        if not all_pages or response.next_position is None:
+            return
+        position = response.next_position
+
+
+def _write_data_pages(pages: Iterator["DataResponse"], output_format: str) -> None:
+    """Write data pages to stdout, each as soon as it has been fetched."""
+    if output_format == "json":
+        for page in pages:
+            typer.echo(_response_json(page))
+        return
+
+    if output_format == "arrow":
+        import pyarrow as pa
+
+        from boj_stat_search.core.columnar import (
+            DATA_TABLE_SCHEMA,
+            data_response_to_table,
+        )
+
+        stream = sys.stdout.buffer
+        with pa.ipc.new_stream(stream, DATA_TABLE_SCHEMA) as writer:
+            for page in pages:
+                for batch in data_response_to_table(page).to_batches():
+                    writer.write_batch(batch)
+                stream.flush()
+        return
+
+    from boj_stat_search.core.formatter import iter_data_csv, iter_data_ndjson
+
+    for number, page in enumerate(pages):
+        chunks = (
+            iter_data_ndjson(page)
+            if output_format == "ndjson"
+            else iter_data_csv(page, header=number == 0)
+        )
+        for chunk in chunks:
+            typer.echo(chunk, nl=False)
+
+
+def _check_data_format(output_format: str, all_pages: bool) -> None:
+    message = None
+    if output_format not in DATA_FORMATS:
+        message = f"format: must be one of {', '.join(DATA_FORMATS)}"
+    elif all_pages and output_format == "json":
+        message = "all-pages: needs --format ndjson, csv or arrow"
+    if message is not None:
+        typer.echo(f"Invalid option: {message}", err=True)
+        raise typer.Exit(code=1)
+
 
 @app.command("list-db")
 def list_db_cmd() -> None:
@@ -34,15 +154,19 @@ def list_db_cmd() -> None:
 @app.command("get-metadata")
 def get_metadata_cmd(
     db: Annotated[str, typer.Argument(help="Database code (e.g. FM01)")],
+    profile: ProfileOption = False,
 ) -> None:
     """Get metadata for a database and print as JSON."""
+    from boj_stat_search.shell.api import BojApiError, get_metadata
+
     try:
-        result = get_metadata(db)
+        with _profiling(profile):
+            result = get_metadata(db)
     except BojApiError as exc:
         typer.echo(f"API error: {exc}", err=True)
         raise typer.Exit(code=1) from exc
 
-    typer.echo(json.dumps(asdict(result), ensure_ascii=False, indent=2))
+    typer.echo(_response_json(result))
 
 
 @app.command("show-layers")
@@ -54,16 +178,90 @@ def show_layers_cmd(
             "--layer", "-l", help="Filter to a specific layer (e.g. '1' or '1,2')"
         ),
     ] = None,
+    max_depth: Annotated[
+        Optional[int],
+        typer.Option(
+            "--max-depth",
+            min=1,
+            max=5,
+            help="Summarize entries deeper than this many layers",
+        ),
+    ] = None,
+    collapse: Annotated[
+        Optional[list[str]],
+        typer.Option(
+            "--collapse",
+            help="Summarize the subtree under a layer path (e.g. '1,2'; repeatable)",
+        ),
+    ] = None,
+    offline: Annotated[
+        bool,
+        typer.Option(
+            "--offline",
+            help=(
+                "Read the tree from the local metadata snapshot or catalog "
+                "instead of calling the BOJ API"
+            ),
+        ),
+    ] = False,
+    save_snapshot: Annotated[
+        bool,
+        typer.Option(
+            "--save-snapshot",
+            help=(
+                "Save the fetched metadata as the local snapshot that "
+                "--offline reads (ignored with --offline)"
+            ),
+        ),
+    ] = False,
+    profile: ProfileOption = False,
 ) -> None:
-    """Show the layer structure of a database."""
+    """Show the layer structure of a database.
+
+    Lines are printed as they are rendered, so large trees start immediately.
+    """
+    from boj_stat_search.shell.api import BojApiError, get_metadata
+    from boj_stat_search.shell.catalog.loader import CatalogError
+    from boj_stat_search.shell.catalog.snapshot import (
+        load_layer_entries,
+        write_metadata_snapshot,
+    )
+    from boj_stat_search.shell.display import show_layers
+
+    layer_index = None
+    if offline:
+        try:
+            entries, layer_index = load_layer_entries(db)
+        except CatalogError as exc:
+            typer.echo(f"Catalog error: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+    else:
+        try:
+            with _profiling(profile):
+                result = get_metadata(db)
+        except BojApiError as exc:
+            typer.echo(f"API error: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+        entries = result.result_set
+        if save_snapshot:
+            try:
+                write_metadata_snapshot(result)
+            except CatalogError as exc:
+                # The snapshot only serves later --offline runs.
+                typer.echo(f"Snapshot not saved: {exc}", err=True)
+
     try:
-        result = get_metadata(db)
-    except BojApiError as exc:
-        typer.echo(f"API error: {exc}", err=True)
+        show_layers(
+            entries,
+            layer,
+            layer_index=layer_index,
+            max_depth=max_depth,
+            collapse=collapse or (),
+        )
+    except ValueError as exc:
+        typer.echo(f"Invalid option: {exc}", err=True)
         raise typer.Exit(code=1) from exc
 
-    show_layers(result.result_set, layer)
-
 
 @app.command("get-data-code")
 def get_data_code_cmd(
@@ -81,22 +279,36 @@ def get_data_code_cmd(
         Optional[int],
         typer.Option("--start-position", "-p", help="Start position for pagination"),
     ] = None,
+    output_format: OutputFormatOption = "json",
+    all_pages: AllPagesOption = False,
+    min_request_interval: MinRequestIntervalOption = 1.0,
+    profile: ProfileOption = False,
 ) -> None:
-    """Get data by series code and print as JSON."""
+    """Get data by series code and print as JSON, NDJSON, CSV or Arrow."""
+    from boj_stat_search.shell.api import BojApiError
+    from boj_stat_search.shell.client import BojClient
+
+    _check_data_format(output_format, all_pages)
     try:
-        result = get_data_code(
-            db=db,
-            code=code,
-            start_date=start_date,
-            end_date=end_date,
-            start_position=start_position,
-        )
+        # One client for every page, so they share its connection and throttle.
+        with BojClient(min_request_interval=min_request_interval) as client:
+            pages = _data_pages(
+                lambda position: client.get_data_code(
+                    db=db,
+                    code=code,
+                    start_date=start_date,
+                    end_date=end_date,
+                    start_position=position,
+                ),
+                start_position,
+                all_pages,
+            )
+            with _profiling(profile):
+                _write_data_pages(pages, output_format)
     except BojApiError as exc:
         typer.echo(f"API error: {exc}", err=True)
         raise typer.Exit(code=1) from exc
 
-    typer.echo(json.dumps(asdict(result), ensure_ascii=False, indent=2))
-
 
 @app.command("get-data-layer")
 def get_data_layer_cmd(
@@ -115,22 +327,206 @@ def get_data_layer_cmd(
         Optional[int],
         typer.Option("--start-position", "-p", help="Start position for pagination"),
     ] = None,
+    output_format: OutputFormatOption = "json",
+    all_pages: AllPagesOption = False,
+    min_request_interval: MinRequestIntervalOption = 1.0,
+    profile: ProfileOption = False,
 ) -> None:
-    """Get data by layer and print as JSON."""
+    """Get data by layer and print as JSON, NDJSON, CSV or Arrow."""
+    from boj_stat_search.shell.api import BojApiError
+    from boj_stat_search.shell.client import BojClient
+
+    _check_data_format(output_format, all_pages)
     try:
-        result = get_data_layer(
-            db=db,
-            frequency=frequency,
-            layer=layer,
-            start_date=start_date,
-            end_date=end_date,
-            start_position=start_position,
+        with BojClient(min_request_interval=min_request_interval) as client:
+            pages = _data_pages(
+                lambda position: client.get_data_layer(
+                    db=db,
+                    frequency=frequency,
+                    layer=layer,
+                    start_date=start_date,
+                    end_date=end_date,
+                    start_position=position,
+                ),
+                start_position,
+                all_pages,
+            )
+            with _profiling(profile):
+                _write_data_pages(pages, output_format)
+    except BojApiError as exc:
+        typer.echo(f"API error: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+
+@app.command("download")
+def download_cmd(
+    output_dir: Annotated[
+        str, typer.Argument(help="Directory to write the partitioned dataset to")
+    ],
+    code: Annotated[
+        Optional[list[str]],
+        typer.Option(
+            "--code",
+            "-c",
+            help="Series code as DB'CODE, or CODE with --db (repeatable, comma lists)",
+        ),
+    ] = None,
+    codes_file: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--codes-file",
+            help="File of series codes, one per line in the --code form",
+        ),
+    ] = None,
+    layer: Annotated[
+        Optional[list[str]],
+        typer.Option(
+            "--layer",
+            "-l",
+            help="Layer under --db with --frequency (e.g. '1,*'; repeatable)",
+        ),
+    ] = None,
+    db: Annotated[
+        Optional[str],
+        typer.Option("--db", help="Database for --layer and codes without a DB"),
+    ] = None,
+    frequency: Annotated[
+        Optional[str],
+        typer.Option("--frequency", help="Frequency of the --layer series"),
+    ] = None,
+    start_date: Annotated[
+        Optional[str],
+        typer.Option("--start-date", "-s", help="Start date (YYYY or YYYYMM)"),
+    ] = None,
+    end_date: Annotated[
+        Optional[str],
+        typer.Option("--end-date", "-e", help="End date (YYYY or YYYYMM)"),
+    ] = None,
+    file_format: Annotated[
+        str,
+        typer.Option("--format", help="Dataset file format: parquet or arrow"),
+    ] = "parquet",
+    compression: Annotated[
+        str,
+        typer.Option(
+            "--compression",
+            help="Codec: none, snappy, gzip, brotli, zstd or lz4 (arrow: none, zstd, lz4)",
+        ),
+    ] = "zstd",
+    workers: Annotated[
+        int,
+        typer.Option("--workers", min=1, help="Requests to run at once"),
+    ] = 4,
+    min_request_interval: MinRequestIntervalOption = 1.0,
+    job_dir: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--job-dir",
+            help="Directory of the resumable job journal (default: OUTPUT_DIR/.job)",
+        ),
+    ] = None,
+    restart: Annotated[
+        bool,
+        typer.Option("--restart", help="Discard the progress of an earlier run"),
+    ] = False,
+) -> None:
+    """Download series into a Parquet or Arrow dataset partitioned by DB and frequency.
+
+    Codes and layers are planned against the local catalog, fetched in
+    parallel under the request interval, and journalled page by page, so an
+    interrupted download resumes when the same command is run again.
+    """
+    import shutil
+
+    import pyarrow as pa
+
+    from boj_stat_search.core.request_plan import plan_data_requests
+    from boj_stat_search.shell.api import BojApiError
+    from boj_stat_search.shell.catalog.loader import CatalogError
+    from boj_stat_search.shell.client import BojClient
+    from boj_stat_search.shell.jobs import (
+        DATASET_COMPRESSION,
+        run_download_job,
+        write_download_dataset,
+    )
+    from boj_stat_search.shell.planner import select_series
+
+    job_path = job_dir if job_dir is not None else Path(output_dir) / ".job"
+    try:
+        if file_format not in DATASET_COMPRESSION:
+            raise ValueError("format: must be parquet or arrow")
+        if compression not in DATASET_COMPRESSION[file_format]:
+            raise ValueError(
+                f"compression: must be one of "
+                f"{', '.join(DATASET_COMPRESSION[file_format])} for {file_format}"
+            )
+        entries = list(code or ())
+        if codes_file is not None:
+            entries.extend(codes_file.read_text(encoding="utf-8").splitlines())
+        selections = [
+            select_series(code_db, codes=codes)
+            for code_db, codes in _codes_by_db(entries, db).items()
+        ]
+        if layer:
+            if db is None or frequency is None:
+                raise ValueError("layer: --db and --frequency are required")
+            selections.extend(
+                select_series(db, frequency=frequency, layer=item) for item in layer
+            )
+        if not selections:
+            raise ValueError("codes/layer: pass --code, --codes-file or --layer")
+        plan = plan_data_requests(pa.concat_tables(selections), start_date, end_date)
+    except (ValueError, OSError) as exc:
+        typer.echo(f"Invalid option: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+    except CatalogError as exc:
+        typer.echo(f"Catalog error: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    if restart:
+        shutil.rmtree(job_path, ignore_errors=True)
+    try:
+        with BojClient(min_request_interval=min_request_interval) as client:
+            report = run_download_job(
+                plan, job_path, client=client, max_workers=workers
+            )
+        rows = write_download_dataset(
+            job_path, output_dir, file_format=file_format, compression=compression
         )
+    except KeyboardInterrupt as exc:
+        typer.echo(
+            "Interrupted; run the same command again to resume the download.",
+            err=True,
+        )
+        raise typer.Exit(code=130) from exc
     except BojApiError as exc:
         typer.echo(f"API error: {exc}", err=True)
+        typer.echo("Run the same command again to resume the download.", err=True)
+        raise typer.Exit(code=1) from exc
+    except ValueError as exc:
+        typer.echo(f"Invalid option: {exc}", err=True)
         raise typer.Exit(code=1) from exc
 
-    typer.echo(json.dumps(asdict(result), ensure_ascii=False, indent=2))
+    typer.echo(
+        f"Wrote {rows} rows from {report.requests} requests to {output_dir} "
+        f"({report.fetched_pages} pages fetched, {report.resumed} requests resumed)."
+    )
+
+
+def _codes_by_db(entries: list[str], default_db: str | None) -> dict[str, list[str]]:
+    """Group ``DB'CODE`` or bare codes (of ``default_db``) by DB, in order."""
+    grouped: dict[str, list[str]] = {}
+    for entry in entries:
+        for item in entry.split(","):
+            item = item.strip()
+            if not item or item.startswith("#"):
+                continue
+            item_db, _, series = item.rpartition("'")
+            item_db = item_db or default_db
+            if item_db is None:
+                raise ValueError(f"code: {item} needs a DB; write DB'CODE or pass --db")
+            grouped.setdefault(item_db, []).append(series)
+    return grouped
 
 
 @app.command("generate-metadata-parquet")
@@ -150,20 +546,27 @@ def generate_metadata_parquet_cmd(
             help="Database code to export (repeat option to select multiple DBs)",
         ),
     ] = None,
-    min_request_interval: Annotated[
-        float,
+    min_request_interval: MinRequestIntervalOption = 1.0,
+    workers: Annotated[
+        Optional[int],
         typer.Option(
-            "--min-request-interval",
-            help="Minimum delay in seconds between BOJ API requests",
+            "--workers",
+            min=1,
+            help="Parse responses in this many worker processes",
         ),
-    ] = 1.0,
+    ] = None,
 ) -> None:
     """Generate per-DB metadata Parquet files."""
+    from boj_stat_search.shell.catalog.exporter import (
+        generate_metadata_parquet_files,
+    )
+
     report = generate_metadata_parquet_files(
         output_dir=output_dir,
         dbs=db,
         min_request_interval=min_request_interval,
         show_progress=True,
+        max_workers=workers,
     )
 
     for db_name in report.succeeded_dbs:
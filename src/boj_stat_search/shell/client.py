@@ -1,14 +1,107 @@
+import contextlib
+import json
+import threading
 import time
+from collections.abc import Callable, Iterator
+from typing import Any, TypeVar
 
 import httpx
 
-from boj_stat_search.shell.api import get_data_code, get_data_layer, get_metadata
+from boj_stat_search.shell.api import (
+    data_code_request_url,
+    data_layer_request_url,
+    get_content,
+    metadata_request_url,
+)
 from boj_stat_search.core.types import Code, Db, ErrorMode, Frequency, Layer, Period
 from boj_stat_search.core.models import DataResponse, MetadataResponse
+from boj_stat_search.core.parser import (
+    parse_data_code_response,
+    parse_metadata_response,
+)
+from boj_stat_search.shell.metrics import (
+    ClientMetrics,
+    RetryEvent,
+    ThrottleEvent,
+    endpoint_name,
+    record_event,
+    use_metrics,
+)
+from boj_stat_search.shell.profiling import (
+    phase,
+    profile_requests,
+    profiled_call,
+    with_timings,
+)
+from boj_stat_search.shell.series_cache import SeriesCache
+
+_T = TypeVar("_T")
+_R = TypeVar("_R", DataResponse, MetadataResponse)
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class _Call:
+    """One in-flight request shared by every caller asking for the same key."""
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: object = None
+        self.error: BaseException | None = None
+
+
+class _SingleFlight:
+    """Coalesce concurrent calls with the same key into one execution."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], _T]) -> _T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            result = fn()
+            call.result = result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return result
 
 
 class BojClient:
-    """Stateful client that reuses a single httpx.Client across requests."""
+    """Stateful client that reuses a single httpx.Client across requests.
+
+    Concurrent calls from several threads that resolve to the same request URL
+    share one network round-trip unless ``coalesce_requests`` is disabled; each
+    caller still parses its own response.
+
+    Transport errors and HTTP 429/5xx responses are retried up to
+    ``max_retries`` times, waiting ``retry_backoff * 2**n`` seconds before the
+    n-th retry. Requests, throttle waits and retries are recorded into
+    ``metrics`` when given. With ``profile`` every parsed response carries
+    per-phase ``timings``, including the time spent throttled.
+
+    With a ``series_cache``, ``get_data_code`` calls without ``start_position``
+    are answered from the cache and only request the periods it lacks.
+    """
 
     def __init__(
         self,
@@ -16,12 +109,31 @@ class BojClient:
         client: httpx.Client | None = None,
         on_validation_error: ErrorMode = "raise",
         min_request_interval: float = 1.0,
+        coalesce_requests: bool = True,
+        max_retries: int = 0,
+        retry_backoff: float = 0.5,
+        metrics: ClientMetrics | None = None,
+        profile: bool = False,
+        series_cache: SeriesCache | None = None,
     ) -> None:
+        if max_retries < 0:
+            raise ValueError("max_retries: must be >= 0")
+        if retry_backoff < 0:
+            raise ValueError("retry_backoff: must be >= 0")
+
         self._external_client = client is not None
         self._client = client if client is not None else httpx.Client()
         self.on_validation_error = on_validation_error
         self.min_request_interval = min_request_interval
+        self.coalesce_requests = coalesce_requests
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.metrics = metrics
+        self.profile = profile
+        self.series_cache = series_cache
         self._last_request_time: float = 0.0
+        self._throttle_lock = threading.Lock()
+        self._single_flight = _SingleFlight()
 
     # --- context manager ---
 
@@ -41,17 +153,84 @@ class BojClient:
     def _throttle(self) -> None:
         if self.min_request_interval <= 0:
             return
-        elapsed = time.monotonic() - self._last_request_time
-        wait = self.min_request_interval - elapsed
-        if wait > 0:
-            time.sleep(wait)
-        self._last_request_time = time.monotonic()
+        start = time.perf_counter()
+        with phase("throttle"), self._throttle_lock:
+            elapsed = time.monotonic() - self._last_request_time
+            wait = self.min_request_interval - elapsed
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request_time = time.monotonic()
+        record_event(ThrottleEvent(seconds=time.perf_counter() - start))
+
+    # --- retries and request coalescing ---
+
+    def _with_retries(self, endpoint: str, fn: Callable[[], _T]) -> _T:
+        attempt = 0
+        while True:
+            self._throttle()
+            try:
+                return fn()
+            except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+                reason = _retry_reason(exc)
+                if reason is None or attempt >= self.max_retries:
+                    raise
+                delay = self.retry_backoff * 2**attempt
+                attempt += 1
+                record_event(
+                    RetryEvent(
+                        endpoint=endpoint, attempt=attempt, reason=reason, delay=delay
+                    )
+                )
+                if delay > 0:
+                    time.sleep(delay)
+
+    def _fetch(self, url: str, endpoint: str) -> bytes:
+        """Fetch ``url`` once for every concurrent caller asking for it."""
+
+        def fetch() -> bytes:
+            return self._with_retries(
+                endpoint, lambda: get_content(url, client=self._client)
+            )
+
+        if not self.coalesce_requests:
+            return fetch()
+        return self._single_flight.do(url, fetch)
+
+    @contextlib.contextmanager
+    def _observed(self, endpoint: str) -> Iterator[Any]:
+        profiling = profile_requests() if self.profile else contextlib.nullcontext()
+        with use_metrics(self.metrics), profiling, profiled_call(endpoint) as profile:
+            yield profile
+
+    def _request(
+        self,
+        endpoint: str,
+        build_url: Callable[[], str],
+        parse: Callable[[dict[str, Any]], _R],
+    ) -> _R:
+        with self._observed(endpoint) as profile:
+            url = build_url()
+            content = self._fetch(url, endpoint)
+            with phase("decode"):
+                raw = json.loads(content)
+            with phase("parse"):
+                response = parse(raw)
+        return with_timings(response, profile)
 
     # --- API methods ---
 
+    def get_content(self, url: str) -> bytes:
+        """Fetch an already built BOJ API URL and return the undecoded response body."""
+        endpoint = endpoint_name(url)
+        with self._observed(endpoint):
+            return self._fetch(url, endpoint)
+
     def get_metadata(self, db: Db | str) -> MetadataResponse:
-        self._throttle()
-        return get_metadata(db, self.on_validation_error, client=self._client)
+        return self._request(
+            "getMetadata",
+            lambda: metadata_request_url(db, self.on_validation_error),
+            parse_metadata_response,
+        )
 
     def get_data_code(
         self,
@@ -61,15 +240,37 @@ class BojClient:
         end_date: Period | str | None = None,
         start_position: int | None = None,
     ) -> DataResponse:
-        self._throttle()
-        return get_data_code(
-            db,
-            code,
-            start_date,
-            end_date,
-            start_position,
-            self.on_validation_error,
-            client=self._client,
+        if self.series_cache is not None and start_position is None:
+            with use_metrics(self.metrics):
+                return self.series_cache.get_data_code(
+                    db,
+                    code,
+                    start_date,
+                    end_date,
+                    self.on_validation_error,
+                    fetch=self._fetch_data_code,
+                )
+        return self._fetch_data_code(db, code, start_date, end_date, start_position)
+
+    def _fetch_data_code(
+        self,
+        db: Db | str | None,
+        code: Code | str | None,
+        start_date: Period | str | None,
+        end_date: Period | str | None,
+        start_position: int | None,
+    ) -> DataResponse:
+        return self._request(
+            "getDataCode",
+            lambda: data_code_request_url(
+                db,
+                code,
+                start_date,
+                end_date,
+                start_position,
+                self.on_validation_error,
+            ),
+            parse_data_code_response,
         )
 
     def get_data_layer(
@@ -81,14 +282,27 @@ class BojClient:
         end_date: Period | str | None = None,
         start_position: int | None = None,
     ) -> DataResponse:
-        self._throttle()
-        return get_data_layer(
-            db,
-            frequency,
-            layer,
-            start_date,
-            end_date,
-            start_position,
-            self.on_validation_error,
-            client=self._client,
+        return self._request(
+            "getDataLayer",
+            lambda: data_layer_request_url(
+                db,
+                frequency,
+                layer,
+                start_date,
+                end_date,
+                start_position,
+                self.on_validation_error,
+            ),
+            parse_data_code_response,
         )
+
+
+def _retry_reason(exc: Exception) -> str | None:
+    if isinstance(exc, httpx.TransportError):
+        return type(exc).__name__
+    if (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code in RETRY_STATUS_CODES
+    ):
+        return f"http_{exc.response.status_code}"
+    return None
@@ -1,4 +1,9 @@
-from boj_stat_search.core.formatter import format_layer_tree
+import sys
+from collections.abc import Iterable
+from typing import TextIO
+
+from boj_stat_search.core.formatter import iter_layer_tree
+from boj_stat_search.core.layer_index import LayerIndex
 from boj_stat_search.core.types import Layer
 from boj_stat_search.core.models import MetadataEntry
 
@@ -6,5 +11,23 @@ from boj_stat_search.core.models import MetadataEntry
 def show_layers(
     metadata_entries: tuple[MetadataEntry, ...],
     layer: Layer | str | None = None,
+    *,
+    layer_index: LayerIndex | None = None,
+    max_depth: int | None = None,
+    collapse: Iterable[str] = (),
+    file: TextIO | None = None,
 ) -> None:
-    print(format_layer_tree(metadata_entries=metadata_entries, layer=layer))
+    """Print the layer tree line by line, so output starts before the tree is done."""
+    stream = file if file is not None else sys.stdout
+    wrote_line = False
+    for line in iter_layer_tree(
+        metadata_entries,
+        layer,
+        layer_index=layer_index,
+        max_depth=max_depth,
+        collapse=collapse,
+    ):
+        stream.write(line + "\n")
+        wrote_line = True
+    if not wrote_line:
+        stream.write("\n")
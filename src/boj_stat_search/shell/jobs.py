@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+
+from boj_stat_search.core.columnar import (
+    DATA_TABLE_SCHEMA,
+    data_response_to_table,
+    table_from_ipc_bytes,
+    table_to_ipc_bytes,
+)
+from boj_stat_search.core.request_plan import PlannedRequest
+from boj_stat_search.shell.catalog.loader import atomic_write_bytes
+from boj_stat_search.shell.client import BojClient
+from boj_stat_search.shell.planner import DEFAULT_MAX_WORKERS
+
+JOURNAL_NAME = "journal.jsonl"
+PARTS_DIR = "parts"
+
+# Compression codecs each dataset format can write; "none" writes uncompressed.
+DATASET_COMPRESSION: dict[str, tuple[str, ...]] = {
+    "parquet": ("none", "snappy", "gzip", "brotli", "zstd", "lz4"),
+    "arrow": ("none", "zstd", "lz4"),
+}
+
+# Part files hold one page of observations each, tagged with their DB.
+JOB_TABLE_SCHEMA = pa.schema([pa.field("db", pa.string()), *DATA_TABLE_SCHEMA])
+
+
+@dataclass(frozen=True, slots=True)
+class DownloadJobReport:
+    job_dir: Path
+    requests: int
+    resumed: int
+    fetched_pages: int
+    parts: tuple[Path, ...]
+
+
+@dataclass(slots=True)
+class _Progress:
+    parts: list[str] = field(default_factory=list)
+    next_position: int | None = None
+    done: bool = False
+
+
+def run_download_job(
+    plan: Sequence[PlannedRequest],
+    job_dir: str | Path,
+    *,
+    client: BojClient | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> DownloadJobReport:
+    """Fetch every page of a plan into part files, resuming earlier runs.
+
+    Each page is written to ``job_dir/parts`` as an Arrow file and then
+    recorded in ``job_dir/journal.jsonl`` with the ``NEXTPOSITION`` it
+    returned. Running the same plan against the same directory again skips
+    the requests the journal marks complete and continues the others from
+    their last cursor, so a crash or Ctrl-C only loses the pages in flight.
+    Requests run in parallel through ``client`` as in ``fetch_planned``.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers: must be >= 1")
+    if not plan:
+        raise ValueError("plan: must contain at least one request")
+
+    root = Path(job_dir).expanduser()
+    journal = _Journal(root / JOURNAL_NAME)
+    progress = journal.open(_plan_fingerprint(plan), len(plan))
+    for index, state in list(progress.items()):
+        # A request whose part files went missing is fetched again.
+        if not all((root / part).is_file() for part in state.parts):
+            journal.restart(index)
+            del progress[index]
+    resumed = sum(1 for state in progress.values() if state.done)
+
+    owns_client = client is None
+    boj_client = client if client is not None else BojClient()
+    stop = threading.Event()
+    fetched_pages = 0
+    counter_lock = threading.Lock()
+
+    def run(index: int) -> None:
+        nonlocal fetched_pages
+        request = plan[index]
+        state = progress.setdefault(index, _Progress())
+        while not state.done and not stop.is_set():
+            response = boj_client.get_data_code(
+                request.db,
+                ",".join(request.codes),
+                request.start_date,
+                request.end_date,
+                state.next_position,
+            )
+            part = f"{PARTS_DIR}/{index:05d}-{len(state.parts):04d}.arrow"
+            table = data_response_to_table(response)
+            table = table.add_column(
+                0, "db", pa.repeat(pa.scalar(request.db), table.num_rows)
+            )
+            atomic_write_bytes(root / part, table_to_ipc_bytes(table))
+            journal.append(index, part, response.next_position)
+            state.parts.append(part)
+            state.next_position = response.next_position
+            state.done = response.next_position is None
+            with counter_lock:
+                fetched_pages += 1
+
+    try:
+        with ThreadPoolExecutor(max_workers) as pool:
+            futures = [
+                pool.submit(run, index)
+                for index in range(len(plan))
+                if not (index in progress and progress[index].done)
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                stop.set()
+                pool.shutdown(cancel_futures=True)
+                raise
+    finally:
+        if owns_client:
+            boj_client.close()
+
+    return DownloadJobReport(
+        job_dir=root,
+        requests=len(plan),
+        resumed=resumed,
+        fetched_pages=fetched_pages,
+        parts=tuple(
+            root / part for index in sorted(progress) for part in progress[index].parts
+        ),
+    )
+
+
+def read_download_job(job_dir: str | Path) -> pa.Table:
+    """Concatenate the part files of a download job in plan order.
+
+    The table has the columns of ``JOB_TABLE_SCHEMA``. Only pages the
+    journal records are read, so an interrupted job yields what it has
+    fetched so far.
+    """
+    root = Path(job_dir).expanduser()
+    _, progress = _read_journal(root / JOURNAL_NAME)
+    tables = [
+        table_from_ipc_bytes((root / part).read_bytes())
+        for index in sorted(progress)
+        for part in progress[index].parts
+    ]
+    if not tables:
+        return JOB_TABLE_SCHEMA.empty_table()
+    return pa.concat_tables(tables)
+
+
+def write_download_dataset(
+    job_dir: str | Path,
+    output_dir: str | Path,
+    *,
+    file_format: str = "parquet",
+    compression: str = "zstd",
+) -> int:
+    """Write the pages of a download job as a dataset partitioned by DB and frequency.
+
+    Part files are streamed batch by batch into hive-style
+    ``db=<DB>/frequency=<FREQUENCY>`` directories of ``output_dir``, as
+    Parquet files or, with ``file_format="arrow"``, Arrow IPC files.
+    Partitions the job writes to are replaced; others are kept. Returns the
+    number of rows written.
+    """
+    import pyarrow.dataset as ds
+
+    if file_format not in DATASET_COMPRESSION:
+        raise ValueError(
+            f"file_format: must be one of {', '.join(DATASET_COMPRESSION)}"
+        )
+    codecs = DATASET_COMPRESSION[file_format]
+    if compression not in codecs:
+        raise ValueError(
+            f"compression: must be one of {', '.join(codecs)} for {file_format}"
+        )
+
+    root = Path(job_dir).expanduser()
+    _, progress = _read_journal(root / JOURNAL_NAME)
+    parts = [
+        root / part for index in sorted(progress) for part in progress[index].parts
+    ]
+    rows = 0
+
+    def batches() -> Iterator[pa.RecordBatch]:
+        nonlocal rows
+        for part in parts:
+            table = table_from_ipc_bytes(part.read_bytes())
+            rows += table.num_rows
+            yield from table.to_batches()
+
+    codec = None if compression == "none" else compression
+    # pyarrow.dataset only defines ParquetFileFormat when built with Parquet.
+    dataset_format = (
+        ds.ParquetFileFormat()  # type: ignore[attr-defined]
+        if file_format == "parquet"
+        else ds.IpcFileFormat()
+    )
+    ds.write_dataset(
+        batches(),
+        Path(output_dir).expanduser(),
+        schema=JOB_TABLE_SCHEMA,
+        format=dataset_format,
+        file_options=dataset_format.make_write_options(compression=codec),
+        partitioning=ds.partitioning(
+            pa.schema(
+                [JOB_TABLE_SCHEMA.field("db"), JOB_TABLE_SCHEMA.field("frequency")]
+            ),
+            flavor="hive",
+        ),
+        basename_template=f"part-{{i}}.{file_format}",
+        existing_data_behavior="delete_matching",
+    )
+    return rows
+
+
+class _Journal:
+    """Append-only record of the pages a job has written."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def open(self, fingerprint: str, requests: int) -> dict[int, _Progress]:
+        """Progress recorded for ``fingerprint``; starts a journal if none exists."""
+        header, progress = _read_journal(self.path)
+        if header is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text("")
+            self._write({"job": fingerprint, "requests": requests})
+            return {}
+        if header.get("job") != fingerprint:
+            raise ValueError(
+                f"job_dir: {self.path.parent} holds a job for a different plan"
+            )
+        self._drop_torn_line()
+        return progress
+
+    def append(self, index: int, part: str, next_position: int | None) -> None:
+        self._write({"request": index, "part": part, "next_position": next_position})
+
+    def restart(self, index: int) -> None:
+        """Forget the pages recorded for request ``index``."""
+        self._write({"request": index, "restart": True})
+
+    def _write(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock, self.path.open("a", encoding="utf-8") as handle:
+            handle.write(line)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def _drop_torn_line(self) -> None:
+        """Cut a line left unfinished by a crash, so appends start on a new line."""
+        content = self.path.read_bytes()
+        if content and not content.endswith(b"\n"):
+            with self.path.open("r+b") as handle:
+                handle.truncate(content.rfind(b"\n") + 1)
+
+
+def _read_journal(path: Path) -> tuple[dict[str, Any] | None, dict[int, _Progress]]:
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return None, {}
+
+    header: dict[str, Any] | None = None
+    progress: dict[int, _Progress] = {}
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if header is None:
+            header = record
+            continue
+        if record.get("restart"):
+            progress.pop(record["request"], None)
+            continue
+        state = progress.setdefault(record["request"], _Progress())
+        state.parts.append(record["part"])
+        state.next_position = record["next_position"]
+        state.done = record["next_position"] is None
+    return header, progress
+
+
+def _plan_fingerprint(plan: Sequence[PlannedRequest]) -> str:
+    requests = [
+        [
+            request.db,
+            list(request.codes),
+            str(request.frequency),
+            request.start_date,
+            request.end_date,
+        ]
+        for request in plan
+    ]
+    return hashlib.sha256(json.dumps(requests).encode("utf-8")).hexdigest()
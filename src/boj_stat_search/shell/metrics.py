@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+import bisect
+import contextlib
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+DEFAULT_SIZE_BUCKETS: tuple[float, ...] = tuple(
+    float(2**power) for power in range(10, 27, 2)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RequestEvent:
+    """One HTTP round-trip; ``status_code`` is None when no response arrived."""
+
+    endpoint: str
+    url: str
+    status_code: int | None
+    started_at: float
+    seconds: float
+    response_bytes: int
+    error: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ThrottleEvent:
+    seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class RetryEvent:
+    endpoint: str
+    attempt: int
+    reason: str
+    delay: float
+
+
+@dataclass(frozen=True, slots=True)
+class CacheEvent:
+    cache: str
+    key: str
+    hit: bool
+
+
+MetricEvent = RequestEvent | ThrottleEvent | RetryEvent | CacheEvent
+MetricListener = Callable[[MetricEvent], None]
+
+_ACTIVE_METRICS: ContextVar[ClientMetrics | None] = ContextVar(
+    "boj_stat_search_metrics", default=None
+)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus layout."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        if list(buckets) != sorted(set(buckets)) or not buckets:
+            raise ValueError("buckets: must be a non-empty increasing sequence")
+        self.buckets = tuple(float(bound) for bound in buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> list[int]:
+        """Counts of observations <= each bucket bound, then the total."""
+        totals: list[int] = []
+        running = 0
+        for count in self.counts:
+            running += count
+            totals.append(running)
+        return totals
+
+
+class ClientMetrics:
+    """Thread-safe request, throttle, retry and cache metrics.
+
+    Pass one to ``BojClient(metrics=...)`` or make it current with
+    ``activate()`` around catalog and functional API calls. Every event is
+    aggregated here and also handed to the listeners added with
+    ``add_listener``.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS,
+    ) -> None:
+        self._latency_buckets = tuple(latency_buckets)
+        self._size_buckets = tuple(size_buckets)
+        Histogram(self._latency_buckets)
+        Histogram(self._size_buckets)
+
+        self._lock = threading.Lock()
+        self._listeners: list[MetricListener] = []
+        self.request_latency: dict[str, Histogram] = {}
+        self.response_size: dict[str, Histogram] = {}
+        self.requests: dict[tuple[str, str], int] = {}
+        self.throttle_wait = Histogram(self._latency_buckets)
+        self.retries: dict[tuple[str, str], int] = {}
+        self.cache: dict[tuple[str, str], int] = {}
+
+    def add_listener(self, listener: MetricListener) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: MetricListener) -> None:
+        with self._lock:
+            self._listeners.remove(listener)
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator[ClientMetrics]:
+        """Record events from code running in this context into these metrics."""
+        token = _ACTIVE_METRICS.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_METRICS.reset(token)
+
+    def record(self, event: MetricEvent) -> None:
+        with self._lock:
+            if isinstance(event, RequestEvent):
+                status = (
+                    "error" if event.status_code is None else str(event.status_code)
+                )
+                key = (event.endpoint, status)
+                self.requests[key] = self.requests.get(key, 0) + 1
+                self._histogram(
+                    self.request_latency, event.endpoint, latency=True
+                ).observe(event.seconds)
+                self._histogram(
+                    self.response_size, event.endpoint, latency=False
+                ).observe(event.response_bytes)
+            elif isinstance(event, ThrottleEvent):
+                self.throttle_wait.observe(event.seconds)
+            elif isinstance(event, RetryEvent):
+                key = (event.endpoint, event.reason)
+                self.retries[key] = self.retries.get(key, 0) + 1
+            else:
+                key = (event.cache, "hit" if event.hit else "miss")
+                self.cache[key] = self.cache.get(key, 0) + 1
+            listeners = tuple(self._listeners)
+
+        for listener in listeners:
+            listener(event)
+
+    def to_prometheus(self, *, prefix: str = "boj_stat_search") -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            _histogram_lines(
+                lines,
+                f"{prefix}_request_duration_seconds",
+                "BOJ API request latency in seconds.",
+                {(("endpoint", name),): h for name, h in self.request_latency.items()},
+            )
+            _histogram_lines(
+                lines,
+                f"{prefix}_response_size_bytes",
+                "BOJ API response body size in bytes.",
+                {(("endpoint", name),): h for name, h in self.response_size.items()},
+            )
+            _counter_lines(
+                lines,
+                f"{prefix}_requests_total",
+                "BOJ API requests by endpoint and HTTP status.",
+                ("endpoint", "status"),
+                self.requests,
+            )
+            _histogram_lines(
+                lines,
+                f"{prefix}_throttle_wait_seconds",
+                "Time spent waiting for the client request interval.",
+                {(): self.throttle_wait},
+            )
+            _counter_lines(
+                lines,
+                f"{prefix}_retries_total",
+                "Retried BOJ API requests by endpoint and reason.",
+                ("endpoint", "reason"),
+                self.retries,
+            )
+            _counter_lines(
+                lines,
+                f"{prefix}_cache_requests_total",
+                "Local cache lookups by cache and result.",
+                ("cache", "result"),
+                self.cache,
+            )
+        return "\n".join(lines) + "\n"
+
+    def _histogram(
+        self, histograms: dict[str, Histogram], name: str, *, latency: bool
+    ) -> Histogram:
+        histogram = histograms.get(name)
+        if histogram is None:
+            buckets = self._latency_buckets if latency else self._size_buckets
+            histogram = histograms[name] = Histogram(buckets)
+        return histogram
+
+
+def current_metrics() -> ClientMetrics | None:
+    return _ACTIVE_METRICS.get()
+
+
+def record_event(event: MetricEvent) -> None:
+    """Hand ``event`` to the current metrics, if any are active."""
+    metrics = _ACTIVE_METRICS.get()
+    if metrics is not None:
+        metrics.record(event)
+
+
+@contextlib.contextmanager
+def use_metrics(metrics: ClientMetrics | None) -> Iterator[None]:
+    """Activate ``metrics`` if given, otherwise keep the current ones."""
+    if metrics is None:
+        yield
+        return
+    with metrics.activate():
+        yield
+
+
+def endpoint_name(url: str) -> str:
+    return urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1] or "unknown"
+
+
+def observed_get(
+    client: httpx.Client, url: str, *, endpoint: str | None = None
+) -> httpx.Response:
+    """GET ``url``, recording a ``RequestEvent`` when metrics are active."""
+    metrics = _ACTIVE_METRICS.get()
+    if metrics is None:
+        return client.get(url)
+
+    name = endpoint if endpoint is not None else endpoint_name(url)
+    started_at = time.time()
+    start = time.perf_counter()
+    try:
+        response = client.get(url)
+    except httpx.TransportError as exc:
+        metrics.record(
+            RequestEvent(
+                endpoint=name,
+                url=url,
+                status_code=None,
+                started_at=started_at,
+                seconds=time.perf_counter() - start,
+                response_bytes=0,
+                error=type(exc).__name__,
+            )
+        )
+        raise
+    metrics.record(
+        RequestEvent(
+            endpoint=name,
+            url=url,
+            status_code=response.status_code,
+            started_at=started_at,
+            seconds=time.perf_counter() - start,
+            response_bytes=len(response.content),
+        )
+    )
+    return response
+
+
+def opentelemetry_listener(tracer: Any = None) -> MetricListener:
+    """Return a listener that turns request events into OpenTelemetry spans.
+
+    Requires ``opentelemetry-api``. Retries, throttle waits and cache lookups
+    are added as events on the current span.
+    """
+    try:
+        from opentelemetry import trace
+    except ImportError as exc:
+        raise ImportError(
+            "opentelemetry_listener requires the opentelemetry-api package"
+        ) from exc
+
+    active_tracer = tracer if tracer is not None else trace.get_tracer(__name__)
+
+    def listener(event: MetricEvent) -> None:
+        if isinstance(event, RequestEvent):
+            start_ns = int(event.started_at * 1e9)
+            span = active_tracer.start_span(
+                f"boj {event.endpoint}",
+                start_time=start_ns,
+                attributes={
+                    "http.request.method": "GET",
+                    "url.full": event.url,
+                    "http.response.status_code": event.status_code or 0,
+                    "http.response.body.size": event.response_bytes,
+                },
+            )
+            if event.error is not None:
+                span.set_attribute("error.type", event.error)
+            span.end(end_time=start_ns + int(event.seconds * 1e9))
+            return
+
+        attributes = {
+            key: value
+            for key, value in (
+                ("seconds", getattr(event, "seconds", None)),
+                ("endpoint", getattr(event, "endpoint", None)),
+                ("reason", getattr(event, "reason", None)),
+                ("cache", getattr(event, "cache", None)),
+                ("hit", getattr(event, "hit", None)),
+            )
+            if value is not None
+        }
+        trace.get_current_span().add_event(
+            f"boj.{type(event).__name__}", attributes=attributes
+        )
+
+    return listener
+
+
+def _labels(pairs: Sequence[tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    escaped = (
+        name + '="' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+        for name, value in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _histogram_lines(
+    lines: list[str],
+    name: str,
+    help_text: str,
+    histograms: dict[tuple[tuple[str, str], ...], Histogram],
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for labels, histogram in sorted(histograms.items()):
+        totals = histogram.cumulative_counts()
+        for bound, total in zip((*histogram.buckets, None), totals):
+            le = "+Inf" if bound is None else _format_number(bound)
+            lines.append(f"{name}_bucket{_labels((*labels, ('le', le)))} {total}")
+        lines.append(f"{name}_sum{_labels(labels)} {_format_number(histogram.sum)}")
+        lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+
+
+def _counter_lines(
+    lines: list[str],
+    name: str,
+    help_text: str,
+    label_names: tuple[str, str],
+    counts: dict[tuple[str, str], int],
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} counter")
+    for values, count in sorted(counts.items()):
+        lines.append(f"{name}{_labels(tuple(zip(label_names, values)))} {count}")
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import datetime
+import json
+import random
+import threading
+import time
+from typing import Any
+
+import httpx
+
+from boj_stat_search.core.mock_api import MockDataset, mock_api_response
+
+
+class MockBojServer:
+    """Local stand-in for the BOJ API, served through an httpx transport.
+
+    Responses come from ``mock_api_response``; on top of them every request
+    waits ``latency`` seconds plus a uniform ``jitter`` in either direction, and
+    a ``failure_rate`` share of requests fails with ``failure_status`` so retry
+    and rate-limit behaviour can be measured offline. Route a client through
+    it with ``client()`` or ``httpx.Client(transport=server.transport())``.
+    """
+
+    def __init__(
+        self,
+        dataset: MockDataset | None = None,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        failure_status: int = 503,
+        seed: int | None = 0,
+    ) -> None:
+        if latency < 0:
+            raise ValueError("latency: must be >= 0")
+        if jitter < 0:
+            raise ValueError("jitter: must be >= 0")
+        if not 0 <= failure_rate <= 1:
+            raise ValueError("failure_rate: must be between 0 and 1")
+
+        self.dataset = dataset if dataset is not None else MockDataset()
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.peak_concurrency = 0
+        self.requests: list[httpx.URL] = []
+
+    @property
+    def request_count(self) -> int:
+        return len(self.requests)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.requests.clear()
+            self.peak_concurrency = self._in_flight
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def client(self, **kwargs: Any) -> httpx.Client:
+        """Return an ``httpx.Client`` whose requests all go to this server."""
+        return httpx.Client(transport=self.transport(), **kwargs)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests.append(request.url)
+            self._in_flight += 1
+            self.peak_concurrency = max(self.peak_concurrency, self._in_flight)
+            delay = self.latency + self._rng.uniform(-self.jitter, self.jitter)
+            fail = self._rng.random() < self.failure_rate
+
+        try:
+            if delay > 0:
+                time.sleep(delay)
+            if fail:
+                return httpx.Response(self.failure_status, request=request)
+
+            status, body = mock_api_response(
+                self.dataset,
+                request.url.path,
+                dict(request.url.params),
+                date=datetime.datetime.now(datetime.UTC).isoformat(),
+            )
+            return httpx.Response(
+                status,
+                content=json.dumps(body, ensure_ascii=False).encode(),
+                headers={"Content-Type": "application/json"},
+                request=request,
+            )
+        finally:
+            with self._lock:
+                self._in_flight -= 1
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import multiprocessing
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, TypeVar
+
+import pyarrow as pa
+
+from boj_stat_search.core.columnar import table_from_ipc_bytes
+
+K = TypeVar("K")
+
+PayloadDecoder = Callable[[Any, bytes], bytes]
+
+# Errors a decoder or the IPC read back can raise for one bad payload.
+DECODE_ERRORS: tuple[type[Exception], ...] = (
+    OSError,
+    ValueError,
+    KeyError,
+    TypeError,
+    pa.ArrowException,
+)
+
+
+def decode_in_processes(
+    payloads: Iterable[tuple[K, bytes | BaseException]],
+    decoder: PayloadDecoder,
+    *,
+    max_workers: int | None = None,
+    max_pending: int | None = None,
+    executor: Executor | None = None,
+) -> Generator[tuple[K, pa.Table | BaseException], None, None]:
+    """Decode raw response bodies in worker processes, yielding tables in input order.
+
+    ``payloads`` is consumed lazily so network fetches in the parent overlap with
+    decoding in the workers. ``decoder`` must be a picklable module-level function
+    that turns a key and its response body into an Arrow IPC buffer. Exceptions passed in
+    place of a payload, and the ``DECODE_ERRORS`` raised while decoding, are
+    yielded instead of a table so one bad page does not stop the pipeline.
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+
+    window = max_pending if max_pending is not None else 2 * (max_workers or 4)
+    if window < 1:
+        raise ValueError("max_pending must be >= 1")
+
+    owns_executor = executor is None
+    pool = (
+        executor
+        if executor is not None
+        # Spawned workers avoid forking a parent that runs Arrow's thread pools.
+        else ProcessPoolExecutor(
+            max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    )
+
+    pending: deque[tuple[K, Future[bytes] | BaseException]] = deque()
+    try:
+        for key, payload in payloads:
+            if isinstance(payload, BaseException):
+                pending.append((key, payload))
+            else:
+                pending.append((key, pool.submit(decoder, key, payload)))
+
+            while len(pending) >= window:
+                yield _resolve(*pending.popleft())
+
+        while pending:
+            yield _resolve(*pending.popleft())
+    finally:
+        for _, item in pending:
+            if isinstance(item, Future):
+                item.cancel()
+        if owns_executor:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _resolve(
+    key: K, item: Future[bytes] | BaseException
+) -> tuple[K, pa.Table | BaseException]:
+    if isinstance(item, BaseException):
+        return key, item
+    try:
+        return key, table_from_ipc_bytes(item.result())
+    except DECODE_ERRORS as exc:
+        return key, exc
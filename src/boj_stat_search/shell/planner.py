@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from boj_stat_search.core.models import DataResponse
+from boj_stat_search.core.request_plan import (
+    MAX_CODES_PER_REQUEST,
+    MAX_OBSERVATIONS_PER_REQUEST,
+    PlannedRequest,
+    plan_data_requests,
+    stitch_data_responses,
+)
+from boj_stat_search.core.time_index import resolve_frequency
+from boj_stat_search.core.types import Db, Frequency, Layer, Period
+from boj_stat_search.shell.catalog.loader import DEFAULT_CACHE_TTL_SECONDS
+from boj_stat_search.shell.catalog.search import (
+    layer_row_positions,
+    list_series,
+    normalize_layer_parts,
+)
+from boj_stat_search.shell.client import BojClient
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def fetch_planned(
+    plan: Sequence[PlannedRequest],
+    *,
+    client: BojClient | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    parameter: dict[str, Any] | None = None,
+) -> DataResponse:
+    """Run the requests of a plan in parallel and stitch them in plan order.
+
+    Requests go through ``client``, so its ``min_request_interval`` throttle
+    paces them however many run at once, and its retries, metrics and series
+    cache apply. A request that still comes back paged follows its
+    ``NEXTPOSITION`` pages. Without ``client`` a default ``BojClient`` is used
+    and closed afterwards.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers: must be >= 1")
+    if not plan:
+        raise ValueError("plan: must contain at least one request")
+
+    owns_client = client is None
+    boj_client = client if client is not None else BojClient()
+    try:
+        with ThreadPoolExecutor(max_workers) as pool:
+            pages = list(
+                pool.map(lambda request: _fetch_pages(boj_client, request), plan)
+            )
+    finally:
+        if owns_client:
+            boj_client.close()
+    return stitch_data_responses(
+        (page for request_pages in pages for page in request_pages),
+        parameter=parameter,
+    )
+
+
+def get_data_layer_planned(
+    db: Db | str,
+    frequency: Frequency | str,
+    layer: Layer | str,
+    start_date: Period | str | None = None,
+    end_date: Period | str | None = None,
+    *,
+    client: BojClient | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_codes: int = MAX_CODES_PER_REQUEST,
+    max_observations: int = MAX_OBSERVATIONS_PER_REQUEST,
+    cache_ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS,
+    cache_dir: str | Path | None = None,
+) -> DataResponse:
+    """``get_data_layer`` over every page, split into parallel requests.
+
+    The series under ``layer`` with ``frequency`` are looked up in the local
+    catalog of ``db`` and fetched with ``getDataCode`` requests planned by
+    ``plan_data_requests``. The result holds every series in layer-tree order
+    (``layer_row_positions``), as if all ``NEXTPOSITION`` pages of the layer
+    query had been followed.
+    """
+    resolved_frequency = resolve_frequency(frequency)
+    layer_parts = normalize_layer_parts(layer)
+    assert layer_parts is not None
+    selected = select_series(
+        db,
+        frequency=resolved_frequency,
+        layer=layer,
+        cache_ttl_seconds=cache_ttl_seconds,
+        cache_dir=cache_dir,
+    )
+
+    plan = plan_data_requests(
+        selected,
+        start_date,
+        end_date,
+        max_codes=max_codes,
+        max_observations=max_observations,
+    )
+    parameter = {
+        "DB": str(db),
+        "FREQUENCY": str(resolved_frequency),
+        **{f"LAYER{depth}": part for depth, part in enumerate(layer_parts, start=1)},
+        "STARTDATE": "" if start_date is None else str(start_date),
+        "ENDDATE": "" if end_date is None else str(end_date),
+    }
+    return fetch_planned(
+        plan, client=client, max_workers=max_workers, parameter=parameter
+    )
+
+
+def select_series(
+    db: Db | str,
+    *,
+    codes: Sequence[str] | None = None,
+    frequency: Frequency | str | None = None,
+    layer: Layer | str | None = None,
+    cache_ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS,
+    cache_dir: str | Path | None = None,
+) -> pa.Table:
+    """Catalog rows of ``db`` to plan requests for.
+
+    Pass ``codes`` to select series by code, in catalog order; every code must
+    be in the catalog. Otherwise ``frequency`` and ``layer`` select the series
+    a ``getDataLayer`` query would return, in layer-tree order.
+    """
+    catalog = list_series(
+        str(db), cache_ttl_seconds=cache_ttl_seconds, cache_dir=cache_dir
+    ).to_arrow()
+    if codes is not None:
+        wanted = pa.array(list(dict.fromkeys(codes)), pa.string())
+        selected = catalog.filter(pc.is_in(catalog["series_code"], value_set=wanted))
+        found = set(selected["series_code"].to_pylist())
+        missing = [code for code in wanted.to_pylist() if code not in found]
+        if missing:
+            raise ValueError(
+                f"code: {', '.join(missing)} not found in the {db} catalog"
+            )
+        return selected
+
+    if frequency is None or layer is None:
+        raise ValueError("codes/layer: pass codes, or a frequency and a layer")
+    resolved_frequency = resolve_frequency(frequency)
+    layer_parts = normalize_layer_parts(layer)
+    assert layer_parts is not None
+    in_layer = catalog.take(
+        layer_row_positions(catalog, layer_parts, cache_dir=cache_dir)
+    )
+    selected = in_layer.filter(
+        _has_frequency(in_layer["frequency"], resolved_frequency)
+    )
+    if selected.num_rows == 0:
+        raise ValueError(
+            f"layer: no {resolved_frequency} series under {','.join(layer_parts)} "
+            f"in the {db} catalog"
+        )
+    return selected
+
+
+def _fetch_pages(client: BojClient, request: PlannedRequest) -> list[DataResponse]:
+    pages: list[DataResponse] = []
+    position: int | None = None
+    while True:
+        response = client.get_data_code(
+            request.db,
+            ",".join(request.codes),
+            request.start_date,
+            request.end_date,
+            position,
+        )
+        pages.append(response)
+        if response.next_position is None:
+            return pages
+        position = response.next_position
+
+
+def _has_frequency(names: pa.ChunkedArray, frequency: Frequency) -> pa.Array:
+    """Mask of catalog ``frequency`` names that resolve to ``frequency``."""
+    encoded = pc.dictionary_encode(names).combine_chunks()
+    matches = []
+    for name in encoded.dictionary.to_pylist():
+        try:
+            matches.append(resolve_frequency(name) == frequency)
+        except ValueError:
+            matches.append(False)
+    return pa.array(matches, pa.bool_()).take(encoded.indices)
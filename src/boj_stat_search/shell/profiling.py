@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import time
+from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+from typing import TypeVar
+
+from boj_stat_search.core.models import DataResponse, MetadataResponse, PhaseTimings
+
+ProfileCallback = Callable[[str, PhaseTimings], None]
+
+_R = TypeVar("_R", DataResponse, MetadataResponse)
+
+
+class _Profile:
+    """Seconds accumulated per phase while one API call runs."""
+
+    __slots__ = ("seconds",)
+
+    def __init__(self) -> None:
+        self.seconds: dict[str, float] = {}
+
+    def timings(self) -> PhaseTimings:
+        return PhaseTimings(**self.seconds)
+
+
+_CALLBACKS: ContextVar[tuple[ProfileCallback | None, ...]] = ContextVar(
+    "boj_stat_search_profile_callbacks", default=()
+)
+_CURRENT_PROFILE: ContextVar[_Profile | None] = ContextVar(
+    "boj_stat_search_profile", default=None
+)
+
+
+@contextlib.contextmanager
+def profile_requests(callback: ProfileCallback | None = None) -> Iterator[None]:
+    """Time each phase of the API calls made in this context.
+
+    Parsed responses carry the result in ``timings``; ``callback`` (if given)
+    also receives ``(endpoint, timings)`` once each call completes, including
+    calls to the ``*_raw`` functions and ``BojClient.get_content``.
+    """
+    token = _CALLBACKS.set((*_CALLBACKS.get(), callback))
+    try:
+        yield
+    finally:
+        _CALLBACKS.reset(token)
+
+
+@contextlib.contextmanager
+def profiled_call(endpoint: str) -> Iterator[_Profile | None]:
+    """Collect phases for one call, or join the call already being profiled."""
+    if not _CALLBACKS.get():
+        yield None
+        return
+
+    current = _CURRENT_PROFILE.get()
+    if current is not None:
+        yield current
+        return
+
+    profile = _Profile()
+    token = _CURRENT_PROFILE.set(profile)
+    try:
+        yield profile
+    finally:
+        _CURRENT_PROFILE.reset(token)
+
+    timings = profile.timings()
+    for callback in _CALLBACKS.get():
+        if callback is not None:
+            callback(endpoint, timings)
+
+
+@contextlib.contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Add the time spent in the block to ``name`` of the profiled call, if any."""
+    profile = _CURRENT_PROFILE.get()
+    if profile is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.seconds[name] = (
+            profile.seconds.get(name, 0.0) + time.perf_counter() - start
+        )
+
+
+def is_profiling() -> bool:
+    return _CURRENT_PROFILE.get() is not None
+
+
+def with_timings(response: _R, profile: _Profile | None) -> _R:
+    if profile is None:
+        return response
+    return dataclasses.replace(response, timings=profile.timings())
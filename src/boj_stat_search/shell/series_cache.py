@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import json
+import shutil
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+import httpx
+import pyarrow as pa
+
+from boj_stat_search.core.columnar import (
+    series_to_batch,
+    table_from_ipc_bytes,
+    table_to_ipc_bytes,
+)
+from boj_stat_search.core.coverage import (
+    OBSERVATION_SCHEMA,
+    MonthRange,
+    merge_observations,
+    merge_ranges,
+    missing_ranges,
+    request_dates,
+    request_months,
+    select_months,
+)
+from boj_stat_search.core.models import DataResponse
+from boj_stat_search.core.time_index import resolve_frequency
+from boj_stat_search.core.types import Code, Db, ErrorMode, Frequency, Period
+from boj_stat_search.shell.api import resolve_code_db, get_data_code
+from boj_stat_search.shell.catalog.loader import (
+    DEFAULT_CACHE_TTL_SECONDS,
+    atomic_write_bytes,
+    default_cache_root,
+)
+from boj_stat_search.shell.metrics import CacheEvent, record_event
+
+# Called as fetch(db, code, start_date, end_date, start_position).
+DataCodeFetcher = Callable[[str, str, str | None, str | None, int | None], DataResponse]
+
+_METADATA_KEY = b"boj_stat_search.series"
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedSeries:
+    observations: pa.Table
+    coverage: MonthRange
+    entry: dict[str, Any]
+    header: dict[str, Any]
+    fetched_at: float
+
+    @property
+    def frequency(self) -> Frequency:
+        return _entry_frequency(self.entry)
+
+
+class SeriesCache:
+    """Observations of single series cached on disk as Arrow files.
+
+    ``get_data_code`` answers from the cached date range of each series and
+    only requests the periods before or after it that a call asks for, then
+    merges them in. Series cached more than ``ttl_seconds`` ago are fetched
+    again in full, so revisions and new observations are picked up.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        *,
+        ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS,
+    ) -> None:
+        if ttl_seconds < 0:
+            raise ValueError("ttl_seconds: must be >= 0")
+        self.cache_dir = (
+            Path(cache_dir).expanduser()
+            if cache_dir is not None
+            else default_cache_root().parent / "series"
+        )
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+    def get_data_code(
+        self,
+        db: Db | str | None = None,
+        code: Code | str | None = None,
+        start_date: Period | str | None = None,
+        end_date: Period | str | None = None,
+        on_validation_error: ErrorMode = "raise",
+        *,
+        client: httpx.Client | None = None,
+        fetch: DataCodeFetcher | None = None,
+    ) -> DataResponse:
+        """``get_data_code`` served from the cache where it covers the range.
+
+        All ``NEXTPOSITION`` pages are fetched, so the response holds every
+        requested series. ``fetch`` replaces the network call, e.g. to go
+        through ``BojClient``; otherwise ``client`` is used.
+        """
+        codes, resolved_db = _split_codes(db, code)
+        if fetch is None:
+            fetch = _api_fetcher(on_validation_error, client)
+
+        with self._lock:
+            cached = {series: self._load(resolved_db, series) for series in codes}
+            header: dict[str, Any] | None = None
+
+            uncached = [series for series in codes if cached[series] is None]
+            edges = _edge_requests(cached, uncached, start_date, end_date)
+            if uncached:
+                header = self._fetch_into(
+                    cached,
+                    fetch,
+                    resolved_db,
+                    uncached,
+                    _optional_text(start_date),
+                    _optional_text(end_date),
+                )
+            for (start, end), group in edges.items():
+                header = self._fetch_into(cached, fetch, resolved_db, group, start, end)
+
+            fetched = set(uncached).union(*edges.values())
+            for series in codes:
+                record_event(
+                    CacheEvent(
+                        "series", f"{resolved_db}'{series}", series not in fetched
+                    )
+                )
+
+        entries = [cached[series] for series in codes]
+        present = [entry for entry in entries if entry is not None]
+        if header is None:
+            header = max(present, key=lambda entry: entry.fetched_at).header
+        return DataResponse(
+            status=header["status"],
+            message_id=header["message_id"],
+            message=header["message"],
+            date=header["date"],
+            parameter={
+                "DB": resolved_db,
+                "CODE": ",".join(codes),
+                "STARTDATE": _optional_text(start_date) or "",
+                "ENDDATE": _optional_text(end_date) or "",
+            },
+            next_position=None,
+            result_set=tuple(
+                _result_entry(entry, start_date, end_date) for entry in present
+            ),
+        )
+
+    def clear(self) -> None:
+        """Remove every cached series."""
+        with self._lock:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    # --- storage ---
+
+    def _path(self, db: str, code: str) -> Path:
+        return self.cache_dir / quote(db, safe="") / f"{quote(code, safe='')}.arrow"
+
+    def _load(self, db: str, code: str) -> _CachedSeries | None:
+        path = self._path(db, code)
+        try:
+            table = table_from_ipc_bytes(path.read_bytes())
+            stored = json.loads((table.schema.metadata or {})[_METADATA_KEY])
+        except (OSError, KeyError, ValueError, pa.ArrowException):
+            return None
+
+        if (
+            self.ttl_seconds == 0
+            or time.time() - stored["fetched_at"] > self.ttl_seconds
+        ):
+            return None
+        return _CachedSeries(
+            observations=table.replace_schema_metadata(None),
+            coverage=(stored["coverage"][0], stored["coverage"][1]),
+            entry=stored["entry"],
+            header=stored["header"],
+            fetched_at=stored["fetched_at"],
+        )
+
+    def _store(self, db: str, code: str, series: _CachedSeries) -> None:
+        stored = {
+            "coverage": list(series.coverage),
+            "entry": series.entry,
+            "header": series.header,
+            "fetched_at": series.fetched_at,
+        }
+        table = series.observations.replace_schema_metadata(
+            {_METADATA_KEY: json.dumps(stored)}
+        )
+        atomic_write_bytes(self._path(db, code), table_to_ipc_bytes(table))
+
+    # --- fetching ---
+
+    def _fetch_into(
+        self,
+        cached: dict[str, _CachedSeries | None],
+        fetch: DataCodeFetcher,
+        db: str,
+        codes: list[str],
+        start_date: str | None,
+        end_date: str | None,
+    ) -> dict[str, Any]:
+        """Fetch ``codes`` over one date range and merge them into ``cached``."""
+        fetched_at = time.time()
+        response, entries = _fetch_pages(fetch, db, codes, start_date, end_date)
+        header = {
+            "status": response.status,
+            "message_id": response.message_id,
+            "message": response.message,
+            "date": response.date,
+        }
+
+        for entry in entries:
+            series = str(entry.get("SERIES_CODE", ""))
+            if series not in cached or not isinstance(entry.get("VALUES"), dict):
+                continue
+            frequency = _entry_frequency(entry)
+            fetched = request_months(start_date, end_date, frequency)
+            observations = pa.Table.from_batches([series_to_batch(entry)]).select(
+                OBSERVATION_SCHEMA.names
+            )
+
+            previous = cached[series]
+            if previous is not None:
+                observations = merge_observations(previous.observations, observations)
+            updated = _CachedSeries(
+                observations=observations,
+                coverage=merge_ranges(
+                    previous.coverage if previous is not None else None, fetched
+                ),
+                entry={key: value for key, value in entry.items() if key != "VALUES"},
+                header=header,
+                fetched_at=previous.fetched_at if previous is not None else fetched_at,
+            )
+            cached[series] = updated
+            self._store(db, series, updated)
+        return header
+
+
+def _split_codes(db: Db | str | None, code: Code | str | None) -> tuple[list[str], str]:
+    if isinstance(code, Code):
+        codes = list(code.codes)
+        embedded_db = code.db
+    elif isinstance(code, str):
+        codes = [part.strip() for part in code.split(",") if part.strip()]
+        embedded_db = None
+    else:
+        codes, embedded_db = [], None
+    if not codes:
+        raise ValueError("code: must provide at least one series code")
+
+    if db is not None and embedded_db is not None and db != embedded_db:
+        raise ValueError("db/code: conflicting DB values between db and Code input")
+    resolved = db if db is not None else embedded_db
+    if resolved is None:
+        resolved = resolve_code_db(code)
+    if resolved is None:
+        raise ValueError(
+            "db: must be given, embedded in the Code, or found in the catalog cache"
+        )
+    return list(dict.fromkeys(codes)), str(resolved)
+
+
+def _edge_requests(
+    cached: dict[str, _CachedSeries | None],
+    uncached: list[str],
+    start_date: Period | str | None,
+    end_date: Period | str | None,
+) -> dict[tuple[str | None, str | None], list[str]]:
+    """Group the cached series by the date ranges still missing for them."""
+    groups: dict[tuple[str | None, str | None], list[str]] = {}
+    for series, entry in cached.items():
+        if entry is None:
+            continue
+        requested = request_months(start_date, end_date, entry.frequency)
+        for months in missing_ranges(entry.coverage, requested):
+            groups.setdefault(request_dates(months, entry.frequency), []).append(series)
+    return groups
+
+
+def _fetch_pages(
+    fetch: DataCodeFetcher,
+    db: str,
+    codes: list[str],
+    start_date: str | None,
+    end_date: str | None,
+) -> tuple[DataResponse, list[dict[str, Any]]]:
+    entries: list[dict[str, Any]] = []
+    position: int | None = None
+    while True:
+        response = fetch(db, ",".join(codes), start_date, end_date, position)
+        entries.extend(response.result_set)
+        if response.next_position is None:
+            return response, entries
+        position = response.next_position
+
+
+def _api_fetcher(
+    on_validation_error: ErrorMode, client: httpx.Client | None
+) -> DataCodeFetcher:
+    def fetch(
+        db: str,
+        code: str,
+        start_date: str | None,
+        end_date: str | None,
+        start_position: int | None,
+    ) -> DataResponse:
+        return get_data_code(
+            db,
+            code,
+            start_date,
+            end_date,
+            start_position,
+            on_validation_error,
+            client=client,
+        )
+
+    return fetch
+
+
+def _result_entry(
+    series: _CachedSeries,
+    start_date: Period | str | None,
+    end_date: Period | str | None,
+) -> dict[str, Any]:
+    frequency = series.frequency
+    observations = select_months(
+        series.observations,
+        frequency,
+        request_months(start_date, end_date, frequency),
+    )
+    return {
+        **series.entry,
+        "VALUES": {
+            "SURVEY_DATES": observations["survey_date"].to_pylist(),
+            "VALUES": observations["value"].to_pylist(),
+        },
+    }
+
+
+def _entry_frequency(entry: dict[str, Any]) -> Frequency:
+    try:
+        return resolve_frequency(str(entry.get("FREQUENCY", "")))
+    except ValueError:
+        # Without a known layout, treat survey dates as months.
+        return Frequency.MONTHLY
+
+
+def _optional_text(value: Period | str | None) -> str | None:
+    return None if value is None else str(value)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import time
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock
 
 import httpx
@@ -10,13 +11,18 @@ import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
 
+from boj_stat_search.shell.catalog import loader
 from boj_stat_search.shell.catalog.loader import (
     CatalogCacheError,
     CatalogFetchError,
+    ensure_search_index,
     load_catalog_all,
     load_catalog_db,
+    load_layer_index,
+    load_search_index,
 )
 from boj_stat_search.core.models import DbInfo
+from boj_stat_search.core.search_index import search_index_rows
 
 
 def _parquet_bytes(rows: list[dict[str, str]]) -> bytes:
@@ -26,7 +32,7 @@ def _parquet_bytes(rows: list[dict[str, str]]) -> bytes:
     return sink.getvalue().to_pybytes()
 
 
-def _write_cached_parquet(path: Path, rows: list[dict[str, str]]) -> None:
+def _write_cached_parquet(path: Path, rows: list[dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     table = pa.Table.from_pylist(rows)
     pq.write_table(table, path)
@@ -223,3 +229,119 @@ def test_load_catalog_all_does_not_close_external_client(tmp_path: Path) -> None
     load_catalog_all(dbs=["FM01", "BP01"], cache_dir=tmp_path, client=client)
 
     client.close.assert_not_called()
+
+
+def _search_row(series_code: str, name_en: str) -> dict[str, str]:
+    return {
+        "series_code": series_code,
+        "name_j": "名称",
+        "name_en": name_en,
+        "category_j": "カテゴリ",
+        "category_en": "Category",
+        "notes_j": "",
+        "notes_en": "",
+    }
+
+
+def test_ensure_search_index_writes_sidecar_on_first_use(tmp_path: Path) -> None:
+    client = Mock(spec=httpx.Client)
+    client.get.return_value = _mock_response(
+        _parquet_bytes([_search_row("A", "Call Rate"), _search_row("B", "Money")])
+    )
+
+    table = load_catalog_db("FM01", cache_dir=tmp_path, client=client)
+
+    assert not any(tmp_path.glob("FM01.index-v*.arrow"))
+    assert load_search_index("FM01", table, cache_dir=tmp_path) is None
+
+    built = ensure_search_index("FM01", table, cache_dir=tmp_path)
+
+    assert built is not None
+    assert any(tmp_path.glob("FM01.index-v*.arrow"))
+    index = load_search_index("FM01", table, cache_dir=tmp_path)
+    assert index is not None
+    assert search_index_rows(index, ["rate"]).to_pylist() == [0]
+
+
+def test_ensure_search_index_removes_other_index_versions(tmp_path: Path) -> None:
+    _write_cached_parquet(tmp_path / "FM01.parquet", [_search_row("A", "Call Rate")])
+    stale = tmp_path / "FM01.index-v0.arrow"
+    stale.write_bytes(b"old")
+    other_db = tmp_path / "BP01.index-v0.arrow"
+    other_db.write_bytes(b"old")
+    table = load_catalog_db("FM01", cache_ttl_seconds=3600, cache_dir=tmp_path)
+
+    ensure_search_index("FM01", table, cache_dir=tmp_path)
+
+    assert not stale.exists()
+    assert other_db.exists()
+    assert [path.name for path in tmp_path.glob("FM01.index-v*.arrow")] == [
+        f"FM01.index-v{loader.SEARCH_INDEX_VERSION}.arrow"
+    ]
+
+
+def test_ensure_search_index_rebuilds_after_refresh(tmp_path: Path) -> None:
+    cache_path = tmp_path / "FM01.parquet"
+    _write_cached_parquet(cache_path, [_search_row("OLD", "Old")])
+    old_table = load_catalog_db("FM01", cache_ttl_seconds=3600, cache_dir=tmp_path)
+    ensure_search_index("FM01", old_table, cache_dir=tmp_path)
+    old_time = time.time() - 7200
+    os.utime(cache_path, (old_time, old_time))
+
+    client = Mock(spec=httpx.Client)
+    client.get.return_value = _mock_response(
+        _parquet_bytes([_search_row("NEW", "New")])
+    )
+    table = load_catalog_db(
+        "FM01", cache_ttl_seconds=60, cache_dir=tmp_path, client=client
+    )
+
+    assert load_search_index("FM01", table, cache_dir=tmp_path) is None
+    ensure_search_index("FM01", table, cache_dir=tmp_path)
+    index = load_search_index("FM01", table, cache_dir=tmp_path)
+    assert index is not None
+    assert index.series_code.to_pylist() == ["NEW"]
+
+
+def test_load_search_index_returns_none_for_other_table(tmp_path: Path) -> None:
+    _write_cached_parquet(tmp_path / "FM01.parquet", [_search_row("A", "Call Rate")])
+    table = load_catalog_db("FM01", cache_ttl_seconds=3600, cache_dir=tmp_path)
+    ensure_search_index("FM01", table, cache_dir=tmp_path)
+
+    other = pa.Table.from_pylist([_search_row("B", "Call Rate")])
+
+    assert load_search_index("FM01", other, cache_dir=tmp_path) is None
+    assert load_search_index("BP01", other, cache_dir=tmp_path) is None
+
+
+def test_load_layer_index_is_reused_until_cache_changes(tmp_path: Path) -> None:
+    rows = [
+        {**_search_row("A", "x"), "layer1": 1},
+        {**_search_row("B", "y"), "layer1": 2},
+    ]
+    for row in rows:
+        row.update({f"layer{depth}": 0 for depth in range(2, 6)})
+    _write_cached_parquet(tmp_path / "FM01.parquet", rows)
+    table = load_catalog_db("FM01", cache_ttl_seconds=3600, cache_dir=tmp_path)
+
+    first = load_layer_index("FM01", table, cache_dir=tmp_path)
+
+    assert load_layer_index("FM01", table, cache_dir=tmp_path) is first
+    assert first.rows(("2",)).to_pylist() == [1]
+    other = table.slice(1)
+    assert load_layer_index("FM01", other, cache_dir=tmp_path) is not first
+
+
+def test_file_memo_drops_least_recently_used_path(tmp_path: Path) -> None:
+    memo: loader._FileMemo[str] = loader._FileMemo(2)
+    first, second, third = (tmp_path / name for name in ("a", "b", "c"))
+    memo.put(first, (1, 1), "a")
+    memo.put(second, (1, 1), "b")
+    assert memo.get(first, (1, 1)) == "a"
+
+    memo.put(third, (1, 1), "c")
+
+    assert len(memo) == 2
+    assert memo.get(second, (1, 1)) is None
+    assert memo.get(first, (1, 1)) == "a"
+    assert memo.get(first, (2, 1)) is None
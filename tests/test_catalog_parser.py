@@ -9,8 +9,9 @@ from boj_stat_search.core.catalog_parser import (
     resolve_db_from_tables,
     row_to_entry,
     table_to_entries,
+    table_to_metadata_entries,
 )
-from boj_stat_search.core.models import SeriesCatalogEntry
+from boj_stat_search.core.models import MetadataEntry, SeriesCatalogEntry
 
 
 def _make_row(**overrides: object) -> dict[str, object]:
@@ -135,6 +136,33 @@ def test_table_to_entries_empty_table_returns_empty_tuple() -> None:
     assert entries == ()
 
 
+def test_table_to_entries_converts_tables_larger_than_one_batch() -> None:
+    rows = [_make_row(series_code=f"CODE{index}") for index in range(5000)]
+
+    entries = table_to_entries(_make_table(rows))
+
+    assert len(entries) == 5000
+    assert entries[0].series_code == "CODE0"
+    assert entries[-1].series_code == "CODE4999"
+
+
+def test_table_to_entries_returns_slotted_entries() -> None:
+    (entry,) = table_to_entries(_make_table())
+
+    assert not hasattr(entry, "__dict__")
+
+
+def test_table_to_entries_shares_repeated_low_cardinality_strings() -> None:
+    first, second = table_to_entries(
+        _make_table([_make_row(series_code="A"), _make_row(series_code="B")])
+    )
+
+    assert first.unit_en is second.unit_en
+    assert first.category_j is second.category_j
+    assert first.frequency is second.frequency
+    assert first.db is second.db
+
+
 def test_table_to_entries_raises_on_missing_columns() -> None:
     table = pa.table({"db": ["BS"], "series_code": ["X"]})
     with pytest.raises(ValueError, match="missing required columns"):
@@ -148,6 +176,54 @@ def test_table_to_entries_raises_on_invalid_row_data() -> None:
         table_to_entries(table)
 
 
+# ---------------------------------------------------------------------------
+# table_to_metadata_entries
+# ---------------------------------------------------------------------------
+
+
+def test_table_to_metadata_entries_maps_catalog_columns() -> None:
+    table = _make_table([_make_row(), _make_row(series_code="", name_en="Header")])
+
+    entries = table_to_metadata_entries(table.drop_columns(["db"]))
+
+    assert entries[0] == MetadataEntry(
+        series_code="BS01'MABJMBS_MA_C__CM_S111",
+        name_of_time_series_j="テスト",
+        name_of_time_series="Test",
+        unit_j="百万円",
+        unit="million yen",
+        frequency="Monthly",
+        category_j="カテゴリ",
+        category="Category",
+        layer1=1,
+        layer2=2,
+        layer3=3,
+        layer4=4,
+        layer5=5,
+        start_of_the_time_series="2000-01",
+        end_of_the_time_series="2024-12",
+        last_update="2025-01-01",
+        notes_j="備考",
+        notes="Notes",
+    )
+    assert entries[1].series_code == ""
+    assert entries[1].name_of_time_series == "Header"
+
+
+def test_table_to_metadata_entries_missing_column_raises() -> None:
+    table = _make_table().drop_columns(["layer3"])
+
+    with pytest.raises(ValueError, match="layer3"):
+        table_to_metadata_entries(table)
+
+
+def test_table_to_metadata_entries_invalid_column_type_raises() -> None:
+    table = _make_table([_make_row(layer1="bad")])
+
+    with pytest.raises(ValueError, match="layer1: must be an integer"):
+        table_to_metadata_entries(table)
+
+
 # ---------------------------------------------------------------------------
 # resolve_db_from_tables
 # ---------------------------------------------------------------------------
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import pyarrow as pa
+import pytest
+
+from boj_stat_search.core.catalog_result import (
+    CATALOG_TABLE_SCHEMA,
+    SeriesCatalogResult,
+    ensure_catalog_table,
+)
+from boj_stat_search.core.models import SeriesCatalogEntry
+
+
+def _make_row(series_code: str, **overrides: object) -> dict[str, object]:
+    row: dict[str, object] = {
+        "db": "FM01",
+        "series_code": series_code,
+        "name_j": f"名前{series_code}",
+        "name_en": f"Name {series_code}",
+        "unit_j": "年％",
+        "unit_en": "percent per annum",
+        "frequency": "DAILY",
+        "category_j": "コールレート",
+        "category_en": "Call Rate",
+        "layer1": 1,
+        "layer2": 0,
+        "layer3": 0,
+        "layer4": 0,
+        "layer5": 0,
+        "start_of_time_series": "19980105",
+        "end_of_time_series": "20260226",
+        "last_update": "20260302",
+        "notes_j": "",
+        "notes_en": "",
+    }
+    row.update(overrides)
+    return row
+
+
+def _result(codes: list[str]) -> SeriesCatalogResult:
+    return SeriesCatalogResult(
+        pa.Table.from_pylist([_make_row(code) for code in codes])
+    )
+
+
+def test_len_and_integer_indexing_build_entries():
+    result = _result(["A", "B", "C"])
+
+    assert len(result) == 3
+    assert isinstance(result[0], SeriesCatalogEntry)
+    assert result[0].series_code == "A"
+    assert result[-1].series_code == "C"
+    assert result[1].name_en == "Name B"
+
+
+@pytest.mark.parametrize("index", [3, -4, 100])
+def test_integer_index_out_of_range_raises_index_error(index: int):
+    with pytest.raises(IndexError):
+        _result(["A", "B", "C"])[index]
+
+
+def test_non_integer_index_raises_type_error():
+    with pytest.raises(TypeError):
+        _result(["A"])["0"]  # type: ignore[index]
+
+
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [
+        (slice(None, 2), ["A", "B"]),
+        (slice(1, None), ["B", "C", "D"]),
+        (slice(-2, None), ["C", "D"]),
+        (slice(None, None, 2), ["A", "C"]),
+        (slice(None, None, -1), ["D", "C", "B", "A"]),
+        (slice(3, 1), []),
+        (slice(10, 20), []),
+    ],
+)
+def test_slicing_returns_lazy_view(key: slice, expected: list[str]):
+    sliced = _result(["A", "B", "C", "D"])[key]
+
+    assert isinstance(sliced, SeriesCatalogResult)
+    assert [entry.series_code for entry in sliced] == expected
+
+
+def test_iteration_yields_entries_in_order_across_batches():
+    codes = [f"CODE{index}" for index in range(2500)]
+
+    result = _result(codes)
+
+    assert [entry.series_code for entry in result] == codes
+
+
+def test_equality_with_tuple_list_and_other_result():
+    result = _result(["A", "B"])
+    entries = tuple(result)
+
+    assert result == entries
+    assert result == list(entries)
+    assert result == _result(["A", "B"])
+    assert result != _result(["A"])
+    assert result != entries[:1]
+    assert result != "AB"
+
+
+def test_sequence_helpers_work_through_lazy_access():
+    result = _result(["A", "B"])
+
+    assert result[1] in result
+    assert result.index(result[1]) == 1
+    assert [entry.series_code for entry in reversed(result)] == ["B", "A"]
+
+
+def test_to_arrow_returns_underlying_table_without_copy():
+    table = pa.Table.from_pylist([_make_row("A"), _make_row("B")])
+
+    result = SeriesCatalogResult(table)
+
+    assert result.to_arrow() is table
+    assert result[:1].to_arrow().column("series_code").to_pylist() == ["A"]
+
+
+def test_empty_result_uses_catalog_schema():
+    result = SeriesCatalogResult.empty()
+
+    assert len(result) == 0
+    assert result == ()
+    assert result.to_arrow().schema == CATALOG_TABLE_SCHEMA
+
+
+def test_repr_reports_length():
+    assert repr(_result(["A", "B"])) == "SeriesCatalogResult(2 entries)"
+
+
+def test_ensure_catalog_table_rejects_missing_columns():
+    with pytest.raises(ValueError, match="missing required columns"):
+        ensure_catalog_table(pa.table({"series_code": ["A"]}))
+
+
+def test_ensure_catalog_table_rejects_non_string_column():
+    table = pa.Table.from_pylist([_make_row("A", name_en=1)])
+
+    with pytest.raises(ValueError, match="name_en: must be a string"):
+        SeriesCatalogResult(table)
+
+
+def test_ensure_catalog_table_rejects_non_integer_layer_column():
+    table = pa.Table.from_pylist([_make_row("A", layer2="1")])
+
+    with pytest.raises(ValueError, match="layer2: must be an integer"):
+        SeriesCatalogResult(table)
+
+
+def test_ensure_catalog_table_rejects_null_values():
+    table = pa.Table.from_pylist([_make_row("A", unit_en=None), _make_row("B")])
+
+    with pytest.raises(ValueError, match="unit_en: must be a string"):
+        SeriesCatalogResult(table)
@@ -13,10 +13,12 @@ from boj_stat_search.shell.catalog import (
     CatalogCacheError,
     CatalogError,
     list_series,
+    load_catalog_db,
+    rank_series,
     resolve_db,
     search_series,
 )
-from boj_stat_search.core import Layer
+from boj_stat_search.core import Layer, SeriesCatalogResult
 from boj_stat_search.core.models import SeriesCatalogEntry
 
 
@@ -88,6 +90,30 @@ def test_search_series_matches_japanese_keyword(monkeypatch) -> None:
     assert isinstance(results[0], SeriesCatalogEntry)
 
 
+def test_search_series_returns_lazy_view_over_filtered_table(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "boj_stat_search.shell.catalog.search.load_catalog_all",
+        lambda **_: _table(
+            [
+                _make_row(
+                    db="FM01", series_code="FM01'A", name_j="A", name_en="Rate A"
+                ),
+                _make_row(db="FM01", series_code="FM01'B", name_j="B", name_en="Stock"),
+                _make_row(
+                    db="FM01", series_code="FM01'C", name_j="C", name_en="Rate C"
+                ),
+            ]
+        ),
+    )
+
+    results = search_series("rate")
+
+    assert isinstance(results, SeriesCatalogResult)
+    assert len(results) == 2
+    assert results.to_arrow()["series_code"].to_pylist() == ["FM01'A", "FM01'C"]
+    assert results[:1][0].series_code == "FM01'A"
+
+
 def test_search_series_matches_english_keyword_case_insensitive(monkeypatch) -> None:
     monkeypatch.setattr(
         "boj_stat_search.shell.catalog.search.load_catalog_all",
@@ -114,6 +140,96 @@ def test_search_series_matches_english_keyword_case_insensitive(monkeypatch) ->
     assert tuple(entry.series_code for entry in results) == ("FM01'A",)
 
 
+def test_search_series_requires_every_keyword_in_sequence(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "boj_stat_search.shell.catalog.search.load_catalog_all",
+        lambda **_: _table(
+            [
+                _make_row(
+                    db="FM01",
+                    series_code="FM01'A",
+                    name_j="対米ドル為替レート",
+                    name_en="Exchange Rate",
+                ),
+                _make_row(
+                    db="BP01",
+                    series_code="BP01'B",
+                    name_j="為替",
+                    name_en="Rate of Exchange",
+                    category_en="Balance of Payments",
+                ),
+            ]
+        ),
+    )
+
+    assert tuple(
+        entry.series_code for entry in search_series(["rate", "exchange"])
+    ) == ("FM01'A", "BP01'B")
+    assert tuple(entry.series_code for entry in search_series("rate exchange")) == ()
+    assert tuple(
+        entry.series_code for entry in search_series(["為替", "payments"])
+    ) == ("BP01'B",)
+
+
+def test_search_series_normalizes_full_width_and_kana_keywords(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "boj_stat_search.shell.catalog.search.load_catalog_all",
+        lambda **_: _table(
+            [
+                _make_row(
+                    db="PR01",
+                    series_code="PR01'A",
+                    name_j="消費者物価指数",
+                    name_en="CPI",
+                ),
+                _make_row(
+                    db="MD02",
+                    series_code="MD02'B",
+                    name_j="ﾏﾈｰｽﾄｯｸ",
+                    name_en="Money Stock",
+                ),
+            ]
+        ),
+    )
+
+    assert tuple(entry.series_code for entry in search_series("ＣＰＩ")) == ("PR01'A",)
+    assert tuple(entry.series_code for entry in search_series("まねー")) == ("MD02'B",)
+
+
+def test_search_series_uses_persisted_search_index(tmp_path: Path, monkeypatch) -> None:
+    table = _table(
+        [
+            _make_row(db="FM01", series_code="FM01'A", name_j="為替", name_en="FX"),
+            _make_row(db="FM01", series_code="FM01'B", name_j="コール", name_en="Call"),
+        ]
+    )
+    pq.write_table(table, tmp_path / "FM01.parquet")
+    load_catalog_db("FM01", cache_ttl_seconds=3600, cache_dir=tmp_path)
+
+    def fail_scan(*_args, **_kwargs):
+        raise AssertionError("keyword scan should not run when an index exists")
+
+    monkeypatch.setattr("boj_stat_search.shell.catalog.search._scan_rows", fail_scan)
+
+    results = search_series(
+        "call", db="FM01", cache_dir=tmp_path, cache_ttl_seconds=3600
+    )
+
+    assert tuple(entry.series_code for entry in results) == ("FM01'B",)
+
+
+def test_search_series_rejects_empty_keyword_sequence() -> None:
+    with pytest.raises(ValueError, match="keyword: must not be empty"):
+        search_series([])
+    with pytest.raises(ValueError, match="keyword: must not be empty"):
+        search_series(["rate", " "])
+
+
+def test_search_series_rejects_non_string_keyword_term() -> None:
+    with pytest.raises(ValueError, match="keyword: must be a string"):
+        search_series(["rate", 1])  # type: ignore[list-item]
+
+
 def test_search_series_matches_category_fields(monkeypatch) -> None:
     monkeypatch.setattr(
         "boj_stat_search.shell.catalog.search.load_catalog_all",
@@ -360,6 +476,75 @@ def test_search_series_raises_catalog_error_when_columns_missing(monkeypatch) ->
         search_series("fm01")
 
 
+def test_rank_series_orders_by_relevance_with_scores(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "boj_stat_search.shell.catalog.search.load_catalog_all",
+        lambda **_: _table(
+            [
+                _make_row(
+                    db="FM01",
+                    series_code="FM01'A",
+                    name_j="無担保コール",
+                    name_en="Call Rate",
+                    category_en="Exchange Rates and Call Rates",
+                ),
+                _make_row(
+                    db="FM08",
+                    series_code="FM08'B",
+                    name_j="為替",
+                    name_en="Exchange Rate",
+                ),
+                _make_row(
+                    db="BP01",
+                    series_code="BP01'C",
+                    name_j="マネー",
+                    name_en="Money Stock",
+                ),
+            ]
+        ),
+    )
+
+    results = rank_series("exchange rate")
+
+    assert tuple(entry.series_code for entry in results) == ("FM08'B", "FM01'A")
+    scores = results.to_arrow()["score"].to_pylist()
+    assert scores[0] > scores[1] > 0
+
+
+def test_rank_series_applies_limit_and_layer_filter(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "boj_stat_search.shell.catalog.search.load_catalog_db",
+        lambda *_args, **_kwargs: _table(
+            [
+                _make_row(
+                    db="FM01",
+                    series_code=f"FM01'{index}",
+                    name_j="レート",
+                    name_en="Rate " * (index + 1),
+                    layer1=1 if index % 2 == 0 else 2,
+                )
+                for index in range(6)
+            ]
+        ),
+    )
+
+    results = rank_series("rate", db="FM01", layer="1", limit=2)
+
+    assert len(results) == 2
+    assert {entry.layer1 for entry in results} == {1}
+
+
+@pytest.mark.parametrize("limit", [0, -1, 1.5, True])
+def test_rank_series_rejects_invalid_limit(limit: object) -> None:
+    with pytest.raises(ValueError, match="limit"):
+        rank_series("rate", limit=limit)  # type: ignore[arg-type]
+
+
+def test_rank_series_rejects_unknown_field_weight() -> None:
+    with pytest.raises(ValueError, match="field_weights"):
+        rank_series("rate", field_weights={"unit_en": 1.0})
+
+
 def test_list_series_returns_all_rows_for_db(monkeypatch) -> None:
     load_db = Mock(
         return_value=_table(
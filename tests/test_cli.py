@@ -3,10 +3,25 @@ from pathlib import Path
 from types import MappingProxyType
 from unittest.mock import patch
 
+import pyarrow as pa
+import pytest
+
 from typer.testing import CliRunner
 
-from boj_stat_search.shell.catalog import MetadataExportReport
+from boj_stat_search.shell.catalog import (
+    CatalogCacheError,
+    CatalogFetchError,
+    MetadataExportReport,
+)
+from boj_stat_search.shell.api import get_metadata
+from boj_stat_search.shell.catalog.exporter import metadata_entries_to_rows
 from boj_stat_search.shell.cli import app
+from boj_stat_search.shell.mock_server import MockBojServer
+from boj_stat_search.core.catalog_result import (
+    CATALOG_TABLE_SCHEMA,
+    SeriesCatalogResult,
+)
+from boj_stat_search.core.mock_api import MockDataset
 from boj_stat_search.core.models import (
     DataResponse,
     DbInfo,
@@ -103,7 +118,7 @@ class TestListDb:
 class TestGetMetadata:
     def test_success_json_output(self) -> None:
         with patch(
-            "boj_stat_search.shell.cli.get_metadata",
+            "boj_stat_search.shell.api.get_metadata",
             return_value=_FAKE_METADATA_RESPONSE,
         ):
             result = runner.invoke(app, ["get-metadata", "FM01"])
@@ -118,35 +133,155 @@ class TestGetMetadata:
 
 
 class TestShowLayers:
+    @pytest.fixture(autouse=True)
+    def _no_snapshot_writes(self):
+        with patch(
+            "boj_stat_search.shell.catalog.snapshot.write_metadata_snapshot"
+        ) as mock_write:
+            self.mock_write_snapshot = mock_write
+            yield
+
     def test_success(self) -> None:
         with (
             patch(
-                "boj_stat_search.shell.cli.get_metadata",
+                "boj_stat_search.shell.api.get_metadata",
                 return_value=_FAKE_METADATA_RESPONSE,
             ),
-            patch("boj_stat_search.shell.cli.show_layers") as mock_show,
+            patch("boj_stat_search.shell.display.show_layers") as mock_show,
         ):
             result = runner.invoke(app, ["show-layers", "FM01"])
         assert result.exit_code == 0
-        mock_show.assert_called_once_with(_FAKE_METADATA_RESPONSE.result_set, None)
+        mock_show.assert_called_once_with(
+            _FAKE_METADATA_RESPONSE.result_set,
+            None,
+            layer_index=None,
+            max_depth=None,
+            collapse=(),
+        )
+        self.mock_write_snapshot.assert_not_called()
+
+    def test_save_snapshot_writes_fetched_metadata(self) -> None:
+        with (
+            patch(
+                "boj_stat_search.shell.api.get_metadata",
+                return_value=_FAKE_METADATA_RESPONSE,
+            ),
+            patch("boj_stat_search.shell.display.show_layers"),
+        ):
+            result = runner.invoke(app, ["show-layers", "FM01", "--save-snapshot"])
+        assert result.exit_code == 0
+        self.mock_write_snapshot.assert_called_once_with(_FAKE_METADATA_RESPONSE)
 
     def test_with_layer_option(self) -> None:
         with (
             patch(
-                "boj_stat_search.shell.cli.get_metadata",
+                "boj_stat_search.shell.api.get_metadata",
                 return_value=_FAKE_METADATA_RESPONSE,
             ),
-            patch("boj_stat_search.shell.cli.show_layers") as mock_show,
+            patch("boj_stat_search.shell.display.show_layers") as mock_show,
         ):
             result = runner.invoke(app, ["show-layers", "FM01", "--layer", "1"])
         assert result.exit_code == 0
-        mock_show.assert_called_once_with(_FAKE_METADATA_RESPONSE.result_set, "1")
+        mock_show.assert_called_once_with(
+            _FAKE_METADATA_RESPONSE.result_set,
+            "1",
+            layer_index=None,
+            max_depth=None,
+            collapse=(),
+        )
+
+    def test_with_depth_and_collapse_options(self) -> None:
+        with (
+            patch(
+                "boj_stat_search.shell.api.get_metadata",
+                return_value=_FAKE_METADATA_RESPONSE,
+            ),
+            patch("boj_stat_search.shell.display.show_layers") as mock_show,
+        ):
+            result = runner.invoke(
+                app,
+                [
+                    "show-layers",
+                    "FM01",
+                    "--max-depth",
+                    "2",
+                    "--collapse",
+                    "1,1",
+                    "--collapse",
+                    "2",
+                ],
+            )
+        assert result.exit_code == 0
+        mock_show.assert_called_once_with(
+            _FAKE_METADATA_RESPONSE.result_set,
+            None,
+            layer_index=None,
+            max_depth=2,
+            collapse=["1,1", "2"],
+        )
+
+    def test_invalid_collapse_path_exits_with_error(self) -> None:
+        with patch(
+            "boj_stat_search.shell.api.get_metadata",
+            return_value=_FAKE_METADATA_RESPONSE,
+        ):
+            result = runner.invoke(app, ["show-layers", "FM01", "--collapse", "1,*"])
+        assert result.exit_code == 1
+        assert "collapse" in result.output
+
+    def test_offline_reads_local_entries_without_api_call(self) -> None:
+        fake_index = object()
+        with (
+            patch("boj_stat_search.shell.api.get_metadata") as mock_get,
+            patch(
+                "boj_stat_search.shell.catalog.snapshot.load_layer_entries",
+                return_value=(_FAKE_METADATA_RESPONSE.result_set, fake_index),
+            ) as mock_load,
+            patch("boj_stat_search.shell.display.show_layers") as mock_show,
+        ):
+            result = runner.invoke(
+                app, ["show-layers", "FM01", "--offline", "--layer", "1"]
+            )
+        assert result.exit_code == 0
+        mock_get.assert_not_called()
+        mock_load.assert_called_once_with("FM01")
+        self.mock_write_snapshot.assert_not_called()
+        mock_show.assert_called_once_with(
+            _FAKE_METADATA_RESPONSE.result_set,
+            "1",
+            layer_index=fake_index,
+            max_depth=None,
+            collapse=(),
+        )
+
+    def test_offline_catalog_error_exits_non_zero(self) -> None:
+        with patch(
+            "boj_stat_search.shell.catalog.snapshot.load_layer_entries",
+            side_effect=CatalogFetchError("download failed"),
+        ):
+            result = runner.invoke(app, ["show-layers", "FM01", "--offline"])
+        assert result.exit_code == 1
+        assert "download failed" in result.output
+
+    def test_snapshot_write_failure_does_not_fail_command(self) -> None:
+        self.mock_write_snapshot.side_effect = CatalogCacheError("read-only")
+        with (
+            patch(
+                "boj_stat_search.shell.api.get_metadata",
+                return_value=_FAKE_METADATA_RESPONSE,
+            ),
+            patch("boj_stat_search.shell.display.show_layers") as mock_show,
+        ):
+            result = runner.invoke(app, ["show-layers", "FM01", "--save-snapshot"])
+        assert result.exit_code == 0
+        assert "Snapshot not saved: read-only" in result.output
+        mock_show.assert_called_once()
 
 
 class TestGetDataCode:
     def test_success_json_output(self) -> None:
         with patch(
-            "boj_stat_search.shell.cli.get_data_code",
+            "boj_stat_search.shell.client.BojClient.get_data_code",
             return_value=_FAKE_DATA_RESPONSE,
         ):
             result = runner.invoke(app, ["get-data-code", "FM01", "FM01'STRDCLUCON"])
@@ -156,7 +291,7 @@ class TestGetDataCode:
 
     def test_with_options(self) -> None:
         with patch(
-            "boj_stat_search.shell.cli.get_data_code",
+            "boj_stat_search.shell.client.BojClient.get_data_code",
             return_value=_FAKE_DATA_RESPONSE,
         ) as mock_fn:
             result = runner.invoke(
@@ -190,7 +325,7 @@ class TestGetDataCode:
 class TestGetDataLayer:
     def test_success_json_output(self) -> None:
         with patch(
-            "boj_stat_search.shell.cli.get_data_layer",
+            "boj_stat_search.shell.client.BojClient.get_data_layer",
             return_value=_FAKE_DATA_RESPONSE,
         ):
             result = runner.invoke(app, ["get-data-layer", "FM01", "D", "1,*"])
@@ -200,7 +335,7 @@ class TestGetDataLayer:
 
     def test_with_options(self) -> None:
         with patch(
-            "boj_stat_search.shell.cli.get_data_layer",
+            "boj_stat_search.shell.client.BojClient.get_data_layer",
             return_value=_FAKE_DATA_RESPONSE,
         ) as mock_fn:
             result = runner.invoke(
@@ -232,11 +367,200 @@ class TestGetDataLayer:
         result = runner.invoke(app, ["get-data-layer", "FM01", "D"])
         assert result.exit_code != 0
 
+    def test_profile_prints_breakdown_to_stderr(self) -> None:
+        http_client = MockBojServer(MockDataset(series_per_db=3, fanout=3)).client()
+        with patch("boj_stat_search.shell.api.httpx.Client", return_value=http_client):
+            result = runner.invoke(
+                app, ["get-data-layer", "FM01", "M", "*", "--profile"]
+            )
+        assert result.exit_code == 0
+        assert "timings" not in json.loads(result.stdout)
+        assert result.stderr.startswith("profile getDataLayer\n")
+        for name in ("build_url", "validate", "network", "decode", "parse", "total"):
+            assert f"  {name} " in result.stderr
+
+
+class TestStreamingDataOutput:
+    @pytest.fixture
+    def server(self) -> MockBojServer:
+        return MockBojServer(
+            MockDataset(series_per_db=12, fanout=3, start_year=2000, page_size=2)
+        )
+
+    def _invoke(self, server: MockBojServer, *options: str):
+        args = ["get-data-layer", "FM01", "M", "*", "-s", "200501", "-e", "200512"]
+        with patch(
+            "boj_stat_search.shell.client.httpx.Client", return_value=server.client()
+        ) as client_class:
+            result = runner.invoke(
+                app, [*args, "--min-request-interval", "0", *options]
+            )
+        self.clients_opened = client_class.call_count
+        return result
+
+    def test_csv_follows_every_page(self, server: MockBojServer) -> None:
+        result = self._invoke(server, "--format", "csv", "--all-pages")
+
+        assert result.exit_code == 0, result.output
+        lines = result.stdout.splitlines()
+        assert lines[0] == "series_code,frequency,survey_date,value"
+        # Six monthly series of twelve observations, two series per page.
+        assert len(lines) == 1 + 6 * 12
+        assert lines[1].startswith("FM01X00001,MONTHLY,200501,")
+        assert len(server.requests) == 3
+        assert self.clients_opened == 1
+
+    def test_all_pages_are_throttled_by_one_client(self, server: MockBojServer) -> None:
+        with patch(
+            "boj_stat_search.shell.client.BojClient._throttle", autospec=True
+        ) as throttle:
+            result = self._invoke(server, "--format", "ndjson", "--all-pages")
+
+        assert result.exit_code == 0, result.output
+        assert len(server.requests) == 3
+        assert throttle.call_count == 3
+        assert {call.args[0] for call in throttle.call_args_list} == {
+            throttle.call_args.args[0]
+        }
+
+    def test_ndjson_writes_one_series_per_line(self, server: MockBojServer) -> None:
+        result = self._invoke(server, "--format", "ndjson")
+
+        assert result.exit_code == 0, result.output
+        series = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [entry["SERIES_CODE"] for entry in series] == [
+            "FM01X00001",
+            "FM01X00003",
+        ]
+        assert len(series[0]["VALUES"]["SURVEY_DATES"]) == 12
+        assert len(server.requests) == 1
+
+    def test_arrow_writes_an_ipc_stream(self, server: MockBojServer) -> None:
+        result = self._invoke(server, "--format", "arrow", "--all-pages")
+
+        assert result.exit_code == 0, result.stderr
+        table = pa.ipc.open_stream(result.stdout_bytes).read_all()
+        assert table.column_names == [
+            "series_code",
+            "frequency",
+            "survey_date",
+            "value",
+        ]
+        assert table.num_rows == 6 * 12
+
+    def test_all_pages_needs_a_streaming_format(self, server: MockBojServer) -> None:
+        result = self._invoke(server, "--all-pages")
+
+        assert result.exit_code == 1
+        assert "all-pages: needs --format ndjson, csv or arrow" in result.stderr
+        assert len(server.requests) == 0
+
+    def test_rejects_unknown_format(self, server: MockBojServer) -> None:
+        result = self._invoke(server, "--format", "xml")
+
+        assert result.exit_code == 1
+        assert "format: must be one of json, ndjson, csv, arrow" in result.stderr
+
+
+def _mock_catalog(http_client) -> SeriesCatalogResult:
+    metadata = get_metadata("FM01", client=http_client)
+    rows = [
+        {**row, "db": "FM01"}
+        for row in metadata_entries_to_rows("FM01", metadata.result_set)
+    ]
+    return SeriesCatalogResult(pa.Table.from_pylist(rows, schema=CATALOG_TABLE_SCHEMA))
+
+
+class TestDownload:
+    @pytest.fixture
+    def server(self) -> MockBojServer:
+        return MockBojServer(
+            MockDataset(series_per_db=12, fanout=3, start_year=2000, page_size=2)
+        )
+
+    def _invoke(self, server: MockBojServer, args: list[str]):
+        http_client = server.client()
+        catalog = _mock_catalog(http_client)
+        server.reset_stats()
+        with (
+            patch("boj_stat_search.shell.planner.list_series", return_value=catalog),
+            patch(
+                "boj_stat_search.shell.client.httpx.Client", return_value=http_client
+            ),
+        ):
+            return runner.invoke(app, ["download", *args])
+
+    def test_writes_partitioned_dataset_and_resumes(
+        self, tmp_path: Path, server: MockBojServer
+    ) -> None:
+        import pyarrow.dataset as ds
+
+        codes_file = tmp_path / "codes.txt"
+        codes_file.write_text("# quarterly\nFM01'FM01X00002\n")
+        args = [
+            str(tmp_path / "out"),
+            "--code",
+            "FM01X00001,FM01X00003",
+            "--db",
+            "FM01",
+            "--codes-file",
+            str(codes_file),
+            "--start-date",
+            "200501",
+            "--end-date",
+            "200604",
+            "--min-request-interval",
+            "0",
+        ]
+        result = self._invoke(server, args)
+
+        assert result.exit_code == 0, result.output
+        assert "Wrote 40 rows from 2 requests" in result.output
+        assert (tmp_path / "out" / "db=FM01" / "frequency=MONTHLY").is_dir()
+        assert (tmp_path / "out" / "db=FM01" / "frequency=QUARTERLY").is_dir()
+        table = ds.dataset(tmp_path / "out", partitioning="hive").to_table()
+        assert table.num_rows == 40
+
+        server.reset_stats()
+        result = self._invoke(server, args)
+        assert result.exit_code == 0, result.output
+        assert "0 pages fetched, 2 requests resumed" in result.output
+        assert len(server.requests) == 0
+
+    def test_code_without_db_exits_with_error(self, tmp_path: Path) -> None:
+        result = runner.invoke(app, ["download", str(tmp_path), "--code", "X1"])
+        assert result.exit_code == 1
+        assert "code: X1 needs a DB" in result.stderr
+
+    def test_layer_requires_frequency(self, tmp_path: Path) -> None:
+        result = runner.invoke(
+            app, ["download", str(tmp_path), "--layer", "1", "--db", "FM01"]
+        )
+        assert result.exit_code == 1
+        assert "--db and --frequency are required" in result.stderr
+
+    def test_rejects_codec_of_other_format(self, tmp_path: Path) -> None:
+        result = runner.invoke(
+            app,
+            [
+                "download",
+                str(tmp_path),
+                "--code",
+                "FM01'X1",
+                "--format",
+                "arrow",
+                "--compression",
+                "snappy",
+            ],
+        )
+        assert result.exit_code == 1
+        assert "compression: must be one of none, zstd, lz4" in result.stderr
+
 
 class TestGenerateMetadataParquet:
     def test_success(self) -> None:
         with patch(
-            "boj_stat_search.shell.cli.generate_metadata_parquet_files",
+            "boj_stat_search.shell.catalog.exporter.generate_metadata_parquet_files",
             return_value=_FAKE_EXPORT_REPORT_SUCCESS,
         ) as mock_fn:
             result = runner.invoke(
@@ -260,6 +584,7 @@ class TestGenerateMetadataParquet:
             dbs=["FM01", "BP01"],
             min_request_interval=0.2,
             show_progress=True,
+            max_workers=None,
         )
         assert "FM01: wrote 12 rows" in result.output
         assert "BP01: wrote 34 rows" in result.output
@@ -270,7 +595,7 @@ class TestGenerateMetadataParquet:
 
     def test_failure_exits_non_zero(self) -> None:
         with patch(
-            "boj_stat_search.shell.cli.generate_metadata_parquet_files",
+            "boj_stat_search.shell.catalog.exporter.generate_metadata_parquet_files",
             return_value=_FAKE_EXPORT_REPORT_FAILURE,
         ) as mock_fn:
             result = runner.invoke(app, ["generate-metadata-parquet"])
@@ -281,6 +606,7 @@ class TestGenerateMetadataParquet:
             dbs=None,
             min_request_interval=1.0,
             show_progress=True,
+            max_workers=None,
         )
         assert "FM01: wrote 12 rows" in result.output
         assert (
@@ -288,3 +614,13 @@ class TestGenerateMetadataParquet:
             in result.output
         )
         assert "BP01: boom" in result.output
+
+    def test_workers_option_is_forwarded(self) -> None:
+        with patch(
+            "boj_stat_search.shell.catalog.exporter.generate_metadata_parquet_files",
+            return_value=_FAKE_EXPORT_REPORT_SUCCESS,
+        ) as mock_fn:
+            result = runner.invoke(app, ["generate-metadata-parquet", "--workers", "4"])
+
+        assert result.exit_code == 0
+        assert mock_fn.call_args.kwargs["max_workers"] == 4
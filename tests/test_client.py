@@ -1,3 +1,5 @@
+import threading
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import httpx
@@ -5,6 +7,12 @@ import httpx
 from boj_stat_search import BojClient
 from boj_stat_search.core.types import Code
 from boj_stat_search.core.models import DataResponse, MetadataResponse
+from boj_stat_search.core.url_builder import (
+    build_data_code_api_url,
+    build_data_layer_api_url,
+    build_metadata_api_url,
+)
+from boj_stat_search.shell import api
 
 
 # ---------------------------------------------------------------------------
@@ -35,6 +43,40 @@ def _make_data_response() -> DataResponse:
     )
 
 
+_METADATA_BODY = {
+    "STATUS": 200,
+    "MESSAGEID": "M181000I",
+    "MESSAGE": "ok",
+    "DATE": "2026-02-21T05:00:12.008+09:00",
+    "DB": "IR01",
+    "RESULTSET": [],
+}
+
+_DATA_BODY = {
+    "STATUS": 200,
+    "MESSAGEID": "M181000I",
+    "MESSAGE": "ok",
+    "DATE": "2026-02-21T15:58:56.071+09:00",
+    "PARAMETER": {},
+    "NEXTPOSITION": None,
+    "RESULTSET": [],
+}
+
+
+def _mock_http_client(requests: list[httpx.Request], handler=None) -> httpx.Client:
+    """An httpx client answering every endpoint with an empty OK response."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if handler is not None:
+            handler(request)
+        if request.url.path.endswith("getMetadata"):
+            return httpx.Response(200, json=_METADATA_BODY)
+        return httpx.Response(200, json=_DATA_BODY)
+
+    return httpx.Client(transport=httpx.MockTransport(respond))
+
+
 # ---------------------------------------------------------------------------
 # Context manager
 # ---------------------------------------------------------------------------
@@ -53,15 +95,14 @@ def test_context_manager_closes_internal_client_on_exit():
         mock_instance.close.assert_called_once()
 
 
-def test_context_manager_delegates_get_metadata():
-    expected = _make_metadata_response()
-    with patch(
-        "boj_stat_search.shell.client.get_metadata", return_value=expected
-    ) as mock_fn:
-        with BojClient() as c:
-            result = c.get_metadata("IR01")
-    mock_fn.assert_called_once_with("IR01", "raise", client=c._client)
-    assert result is expected
+def test_context_manager_fetches_get_metadata():
+    requests: list[httpx.Request] = []
+    with BojClient(client=_mock_http_client(requests)) as c:
+        result = c.get_metadata("IR01")
+    assert [str(request.url) for request in requests] == [
+        build_metadata_api_url("IR01")
+    ]
+    assert result == _make_metadata_response()
 
 
 # ---------------------------------------------------------------------------
@@ -106,15 +147,12 @@ def test_explicit_close_does_not_close_external_client():
 
 
 def test_external_client_is_used_for_requests():
-    external = Mock(spec=httpx.Client)
-    expected = _make_metadata_response()
-    with patch(
-        "boj_stat_search.shell.client.get_metadata", return_value=expected
-    ) as mock_fn:
-        c = BojClient(client=external)
-        result = c.get_metadata("IR01")
-    mock_fn.assert_called_once_with("IR01", "raise", client=external)
-    assert result is expected
+    requests: list[httpx.Request] = []
+    external = _mock_http_client(requests)
+    c = BojClient(client=external)
+    result = c.get_metadata("IR01")
+    assert len(requests) == 1
+    assert result == _make_metadata_response()
 
 
 # ---------------------------------------------------------------------------
@@ -122,15 +160,12 @@ def test_external_client_is_used_for_requests():
 # ---------------------------------------------------------------------------
 
 
-def test_get_metadata_delegates_to_functional_api():
-    expected = _make_metadata_response()
-    with patch(
-        "boj_stat_search.shell.client.get_metadata", return_value=expected
-    ) as mock_fn:
-        c = BojClient()
-        result = c.get_metadata("IR01")
-    mock_fn.assert_called_once_with("IR01", "raise", client=c._client)
-    assert result is expected
+def test_get_metadata_requests_metadata_url():
+    requests: list[httpx.Request] = []
+    c = BojClient(client=_mock_http_client(requests))
+    result = c.get_metadata("IR01")
+    assert str(requests[0].url) == build_metadata_api_url("IR01")
+    assert result == _make_metadata_response()
 
 
 # ---------------------------------------------------------------------------
@@ -138,50 +173,39 @@ def test_get_metadata_delegates_to_functional_api():
 # ---------------------------------------------------------------------------
 
 
-def test_get_data_code_delegates_minimal_args():
-    expected = _make_data_response()
-    with patch(
-        "boj_stat_search.shell.client.get_data_code", return_value=expected
-    ) as mock_fn:
-        c = BojClient()
-        result = c.get_data_code("FM01", "STRDCLUCON")
-    mock_fn.assert_called_once_with(
-        "FM01", "STRDCLUCON", None, None, None, "raise", client=c._client
+def test_get_data_code_requests_minimal_args():
+    requests: list[httpx.Request] = []
+    c = BojClient(client=_mock_http_client(requests))
+    result = c.get_data_code("FM01", "STRDCLUCON")
+    assert [str(request.url) for request in requests] == [
+        build_data_code_api_url("FM01", "STRDCLUCON")
+    ]
+    assert result == _make_data_response()
+
+
+def test_get_data_code_requests_all_optional_args():
+    requests: list[httpx.Request] = []
+    c = BojClient(client=_mock_http_client(requests))
+    result = c.get_data_code(
+        "FM01",
+        "STRDCLUCON",
+        start_date="202501",
+        end_date="202512",
+        start_position=10,
     )
-    assert result is expected
-
-
-def test_get_data_code_delegates_all_optional_args():
-    expected = _make_data_response()
-    with patch(
-        "boj_stat_search.shell.client.get_data_code", return_value=expected
-    ) as mock_fn:
-        c = BojClient()
-        result = c.get_data_code(
-            "FM01",
-            "STRDCLUCON",
-            start_date="202501",
-            end_date="202512",
-            start_position=10,
-        )
-    mock_fn.assert_called_once_with(
-        "FM01", "STRDCLUCON", "202501", "202512", 10, "raise", client=c._client
+    assert str(requests[0].url) == build_data_code_api_url(
+        "FM01", "STRDCLUCON", "202501", "202512", 10
     )
-    assert result is expected
+    assert result == _make_data_response()
 
 
-def test_get_data_code_delegates_code_class_with_embedded_db():
-    expected = _make_data_response()
+def test_get_data_code_requests_code_class_with_embedded_db():
+    requests: list[httpx.Request] = []
     code = Code("FM01'STRDCLUCON")
-    with patch(
-        "boj_stat_search.shell.client.get_data_code", return_value=expected
-    ) as mock_fn:
-        c = BojClient()
-        result = c.get_data_code(code=code)
-    mock_fn.assert_called_once_with(
-        None, code, None, None, None, "raise", client=c._client
-    )
-    assert result is expected
+    c = BojClient(client=_mock_http_client(requests))
+    result = c.get_data_code(code=code)
+    assert str(requests[0].url) == build_data_code_api_url(code=code)
+    assert result == _make_data_response()
 
 
 # ---------------------------------------------------------------------------
@@ -189,37 +213,31 @@ def test_get_data_code_delegates_code_class_with_embedded_db():
 # ---------------------------------------------------------------------------
 
 
-def test_get_data_layer_delegates_minimal_args():
-    expected = _make_data_response()
-    with patch(
-        "boj_stat_search.shell.client.get_data_layer", return_value=expected
-    ) as mock_fn:
-        c = BojClient()
-        result = c.get_data_layer("MD10", "Q", "*")
-    mock_fn.assert_called_once_with(
-        "MD10", "Q", "*", None, None, None, "raise", client=c._client
+def test_get_data_layer_requests_minimal_args():
+    requests: list[httpx.Request] = []
+    c = BojClient(client=_mock_http_client(requests))
+    result = c.get_data_layer("MD10", "Q", "*")
+    assert [str(request.url) for request in requests] == [
+        build_data_layer_api_url("MD10", "Q", "*")
+    ]
+    assert result == _make_data_response()
+
+
+def test_get_data_layer_requests_all_optional_args():
+    requests: list[httpx.Request] = []
+    c = BojClient(client=_mock_http_client(requests))
+    result = c.get_data_layer(
+        "BP01",
+        "M",
+        "1,1,1",
+        start_date="202504",
+        end_date="202509",
+        start_position=255,
     )
-    assert result is expected
-
-
-def test_get_data_layer_delegates_all_optional_args():
-    expected = _make_data_response()
-    with patch(
-        "boj_stat_search.shell.client.get_data_layer", return_value=expected
-    ) as mock_fn:
-        c = BojClient()
-        result = c.get_data_layer(
-            "BP01",
-            "M",
-            "1,1,1",
-            start_date="202504",
-            end_date="202509",
-            start_position=255,
-        )
-    mock_fn.assert_called_once_with(
-        "BP01", "M", "1,1,1", "202504", "202509", 255, "raise", client=c._client
+    assert str(requests[0].url) == build_data_layer_api_url(
+        "BP01", "M", "1,1,1", "202504", "202509", 255
     )
-    assert result is expected
+    assert result == _make_data_response()
 
 
 # ---------------------------------------------------------------------------
@@ -284,21 +302,13 @@ def test_throttle_updates_last_request_time():
 
 def test_throttle_applied_to_all_methods():
     """_throttle is called once per API method invocation."""
-    meta = _make_metadata_response()
-    data = _make_data_response()
-
-    with (
-        patch("boj_stat_search.shell.client.get_metadata", return_value=meta),
-        patch("boj_stat_search.shell.client.get_data_code", return_value=data),
-        patch("boj_stat_search.shell.client.get_data_layer", return_value=data),
-    ):
-        c = BojClient(min_request_interval=0)  # disable real sleeping
-        with patch.object(c, "_throttle") as mock_throttle:
-            c.get_metadata("IR01")
-            c.get_data_code("FM01", "CODE")
-            c.get_data_layer("MD10", "Q", "*")
+    c = BojClient(client=_mock_http_client([]), min_request_interval=0)
+    with patch.object(c, "_throttle") as mock_throttle:
+        c.get_metadata("IR01")
+        c.get_data_code("FM01", "CODE")
+        c.get_data_layer("MD10", "Q", "*")
 
-        assert mock_throttle.call_count == 3
+    assert mock_throttle.call_count == 3
 
 
 # ---------------------------------------------------------------------------
@@ -312,34 +322,173 @@ def test_on_validation_error_default_is_raise():
 
 
 def test_on_validation_error_forwarded_to_get_metadata():
-    expected = _make_metadata_response()
     with patch(
-        "boj_stat_search.shell.client.get_metadata", return_value=expected
+        "boj_stat_search.shell.client.metadata_request_url",
+        wraps=api.metadata_request_url,
     ) as mock_fn:
-        c = BojClient(on_validation_error="warn")
+        c = BojClient(client=_mock_http_client([]), on_validation_error="warn")
         c.get_metadata("IR01")
-    mock_fn.assert_called_once_with("IR01", "warn", client=c._client)
+    mock_fn.assert_called_once_with("IR01", "warn")
 
 
 def test_on_validation_error_forwarded_to_get_data_code():
-    expected = _make_data_response()
     with patch(
-        "boj_stat_search.shell.client.get_data_code", return_value=expected
+        "boj_stat_search.shell.client.data_code_request_url",
+        wraps=api.data_code_request_url,
     ) as mock_fn:
-        c = BojClient(on_validation_error="ignore")
+        c = BojClient(client=_mock_http_client([]), on_validation_error="ignore")
         c.get_data_code("FM01", "STRDCLUCON")
-    mock_fn.assert_called_once_with(
-        "FM01", "STRDCLUCON", None, None, None, "ignore", client=c._client
-    )
+    mock_fn.assert_called_once_with("FM01", "STRDCLUCON", None, None, None, "ignore")
 
 
 def test_on_validation_error_forwarded_to_get_data_layer():
-    expected = _make_data_response()
     with patch(
-        "boj_stat_search.shell.client.get_data_layer", return_value=expected
+        "boj_stat_search.shell.client.data_layer_request_url",
+        wraps=api.data_layer_request_url,
     ) as mock_fn:
-        c = BojClient(on_validation_error="warn")
+        c = BojClient(client=_mock_http_client([]), on_validation_error="warn")
         c.get_data_layer("MD10", "Q", "*")
-    mock_fn.assert_called_once_with(
-        "MD10", "Q", "*", None, None, None, "warn", client=c._client
+    mock_fn.assert_called_once_with("MD10", "Q", "*", None, None, None, "warn")
+
+
+# ---------------------------------------------------------------------------
+# Request coalescing
+# ---------------------------------------------------------------------------
+
+
+def _run_concurrently(count: int, fn):
+    results: list = [None] * count
+
+    def worker(index: int) -> None:
+        try:
+            results[index] = fn()
+        except Exception as exc:  # noqa: BLE001 - collected for assertions
+            results[index] = exc
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_concurrent_identical_get_data_code_calls_share_one_request():
+    release = threading.Event()
+    started = threading.Event()
+    requests: list[httpx.Request] = []
+
+    def slow(request: httpx.Request) -> None:
+        started.set()
+        release.wait(timeout=5)
+
+    c = BojClient(client=_mock_http_client(requests, slow), min_request_interval=0)
+    threads, results = _run_concurrently(
+        5, lambda: c.get_data_code("FM01", "STRDCLUCON")
+    )
+    assert started.wait(timeout=5)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(requests) == 1
+    assert all(result == _make_data_response() for result in results)
+
+
+def test_coalesced_callers_receive_their_own_response():
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow(request: httpx.Request) -> None:
+        started.set()
+        release.wait(timeout=5)
+
+    c = BojClient(client=_mock_http_client([], slow), min_request_interval=0)
+    threads, results = _run_concurrently(
+        3, lambda: c.get_data_code("FM01", "STRDCLUCON")
+    )
+    assert started.wait(timeout=5)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    results[0].parameter["DB"] = "changed"
+    assert results[1].parameter == {}
+    assert results[2].parameter == {}
+
+
+def test_concurrent_calls_with_different_urls_are_not_coalesced():
+    barrier = threading.Barrier(2, timeout=5)
+    requests: list[httpx.Request] = []
+
+    def wait_for_both(request: httpx.Request) -> None:
+        barrier.wait()
+
+    c = BojClient(
+        client=_mock_http_client(requests, wait_for_both), min_request_interval=0
     )
+    codes = iter(["STRDCLUCON", "STRACLUCON"])
+    lock = threading.Lock()
+
+    def call():
+        with lock:
+            code = next(codes)
+        return c.get_data_code("FM01", code)
+
+    threads, results = _run_concurrently(2, call)
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(requests) == 2
+    assert all(result == _make_data_response() for result in results)
+
+
+def test_coalesced_followers_receive_leader_error():
+    release = threading.Event()
+    started = threading.Event()
+    error = httpx.ConnectError("boom")
+    requests: list[httpx.Request] = []
+
+    def failing(request: httpx.Request) -> None:
+        started.set()
+        release.wait(timeout=5)
+        raise error
+
+    c = BojClient(client=_mock_http_client(requests, failing), min_request_interval=0)
+    threads, results = _run_concurrently(3, lambda: c.get_metadata("IR01"))
+    assert started.wait(timeout=5)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(requests) == 1
+    assert all(result is error for result in results)
+
+
+def test_sequential_identical_calls_are_not_cached():
+    requests: list[httpx.Request] = []
+    c = BojClient(client=_mock_http_client(requests), min_request_interval=0)
+    c.get_data_layer("MD10", "Q", "*")
+    c.get_data_layer("MD10", "Q", "*")
+
+    assert len(requests) == 2
+
+
+def test_coalescing_can_be_disabled():
+    barrier = threading.Barrier(2, timeout=5)
+    requests: list[httpx.Request] = []
+
+    def wait_for_both(request: httpx.Request) -> None:
+        barrier.wait()
+
+    c = BojClient(
+        client=_mock_http_client(requests, wait_for_both),
+        min_request_interval=0,
+        coalesce_requests=False,
+    )
+    threads, _ = _run_concurrently(2, lambda: c.get_data_code("FM01", "STRDCLUCON"))
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(requests) == 2
@@ -0,0 +1,191 @@
+import datetime
+import sys
+
+import pyarrow as pa
+import pytest
+
+from boj_stat_search.core.columnar import (
+    DATA_TABLE_SCHEMA,
+    data_response_to_table,
+    data_table_to_wide,
+    table_from_ipc_bytes,
+    table_to_ipc_bytes,
+    wide_table_to_numpy,
+)
+from boj_stat_search.core.models import DataResponse
+
+
+def _make_data_response(result_set: tuple[dict, ...]) -> DataResponse:
+    return DataResponse(
+        status=200,
+        message_id="M181000I",
+        message="ok",
+        date="2026-02-21T15:58:56.071+09:00",
+        parameter={},
+        next_position=None,
+        result_set=result_set,
+    )
+
+
+def _series(code: str, dates: list, values: list, frequency: str = "DAILY") -> dict:
+    return {
+        "SERIES_CODE": code,
+        "FREQUENCY": frequency,
+        "VALUES": {"SURVEY_DATES": dates, "VALUES": values},
+    }
+
+
+def test_data_response_to_table_flattens_series_in_order():
+    response = _make_data_response(
+        (
+            _series("A", [19980105, 19980106], [0.49, None]),
+            _series("B", [19980105], [1], frequency="MONTHLY"),
+        )
+    )
+
+    table = data_response_to_table(response)
+
+    assert table.schema == DATA_TABLE_SCHEMA
+    assert table.to_pylist() == [
+        {
+            "series_code": "A",
+            "frequency": "DAILY",
+            "survey_date": 19980105,
+            "value": 0.49,
+        },
+        {
+            "series_code": "A",
+            "frequency": "DAILY",
+            "survey_date": 19980106,
+            "value": None,
+        },
+        {
+            "series_code": "B",
+            "frequency": "MONTHLY",
+            "survey_date": 19980105,
+            "value": 1.0,
+        },
+    ]
+
+
+def test_data_response_to_table_parses_quoted_numbers():
+    response = _make_data_response((_series("A", ["20250221"], ["0.227"]),))
+
+    table = data_response_to_table(response)
+
+    assert table["survey_date"].to_pylist() == [20250221]
+    assert table["value"].to_pylist() == [0.227]
+
+
+def test_data_response_to_table_skips_entries_without_values():
+    response = _make_data_response(({"SERIES_CODE": "A"}, _series("B", [], [])))
+
+    table = data_response_to_table(response)
+
+    assert table.schema == DATA_TABLE_SCHEMA
+    assert table.num_rows == 0
+
+
+def test_data_response_to_table_returns_empty_table_for_empty_result_set():
+    table = data_response_to_table(_make_data_response(()))
+
+    assert table.schema == DATA_TABLE_SCHEMA
+    assert table.num_rows == 0
+
+
+def test_data_response_to_table_rejects_mismatched_lengths():
+    response = _make_data_response((_series("A", [2024, 2025], [1.0]),))
+
+    with pytest.raises(ValueError, match="same length for series A"):
+        data_response_to_table(response)
+
+
+def test_ipc_round_trip_preserves_table():
+    table = pa.table({"a": [1, 2], "b": ["x", None]})
+
+    assert table_from_ipc_bytes(table_to_ipc_bytes(table)).equals(table)
+
+
+def test_data_table_to_wide_aligns_series_on_union_of_dates():
+    response = _make_data_response(
+        (
+            _series("B", [202403, 202401], [30.0, 10.0], frequency="MONTHLY"),
+            _series("A", [202402, 202403], [2.0, None], frequency="MONTHLY"),
+        )
+    )
+
+    wide = response.to_wide()
+
+    assert wide.column_names == ["date", "B", "A"]
+    assert wide.schema.field("date").type == pa.date32()
+    assert wide.to_pylist() == [
+        {"date": datetime.date(2024, 1, 1), "B": 10.0, "A": None},
+        {"date": datetime.date(2024, 2, 1), "B": None, "A": 2.0},
+        {"date": datetime.date(2024, 3, 1), "B": 30.0, "A": None},
+    ]
+
+
+def test_data_table_to_wide_mixes_frequencies_by_period_start():
+    table = data_response_to_table(
+        _make_data_response(
+            (
+                _series("Q", [202401, 202404], [1.0, 2.0], frequency="QUARTERLY"),
+                _series("M", [202403, 202404], [3.0, 4.0], frequency="MONTHLY"),
+            )
+        )
+    )
+
+    wide = data_table_to_wide(table)
+
+    assert wide["date"].to_pylist() == [
+        datetime.date(2024, 1, 1),
+        datetime.date(2024, 3, 1),
+        datetime.date(2024, 4, 1),
+    ]
+    assert wide["Q"].to_pylist() == [1.0, None, 2.0]
+    assert wide["M"].to_pylist() == [None, 3.0, 4.0]
+
+
+def test_data_table_to_wide_keeps_first_of_repeated_dates():
+    table = data_response_to_table(
+        _make_data_response(
+            (
+                _series("A", [20240105], [1.0]),
+                _series("A", [20240105, 20240106], [9.0, 2.0]),
+            )
+        )
+    )
+
+    assert data_table_to_wide(table).to_pylist() == [
+        {"date": datetime.date(2024, 1, 5), "A": 1.0},
+        {"date": datetime.date(2024, 1, 6), "A": 2.0},
+    ]
+
+
+def test_data_table_to_wide_of_empty_table_has_only_dates():
+    wide = data_table_to_wide(DATA_TABLE_SCHEMA.empty_table())
+
+    assert wide.column_names == ["date"]
+    assert wide.num_rows == 0
+
+
+def test_wide_table_to_numpy_fills_missing_with_nan():
+    np = pytest.importorskip("numpy")
+    response = _make_data_response(
+        (
+            _series("A", [2023, 2024], [1.0, 2.0], frequency="ANNUAL"),
+            _series("B", [2024], [5.0], frequency="ANNUAL"),
+        )
+    )
+
+    values = response.to_wide(as_numpy=True)
+
+    assert values.shape == (2, 2)
+    np.testing.assert_array_equal(values, [[1.0, np.nan], [2.0, 5.0]])
+
+
+def test_wide_table_to_numpy_requires_numpy(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    with pytest.raises(ImportError, match="numpy"):
+        wide_table_to_numpy(pa.table({"date": pa.array([], pa.date32())}))
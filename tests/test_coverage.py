@@ -0,0 +1,81 @@
+import pyarrow as pa
+import pytest
+
+from boj_stat_search.core.coverage import (
+    OPEN_END,
+    OPEN_START,
+    merge_observations,
+    merge_ranges,
+    missing_ranges,
+    request_dates,
+    request_months,
+    request_value_months,
+    select_months,
+)
+from boj_stat_search.core.types import Period
+
+
+@pytest.mark.parametrize(
+    ("frequency", "start", "end", "months"),
+    [
+        ("CY", "2000", "2001", (24000, 24023)),
+        ("FY", "2000", "2000", (24003, 24014)),
+        ("FH", "200002", "200002", (24009, 24014)),
+        ("Q", "200002", "200003", (24003, 24008)),
+        ("M", "200002", "200002", (24001, 24001)),
+        ("D", "200002", "200003", (24001, 24002)),
+    ],
+)
+def test_request_months_round_trip(frequency, start, end, months):
+    assert request_months(start, end, frequency) == months
+    assert request_dates(months, frequency) == (start, end)
+
+
+def test_request_value_months_reads_request_notation_column_wise():
+    values = pa.chunked_array([["200003", "200002", ""], ["20000215", None]])
+
+    quarterly = request_value_months(values[:3], "QUARTERLY")
+    daily = request_value_months(values[3:], "DAILY")
+
+    assert quarterly[0].to_pylist() == [24006, 24003, None]
+    assert quarterly[1].to_pylist() == [24008, 24005, None]
+    assert daily[0].to_pylist() == [24001, None]
+    assert daily[1].to_pylist() == [24001, None]
+    assert request_value_months(pa.array(["2000"]), "FY")[0].to_pylist() == [24003]
+
+
+def test_missing_bounds_are_open():
+    assert request_months(None, Period("2000"), "ANNUAL") == (OPEN_START, 24011)
+    assert request_dates((OPEN_START, OPEN_END), "Q") == (None, None)
+
+
+def test_request_months_rejects_dates_in_the_wrong_notation():
+    with pytest.raises(ValueError, match="QQ must be between 01 and 04"):
+        request_months("201005", None, "Q")
+
+
+def test_missing_ranges_returns_uncovered_edges():
+    assert missing_ranges(None, (5, 25)) == [(5, 25)]
+    assert missing_ranges((10, 20), (5, 25)) == [(5, 9), (21, 25)]
+    assert missing_ranges((10, 20), (12, 18)) == []
+    assert missing_ranges((10, 20), (30, 40)) == [(21, 40)]
+    assert merge_ranges((10, 20), (21, 40)) == (10, 40)
+
+
+def test_merge_observations_sorts_and_prefers_fetched_values():
+    cached = pa.table({"survey_date": [201003, 201001], "value": [3.0, 1.0]})
+    fetched = pa.table({"survey_date": [201004, 201003], "value": [4.0, 30.0]})
+
+    assert merge_observations(cached, fetched).to_pylist() == [
+        {"survey_date": 201001, "value": 1.0},
+        {"survey_date": 201003, "value": 30.0},
+        {"survey_date": 201004, "value": 4.0},
+    ]
+
+
+def test_select_months_keeps_periods_starting_in_range():
+    table = pa.table({"survey_date": [2009, 2010, 2011], "value": [1.0, 2.0, 3.0]})
+
+    selected = select_months(table, "FY", request_months("2010", "2010", "FY"))
+
+    assert selected["survey_date"].to_pylist() == [2010]
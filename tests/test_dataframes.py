@@ -0,0 +1,86 @@
+import datetime
+import sys
+
+import pyarrow as pa
+import pytest
+
+from boj_stat_search.core.catalog_result import (
+    CATALOG_TABLE_SCHEMA,
+    SeriesCatalogResult,
+)
+from boj_stat_search.core.dataframes import table_to_pandas, table_to_polars
+from boj_stat_search.core.models import DataResponse
+
+
+def _data_response() -> DataResponse:
+    return DataResponse(
+        status=200,
+        message_id="M181000I",
+        message="ok",
+        date="2026-02-21T15:58:56.071+09:00",
+        parameter={},
+        next_position=None,
+        result_set=(
+            {
+                "SERIES_CODE": "A",
+                "FREQUENCY": "MONTHLY",
+                "VALUES": {"SURVEY_DATES": [202401, 202402], "VALUES": [1.5, None]},
+            },
+        ),
+    )
+
+
+def test_data_response_to_pandas_keeps_columns_and_dates():
+    pd = pytest.importorskip("pandas")
+
+    frame = _data_response().to_pandas()
+
+    assert list(frame.columns) == [
+        "series_code",
+        "frequency",
+        "survey_date",
+        "value",
+        "date",
+    ]
+    assert pd.api.types.is_datetime64_any_dtype(frame["date"])
+    assert frame["value"].isna().tolist() == [False, True]
+
+
+def test_data_response_to_polars_keeps_columns_and_dates():
+    pl = pytest.importorskip("polars")
+
+    frame = _data_response().to_polars()
+
+    assert frame.columns == ["series_code", "frequency", "survey_date", "value", "date"]
+    assert frame.schema["date"] == pl.Date
+    assert frame["date"].to_list() == [
+        datetime.date(2024, 1, 1),
+        datetime.date(2024, 2, 1),
+    ]
+
+
+def test_catalog_result_to_pandas_has_catalog_columns():
+    pytest.importorskip("pandas")
+
+    frame = SeriesCatalogResult.empty().to_pandas()
+
+    assert list(frame.columns) == CATALOG_TABLE_SCHEMA.names
+
+
+def test_catalog_result_to_polars_has_catalog_columns():
+    pytest.importorskip("polars")
+
+    frame = SeriesCatalogResult.empty().to_polars()
+
+    assert frame.columns == CATALOG_TABLE_SCHEMA.names
+
+
+@pytest.mark.parametrize(
+    ("convert", "module"),
+    [(table_to_pandas, "pandas"), (table_to_polars, "polars")],
+)
+def test_adapters_require_their_library(convert, module, monkeypatch):
+    monkeypatch.setitem(sys.modules, module, None)
+
+    with pytest.raises(ImportError, match=f"requires the {module} package"):
+        convert(pa.table({"a": [1]}))
@@ -1,3 +1,5 @@
+import io
+
 from boj_stat_search.shell.display import show_layers
 from boj_stat_search.core.models import MetadataEntry
 
@@ -59,3 +61,22 @@ def test_show_layers_prints_filtered_tree(capsys):
     captured = capsys.readouterr()
     assert captured.out == "  - (1,1) A [A]\n"
     assert captured.err == ""
+
+
+def test_show_layers_writes_lines_to_given_stream():
+    entries = (
+        _entry(name_of_time_series="Root", layer1=1),
+        _entry(series_code="S1", name_of_time_series="First", layer1=1, layer2=1),
+        _entry(series_code="S2", name_of_time_series="Second", layer1=1, layer2=2),
+    )
+    stream = io.StringIO()
+
+    show_layers(entries, max_depth=1, file=stream)
+
+    assert stream.getvalue() == "- (1) Root\n  - ... (2 more)\n"
+
+
+def test_show_layers_prints_blank_line_for_empty_tree(capsys):
+    show_layers((), layer="1")
+
+    assert capsys.readouterr().out == "\n"
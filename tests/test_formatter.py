@@ -1,8 +1,20 @@
+import json
+
 import pytest
 
-from boj_stat_search.core import format_layer_tree
+from boj_stat_search.core import format_layer_tree, layer_index_for_entries
+from boj_stat_search.core.formatter import (
+    format_phase_timings,
+    iter_data_csv,
+    iter_data_ndjson,
+    iter_layer_tree,
+)
 from boj_stat_search.core.types import Layer
-from boj_stat_search.core.models import MetadataEntry
+from boj_stat_search.core.models import (
+    DataResponse,
+    MetadataEntry,
+    PhaseTimings,
+)
 
 
 def _entry(
@@ -140,3 +152,155 @@ def test_format_layer_tree_returns_empty_string_when_no_entry_matches_filter():
     entries = (_entry(series_code="A", name_of_time_series="A", layer1=1, layer2=1),)
 
     assert format_layer_tree(entries, layer=Layer(2)) == ""
+
+
+def test_format_layer_tree_reuses_prebuilt_layer_index():
+    entries = (
+        _entry(series_code="B", name_of_time_series="Beta", layer1=2),
+        _entry(series_code="A", name_of_time_series="Alpha", layer1=1, layer2=1),
+        _entry(name_of_time_series="Header", layer1=1),
+    )
+    sorted_entries, layer_index = layer_index_for_entries(entries)
+
+    for layer in (None, "1", "1,*", "*"):
+        assert format_layer_tree(
+            sorted_entries, layer, layer_index=layer_index
+        ) == format_layer_tree(entries, layer)
+
+
+def test_format_layer_tree_rejects_layer_index_for_other_entries():
+    _, layer_index = layer_index_for_entries((_entry(layer1=1),))
+
+    with pytest.raises(ValueError, match="layer_index"):
+        format_layer_tree((), layer_index=layer_index)
+
+
+def _nested_entries() -> tuple[MetadataEntry, ...]:
+    return (
+        _entry(name_of_time_series="Header 1", layer1=1),
+        _entry(name_of_time_series="Header 1,1", layer1=1, layer2=1),
+        _entry(series_code="A", name_of_time_series="A", layer1=1, layer2=1, layer3=1),
+        _entry(series_code="B", name_of_time_series="B", layer1=1, layer2=1, layer3=2),
+        _entry(name_of_time_series="Header 1,2", layer1=1, layer2=2),
+        _entry(series_code="C", name_of_time_series="C", layer1=1, layer2=2, layer3=1),
+        _entry(name_of_time_series="Header 2", layer1=2),
+        _entry(series_code="D", name_of_time_series="D", layer1=2, layer2=1),
+    )
+
+
+def test_iter_layer_tree_yields_same_lines_as_format_layer_tree():
+    entries = _nested_entries()
+
+    assert list(iter_layer_tree(entries)) == format_layer_tree(entries).split("\n")
+
+
+def test_iter_layer_tree_is_lazy():
+    lines = iter_layer_tree(_nested_entries())
+
+    assert next(lines) == "- (1) Header 1"
+
+
+def test_iter_layer_tree_summarizes_entries_below_max_depth():
+    lines = list(iter_layer_tree(_nested_entries(), max_depth=2))
+
+    assert lines == [
+        "- (1) Header 1",
+        "  - (1,1) Header 1,1",
+        "    - ... (2 more)",
+        "  - (1,2) Header 1,2",
+        "    - ... (1 more)",
+        "- (2) Header 2",
+        "  - (2,1) D [D]",
+    ]
+
+
+def test_iter_layer_tree_collapses_selected_subtrees():
+    lines = list(iter_layer_tree(_nested_entries(), collapse=["1,1", "2"]))
+
+    assert lines == [
+        "- (1) Header 1",
+        "  - (1,1) Header 1,1",
+        "    - ... (2 more)",
+        "  - (1,2) Header 1,2",
+        "    - (1,2,1) C [C]",
+        "- (2) Header 2",
+        "  - ... (1 more)",
+    ]
+
+
+def test_iter_layer_tree_combines_filter_and_depth_limit():
+    lines = list(iter_layer_tree(_nested_entries(), layer="1,*", max_depth=2))
+
+    assert lines == [
+        "  - (1,1) Header 1,1",
+        "    - ... (2 more)",
+        "  - (1,2) Header 1,2",
+        "    - ... (1 more)",
+    ]
+
+
+@pytest.mark.parametrize("max_depth", [0, 6, True])
+def test_iter_layer_tree_rejects_invalid_max_depth(max_depth):
+    with pytest.raises(ValueError, match="max_depth"):
+        list(iter_layer_tree(_nested_entries(), max_depth=max_depth))
+
+
+@pytest.mark.parametrize("collapse", ["1", ["1,*"], ["01"], [""]])
+def test_iter_layer_tree_rejects_invalid_collapse(collapse):
+    with pytest.raises(ValueError, match="collapse"):
+        list(iter_layer_tree(_nested_entries(), collapse=collapse))
+
+
+def test_format_phase_timings_lists_entered_phases_with_shares():
+    timings = PhaseTimings(build_url=0.001, validate=0.001, network=0.018)
+
+    assert format_phase_timings("getDataLayer", timings).splitlines() == [
+        "profile getDataLayer",
+        "  build_url        1.00 ms    5.0%",
+        "  validate         1.00 ms    5.0%",
+        "  network         18.00 ms   90.0%",
+        "  total           20.00 ms",
+    ]
+
+
+_DATA_RESPONSE = DataResponse(
+    status=200,
+    message_id="M181000I",
+    message="OK",
+    date="2025-02-22",
+    parameter={"DB": "FM01"},
+    next_position=None,
+    result_set=(
+        {
+            "SERIES_CODE": "A",
+            "FREQUENCY": "MONTHLY",
+            "NAME_OF_TIME_SERIES": "名前, with comma",
+            "VALUES": {"SURVEY_DATES": [202401, 202402], "VALUES": [1.5, None]},
+        },
+        {
+            "SERIES_CODE": "B",
+            "FREQUENCY": "QUARTERLY",
+            "VALUES": {"SURVEY_DATES": [202401], "VALUES": [2.0]},
+        },
+    ),
+)
+
+
+def test_iter_data_ndjson_yields_one_line_per_series():
+    lines = list(iter_data_ndjson(_DATA_RESPONSE))
+
+    assert len(lines) == 2
+    assert all(line.endswith("\n") and line.count("\n") == 1 for line in lines)
+    assert [json.loads(line) for line in lines] == list(_DATA_RESPONSE.result_set)
+    assert "名前" in lines[0]
+
+
+def test_iter_data_csv_yields_header_then_one_chunk_per_series():
+    chunks = list(iter_data_csv(_DATA_RESPONSE))
+
+    assert chunks == [
+        "series_code,frequency,survey_date,value\n",
+        "A,MONTHLY,202401,1.5\nA,MONTHLY,202402,\n",
+        "B,QUARTERLY,202401,2.0\n",
+    ]
+    assert list(iter_data_csv(_DATA_RESPONSE, header=False)) == chunks[1:]
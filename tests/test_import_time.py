@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Generous ceilings: a regression that pulls pyarrow or httpx back into the
+# import path costs well over 100 ms, while the lazy imports take a few ms.
+IMPORT_BUDGET_SECONDS = 0.15
+CLI_IMPORT_BUDGET_SECONDS = 0.4
+
+HEAVY_MODULES = ("pyarrow", "httpx", "tqdm")
+# Only imported by the to_pandas / to_polars adapters.
+DATAFRAME_MODULES = ("pandas", "polars")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def _import_in_subprocess(module: str) -> tuple[float, set[str]]:
+    """Return the best of three fresh-interpreter import times and loaded modules."""
+    best = float("inf")
+    modules: set[str] = set()
+    for _ in range(3):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        best = min(best, result["elapsed"])
+        modules = set(result["modules"])
+    return best, modules
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["boj_stat_search", "boj_stat_search.core", "boj_stat_search.shell.catalog"],
+)
+def test_package_import_does_not_load_heavy_dependencies(module: str) -> None:
+    elapsed, modules = _import_in_subprocess(module)
+
+    assert not modules & set(HEAVY_MODULES)
+    assert elapsed < IMPORT_BUDGET_SECONDS
+
+
+def test_cli_import_does_not_load_heavy_dependencies() -> None:
+    elapsed, modules = _import_in_subprocess("boj_stat_search.shell.cli")
+
+    assert not modules & set(HEAVY_MODULES)
+    assert elapsed < CLI_IMPORT_BUDGET_SECONDS
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["boj_stat_search.core.catalog_result", "boj_stat_search.core.columnar"],
+)
+def test_result_modules_do_not_load_dataframe_libraries(module: str) -> None:
+    _, modules = _import_in_subprocess(module)
+
+    assert not modules & set(DATAFRAME_MODULES)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from boj_stat_search.core.mock_api import MockDataset
+from boj_stat_search.core.request_plan import PlannedRequest
+from boj_stat_search.core.types import Frequency
+from boj_stat_search.shell.client import BojClient
+from boj_stat_search.shell.jobs import (
+    JOB_TABLE_SCHEMA,
+    JOURNAL_NAME,
+    read_download_job,
+    run_download_job,
+    write_download_dataset,
+)
+from boj_stat_search.shell.mock_server import MockBojServer
+
+CODES = ("FM01X00001", "FM01X00003", "FM01X00005")
+# Three series over two pages each.
+PLAN = [
+    PlannedRequest("FM01", CODES, Frequency.MONTHLY, "200501", "200512"),
+    PlannedRequest("FM01", CODES, Frequency.MONTHLY, "200601", "200612"),
+]
+
+
+class _CrashingClient(BojClient):
+    """Fails the request after ``calls`` successful ones."""
+
+    def __init__(self, *args, calls: int, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.remaining = calls
+
+    def get_data_code(self, *args, **kwargs):
+        if self.remaining == 0:
+            raise KeyboardInterrupt
+        self.remaining -= 1
+        return super().get_data_code(*args, **kwargs)
+
+
+@pytest.fixture
+def server() -> MockBojServer:
+    return MockBojServer(
+        MockDataset(series_per_db=12, fanout=3, start_year=2000, page_size=2)
+    )
+
+
+@pytest.fixture
+def http_client(server: MockBojServer) -> Iterator[httpx.Client]:
+    with server.client() as client:
+        yield client
+
+
+def test_interrupted_job_resumes_from_last_cursor(
+    tmp_path: Path, server: MockBojServer, http_client: httpx.Client
+) -> None:
+    with BojClient(client=http_client, min_request_interval=0) as client:
+        expected = run_download_job(
+            PLAN, tmp_path / "reference", client=client, max_workers=1
+        )
+    server.reset_stats()
+
+    crashing = _CrashingClient(client=http_client, min_request_interval=0, calls=3)
+    with pytest.raises(KeyboardInterrupt):
+        run_download_job(PLAN, tmp_path / "job", client=crashing, max_workers=1)
+    assert len(server.requests) == 3
+    server.reset_stats()
+
+    with BojClient(client=http_client, min_request_interval=0) as client:
+        report = run_download_job(PLAN, tmp_path / "job", client=client)
+
+    assert report.resumed == 1
+    assert report.fetched_pages == 1
+    assert len(server.requests) == 1
+    assert server.requests[0].params["startPosition"] == "3"
+    assert [part.name for part in report.parts] == [
+        part.name for part in expected.parts
+    ]
+    table = read_download_job(tmp_path / "job")
+    assert table.schema == JOB_TABLE_SCHEMA
+    assert table.equals(read_download_job(tmp_path / "reference"))
+    assert set(table["series_code"].to_pylist()) == set(CODES)
+
+
+def test_completed_job_is_not_fetched_again(
+    tmp_path: Path, server: MockBojServer, http_client: httpx.Client
+) -> None:
+    with BojClient(client=http_client, min_request_interval=0) as client:
+        first = run_download_job(PLAN, tmp_path, client=client)
+        server.reset_stats()
+        second = run_download_job(PLAN, tmp_path, client=client)
+
+    assert first.fetched_pages == 4
+    assert second.resumed == len(PLAN)
+    assert second.fetched_pages == 0
+    assert second.parts == first.parts
+    assert len(server.requests) == 0
+
+
+def test_request_with_missing_part_is_fetched_again(
+    tmp_path: Path, server: MockBojServer, http_client: httpx.Client
+) -> None:
+    with BojClient(client=http_client, min_request_interval=0) as client:
+        first = run_download_job(PLAN, tmp_path, client=client)
+        expected = read_download_job(tmp_path)
+        first.parts[-1].unlink()
+        # A crash mid-append leaves a torn last line.
+        with (tmp_path / JOURNAL_NAME).open("a") as journal:
+            journal.write('{"request": 1, "pa')
+        server.reset_stats()
+        report = run_download_job(PLAN, tmp_path, client=client)
+
+    assert report.resumed == 1
+    assert report.fetched_pages == 2
+    assert len(server.requests) == 2
+    assert read_download_job(tmp_path).equals(expected)
+
+
+def test_job_dir_rejects_a_different_plan(
+    tmp_path: Path, http_client: httpx.Client
+) -> None:
+    with BojClient(client=http_client, min_request_interval=0) as client:
+        run_download_job(PLAN[:1], tmp_path, client=client)
+        with pytest.raises(ValueError, match="different plan"):
+            run_download_job(PLAN, tmp_path, client=client)
+
+
+def test_read_download_job_without_journal_is_empty(tmp_path: Path) -> None:
+    assert read_download_job(tmp_path).num_rows == 0
+
+
+def test_run_download_job_rejects_empty_plan(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="plan"):
+        run_download_job([], tmp_path)
+
+
+@pytest.mark.parametrize(
+    ("file_format", "compression"), [("parquet", "zstd"), ("arrow", "none")]
+)
+def test_write_download_dataset_partitions_by_db_and_frequency(
+    tmp_path: Path, http_client: httpx.Client, file_format: str, compression: str
+) -> None:
+    import pyarrow.dataset as ds
+
+    with BojClient(client=http_client, min_request_interval=0) as client:
+        run_download_job(PLAN, tmp_path / "job", client=client)
+    rows = write_download_dataset(
+        tmp_path / "job",
+        tmp_path / "out",
+        file_format=file_format,
+        compression=compression,
+    )
+
+    expected = read_download_job(tmp_path / "job")
+    assert rows == expected.num_rows
+    assert (tmp_path / "out" / "db=FM01" / "frequency=MONTHLY").is_dir()
+    dataset = ds.dataset(
+        tmp_path / "out",
+        format="parquet" if file_format == "parquet" else "arrow",
+        partitioning="hive",
+    )
+    order = [("series_code", "ascending"), ("survey_date", "ascending")]
+    table = dataset.to_table().select(JOB_TABLE_SCHEMA.names).sort_by(order)
+    assert table.to_pylist() == expected.sort_by(order).to_pylist()
+
+
+def test_write_download_dataset_rejects_unknown_codec(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="compression"):
+        write_download_dataset(
+            tmp_path, tmp_path / "out", file_format="arrow", compression="snappy"
+        )
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import pyarrow as pa
+import pytest
+
+from boj_stat_search.core.layer_index import LayerIndex
+
+_PATHS = [
+    (1, 0, 0, 0, 0),
+    (1, 1, 0, 0, 0),
+    (1, 1, 3, 0, 0),
+    (1, 2, 3, 0, 0),
+    (1, 2, 4, 0, 0),
+    (2, 0, 0, 0, 0),
+    (2, 1, 3, 0, 0),
+    (10, 1, 1, 1, 1),
+]
+
+
+def _table(paths: list[tuple[int, ...]]) -> pa.Table:
+    return pa.table(
+        {
+            "series_code": [f"S{index}" for index in range(len(paths))],
+            **{
+                f"layer{depth + 1}": [path[depth] for path in paths]
+                for depth in range(5)
+            },
+        }
+    )
+
+
+def _rows(index: LayerIndex, layer: str, **kwargs: bool) -> list[int]:
+    return index.rows(tuple(layer.split(",")), **kwargs).to_pylist()
+
+
+def _brute_force(paths: list[tuple[int, ...]], tokens: tuple[str, ...]) -> set[int]:
+    return {
+        row
+        for row, path in enumerate(paths)
+        if all(
+            token == "*" or str(path[depth]) == token
+            for depth, token in enumerate(tokens)
+        )
+    }
+
+
+def test_layer_index_from_table_matches_prefix_filters() -> None:
+    index = LayerIndex.from_table(_table(_PATHS))
+
+    assert _rows(index, "1") == [0, 1, 2, 3, 4]
+    assert _rows(index, "1,2") == [3, 4]
+    assert _rows(index, "10,1,1,1,1") == [7]
+    assert _rows(index, "3") == []
+
+
+def test_layer_index_walks_wildcard_subtrees() -> None:
+    index = LayerIndex.from_table(_table(_PATHS))
+
+    assert _rows(index, "*,*,3") == [2, 3, 6]
+    assert _rows(index, "1,*,3") == [2, 3]
+    assert _rows(index, "*,1") == [1, 2, 6, 7]
+
+
+def test_layer_index_stop_at_zero_excludes_shorter_paths() -> None:
+    index = LayerIndex.from_table(_table(_PATHS))
+
+    assert _rows(index, "1,*") == [0, 1, 2, 3, 4]
+    assert _rows(index, "1,*", stop_at_zero=True) == [1, 2, 3, 4]
+    assert _rows(index, "2,0", stop_at_zero=True) == []
+
+
+def test_layer_index_rejects_non_canonical_tokens() -> None:
+    index = LayerIndex.from_table(_table(_PATHS))
+
+    assert _rows(index, "01") == []
+
+
+def test_layer_index_returns_rows_in_tree_order_for_unsorted_input() -> None:
+    paths = [(2, 0, 0, 0, 0), (1, 2, 0, 0, 0), (1, 1, 0, 0, 0)]
+    index = LayerIndex.from_table(_table(paths))
+
+    assert index.rows(None).to_pylist() == [2, 1, 0]
+    assert _rows(index, "1,*") == [2, 1]
+
+
+@pytest.mark.parametrize(
+    "layer", ["*", "1,*", "*,*,3", "*,1,*", "2,*,3", "*,*,*,*,1", "10,*"]
+)
+def test_layer_index_agrees_with_full_scan(layer: str) -> None:
+    paths = [
+        (a, b, c, 0, 1 if a == b else 0)
+        for a in (1, 2, 10)
+        for b in (0, 1, 2)
+        for c in (0, 3)
+    ][::-1]
+    index = LayerIndex.from_table(_table(paths))
+    tokens = tuple(layer.split(","))
+
+    assert set(index.rows(tokens).to_pylist()) == _brute_force(paths, tokens)
+
+
+def test_layer_index_from_paths_keeps_given_order() -> None:
+    index = LayerIndex.from_paths([(1, 0, 0, 0, 0), (1, 1, 0, 0, 0)])
+
+    assert len(index) == 2
+    assert _rows(index, "1,1") == [1]
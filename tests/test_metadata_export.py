@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import httpx
 import pyarrow.parquet as pq
 
+from boj_stat_search.core.columnar import table_from_ipc_bytes
 from boj_stat_search.shell.catalog import (
     METADATA_PARQUET_COLUMNS,
+    decode_metadata_payload,
     generate_metadata_parquet_files,
     metadata_entries_to_rows,
     write_metadata_parquet,
@@ -96,6 +101,14 @@ def test_metadata_entries_to_rows_filters_empty_series_code_and_maps_fields() ->
     ]
 
 
+def test_metadata_entries_to_rows_keeps_headers_when_requested() -> None:
+    entries = (_make_entry(""), _make_entry("A"))
+
+    rows = metadata_entries_to_rows("FM01", entries, include_headers=True)
+
+    assert [row["series_code"] for row in rows] == ["", "A"]
+
+
 def test_write_metadata_parquet_writes_expected_schema_and_rows(tmp_path: Path) -> None:
     rows = [
         {
@@ -226,7 +239,7 @@ def test_generate_metadata_parquet_files_continues_on_failures_and_reports_them(
 ) -> None:
     responses: dict[str, Any] = {
         "FM01": _make_metadata_response("FM01", (_make_entry("STRDCLUCON"),)),
-        "BP01": RuntimeError("boom"),
+        "BP01": httpx.ConnectError("boom"),
     }
 
     def fake_client_factory(*, min_request_interval: float) -> _FakeClient:
@@ -309,3 +322,88 @@ def test_generate_metadata_parquet_files_uses_tqdm_when_show_progress_enabled(
     assert progress.closed is True
     assert progress.postfixes[-1] == "BP01: 1 rows"
     assert report.is_success is True
+
+
+def _metadata_payload(db: str, series_codes: list[str]) -> bytes:
+    return json.dumps(
+        {
+            "STATUS": 200,
+            "MESSAGEID": "M181000I",
+            "MESSAGE": "ok",
+            "DATE": "2026-02-22T00:00:00+09:00",
+            "DB": db,
+            "RESULTSET": [
+                {
+                    "SERIES_CODE": code,
+                    "NAME_OF_TIME_SERIES": f"name {code}",
+                    "LAYER1": 1,
+                }
+                for code in series_codes
+            ],
+        }
+    ).encode()
+
+
+def test_decode_metadata_payload_returns_parquet_rows_as_ipc() -> None:
+    table = table_from_ipc_bytes(
+        decode_metadata_payload("FM01", _metadata_payload("FM01", ["", "STRDCLUCON"]))
+    )
+
+    assert table.column_names == list(METADATA_PARQUET_COLUMNS)
+    assert table["series_code"].to_pylist() == ["STRDCLUCON"]
+    assert table["name_en"].to_pylist() == ["name STRDCLUCON"]
+
+
+class _FakeContentClient(_FakeClient):
+    def get_content(self, url: str) -> bytes:
+        db = url.rsplit("db=", 1)[1]
+        self.calls.append(db)
+        response = self._responses[db]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def test_generate_metadata_parquet_files_decodes_in_worker_pool(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    responses: dict[str, Any] = {
+        "FM01": _metadata_payload("FM01", ["STRDCLUCON"]),
+        "IR01": httpx.ConnectError("boom"),
+        "BP01": _metadata_payload("BP01", ["CODE1", "CODE2", ""]),
+    }
+    created_clients: list[_FakeContentClient] = []
+
+    def fake_client_factory(*, min_request_interval: float) -> _FakeContentClient:
+        client = _FakeContentClient(
+            responses, min_request_interval=min_request_interval
+        )
+        created_clients.append(client)
+        return client
+
+    monkeypatch.setattr(
+        "boj_stat_search.shell.catalog.exporter.BojClient", fake_client_factory
+    )
+    monkeypatch.setattr(
+        "boj_stat_search.shell.parallel.ProcessPoolExecutor",
+        lambda max_workers, **_: ThreadPoolExecutor(max_workers),
+    )
+
+    output_dir = tmp_path / "metadata"
+    report = generate_metadata_parquet_files(
+        output_dir=output_dir,
+        dbs=["FM01", "IR01", "BP01"],
+        max_workers=2,
+    )
+
+    assert created_clients[0].calls == ["FM01", "IR01", "BP01"]
+    assert report.succeeded_dbs == ("FM01", "BP01")
+    assert report.failed_dbs == ("IR01",)
+    assert report.error_messages["IR01"] == "boom"
+    assert dict(report.row_counts) == {"FM01": 1, "BP01": 2}
+    assert pq.read_table(output_dir / "BP01.parquet")["series_code"].to_pylist() == [
+        "CODE1",
+        "CODE2",
+    ]
+    assert not (output_dir / "IR01.parquet").exists()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import httpx
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from boj_stat_search.core.formatter import format_layer_tree
+from boj_stat_search.core.models import MetadataEntry, MetadataResponse
+from boj_stat_search.shell.catalog import (
+    CatalogCacheError,
+    load_layer_entries,
+    load_metadata_snapshot,
+    metadata_entries_to_rows,
+    write_metadata_snapshot,
+)
+
+
+def _entry(series_code: str, name: str, layers: tuple[int, ...]) -> MetadataEntry:
+    padded = (*layers, *(0,) * (5 - len(layers)))
+    return MetadataEntry(
+        series_code=series_code,
+        name_of_time_series_j="",
+        name_of_time_series=name,
+        unit_j="",
+        unit="",
+        frequency="MONTHLY" if series_code else "",
+        category_j="",
+        category="",
+        layer1=padded[0],
+        layer2=padded[1],
+        layer3=padded[2],
+        layer4=padded[3],
+        layer5=padded[4],
+        start_of_the_time_series="",
+        end_of_the_time_series="",
+        last_update="",
+        notes_j="",
+        notes="",
+    )
+
+
+_ENTRIES = (
+    _entry("", "Deposits", (1,)),
+    _entry("B", "Regional banks", (1, 2)),
+    _entry("A", "Domestic banks", (1, 1)),
+    _entry("", "Loans", (2,)),
+    _entry("C", "Housing", (2, 1)),
+)
+
+
+def _response(entries: tuple[MetadataEntry, ...] = _ENTRIES) -> MetadataResponse:
+    return MetadataResponse(
+        status=200,
+        message_id="M181000I",
+        message="ok",
+        date="2026-02-22T00:00:00+09:00",
+        db="BP01",
+        result_set=entries,
+    )
+
+
+def test_snapshot_round_trip_keeps_header_rows(tmp_path: Path) -> None:
+    path = write_metadata_snapshot(_response(), cache_dir=tmp_path)
+
+    assert path == tmp_path / "BP01.metadata.parquet"
+    assert load_metadata_snapshot("BP01", cache_dir=tmp_path) == _ENTRIES
+
+
+def test_load_metadata_snapshot_returns_none_when_missing(tmp_path: Path) -> None:
+    assert load_metadata_snapshot("BP01", cache_dir=tmp_path) is None
+
+
+def test_load_metadata_snapshot_raises_on_corrupted_file(tmp_path: Path) -> None:
+    (tmp_path / "BP01.metadata.parquet").write_bytes(b"not parquet")
+
+    with pytest.raises(CatalogCacheError, match="BP01"):
+        load_metadata_snapshot("BP01", cache_dir=tmp_path)
+
+
+def test_load_layer_entries_prefers_snapshot(tmp_path: Path) -> None:
+    write_metadata_snapshot(_response(), cache_dir=tmp_path)
+    client = Mock(spec=httpx.Client)
+
+    entries, layer_index = load_layer_entries("BP01", cache_dir=tmp_path, client=client)
+
+    assert format_layer_tree(entries, layer_index=layer_index) == (
+        format_layer_tree(_ENTRIES)
+    )
+    assert "(1) Deposits" in format_layer_tree(entries, layer_index=layer_index)
+    client.get.assert_not_called()
+
+
+def test_load_layer_entries_falls_back_to_cached_catalog(tmp_path: Path) -> None:
+    rows = metadata_entries_to_rows("BP01", _ENTRIES)
+    pq.write_table(pa.Table.from_pylist(rows), tmp_path / "BP01.parquet")
+    client = Mock(spec=httpx.Client)
+
+    entries, layer_index = load_layer_entries("BP01", cache_dir=tmp_path, client=client)
+
+    assert format_layer_tree(entries, layer_index=layer_index).split("\n") == [
+        "  - (1,1) Domestic banks [A]",
+        "  - (1,2) Regional banks [B]",
+        "  - (2,1) Housing [C]",
+    ]
+    client.get.assert_not_called()
@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import httpx
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from boj_stat_search.core.mock_api import MockDataset
+from boj_stat_search.shell.api import get_metadata
+from boj_stat_search.shell.catalog.loader import load_catalog_db
+from boj_stat_search.shell.client import BojClient
+from boj_stat_search.shell.metrics import (
+    CacheEvent,
+    ClientMetrics,
+    Histogram,
+    RequestEvent,
+    RetryEvent,
+    ThrottleEvent,
+    current_metrics,
+    opentelemetry_listener,
+)
+from boj_stat_search.shell.mock_server import MockBojServer
+
+
+def _flaky_client(
+    failures: int, *, status: int = 503
+) -> tuple[httpx.Client, list[int]]:
+    """Client whose first ``failures`` requests fail before the mock API answers."""
+    server = MockBojServer(MockDataset(series_per_db=3, fanout=3))
+    calls: list[int] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        calls.append(len(calls))
+        if len(calls) <= failures:
+            return httpx.Response(status, request=request)
+        return server.handle(request)
+
+    return httpx.Client(transport=httpx.MockTransport(handle)), calls
+
+
+def test_histogram_counts_observations_into_cumulative_buckets() -> None:
+    histogram = Histogram((0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative_counts() == [2, 3, 4]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(2.65)
+
+
+def test_histogram_rejects_unsorted_buckets() -> None:
+    with pytest.raises(ValueError, match="buckets"):
+        Histogram((1.0, 0.5))
+
+
+def test_client_records_latency_and_response_size_per_endpoint() -> None:
+    metrics = ClientMetrics()
+    server = MockBojServer(MockDataset(series_per_db=3, fanout=3))
+
+    with BojClient(
+        client=server.client(), min_request_interval=0, metrics=metrics
+    ) as client:
+        client.get_metadata("FM01")
+        client.get_data_layer("FM01", "M", "*")
+        client.get_data_layer("FM01", "Q", "*")
+
+    assert metrics.requests == {("getMetadata", "200"): 1, ("getDataLayer", "200"): 2}
+    assert metrics.request_latency["getDataLayer"].count == 2
+    assert metrics.response_size["getMetadata"].sum > 0
+
+
+def test_client_records_failed_requests_by_status() -> None:
+    metrics = ClientMetrics()
+    http_client, _ = _flaky_client(1, status=500)
+
+    with BojClient(
+        client=http_client, min_request_interval=0, metrics=metrics
+    ) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get_metadata("FM01")
+
+    assert metrics.requests == {("getMetadata", "500"): 1}
+
+
+def test_client_retries_retryable_status_and_records_retries() -> None:
+    metrics = ClientMetrics()
+    events: list[object] = []
+    metrics.add_listener(events.append)
+    http_client, calls = _flaky_client(2)
+
+    with BojClient(
+        client=http_client,
+        min_request_interval=0,
+        max_retries=2,
+        retry_backoff=0,
+        metrics=metrics,
+    ) as client:
+        response = client.get_metadata("FM01")
+
+    assert response.status == 200
+    assert len(calls) == 3
+    assert metrics.retries == {("getMetadata", "http_503"): 2}
+    assert [event.attempt for event in events if isinstance(event, RetryEvent)] == [
+        1,
+        2,
+    ]
+
+
+def test_client_gives_up_after_max_retries() -> None:
+    http_client, calls = _flaky_client(5)
+
+    with BojClient(
+        client=http_client, min_request_interval=0, max_retries=1, retry_backoff=0
+    ) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get_metadata("FM01")
+
+    assert len(calls) == 2
+
+
+def test_client_does_not_retry_client_errors() -> None:
+    http_client, calls = _flaky_client(1, status=400)
+
+    with BojClient(
+        client=http_client, min_request_interval=0, max_retries=3, retry_backoff=0
+    ) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get_metadata("FM01")
+
+    assert len(calls) == 1
+
+
+def test_client_rejects_negative_retry_settings() -> None:
+    with pytest.raises(ValueError, match="max_retries"):
+        BojClient(max_retries=-1)
+    with pytest.raises(ValueError, match="retry_backoff"):
+        BojClient(retry_backoff=-1)
+
+
+def test_client_records_throttle_wait() -> None:
+    metrics = ClientMetrics()
+    events: list[object] = []
+    metrics.add_listener(events.append)
+    server = MockBojServer(MockDataset(series_per_db=3, fanout=3))
+
+    with BojClient(
+        client=server.client(), min_request_interval=0.05, metrics=metrics
+    ) as client:
+        client.get_data_layer("FM01", "M", "*")
+        client.get_data_layer("FM01", "Q", "*")
+
+    waits = [event.seconds for event in events if isinstance(event, ThrottleEvent)]
+    assert len(waits) == 2
+    assert waits[1] > 0.02
+    assert metrics.throttle_wait.count == 2
+
+
+def test_activate_scopes_functional_api_calls() -> None:
+    metrics = ClientMetrics()
+    server = MockBojServer(MockDataset(series_per_db=3, fanout=3))
+
+    with server.client() as http_client:
+        get_metadata("FM01", client=http_client)
+        with metrics.activate():
+            assert current_metrics() is metrics
+            get_metadata("FM01", client=http_client)
+
+    assert current_metrics() is None
+    assert metrics.requests == {("getMetadata", "200"): 1}
+
+
+def test_transport_errors_are_recorded_without_status() -> None:
+    metrics = ClientMetrics()
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    with httpx.Client(transport=httpx.MockTransport(handle)) as http_client:
+        with metrics.activate(), pytest.raises(httpx.ConnectError):
+            get_metadata("FM01", client=http_client)
+
+    assert metrics.requests == {("getMetadata", "error"): 1}
+
+
+def test_catalog_loader_records_cache_misses_hits_and_downloads(
+    tmp_path: Path,
+) -> None:
+    sink = pa.BufferOutputStream()
+    pq.write_table(pa.table({"series_code": ["A"]}), sink)
+    content = sink.getvalue().to_pybytes()
+    metrics = ClientMetrics()
+    events: list[object] = []
+    metrics.add_listener(events.append)
+
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=content)
+    )
+    with httpx.Client(transport=transport) as http_client:
+        load_catalog_db("FM01", cache_dir=tmp_path, client=http_client, metrics=metrics)
+        load_catalog_db("FM01", cache_dir=tmp_path, client=http_client, metrics=metrics)
+
+    cache_events = [event for event in events if isinstance(event, CacheEvent)]
+    assert [event.hit for event in cache_events] == [False, True]
+    assert metrics.cache == {("catalog", "hit"): 1, ("catalog", "miss"): 1}
+    assert metrics.requests == {("catalog", "200"): 1}
+    assert metrics.response_size["catalog"].sum == len(content)
+
+
+def test_to_prometheus_renders_histograms_and_counters() -> None:
+    metrics = ClientMetrics(latency_buckets=(0.1, 1.0), size_buckets=(100,))
+    metrics.record(
+        RequestEvent(
+            endpoint="getDataCode",
+            url="https://example.test/api/v1/getDataCode",
+            status_code=200,
+            started_at=0.0,
+            seconds=0.5,
+            response_bytes=50,
+        )
+    )
+    metrics.record(
+        RetryEvent(endpoint="getDataCode", attempt=1, reason="http_503", delay=0.5)
+    )
+    metrics.record(CacheEvent(cache="catalog", key="FM01", hit=True))
+
+    text = metrics.to_prometheus()
+
+    assert "# TYPE boj_stat_search_request_duration_seconds histogram" in text
+    assert (
+        'boj_stat_search_request_duration_seconds_bucket{endpoint="getDataCode",le="0.1"} 0'
+        in text
+    )
+    assert (
+        'boj_stat_search_request_duration_seconds_bucket{endpoint="getDataCode",le="+Inf"} 1'
+        in text
+    )
+    assert (
+        'boj_stat_search_request_duration_seconds_sum{endpoint="getDataCode"} 0.5'
+        in text
+    )
+    assert (
+        'boj_stat_search_response_size_bytes_bucket{endpoint="getDataCode",le="100"} 1'
+        in text
+    )
+    assert (
+        'boj_stat_search_requests_total{endpoint="getDataCode",status="200"} 1' in text
+    )
+    assert (
+        'boj_stat_search_retries_total{endpoint="getDataCode",reason="http_503"} 1'
+        in text
+    )
+    assert (
+        'boj_stat_search_cache_requests_total{cache="catalog",result="hit"} 1' in text
+    )
+    assert "boj_stat_search_throttle_wait_seconds_count 0" in text
+    assert text.endswith("\n")
+
+
+def test_opentelemetry_listener_requires_opentelemetry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(sys.modules, "opentelemetry", None)
+
+    with pytest.raises(ImportError, match="opentelemetry-api"):
+        opentelemetry_listener()
+
+
+def test_opentelemetry_listener_records_request_spans() -> None:
+    pytest.importorskip("opentelemetry")
+    spans: list[dict[str, object]] = []
+
+    class _Span:
+        def __init__(self, name: str, **kwargs: object) -> None:
+            self.record: dict[str, object] = {"name": name, **kwargs}
+            spans.append(self.record)
+
+        def end(self, end_time: int) -> None:
+            self.record["end_time"] = end_time
+
+    class _Tracer:
+        def start_span(self, name: str, **kwargs: object) -> _Span:
+            return _Span(name, **kwargs)
+
+    listener = opentelemetry_listener(_Tracer())
+    listener(
+        RequestEvent(
+            endpoint="getDataCode",
+            url="https://example.test/getDataCode",
+            status_code=200,
+            started_at=1.0,
+            seconds=0.5,
+            response_bytes=42,
+        )
+    )
+    # Other events go to the current span, a no-op without an SDK.
+    listener(CacheEvent(cache="catalog", key="FM01", hit=True))
+
+    assert spans == [
+        {
+            "name": "boj getDataCode",
+            "start_time": 1_000_000_000,
+            "attributes": {
+                "http.request.method": "GET",
+                "url.full": "https://example.test/getDataCode",
+                "http.response.status_code": 200,
+                "http.response.body.size": 42,
+            },
+            "end_time": 1_500_000_000,
+        }
+    ]
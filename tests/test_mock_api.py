@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import pytest
+
+from boj_stat_search.core.mock_api import MockDataset, mock_api_response
+from boj_stat_search.core.parser import (
+    parse_data_code_response,
+    parse_metadata_response,
+)
+
+_DATE = "2026-02-22T00:00:00+09:00"
+
+
+def _respond(dataset: MockDataset, endpoint: str, **params: str):
+    return mock_api_response(dataset, f"/api/v1/{endpoint}", params, date=_DATE)
+
+
+def test_metadata_lists_headers_before_their_series() -> None:
+    dataset = MockDataset(series_per_db=12, fanout=3, frequencies=("M",))
+
+    status, body = _respond(dataset, "getMetadata", db="FM01")
+    response = parse_metadata_response(body)
+
+    assert status == 200
+    assert response.db == "FM01"
+    paths = [
+        (entry.series_code != "", entry.layer1, entry.layer2, entry.layer3)
+        for entry in response.result_set
+    ]
+    assert paths[:5] == [
+        (False, 1, 0, 0),
+        (False, 1, 1, 0),
+        (True, 1, 1, 1),
+        (True, 1, 1, 2),
+        (True, 1, 1, 3),
+    ]
+    assert sum(entry.series_code != "" for entry in response.result_set) == 12
+    assert response.result_set[2].frequency == "MONTHLY"
+
+
+def test_responses_are_deterministic() -> None:
+    dataset = MockDataset(series_per_db=5)
+
+    first = _respond(dataset, "getDataCode", db="FM01", code="FM01X00001")
+    second = _respond(dataset, "getDataCode", db="FM01", code="FM01X00001")
+
+    assert first == second
+
+
+def test_parameter_names_are_case_insensitive() -> None:
+    dataset = MockDataset(series_per_db=5)
+
+    status, body = _respond(dataset, "getdatacode", DB="fm01", CODE="FM01X00001")
+
+    assert status == 200
+    assert body["PARAMETER"]["DB"] == "FM01"
+
+
+def test_data_layer_pages_with_next_position() -> None:
+    dataset = MockDataset(series_per_db=30, frequencies=("M",), page_size=12)
+
+    codes: list[str] = []
+    position: int | None = 1
+    pages = 0
+    while position is not None:
+        status, body = _respond(
+            dataset,
+            "getDataLayer",
+            db="MD10",
+            frequency="M",
+            layer="*",
+            startPosition=str(position),
+        )
+        assert status == 200
+        response = parse_data_code_response(body)
+        codes.extend(entry["SERIES_CODE"] for entry in response.result_set)
+        position = response.next_position
+        pages += 1
+
+    assert pages == 3
+    assert codes == [f"MD10X{index:05d}" for index in range(1, 31)]
+
+
+def test_data_layer_filters_by_frequency_and_layer() -> None:
+    dataset = MockDataset(series_per_db=200, frequencies=("M", "Q"), fanout=10)
+
+    _, body = _respond(dataset, "getDataLayer", db="FM01", frequency="Q", layer="2,*,4")
+
+    codes = [entry["SERIES_CODE"] for entry in body["RESULTSET"]]
+    assert codes == [f"FM01X{index:05d}" for index in range(104, 201, 10)]
+    assert all(entry["FREQUENCY"] == "QUARTERLY" for entry in body["RESULTSET"])
+    assert body["NEXTPOSITION"] is None
+    assert body["PARAMETER"]["LAYER3"] == "4"
+
+
+@pytest.mark.parametrize(
+    ("frequency", "start_date", "end_date", "expected"),
+    [
+        ("M", "202401", "202403", [202401, 202402, 202403]),
+        ("Q", "202402", "202403", [202404, 202407]),
+        ("CY", "2023", "2024", [2023, 2024]),
+        ("CH", "202402", "202402", [202407]),
+    ],
+)
+def test_data_code_filters_survey_dates(
+    frequency: str, start_date: str, end_date: str, expected: list[int]
+) -> None:
+    dataset = MockDataset(series_per_db=1, frequencies=(frequency,))
+
+    _, body = _respond(
+        dataset,
+        "getDataCode",
+        db="FM01",
+        code="FM01X00001",
+        startDate=start_date,
+        endDate=end_date,
+    )
+
+    values = body["RESULTSET"][0]["VALUES"]
+    assert values["SURVEY_DATES"] == expected
+    assert len(values["VALUES"]) == len(expected)
+
+
+def test_daily_series_use_business_days() -> None:
+    dataset = MockDataset(
+        series_per_db=1, frequencies=("D",), start_year=2024, end_year=2024
+    )
+
+    _, body = _respond(
+        dataset,
+        "getDataCode",
+        db="FM01",
+        code="FM01X00001",
+        startDate="202401",
+        endDate="202401",
+    )
+
+    dates = body["RESULTSET"][0]["VALUES"]["SURVEY_DATES"]
+    assert dates[:3] == [20240101, 20240102, 20240103]
+    assert 20240106 not in dates
+    assert len(dates) == 23
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "params", "message_id"),
+    [
+        ("getMetadata", {"db": "XX99"}, "M181005E"),
+        ("getMetadata", {}, "M181005E"),
+        ("getDataCode", {"db": "FM01", "code": "UNKNOWN"}, "M181001E"),
+        ("getDataCode", {"db": "FM01"}, "M181001E"),
+        (
+            "getDataCode",
+            {"db": "FM01", "code": "FM01X00001", "startDate": "2024"},
+            "M181001E",
+        ),
+        (
+            "getDataCode",
+            {"db": "FM01", "code": "FM01X00001", "startPosition": "0"},
+            "M181001E",
+        ),
+        ("getDataLayer", {"db": "FM01", "frequency": "X", "layer": "*"}, "M181018E"),
+        ("getDataLayer", {"db": "FM01", "frequency": "M", "layer": "a"}, "M181001E"),
+    ],
+)
+def test_invalid_requests_return_400_error_bodies(
+    endpoint: str, params: dict[str, str], message_id: str
+) -> None:
+    status, body = _respond(MockDataset(series_per_db=5), endpoint, **params)
+
+    assert status == 400
+    assert body == {
+        "STATUS": 400,
+        "MESSAGEID": message_id,
+        "MESSAGE": body["MESSAGE"],
+        "DATE": _DATE,
+    }
+
+
+def test_too_many_codes_is_rejected() -> None:
+    dataset = MockDataset(series_per_db=5, max_codes=2)
+
+    status, body = _respond(
+        dataset, "getDataCode", db="FM01", code="FM01X00001,FM01X00002,FM01X00003"
+    )
+
+    assert status == 400
+    assert body["MESSAGEID"] == "M181001E"
+
+
+def test_unknown_endpoint_returns_404() -> None:
+    status, _ = _respond(MockDataset(), "getSomething", db="FM01")
+
+    assert status == 404
+
+
+def test_dbs_restricts_served_databases() -> None:
+    dataset = MockDataset(series_per_db=1, dbs=("CUSTOM",))
+
+    assert _respond(dataset, "getMetadata", db="CUSTOM")[0] == 200
+    assert _respond(dataset, "getMetadata", db="FM01")[0] == 400
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "field"),
+    [
+        ({"series_per_db": 0}, "series_per_db"),
+        ({"page_size": True}, "page_size"),
+        ({"frequencies": ()}, "frequencies"),
+        ({"frequencies": ("X",)}, "frequencies"),
+        ({"start_year": 2030, "end_year": 2020}, "start_year"),
+    ],
+)
+def test_dataset_rejects_invalid_settings(kwargs: dict, field: str) -> None:
+    with pytest.raises(ValueError, match=field):
+        MockDataset(**kwargs)
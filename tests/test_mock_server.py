@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import httpx
+import pytest
+
+from boj_stat_search.core.mock_api import MockDataset
+from boj_stat_search.shell.api import BojApiError, get_data_layer_raw
+from boj_stat_search.shell.client import BojClient
+from boj_stat_search.shell.mock_server import MockBojServer
+
+
+def test_client_pages_through_data_layer() -> None:
+    server = MockBojServer(MockDataset(series_per_db=40, page_size=15))
+
+    codes: list[str] = []
+    with BojClient(client=server.client(), min_request_interval=0) as client:
+        position: int | None = None
+        while True:
+            response = client.get_data_layer("FM01", "M", "*", start_position=position)
+            codes.extend(entry["SERIES_CODE"] for entry in response.result_set)
+            position = response.next_position
+            if position is None:
+                break
+
+    assert len(codes) == 20
+    assert server.request_count == 2
+    assert all(url.path == "/api/v1/getDataLayer" for url in server.requests)
+
+
+def test_metadata_round_trip_through_client() -> None:
+    server = MockBojServer(MockDataset(series_per_db=3, fanout=3))
+
+    with BojClient(client=server.client(), min_request_interval=0) as client:
+        response = client.get_metadata("FM01")
+
+    assert response.status == 200
+    assert [entry.series_code for entry in response.result_set] == [
+        "",
+        "",
+        "FM01X00001",
+        "FM01X00002",
+        "FM01X00003",
+    ]
+
+
+def test_400_errors_surface_as_boj_api_error() -> None:
+    server = MockBojServer()
+
+    with server.client() as http_client, pytest.raises(BojApiError) as exc_info:
+        get_data_layer_raw(
+            "FM01", "X", "*", on_validation_error="ignore", client=http_client
+        )
+
+    assert exc_info.value.response.status_code == 400
+    assert exc_info.value.message_id == "M181018E"
+
+
+def test_failure_rate_returns_failure_status() -> None:
+    server = MockBojServer(failure_rate=1.0, failure_status=503)
+
+    with server.client() as http_client:
+        response = http_client.get(
+            "https://www.stat-search.boj.or.jp/api/v1/getMetadata?db=FM01"
+        )
+
+    assert response.status_code == 503
+
+
+def test_latency_delays_each_request() -> None:
+    server = MockBojServer(MockDataset(series_per_db=1), latency=0.05)
+
+    with server.client() as http_client:
+        start = time.perf_counter()
+        http_client.get("https://www.stat-search.boj.or.jp/api/v1/getMetadata?db=FM01")
+        elapsed = time.perf_counter() - start
+
+    assert elapsed >= 0.05
+
+
+def test_tracks_peak_concurrency() -> None:
+    server = MockBojServer(MockDataset(series_per_db=1), latency=0.05)
+    barrier = threading.Barrier(4)
+
+    def fetch() -> None:
+        with server.client() as http_client:
+            barrier.wait()
+            http_client.get(
+                "https://www.stat-search.boj.or.jp/api/v1/getMetadata?db=FM01"
+            )
+
+    threads = [threading.Thread(target=fetch) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert server.request_count == 4
+    assert server.peak_concurrency >= 2
+
+    server.reset_stats()
+    assert server.request_count == 0
+    assert server.peak_concurrency == 0
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "field"),
+    [
+        ({"latency": -1}, "latency"),
+        ({"jitter": -0.1}, "jitter"),
+        ({"failure_rate": 1.5}, "failure_rate"),
+    ],
+)
+def test_rejects_invalid_settings(kwargs: dict, field: str) -> None:
+    with pytest.raises(ValueError, match=field):
+        MockBojServer(**kwargs)
+
+
+def test_transport_can_back_any_httpx_client() -> None:
+    server = MockBojServer(MockDataset(series_per_db=1))
+
+    with httpx.Client(transport=server.transport()) as http_client:
+        response = http_client.get("http://localhost/api/v1/getMetadata?db=FM01")
+
+    assert response.json()["DB"] == "FM01"
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pyarrow as pa
+import pytest
+
+from boj_stat_search.core.columnar import table_to_ipc_bytes
+from boj_stat_search.shell.catalog import decode_metadata_payload
+from boj_stat_search.shell.parallel import decode_in_processes
+
+
+def _payload_decoder(key: object, content: bytes) -> bytes:
+    if content == b"bad":
+        raise ValueError("cannot decode")
+    return table_to_ipc_bytes(pa.table({"payload": [content.decode()]}))
+
+
+def test_decode_in_processes_yields_tables_in_input_order() -> None:
+    payloads = [(index, f"page-{index}".encode()) for index in range(10)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            decode_in_processes(
+                payloads, _payload_decoder, executor=executor, max_pending=3
+            )
+        )
+
+    assert [key for key, _ in results] == list(range(10))
+    tables = [table for _, table in results if isinstance(table, pa.Table)]
+    assert [table["payload"][0].as_py() for table in tables] == [
+        f"page-{index}" for index in range(10)
+    ]
+
+
+def test_decode_in_processes_passes_through_fetch_and_decode_errors() -> None:
+    fetch_error = RuntimeError("fetch failed")
+    payloads = [("a", b"ok"), ("b", fetch_error), ("c", b"bad")]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = dict(
+            decode_in_processes(payloads, _payload_decoder, executor=executor)
+        )
+
+    assert isinstance(results["a"], pa.Table)
+    assert results["b"] is fetch_error
+    assert isinstance(results["c"], ValueError)
+
+
+def test_decode_in_processes_consumes_payloads_lazily() -> None:
+    consumed: list[int] = []
+
+    def payloads():
+        for index in range(6):
+            consumed.append(index)
+            yield index, b"x"
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        decoded = decode_in_processes(
+            payloads(), _payload_decoder, executor=executor, max_pending=2
+        )
+        next(decoded)
+        assert len(consumed) == 2
+        decoded.close()
+
+
+def test_decode_in_processes_uses_real_worker_processes() -> None:
+    body = (
+        b'{"DB": "OTHER", "RESULTSET": [{"SERIES_CODE": "A", "LAYER1": 1}, '
+        b'{"SERIES_CODE": ""}]}'
+    )
+
+    results = list(
+        decode_in_processes([("FM01", body)], decode_metadata_payload, max_workers=1)
+    )
+
+    [(key, table)] = results
+    assert key == "FM01"
+    assert isinstance(table, pa.Table)
+    assert table["series_code"].to_pylist() == ["A"]
+    assert table["layer1"].to_pylist() == [1]
+
+
+def test_decode_in_processes_rejects_invalid_worker_count() -> None:
+    with pytest.raises(ValueError, match="max_workers"):
+        list(decode_in_processes([], _payload_decoder, max_workers=0))
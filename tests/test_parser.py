@@ -172,3 +172,20 @@ def test_parse_data_code_response_handles_error_payload_with_missing_fields():
         next_position=None,
         result_set=(),
     )
+
+
+def test_parse_metadata_response_shares_repeated_strings_across_entries():
+    raw = {
+        "STATUS": 200,
+        "DB": "FM01",
+        "RESULTSET": [
+            {"SERIES_CODE": code, "UNIT": "percent per annum", "FREQUENCY": "DAILY"}
+            for code in ("A", "B")
+        ],
+    }
+
+    first, second = parse_metadata_response(raw).result_set
+
+    assert first.unit is second.unit
+    assert first.frequency is second.frequency
+    assert not hasattr(first, "__dict__")
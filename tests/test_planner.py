@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pyarrow as pa
+import pytest
+
+from boj_stat_search.core.catalog_result import (
+    CATALOG_TABLE_SCHEMA,
+    SeriesCatalogResult,
+)
+from boj_stat_search.core.mock_api import MockDataset
+from boj_stat_search.core.request_plan import PlannedRequest
+from boj_stat_search.core.types import Frequency
+from boj_stat_search.shell.api import get_data_layer, get_metadata
+from boj_stat_search.shell.catalog.exporter import metadata_entries_to_rows
+from boj_stat_search.shell.client import BojClient
+from boj_stat_search.shell.mock_server import MockBojServer
+from boj_stat_search.shell.planner import (
+    fetch_planned,
+    get_data_layer_planned,
+    select_series,
+)
+
+
+@pytest.fixture
+def server() -> MockBojServer:
+    return MockBojServer(
+        MockDataset(series_per_db=12, fanout=3, start_year=2000, page_size=2)
+    )
+
+
+@pytest.fixture
+def http_client(server: MockBojServer) -> Iterator[httpx.Client]:
+    with server.client() as client:
+        yield client
+
+
+@pytest.fixture
+def catalog(monkeypatch, http_client: httpx.Client) -> SeriesCatalogResult:
+    metadata = get_metadata("FM01", client=http_client)
+    rows = [
+        {**row, "db": "FM01"}
+        for row in metadata_entries_to_rows("FM01", metadata.result_set)
+    ]
+    result = SeriesCatalogResult(
+        pa.Table.from_pylist(rows, schema=CATALOG_TABLE_SCHEMA)
+    )
+    monkeypatch.setattr(
+        "boj_stat_search.shell.planner.list_series", lambda *_args, **_kwargs: result
+    )
+    return result
+
+
+def _layer_pages(http_client: httpx.Client, *args) -> dict[str, list[int]]:
+    values: dict[str, list[int]] = {}
+    position = None
+    while True:
+        response = get_data_layer(*args, start_position=position, client=http_client)
+        for entry in response.result_set:
+            values[entry["SERIES_CODE"]] = entry["VALUES"]["SURVEY_DATES"]
+        if response.next_position is None:
+            return values
+        position = response.next_position
+
+
+def test_planned_layer_query_matches_every_page(
+    tmp_path: Path,
+    server: MockBojServer,
+    http_client: httpx.Client,
+    catalog: SeriesCatalogResult,
+) -> None:
+    expected = _layer_pages(http_client, "FM01", "M", "1,*", "200501", "201012")
+    server.reset_stats()
+
+    with BojClient(client=http_client, min_request_interval=0) as client:
+        response = get_data_layer_planned(
+            "FM01",
+            "M",
+            "1,*",
+            "200501",
+            "201012",
+            client=client,
+            max_workers=3,
+            max_codes=2,
+            max_observations=48,
+            cache_dir=tmp_path,
+        )
+
+    stitched = {
+        entry["SERIES_CODE"]: entry["VALUES"]["SURVEY_DATES"]
+        for entry in response.result_set
+    }
+    assert list(stitched) == list(expected)
+    assert stitched == expected
+    assert response.parameter["LAYER1"] == "1"
+    assert response.next_position is None
+    # 5 monthly series over 72 months: two chunks of 2 in 24-month windows
+    # and one single series in 48-month windows.
+    assert len(server.requests) == 3 + 3 + 2
+
+
+def test_planned_request_follows_remaining_pages(
+    server: MockBojServer, http_client: httpx.Client
+) -> None:
+    codes = ("FM01X00001", "FM01X00003", "FM01X00005")
+    plan = [PlannedRequest("FM01", codes, Frequency.MONTHLY, "201001", "201012")]
+
+    with BojClient(client=http_client, min_request_interval=0) as client:
+        response = fetch_planned(plan, client=client)
+
+    assert [entry["SERIES_CODE"] for entry in response.result_set] == list(codes)
+    assert len(server.requests) == 2
+
+
+def test_planned_layer_query_rejects_empty_selection(
+    tmp_path: Path, catalog: SeriesCatalogResult
+) -> None:
+    with pytest.raises(ValueError, match="no D series"):
+        get_data_layer_planned("FM01", "D", "*", cache_dir=tmp_path)
+
+
+def test_select_series_by_code_keeps_catalog_rows(
+    catalog: SeriesCatalogResult,
+) -> None:
+    selected = select_series("FM01", codes=["FM01X00004", "FM01X00002"])
+
+    assert selected["series_code"].to_pylist() == ["FM01X00002", "FM01X00004"]
+    assert selected.schema == catalog.to_arrow().schema
+
+
+def test_select_series_rejects_unknown_code(catalog: SeriesCatalogResult) -> None:
+    with pytest.raises(ValueError, match="NOPE not found in the FM01 catalog"):
+        select_series("FM01", codes=["FM01X00002", "NOPE"])
+
+
+def test_fetch_planned_rejects_empty_plan() -> None:
+    with pytest.raises(ValueError, match="plan"):
+        fetch_planned([])
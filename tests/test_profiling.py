@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import dataclasses
+import warnings
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from boj_stat_search.core.mock_api import MockDataset
+from boj_stat_search.core.models import PhaseTimings
+from boj_stat_search.shell.api import (
+    get_data_code,
+    get_data_layer,
+    get_data_layer_raw,
+    get_metadata,
+)
+from boj_stat_search.shell.client import BojClient
+from boj_stat_search.shell.mock_server import MockBojServer
+from boj_stat_search.shell.profiling import profile_requests
+
+
+@pytest.fixture
+def http_client() -> Iterator[httpx.Client]:
+    server = MockBojServer(MockDataset(series_per_db=6, fanout=3))
+    with server.client() as client:
+        yield client
+
+
+def test_timings_are_absent_without_profiling(http_client: httpx.Client) -> None:
+    response = get_data_layer("FM01", "M", "*", client=http_client)
+
+    assert response.timings is None
+
+
+def test_profiled_response_records_every_phase(http_client: httpx.Client) -> None:
+    with profile_requests():
+        response = get_data_layer("FM01", "M", "*", client=http_client)
+
+    timings = response.timings
+    assert timings is not None
+    for name in ("build_url", "validate", "network", "decode", "parse"):
+        assert getattr(timings, name) > 0, name
+    assert timings.throttle == 0
+    assert timings.resolve_db == 0
+    assert timings.total == pytest.approx(sum(timings.as_dict().values()))
+
+
+def test_callback_receives_one_breakdown_per_call(http_client: httpx.Client) -> None:
+    calls: list[tuple[str, PhaseTimings]] = []
+
+    with profile_requests(lambda endpoint, timings: calls.append((endpoint, timings))):
+        metadata = get_metadata("FM01", client=http_client)
+        get_data_layer_raw("FM01", "Q", "*", client=http_client)
+
+    assert [endpoint for endpoint, _ in calls] == ["getMetadata", "getDataLayer"]
+    assert calls[0][1] == metadata.timings
+    assert calls[1][1].parse == 0
+
+
+def test_data_code_lookup_is_timed_as_resolve_db(http_client: httpx.Client) -> None:
+    code = get_data_layer("FM01", "M", "*", client=http_client).result_set[0][
+        "SERIES_CODE"
+    ]
+
+    with patch(
+        "boj_stat_search.shell.catalog.search.resolve_db", return_value="FM01"
+    ) as resolver:
+        with profile_requests():
+            response = get_data_code(code=code, client=http_client)
+
+    resolver.assert_called_once_with(code)
+    assert response.timings is not None
+    assert response.timings.resolve_db > 0
+
+
+def test_profiled_validation_keeps_error_modes(http_client: httpx.Client) -> None:
+    with profile_requests():
+        with pytest.raises(ValueError, match="Invalid parameters"):
+            get_data_layer("FM01", "X", "*", client=http_client)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with pytest.raises(httpx.HTTPStatusError):
+                get_data_layer(
+                    "FM01", "X", "*", on_validation_error="warn", client=http_client
+                )
+
+    assert any("Invalid parameters" in str(item.message) for item in caught)
+
+
+def test_timings_do_not_affect_response_equality(http_client: httpx.Client) -> None:
+    with profile_requests():
+        profiled = get_metadata("FM01", client=http_client)
+
+    assert profiled.timings is not None
+    assert profiled == dataclasses.replace(profiled, timings=None)
+
+
+def test_client_profile_includes_throttle_wait(http_client: httpx.Client) -> None:
+    calls: list[str] = []
+
+    with BojClient(
+        client=http_client, min_request_interval=0.05, profile=True
+    ) as client:
+        client.get_data_layer("FM01", "M", "*")
+        with profile_requests(lambda endpoint, timings: calls.append(endpoint)):
+            response = client.get_data_layer("FM01", "Q", "*")
+
+    assert response.timings is not None
+    assert response.timings.throttle > 0.02
+    assert calls == ["getDataLayer"]
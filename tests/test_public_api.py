@@ -1,3 +1,5 @@
+import pytest
+
 import boj_stat_search as bss
 
 from boj_stat_search.shell.api import (
@@ -16,6 +18,7 @@ from boj_stat_search.shell.catalog import (
     MetadataExportReport as CatalogMetadataExportReport,
     generate_metadata_parquet_files as catalog_generate_metadata_parquet_files,
     list_series as catalog_list_series,
+    rank_series as catalog_rank_series,
     load_catalog_all as catalog_load_catalog_all,
     load_catalog_db as catalog_load_catalog_db,
     resolve_db as catalog_resolve_db,
@@ -26,12 +29,27 @@ from boj_stat_search.core import Db as CoreDb
 from boj_stat_search.core import Frequency as CoreFrequency
 from boj_stat_search.core import Layer as CoreLayer
 from boj_stat_search.core import Period as CorePeriod
+from boj_stat_search.core import SeriesCatalogResult as CoreSeriesCatalogResult
 from boj_stat_search.shell.display import show_layers as display_show_layers
+from boj_stat_search.shell.metrics import ClientMetrics as MetricsClientMetrics
+from boj_stat_search.shell.series_cache import SeriesCache as CacheSeriesCache
+from boj_stat_search.shell.planner import (
+    fetch_planned as planner_fetch_planned,
+    get_data_layer_planned as planner_get_data_layer_planned,
+)
+from boj_stat_search.shell.jobs import (
+    read_download_job as jobs_read_download_job,
+    run_download_job as jobs_run_download_job,
+)
+from boj_stat_search.shell.profiling import (
+    profile_requests as profiling_profile_requests,
+)
 from boj_stat_search.core.models import (
     BaseResponse as ModelsBaseResponse,
     DataResponse as ModelsDataResponse,
     MetadataEntry as ModelsMetadataEntry,
     MetadataResponse as ModelsMetadataResponse,
+    PhaseTimings as ModelsPhaseTimings,
     SeriesCatalogEntry as ModelsSeriesCatalogEntry,
 )
 
@@ -44,6 +62,10 @@ def test_top_level_re_exports_functional_api():
     assert bss.get_data_code is api_get_data_code
     assert bss.get_data_layer_raw is api_get_data_layer_raw
     assert bss.get_data_layer is api_get_data_layer
+    assert bss.get_data_layer_planned is planner_get_data_layer_planned
+    assert bss.fetch_planned is planner_fetch_planned
+    assert bss.run_download_job is jobs_run_download_job
+    assert bss.read_download_job is jobs_read_download_job
     assert (
         bss.generate_metadata_parquet_files is catalog_generate_metadata_parquet_files
     )
@@ -51,8 +73,10 @@ def test_top_level_re_exports_functional_api():
     assert bss.load_catalog_all is catalog_load_catalog_all
     assert bss.list_series is catalog_list_series
     assert bss.search_series is catalog_search_series
+    assert bss.rank_series is catalog_rank_series
     assert bss.resolve_db is catalog_resolve_db
     assert bss.show_layers is display_show_layers
+    assert bss.profile_requests is profiling_profile_requests
 
 
 def test_top_level_re_exports_key_types_and_models():
@@ -62,19 +86,25 @@ def test_top_level_re_exports_key_types_and_models():
     assert bss.Code is CoreCode
     assert bss.Period is CorePeriod
     assert bss.MetadataExportReport is CatalogMetadataExportReport
+    assert bss.ClientMetrics is MetricsClientMetrics
+    assert bss.SeriesCache is CacheSeriesCache
     assert bss.CatalogError is CatalogCatalogError
     assert bss.CatalogFetchError is CatalogCatalogFetchError
     assert bss.CatalogCacheError is CatalogCatalogCacheError
     assert bss.BaseResponse is ModelsBaseResponse
     assert bss.MetadataEntry is ModelsMetadataEntry
     assert bss.SeriesCatalogEntry is ModelsSeriesCatalogEntry
+    assert bss.SeriesCatalogResult is CoreSeriesCatalogResult
     assert bss.MetadataResponse is ModelsMetadataResponse
     assert bss.DataResponse is ModelsDataResponse
+    assert bss.PhaseTimings is ModelsPhaseTimings
 
 
 def test_top_level_has_expected_public_symbols():
     expected = {
         "BojClient",
+        "ClientMetrics",
+        "SeriesCache",
         "BojApiError",
         "get_metadata_raw",
         "get_metadata",
@@ -82,11 +112,16 @@ def test_top_level_has_expected_public_symbols():
         "get_data_code",
         "get_data_layer_raw",
         "get_data_layer",
+        "get_data_layer_planned",
+        "fetch_planned",
+        "run_download_job",
+        "read_download_job",
         "generate_metadata_parquet_files",
         "load_catalog_db",
         "load_catalog_all",
         "list_series",
         "search_series",
+        "rank_series",
         "resolve_db",
         "Db",
         "Frequency",
@@ -94,6 +129,7 @@ def test_top_level_has_expected_public_symbols():
         "Code",
         "Period",
         "MetadataExportReport",
+        "DownloadJobReport",
         "CatalogError",
         "CatalogFetchError",
         "CatalogCacheError",
@@ -101,9 +137,31 @@ def test_top_level_has_expected_public_symbols():
         "DbInfo",
         "MetadataEntry",
         "SeriesCatalogEntry",
+        "SeriesCatalogResult",
         "MetadataResponse",
         "DataResponse",
+        "PhaseTimings",
         "list_db",
         "show_layers",
+        "profile_requests",
     }
     assert set(bss.__all__) == expected
+
+
+def test_top_level_names_load_on_first_access():
+    assert "search_series" in dir(bss)
+    assert "load_catalog_db" in dir(bss)
+
+
+def test_top_level_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError, match="no_such_name"):
+        bss.no_such_name
+
+
+def test_lazy_packages_resolve_every_exported_name():
+    import boj_stat_search.core as core
+    import boj_stat_search.shell.catalog as catalog
+
+    for package in (bss, core, catalog):
+        for name in package.__all__:
+            assert getattr(package, name) is not None
@@ -0,0 +1,187 @@
+import pyarrow as pa
+import pytest
+
+from boj_stat_search.core.catalog_result import CATALOG_TABLE_SCHEMA
+from boj_stat_search.core.models import DataResponse
+from boj_stat_search.core.request_plan import (
+    PlannedRequest,
+    plan_data_requests,
+    stitch_data_responses,
+)
+from boj_stat_search.core.types import Frequency
+
+
+def _catalog(*rows: tuple[str, str, str, str, str]) -> pa.Table:
+    defaults = {name: "" for name in CATALOG_TABLE_SCHEMA.names}
+    defaults.update({f"layer{depth}": 0 for depth in range(1, 6)})
+    return pa.Table.from_pylist(
+        [
+            {
+                **defaults,
+                "db": db,
+                "series_code": code,
+                "frequency": frequency,
+                "start_of_time_series": start,
+                "end_of_time_series": end,
+            }
+            for db, code, frequency, start, end in rows
+        ],
+        schema=CATALOG_TABLE_SCHEMA,
+    )
+
+
+def _response(*entries: tuple[str, list[int]], parameter=None) -> DataResponse:
+    return DataResponse(
+        status=200,
+        message_id="M181000I",
+        message="ok",
+        date="2025-01-01T00:00:00.000+09:00",
+        parameter=parameter or {},
+        next_position=None,
+        result_set=tuple(
+            {
+                "SERIES_CODE": code,
+                "VALUES": {"SURVEY_DATES": dates, "VALUES": [1.0] * len(dates)},
+            }
+            for code, dates in entries
+        ),
+    )
+
+
+def test_plan_groups_series_by_db_and_frequency_in_catalog_order():
+    catalog = _catalog(
+        ("FM01", "A", "MONTHLY", "", ""),
+        ("FM01", "", "", "", ""),
+        ("FM01", "B", "QUARTERLY", "", ""),
+        ("FM01", "C", "MONTHLY", "", ""),
+        ("FM02", "D", "MONTHLY", "", ""),
+        ("FM02", "E", "HOURLY", "", ""),
+        ("FM01", "F", "MONTHLY", "", ""),
+    )
+
+    plan = plan_data_requests(catalog, max_codes=2)
+
+    assert plan == (
+        PlannedRequest("FM01", ("A", "C"), Frequency.MONTHLY, None, None),
+        PlannedRequest("FM01", ("F",), Frequency.MONTHLY, None, None),
+        PlannedRequest("FM01", ("B",), Frequency.QUARTERLY, None, None),
+        PlannedRequest("FM02", ("D",), Frequency.MONTHLY, None, None),
+    )
+
+
+def test_plan_splits_catalog_span_into_windows_keeping_open_bounds():
+    catalog = _catalog(
+        ("FM01", "A", "MONTHLY", "200001", "200912"),
+        ("FM01", "B", "MONTHLY", "200301", "200512"),
+    )
+
+    plan = plan_data_requests(catalog, max_observations=96)
+
+    assert [(item.start_date, item.end_date) for item in plan] == [
+        (None, "200312"),
+        ("200401", "200712"),
+        ("200801", None),
+    ]
+
+
+def test_plan_clips_windows_to_the_requested_range():
+    catalog = _catalog(("FM01", "A", "QUARTERLY", "199001", "202503"))
+
+    plan = plan_data_requests(catalog, "201002", "201201", max_observations=4)
+
+    assert [(item.start_date, item.end_date) for item in plan] == [
+        ("201002", "201101"),
+        ("201102", "201201"),
+    ]
+
+
+def test_plan_reads_quarterly_catalog_span_in_request_notation():
+    # 202503 is 2025Q3, not March 2025.
+    catalog = _catalog(("FM01", "A", "QUARTERLY", "202301", "202503"))
+
+    plan = plan_data_requests(catalog, max_observations=3)
+
+    assert [(item.start_date, item.end_date) for item in plan] == [
+        (None, "202303"),
+        ("202304", "202402"),
+        ("202403", "202501"),
+        ("202502", None),
+    ]
+
+
+def test_plan_reads_semiannual_catalog_span_in_request_notation():
+    # 201002 is the second half of 2010, not February.
+    catalog = _catalog(("FM01", "A", "SEMIANNUAL", "201002", "201202"))
+
+    plan = plan_data_requests(catalog, max_observations=2)
+
+    assert [(item.start_date, item.end_date) for item in plan] == [
+        (None, "201101"),
+        ("201102", "201201"),
+        ("201202", None),
+    ]
+
+
+def test_plan_sizes_daily_windows_by_days_per_month():
+    catalog = _catalog(("FM01", "A", "DAILY", "20100104", "20100630"))
+
+    plan = plan_data_requests(catalog, max_observations=62)
+
+    assert [(item.start_date, item.end_date) for item in plan] == [
+        (None, "201002"),
+        ("201003", "201004"),
+        ("201005", None),
+    ]
+
+
+def test_plan_keeps_one_request_without_known_bounds():
+    catalog = _catalog(("FM01", "A", "MONTHLY", "", "201012"))
+
+    plan = plan_data_requests(catalog, "201101", None, max_observations=1)
+
+    assert plan == (PlannedRequest("FM01", ("A",), Frequency.MONTHLY, "201101", None),)
+
+
+@pytest.mark.parametrize(
+    ("options", "message"),
+    [
+        ({"max_codes": 0}, "max_codes"),
+        ({"max_codes": 251}, "max_codes"),
+        ({"max_observations": 0}, "max_observations"),
+    ],
+)
+def test_plan_rejects_invalid_limits(options, message):
+    with pytest.raises(ValueError, match=message):
+        plan_data_requests(_catalog(), **options)
+
+
+def test_stitch_concatenates_windows_in_order():
+    stitched = stitch_data_responses(
+        [
+            _response(("A", [201001]), ("B", [201001]), parameter={"DB": "FM01"}),
+            _response(("C", [201001])),
+            _response(("A", [201002, 201003]), ("B", [])),
+        ]
+    )
+
+    assert [entry["SERIES_CODE"] for entry in stitched.result_set] == ["A", "B", "C"]
+    assert stitched.result_set[0]["VALUES"]["SURVEY_DATES"] == [
+        201001,
+        201002,
+        201003,
+    ]
+    assert stitched.parameter == {"DB": "FM01"}
+    assert stitched.next_position is None
+
+
+def test_stitch_does_not_modify_responses():
+    first = _response(("A", [201001]))
+
+    stitch_data_responses([first, _response(("A", [201002]))], parameter={"X": "1"})
+
+    assert first.result_set[0]["VALUES"]["SURVEY_DATES"] == [201001]
+
+
+def test_stitch_requires_a_response():
+    with pytest.raises(ValueError, match="responses"):
+        stitch_data_responses([])
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import pyarrow as pa
+import pytest
+
+from boj_stat_search.core.columnar import table_from_ipc_bytes, table_to_ipc_bytes
+from boj_stat_search.core.search_index import (
+    build_search_index,
+    normalize_search_text,
+    search_index_from_table,
+    search_index_rows,
+    search_index_to_table,
+)
+
+
+def _table(rows: list[tuple[str, str, str, str]]) -> pa.Table:
+    return pa.table(
+        {
+            "series_code": [f"CODE{index}" for index in range(len(rows))],
+            "name_j": [row[0] for row in rows],
+            "name_en": [row[1] for row in rows],
+            "category_j": [row[2] for row in rows],
+            "category_en": [row[3] for row in rows],
+            "notes_j": ["" for _ in rows],
+            "notes_en": ["See note(a)." for _ in rows],
+        }
+    )
+
+
+_ROWS = [
+    ("対米ドル為替レート", "Exchange Rate USD/JPY", "為替", "Foreign Exchange"),
+    ("マネーストック", "Money Stock M2", "マネー", "Money"),
+    (
+        "円の実効為替レート",
+        "Effective Exchange Rate of Yen",
+        "為替",
+        "Foreign Exchange",
+    ),
+    ("国際与信統計", "International Claims on Japan", "BIS", "BIS"),
+]
+
+
+def _rows(terms: list[str], rows=_ROWS) -> list[int]:
+    return search_index_rows(build_search_index(_table(rows)), terms).to_pylist()
+
+
+def test_search_index_matches_japanese_bigrams() -> None:
+    assert _rows(["為替レート"]) == [0, 2]
+
+
+def test_search_index_matches_single_japanese_character() -> None:
+    assert _rows(["円"]) == [2]
+
+
+def test_search_index_matches_english_words_case_insensitive() -> None:
+    assert _rows(["EXCHANGE rate"]) == [0, 2]
+
+
+def test_search_index_matches_word_fragments() -> None:
+    assert _rows(["xchan"]) == [0, 2]
+    assert _rows(["m2"]) == [1]
+
+
+def test_search_index_requires_every_term() -> None:
+    assert _rows(["exchange", "yen"]) == [2]
+    assert _rows(["claims", "為替"]) == []
+
+
+def test_search_index_keeps_phrase_semantics_for_one_term() -> None:
+    assert _rows(["rate exchange"]) == []
+
+
+def test_search_index_matches_punctuation_only_terms_by_scan() -> None:
+    assert _rows(["/"]) == [0]
+
+
+def test_search_index_does_not_match_across_fields() -> None:
+    assert _rows(["stockマネー"]) == []
+
+
+def test_search_index_returns_empty_for_unknown_gram() -> None:
+    assert _rows(["xyzzy"]) == []
+
+
+def test_search_index_round_trips_through_ipc() -> None:
+    table = _table(_ROWS)
+    index = build_search_index(table)
+
+    restored = search_index_from_table(
+        table_from_ipc_bytes(table_to_ipc_bytes(search_index_to_table(index)))
+    )
+
+    assert restored.matches_table(table)
+    assert search_index_rows(restored, ["exchange", "yen"]).to_pylist() == [2]
+
+
+def test_search_index_matches_table_rejects_other_rows() -> None:
+    index = build_search_index(_table(_ROWS))
+
+    assert not index.matches_table(_table(_ROWS[:2]))
+    assert not index.matches_table(_table(_ROWS).slice(1))
+
+
+def test_search_index_from_table_rejects_unknown_version() -> None:
+    table = search_index_to_table(build_search_index(_table(_ROWS)))
+
+    with pytest.raises(ValueError, match="search index"):
+        search_index_from_table(table.replace_schema_metadata({}))
+
+
+def test_build_search_index_requires_search_columns() -> None:
+    with pytest.raises(ValueError, match="name_en"):
+        build_search_index(pa.table({"series_code": ["A"], "name_j": ["x"]}))
+
+
+def test_build_search_index_handles_empty_table() -> None:
+    assert _rows(["rate"], rows=[]) == []
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("ＣＰＩ", "cpi"),
+        ("Ｍ２", "m2"),
+        ("ﾏﾈｰｽﾄｯｸ", "マネーストック"),
+        ("まねーすとっく", "マネーストック"),
+        ("ﾊﾟﾊﾞ", "パバ"),
+        ("Exchange Rate", "exchange rate"),
+    ],
+)
+def test_normalize_search_text_folds_width_case_and_kana(
+    text: str, expected: str
+) -> None:
+    assert normalize_search_text(text) == expected
+
+
+def test_search_index_matches_across_width_and_kana_variants() -> None:
+    rows = [
+        ("消費者物価指数", "ＣＰＩ", "物価", "Prices"),
+        ("ﾏﾈｰｽﾄｯｸ", "Money Stock", "マネー", "Money"),
+    ]
+
+    assert _rows(["cpi"], rows=rows) == [0]
+    assert _rows(["ＣＰＩ"], rows=rows) == [0]
+    assert _rows(["マネー"], rows=rows) == [1]
+    assert _rows(["まねー"], rows=rows) == [1]
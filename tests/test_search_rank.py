@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import pyarrow as pa
+import pytest
+
+from boj_stat_search.core.search_index import build_search_index
+from boj_stat_search.core.search_rank import (
+    DEFAULT_FIELD_WEIGHTS,
+    TermMatches,
+    match_search_terms,
+    resolve_field_weights,
+    score_term_matches,
+    top_ranked,
+)
+
+
+def _table(rows: list[dict[str, str]]) -> pa.Table:
+    fields = ("name_j", "name_en", "category_j", "category_en", "notes_j", "notes_en")
+    return pa.table(
+        {
+            "series_code": [f"CODE{index}" for index in range(len(rows))],
+            **{name: [row.get(name, "") for row in rows] for name in fields},
+        }
+    )
+
+
+def _ranked(
+    rows: list[dict[str, str]], terms: list[str], **kwargs: object
+) -> list[tuple[int, float]]:
+    matches = match_search_terms(build_search_index(_table(rows)), terms)
+    scores = score_term_matches(matches, **kwargs)  # type: ignore[arg-type]
+    ranked = top_ranked(matches.rows, scores)
+    return list(zip(ranked["row"].to_pylist(), ranked["score"].to_pylist()))
+
+
+def test_match_search_terms_keeps_rows_matching_any_term() -> None:
+    matches = match_search_terms(
+        build_search_index(
+            _table(
+                [
+                    {"name_en": "Call Rate"},
+                    {"name_en": "Money Stock"},
+                    {"notes_en": "Exchange rate basis"},
+                ]
+            )
+        ),
+        ["rate", "stock"],
+    )
+
+    assert matches.rows.to_pylist() == [0, 1, 2]
+    assert matches.num_rows == 3
+    assert matches.counts[0][1].to_pylist() == [1, 0, 0]
+    assert matches.counts[0][5].to_pylist() == [0, 0, 1]
+    assert matches.counts[1][1].to_pylist() == [0, 1, 0]
+
+
+def test_match_search_terms_rejects_empty_terms() -> None:
+    with pytest.raises(ValueError, match="terms"):
+        match_search_terms(build_search_index(_table([{"name_en": "x"}])), [])
+
+
+def test_score_term_matches_prefers_name_over_notes() -> None:
+    ranked = _ranked(
+        [{"notes_en": "Exchange rate"}, {"name_en": "Exchange rate"}, {}],
+        ["exchange"],
+    )
+
+    assert [row for row, _ in ranked] == [1, 0]
+
+
+def test_score_term_matches_respects_custom_field_weights() -> None:
+    ranked = _ranked(
+        [{"notes_en": "Exchange rate"}, {"name_en": "Exchange rate"}, {}],
+        ["exchange"],
+        field_weights={"name_en": 0.1, "notes_en": 5.0},
+    )
+
+    assert [row for row, _ in ranked] == [0, 1]
+
+
+def test_score_term_matches_prefers_rows_matching_more_terms() -> None:
+    ranked = _ranked(
+        [
+            {"name_en": "Yen exchange"},
+            {"name_en": "Effective exchange rate of yen"},
+            {"name_en": "Call rate"},
+        ],
+        ["exchange", "rate", "yen"],
+    )
+
+    assert ranked[0][0] == 1
+
+
+def test_score_term_matches_weights_rare_terms_higher() -> None:
+    rows = [{"name_en": "Rate"} for _ in range(5)] + [{"name_en": "Tankan"}]
+
+    ranked = _ranked(rows, ["rate", "tankan"])
+
+    assert ranked[0][0] == 5
+    assert ranked[0][1] > ranked[1][1] > 0
+
+
+def test_score_term_matches_favours_shorter_fields() -> None:
+    ranked = _ranked(
+        [
+            {"name_en": "Loans and discounts outstanding by industry, city banks"},
+            {"name_en": "Loans"},
+        ],
+        ["loans"],
+    )
+
+    assert [row for row, _ in ranked] == [1, 0]
+
+
+def test_term_matches_concat_offsets_rows_and_sums_statistics() -> None:
+    first = match_search_terms(
+        build_search_index(_table([{"name_en": "Rate"}, {"name_en": "x"}])), ["rate"]
+    )
+    second = match_search_terms(
+        build_search_index(_table([{"name_en": "Call rate"}])), ["rate"]
+    )
+
+    combined = TermMatches.concat([first, second.offset(2)])
+
+    assert combined.rows.to_pylist() == [0, 2]
+    assert combined.num_rows == 3
+    assert combined.length_totals[1] == 4 + 1 + 9
+
+
+def test_term_matches_concat_rejects_mismatched_terms() -> None:
+    index = build_search_index(_table([{"name_en": "Rate"}]))
+
+    with pytest.raises(ValueError, match="same number of terms"):
+        TermMatches.concat(
+            [
+                match_search_terms(index, ["rate"]),
+                match_search_terms(index, ["rate", "x"]),
+            ]
+        )
+
+
+def test_top_ranked_selects_limit_in_descending_order() -> None:
+    rows = pa.array(range(10), type=pa.int64())
+    scores = pa.array([float(value % 4) for value in range(10)])
+
+    ranked = top_ranked(rows, scores, limit=3)
+
+    assert ranked["row"].to_pylist() == [3, 7, 2]
+    assert ranked["score"].to_pylist() == [3.0, 3.0, 2.0]
+
+
+def test_top_ranked_without_limit_sorts_everything() -> None:
+    ranked = top_ranked(pa.array([0, 1, 2]), pa.array([1.0, 3.0, 2.0]))
+
+    assert ranked["row"].to_pylist() == [1, 2, 0]
+
+
+def test_top_ranked_rejects_negative_limit() -> None:
+    with pytest.raises(ValueError, match="limit"):
+        top_ranked(pa.array([0]), pa.array([1.0]), limit=-1)
+
+
+def test_resolve_field_weights_merges_over_defaults() -> None:
+    weights = resolve_field_weights({"notes_en": 2})
+
+    assert weights["notes_en"] == 2.0
+    assert weights["name_en"] == DEFAULT_FIELD_WEIGHTS["name_en"]
+
+
+@pytest.mark.parametrize(
+    ("field_weights", "message"),
+    [
+        ({"unit_en": 1.0}, "keys must be one of"),
+        ({"name_en": "high"}, "must be numbers"),
+        ({"name_en": -1.0}, "must be >= 0"),
+    ],
+)
+def test_resolve_field_weights_rejects_invalid_values(
+    field_weights: dict[str, object], message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        resolve_field_weights(field_weights)  # type: ignore[arg-type]
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from boj_stat_search.core.mock_api import MockDataset
+from boj_stat_search.core.types import Code
+from boj_stat_search.shell.api import get_data_code
+from boj_stat_search.shell.client import BojClient
+from boj_stat_search.shell.metrics import ClientMetrics
+from boj_stat_search.shell.mock_server import MockBojServer
+from boj_stat_search.shell.series_cache import SeriesCache
+
+MONTHLY = "FM01X00001"
+QUARTERLY = "FM01X00002"
+OTHER_MONTHLY = "FM01X00003"
+
+
+@pytest.fixture
+def server() -> MockBojServer:
+    return MockBojServer(
+        MockDataset(series_per_db=4, start_year=1995, end_year=2025, page_size=1)
+    )
+
+
+@pytest.fixture
+def http_client(server: MockBojServer) -> Iterator[httpx.Client]:
+    with server.client() as client:
+        yield client
+
+
+def _requested_ranges(server: MockBojServer) -> list[tuple[str, str, str]]:
+    return [
+        (
+            url.params.get("code", ""),
+            url.params.get("startDate", ""),
+            url.params.get("endDate", ""),
+        )
+        for url in server.requests
+    ]
+
+
+def _values(response) -> dict[str, list[int]]:
+    return {
+        entry["SERIES_CODE"]: entry["VALUES"]["SURVEY_DATES"]
+        for entry in response.result_set
+    }
+
+
+def test_overlapping_range_fetches_only_missing_edges(
+    tmp_path: Path, server: MockBojServer, http_client: httpx.Client
+) -> None:
+    cache = SeriesCache(tmp_path)
+
+    cache.get_data_code("FM01", MONTHLY, "200501", "201012", client=http_client)
+    server.reset_stats()
+    response = cache.get_data_code(
+        "FM01", MONTHLY, "200001", "202012", client=http_client
+    )
+
+    assert _requested_ranges(server) == [
+        (MONTHLY, "200001", "200412"),
+        (MONTHLY, "201101", "202012"),
+    ]
+    direct = get_data_code("FM01", MONTHLY, "200001", "202012", client=http_client)
+    assert _values(response) == _values(direct)
+    assert (
+        response.result_set[0]["VALUES"]["VALUES"]
+        == direct.result_set[0]["VALUES"]["VALUES"]
+    )
+
+
+def test_covered_range_is_served_without_requests(
+    tmp_path: Path, server: MockBojServer, http_client: httpx.Client
+) -> None:
+    cache = SeriesCache(tmp_path)
+    cache.get_data_code("FM01", QUARTERLY, "200001", "201004", client=http_client)
+    server.reset_stats()
+
+    response = cache.get_data_code(
+        "FM01", QUARTERLY, "200502", "200503", client=http_client
+    )
+
+    assert server.request_count == 0
+    assert _values(response) == {QUARTERLY: [200504, 200507]}
+    assert response.parameter["STARTDATE"] == "200502"
+
+
+def test_series_are_grouped_by_missing_range_and_paged(
+    tmp_path: Path, server: MockBojServer, http_client: httpx.Client
+) -> None:
+    cache = SeriesCache(tmp_path)
+    codes = Code(f"FM01'{MONTHLY}", f"FM01'{OTHER_MONTHLY}")
+    cache.get_data_code(
+        code=codes, start_date="201001", end_date="201012", client=http_client
+    )
+    cache.get_data_code("FM01", QUARTERLY, "201001", "201004", client=http_client)
+    server.reset_stats()
+
+    response = cache.get_data_code(
+        "FM01", f"{MONTHLY},{QUARTERLY},{OTHER_MONTHLY}", "201001", client=http_client
+    )
+
+    # All three lack everything from 2011 on, which "201101" requests for
+    # both frequencies; page_size=1 returns one series per page.
+    assert (
+        _requested_ranges(server)
+        == [(f"{MONTHLY},{QUARTERLY},{OTHER_MONTHLY}", "201101", "")] * 3
+    )
+    assert [entry["SERIES_CODE"] for entry in response.result_set] == [
+        MONTHLY,
+        QUARTERLY,
+        OTHER_MONTHLY,
+    ]
+    assert _values(response)[QUARTERLY][:2] == [201001, 201004]
+    assert _values(response)[QUARTERLY][-1] == 202510
+
+
+def test_expired_series_are_fetched_again(
+    tmp_path: Path, server: MockBojServer, http_client: httpx.Client
+) -> None:
+    cache = SeriesCache(tmp_path, ttl_seconds=0)
+    cache.get_data_code("FM01", MONTHLY, "201001", "201012", client=http_client)
+    server.reset_stats()
+
+    cache.get_data_code("FM01", MONTHLY, "201001", "201012", client=http_client)
+
+    assert _requested_ranges(server) == [(MONTHLY, "201001", "201012")]
+
+
+def test_client_routes_data_code_calls_through_series_cache(
+    tmp_path: Path, server: MockBojServer, http_client: httpx.Client
+) -> None:
+    metrics = ClientMetrics()
+
+    with BojClient(
+        client=http_client,
+        min_request_interval=0,
+        metrics=metrics,
+        series_cache=SeriesCache(tmp_path),
+    ) as client:
+        first = client.get_data_code("FM01", MONTHLY, "201001", "201006")
+        second = client.get_data_code("FM01", MONTHLY, "201003", "201006")
+
+    assert server.request_count == 1
+    assert _values(second)[MONTHLY] == _values(first)[MONTHLY][2:]
+    assert metrics.cache == {("series", "miss"): 1, ("series", "hit"): 1}
+
+
+def test_series_cache_requires_db(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="db: must be given"):
+        SeriesCache(tmp_path).get_data_code(code="UNKNOWN_SERIES_CODE")
+
+
+def test_clear_removes_cached_series(
+    tmp_path: Path, server: MockBojServer, http_client: httpx.Client
+) -> None:
+    cache = SeriesCache(tmp_path)
+    cache.get_data_code("FM01", MONTHLY, "201001", "201012", client=http_client)
+
+    cache.clear()
+    server.reset_stats()
+    cache.get_data_code("FM01", MONTHLY, "201001", "201012", client=http_client)
+
+    assert server.request_count == 1
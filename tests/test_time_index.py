@@ -0,0 +1,230 @@
+import datetime
+
+import pyarrow as pa
+import pytest
+
+from boj_stat_search.core.models import DataResponse
+from boj_stat_search.core.time_index import (
+    observation_dates,
+    period_range,
+    resolve_frequency,
+    survey_dates_to_dates,
+    survey_dates_to_ordinals,
+)
+from boj_stat_search.core.types import Frequency, Period
+
+
+def _dates(values: list, frequency: str) -> list:
+    return survey_dates_to_dates(pa.array(values, pa.int64()), frequency).to_pylist()
+
+
+def test_resolve_frequency_accepts_codes_and_series_names():
+    assert resolve_frequency("Q") is Frequency.QUARTERLY
+    assert resolve_frequency("ANNUAL(MAR)") is Frequency.FISCAL_YEAR
+    assert resolve_frequency("WEEKLY(MONDAY)") is Frequency.WEEKLY
+    assert resolve_frequency(Frequency.DAILY) is Frequency.DAILY
+
+    with pytest.raises(ValueError, match="frequency: unknown frequency"):
+        resolve_frequency("HOURLY")
+
+
+@pytest.mark.parametrize(
+    ("values", "frequency", "expected"),
+    [
+        ([2010], "CY", [datetime.date(2010, 1, 1)]),
+        ([2010], "FY", [datetime.date(2010, 4, 1)]),
+        (
+            [201001, 201007],
+            "CH",
+            [datetime.date(2010, 1, 1), datetime.date(2010, 7, 1)],
+        ),
+        (
+            [201004, 201012],
+            "FH",
+            [datetime.date(2010, 4, 1), datetime.date(2010, 10, 1)],
+        ),
+        (
+            [201005, 201012],
+            "Q",
+            [datetime.date(2010, 4, 1), datetime.date(2010, 10, 1)],
+        ),
+        ([201005], "MONTHLY", [datetime.date(2010, 5, 1)]),
+        (
+            [19980105, 20240229],
+            "D",
+            [datetime.date(1998, 1, 5), datetime.date(2024, 2, 29)],
+        ),
+    ],
+)
+def test_survey_dates_to_dates_aligns_to_period_start(values, frequency, expected):
+    assert _dates(values, frequency) == expected
+
+
+def test_survey_dates_to_dates_matches_calendar_for_every_day():
+    days = [
+        datetime.date(1899, 12, 1) + datetime.timedelta(days=offset)
+        for offset in range(0, 60_000, 7)
+    ]
+    survey_dates = [day.year * 10_000 + day.month * 100 + day.day for day in days]
+
+    assert _dates(survey_dates, "D") == days
+
+
+def test_survey_dates_to_dates_handles_mixed_layouts_and_nulls():
+    assert _dates([2010, 201005, 20100517, None], "D") == [
+        datetime.date(2010, 1, 1),
+        datetime.date(2010, 5, 1),
+        datetime.date(2010, 5, 17),
+        None,
+    ]
+    assert _dates([], "Q") == []
+
+
+def test_survey_dates_to_dates_rejects_out_of_range_years():
+    with pytest.raises(ValueError, match="survey_date: year must be between"):
+        _dates([99990101], "D")
+
+
+def test_survey_dates_to_dates_accepts_chunked_arrays():
+    chunked = pa.chunked_array([[201001], [201002]], pa.int64())
+
+    assert survey_dates_to_dates(chunked, "M").to_pylist() == [
+        datetime.date(2010, 1, 1),
+        datetime.date(2010, 2, 1),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("values", "frequency", "expected"),
+    [
+        ([1969, 1970, 2010], "CY", [-1, 0, 40]),
+        ([1970, 1971], "FY", [0, 1]),
+        ([196912, 197001, 197004], "Q", [-1, 0, 1]),
+        ([197003, 197004, 197010], "FH", [-1, 0, 1]),
+        ([196912, 197001, 201001], "M", [-1, 0, 480]),
+        ([19691231, 19700101, 19700102], "D", [-1, 0, 1]),
+        ([19691228, 19691229, 19700104, 19700105], "W", [-1, 0, 0, 1]),
+    ],
+)
+def test_survey_dates_to_ordinals_counts_periods_from_1970(values, frequency, expected):
+    ordinals = survey_dates_to_ordinals(pa.array(values, pa.int64()), frequency)
+
+    assert ordinals.to_pylist() == expected
+
+
+@pytest.mark.parametrize(
+    ("survey_date", "frequency", "expected"),
+    [
+        (2010, "CY", "2010"),
+        (2010, "FY", "2010"),
+        (201007, "CH", "201002"),
+        (201010, "FH", "201002"),
+        (201005, "Q", "201002"),
+        (201005, "M", "201005"),
+        (20100105, "W", None),
+        (20100105, "D", None),
+    ],
+)
+def test_survey_date_ordinals_round_trip_through_period(
+    survey_date, frequency, expected
+):
+    (ordinal,) = survey_dates_to_ordinals(
+        pa.array([survey_date], pa.int64()), frequency
+    ).to_pylist()
+
+    if expected is None:
+        with pytest.raises(ValueError, match="requested by month"):
+            Period.from_ordinal(ordinal, frequency)
+        with pytest.raises(ValueError, match="requested by month"):
+            period_range("201001", "201001", frequency)
+        return
+    period = Period.from_ordinal(ordinal, frequency)
+    assert period.value == expected
+    assert period_range(period, period, frequency).to_pylist() == [ordinal]
+
+
+def test_period_range_returns_int32_ordinals():
+    ordinals = period_range("201003", "201102", "Q")
+
+    assert ordinals.type == pa.int32()
+    assert ordinals.to_pylist() == [162, 163, 164, 165]
+    assert [Period.from_ordinal(value, "Q").value for value in [162, 165]] == [
+        "201003",
+        "201102",
+    ]
+
+
+def test_period_range_converts_periods_of_other_frequencies():
+    ordinals = period_range(Period.month(2010, 2), Period("2011"), "FY")
+
+    assert ordinals.to_pylist() == [39, 40, 41]
+
+
+def test_period_range_is_empty_when_end_precedes_start():
+    assert period_range("2011", "2010", "CY").to_pylist() == []
+
+
+def test_observation_dates_resolves_each_row_frequency():
+    table = pa.table(
+        {
+            "frequency": ["QUARTERLY", "DAILY", "ANNUAL(MAR)", "UNKNOWN"],
+            "survey_date": pa.array([201005, 20100517, 2010, 202001], pa.int64()),
+        }
+    )
+
+    assert observation_dates(table).to_pylist() == [
+        datetime.date(2010, 4, 1),
+        datetime.date(2010, 5, 17),
+        datetime.date(2010, 4, 1),
+        datetime.date(2020, 1, 1),
+    ]
+
+
+def test_data_response_to_arrow_adds_date_column():
+    response = DataResponse(
+        status=200,
+        message_id="M181000I",
+        message="ok",
+        date="2026-02-21T15:58:56.071+09:00",
+        parameter={},
+        next_position=None,
+        result_set=(
+            {
+                "SERIES_CODE": "A",
+                "FREQUENCY": "QUARTERLY",
+                "VALUES": {"SURVEY_DATES": [202401, 202404], "VALUES": [1.0, 2.0]},
+            },
+        ),
+    )
+
+    table = response.to_arrow()
+
+    assert table.column_names == [
+        "series_code",
+        "frequency",
+        "survey_date",
+        "value",
+        "date",
+    ]
+    assert table.schema.field("date").type == pa.date32()
+    assert table["date"].to_pylist() == [
+        datetime.date(2024, 1, 1),
+        datetime.date(2024, 4, 1),
+    ]
+
+
+def test_empty_data_response_to_arrow_has_date_column():
+    response = DataResponse(
+        status=200,
+        message_id="M181000I",
+        message="ok",
+        date="",
+        parameter={},
+        next_position=None,
+        result_set=(),
+    )
+
+    table = response.to_arrow()
+
+    assert table.num_rows == 0
+    assert table.schema.field("date").type == pa.date32()
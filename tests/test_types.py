@@ -72,6 +72,100 @@ def test_period_rejects_invalid_month():
         Period.month(2025, 13)
 
 
+def test_period_factories_attach_their_frequency():
+    assert Period.year(2025).frequency is Frequency.CALENDAR_YEAR
+    assert Period.half(2025, 1, "FH").frequency is Frequency.FISCAL_HALF
+    assert Period.quarter(2025, 1).frequency is Frequency.QUARTERLY
+    assert Period.month(2025, 1, Frequency.DAILY).frequency is Frequency.DAILY
+    assert Period("2025").frequency is None
+
+
+def test_period_rejects_frequency_not_matching_factory_or_value():
+    with pytest.raises(ValueError, match="for Period.year"):
+        Period.year(2025, "Q")
+    with pytest.raises(ValueError, match="QQ must be between 01 and 04"):
+        Period("202505", "Q")
+
+
+def test_period_equality_includes_frequency():
+    assert Period.year(2025) == Period("2025", "CY")
+    assert hash(Period.year(2025)) == hash(Period("2025", "CY"))
+    assert Period.year(2025) != Period("2025")
+    assert Period.year(2025) != Period.year(2025, "FY")
+    assert Period.year(2025).value == Period("2025").value
+
+
+@pytest.mark.parametrize(
+    ("period", "expected"),
+    [
+        (Period.year(1970), 0),
+        (Period.year(1970, "FY"), 0),
+        (Period.half(1971, 2), 3),
+        (Period.quarter(1969, 4), -1),
+        (Period.month(2010, 1), 480),
+    ],
+)
+def test_period_ordinal_counts_periods_from_1970(period, expected):
+    assert period.ordinal == expected
+    assert Period.from_ordinal(expected, period.frequency) == period
+
+
+@pytest.mark.parametrize("frequency", ["W", "D"])
+def test_period_ordinal_rejects_weekly_and_daily(frequency):
+    period = Period.month(2010, 1, frequency)
+
+    with pytest.raises(ValueError, match="requested by month"):
+        assert period.ordinal
+    with pytest.raises(ValueError, match="requested by month"):
+        Period.from_ordinal(10959, frequency)
+    assert period + 1 == Period.month(2010, 2, frequency)
+    assert period < Period.month(2010, 2, frequency)
+
+
+def test_period_addition_and_subtraction_move_by_periods():
+    start = Period.quarter(2010, 3)
+
+    assert start + 2 == Period.quarter(2011, 1)
+    assert 2 + start == Period.quarter(2011, 1)
+    assert start - 3 == Period.quarter(2009, 4)
+    assert (start + 6) - start == 6
+    assert (start + 1).frequency is Frequency.QUARTERLY
+
+
+def test_period_comparison_is_chronological():
+    periods = [Period.month(2011, 1), Period.month(2010, 12), Period.month(2010, 2)]
+
+    assert sorted(periods) == [periods[2], periods[1], periods[0]]
+    assert Period.half(2010, 2) > Period.half(2010, 1)
+    assert Period.year(2010) <= Period.year(2010)
+
+
+def test_period_arithmetic_requires_matching_frequency():
+    with pytest.raises(ValueError, match="frequency is required"):
+        Period("2025") + 1
+    with pytest.raises(ValueError, match="frequencies Q and M"):
+        assert Period.quarter(2025, 1) < Period.month(2025, 1)
+    with pytest.raises(TypeError):
+        assert Period.year(2025) + 1.5  # type: ignore[operator]
+
+
+@pytest.mark.parametrize(
+    ("period", "frequency", "how", "expected"),
+    [
+        (Period.quarter(2010, 1), "FY", "start", "2009"),
+        (Period.quarter(2010, 2), "FY", "start", "2010"),
+        (Period.year(2010, "FY"), "Q", "start", "201002"),
+        (Period.year(2010, "FY"), "M", "end", "201103"),
+        (Period.month(2010, 9), "FH", "start", "201001"),
+        (Period.half(2010, 2), "CY", "end", "2010"),
+    ],
+)
+def test_period_asfreq_converts_between_frequencies(period, frequency, how, expected):
+    converted = period.asfreq(frequency, how)
+
+    assert converted == Period(expected, frequency)
+
+
 def test_code_accepts_plain_series_code():
     code = Code("MADR1Z@D")
 
@@ -1,11 +1,15 @@
-from typing import cast
+from typing import Any, cast
 
 import pytest
 
 from boj_stat_search.core.types import Code, ErrorMode, Frequency, Layer, Period
 from boj_stat_search.core.url_builder import (
+    DataCodeSpec,
+    DataLayerSpec,
     build_data_code_api_url,
+    build_data_code_api_urls,
     build_data_layer_api_url,
+    build_data_layer_api_urls,
     build_metadata_api_url,
 )
 
@@ -386,3 +390,72 @@ def test_build_data_layer_api_url_raises_on_invalid_on_validation_error_mode():
             layer="*",
             on_validation_error=cast(ErrorMode, "invalid"),
         )
+
+
+_DATA_CODE_SPECS: list[tuple[Any, ...]] = [
+    DataCodeSpec("FM01", "STRDCLUCON", "202401", "202412"),
+    DataCodeSpec("FM01", "A,B,C", "202401", "202412", 3),
+    DataCodeSpec(None, Code("FM01'STRDCLUCON", "STRACLUCON"), Period.year(2024)),
+    ("CO", "TK99F1000601GCQ01000", None, Period.quarter(2025, 1)),
+    DataCodeSpec("FM01", "A B", "2024"),
+]
+
+_DATA_LAYER_SPECS: list[tuple[Any, ...]] = [
+    DataLayerSpec("MD10", Frequency.QUARTERLY, Layer(1, "*"), "202401", "202404"),
+    DataLayerSpec("MD10", "q", "1,*", Period.quarter(2024, 1), None, 256),
+    ("BP01", "M", "1,1,1", Period.month(2024, 1), Period.month(2024, 12)),
+    DataLayerSpec("BP01", "CY", "*"),
+]
+
+
+def test_build_data_code_api_urls_matches_single_builder():
+    result = build_data_code_api_urls(_DATA_CODE_SPECS)
+
+    assert result == [build_data_code_api_url(*spec) for spec in _DATA_CODE_SPECS]
+
+
+def test_build_data_layer_api_urls_matches_single_builder():
+    result = build_data_layer_api_urls(_DATA_LAYER_SPECS)
+
+    assert result == [build_data_layer_api_url(*spec) for spec in _DATA_LAYER_SPECS]
+
+
+def test_build_data_code_api_urls_reports_invalid_spec_position():
+    specs = [
+        DataCodeSpec("FM01", "A"),
+        DataCodeSpec("FM01", "A,,B"),
+        DataCodeSpec("UNKNOWN", "A"),
+    ]
+
+    with pytest.raises(ValueError, match="spec 1: code: .* \\(and 1 more"):
+        build_data_code_api_urls(specs)
+
+
+def test_build_data_layer_api_urls_warns_per_invalid_spec():
+    specs = [
+        DataLayerSpec("MD10", "Q", "1,a"),
+        DataLayerSpec("MD10", "Q", "1"),
+        DataLayerSpec("MD10", "X", "1"),
+    ]
+
+    with pytest.warns(UserWarning) as caught:
+        result = build_data_layer_api_urls(specs, on_validation_error="warn")
+
+    assert [str(item.message).split(":")[0] for item in caught] == [
+        "Invalid parameters in spec 0",
+        "Invalid parameters in spec 2",
+    ]
+    assert result == [
+        build_data_layer_api_url(**spec._asdict(), on_validation_error="ignore")
+        for spec in specs
+    ]
+
+
+def test_build_data_code_api_urls_reports_conflicting_db_position():
+    with pytest.raises(ValueError, match="spec 0: db/code"):
+        build_data_code_api_urls([DataCodeSpec("CO", Code("FM01'A"))])
+
+
+def test_build_data_code_api_urls_rejects_invalid_error_mode():
+    with pytest.raises(ValueError, match="on_validation_error"):
+        build_data_code_api_urls([], on_validation_error=cast(ErrorMode, "invalid"))
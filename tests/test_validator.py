@@ -1,7 +1,10 @@
+from typing import Any
+
 import pytest
 
 from boj_stat_search.core.types import Code, Frequency, Layer, Period
 from boj_stat_search.core.validator import (
+    BatchValidator,
     coerce_code,
     coerce_frequency,
     coerce_layer,
@@ -315,3 +318,47 @@ def test_validate_metadata_params_rejects_unknown_db():
     errors = validate_metadata_params(db="UNKNOWN")
 
     assert _has_error(errors, "list_db()")
+
+
+@pytest.mark.parametrize(
+    "code",
+    ["A,B", "A,", ",A", "A,,B", "A, ,B", "A,\t,B", "A B,C", "A,\u3000,B"],
+)
+def test_validate_data_code_params_detects_empty_codes(code):
+    errors = validate_data_code_params(db="FM01", code=code)
+
+    expected = any(part.strip() == "" for part in code.split(","))
+    assert _has_error(errors, "non-empty comma-separated") is expected
+
+
+def test_batch_validator_matches_single_validation():
+    validator = BatchValidator()
+    data_code: list[tuple[Any, ...]] = [
+        ("FM01", "A", "202401", "2024", None),
+        ("FM01", "B", "202401", "2024", None),
+        ("UNKNOWN", "A,,B", Period.year(2025), None, 0),
+        ("FM01", "C", "202401", "202412", None),
+    ]
+    data_layer: list[tuple[Any, ...]] = [
+        ("MD10", "Q", "1,*", "202405", None, None),
+        ("MD10", "q", Layer(1, "*"), Period.quarter(2024, 1), "202401", None),
+        ("MD10", Frequency.FISCAL_YEAR, "1,x", "2024", "2023", 1),
+    ]
+
+    for params in data_code * 2:
+        assert validator.data_code_params(*params) == validate_data_code_params(*params)
+    for params in data_layer * 2:
+        assert validator.data_layer_params(*params) == validate_data_layer_params(
+            *params
+        )
+
+
+def test_batch_validator_accepts_unhashable_values():
+    errors = BatchValidator().data_code_params(
+        ["FM01"],  # type: ignore[arg-type]
+        "A",
+        start_date=["2024"],  # type: ignore[arg-type]
+    )
+
+    assert _has_error(errors, "db: must be a string")
+    assert _has_error(errors, "start_date: must be a string")